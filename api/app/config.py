@@ -62,6 +62,10 @@ class Settings(BaseSettings):
     cache_user_ttl: int = 30
     cache_list_ttl: int = 60
 
+    # Reading storage: "json" (reading_result JSONB) or "packed" (reading_result_packed).
+    # Packed rows leave reading_result NULL, so JSONB indexes/queries skip them.
+    reading_result_format: str = "json"
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
@@ -1,5 +1,6 @@
 """NPS API — FastAPI application entry point."""
 
+import asyncio
 import logging
 import os
 import time
@@ -40,6 +41,7 @@ import app.orm.user  # noqa: F401
 import app.orm.api_key  # noqa: F401
 import app.orm.oracle_settings  # noqa: F401
 import app.orm.oracle_feedback  # noqa: F401
+import app.orm.oracle_reading_pattern  # noqa: F401
 import app.orm.user_settings  # noqa: F401
 import app.orm.share_link  # noqa: F401
 import app.orm.telegram_link  # noqa: F401
@@ -93,6 +95,20 @@ async def lifespan(app: FastAPI):
         logger.info("Oracle gRPC unavailable, using direct legacy imports: %s", exc)
         app.state.oracle_channel = None
 
+    # Start framework worker pool (graceful fallback: readings run inline)
+    app.state.framework_pool = None
+    try:
+        from oracle_service.worker_pool import FrameworkWorkerPool, set_worker_pool
+
+        framework_pool = FrameworkWorkerPool.from_env()
+        if framework_pool is not None:
+            await asyncio.to_thread(framework_pool.start)
+            set_worker_pool(framework_pool)
+            app.state.framework_pool = framework_pool
+    except Exception as exc:
+        logger.warning("Framework worker pool failed to start (non-fatal): %s", exc)
+        app.state.framework_pool = None
+
     # Start daily reading scheduler (graceful fallback)
     daily_scheduler = None
     try:
@@ -116,6 +132,10 @@ async def lifespan(app: FastAPI):
     if daily_scheduler:
         await daily_scheduler.stop()
         logger.info("Daily scheduler stopped")
+    if app.state.framework_pool:
+        set_worker_pool(None)
+        app.state.framework_pool.shutdown(wait=False)
+        logger.info("Framework worker pool stopped")
     if app.state.redis:
         await app.state.redis.close()
         logger.info("Redis connection closed")
@@ -70,3 +70,25 @@ class AdminOracleProfileListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class PatternFrequency(BaseModel):
+    pattern_type: str
+    value: str
+    readings: int
+    users: int
+    last_seen: date | None = None
+
+
+class PatternStatsResponse(BaseModel):
+    total_patterns: int
+    readings_with_patterns: int
+    by_type: dict[str, int]
+    top: list[PatternFrequency]
+
+
+class PatternBackfillResponse(BaseModel):
+    readings: int
+    patterns: int
+    batches: int
+    last_id: int
@@ -30,6 +30,7 @@ EVENT_TYPES = {
     # Oracle reading progress events
     "READING_STARTED": "reading_started",
     "READING_PROGRESS": "reading_progress",
+    "READING_SECTION": "reading_section",
     "READING_COMPLETE": "reading_complete",
     "READING_ERROR": "reading_error",
     "DAILY_READING": "daily_reading",
@@ -46,6 +47,14 @@ class ReadingProgressEvent(BaseModel):
     user_id: int | None = None
 
 
+class ReadingSectionEvent(BaseModel):
+    """One AI interpretation section, sent as soon as it is complete."""
+
+    reading_type: str  # "time", "daily"
+    section: str  # "header", "universal_address", "core_identity", ... "footer"
+    content: str
+
+
 class ReadingCompleteEvent(BaseModel):
     """Sent when a reading finishes successfully."""
 
@@ -398,6 +398,28 @@ class ReadingStatsResponse(BaseModel):
     most_active_day: str | None
 
 
+class ReadingPatternEntry(BaseModel):
+    pattern_type: str
+    value: str
+    occurrences: int | None = None
+    strength: str
+
+
+class SimilarReading(BaseModel):
+    reading_id: int
+    user_id: int | None = None
+    shared_patterns: int
+    reading_date: str
+
+
+class SimilarReadingsResponse(BaseModel):
+    """Readings sharing detected patterns with one reading."""
+
+    reading_id: int
+    patterns: list[ReadingPatternEntry]
+    similar: list[SimilarReading]
+
+
 # ─── Multi-User Reading Models ──────────────────────────────────────────────
 
 
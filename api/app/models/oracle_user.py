@@ -96,3 +96,50 @@ class OracleUserListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+# ─── Compatible-profile search ──────────────────────────────────────────────
+
+
+class CompatibleProfileSearchRequest(BaseModel):
+    """Find saved profiles compatible with a person given by birthday."""
+
+    birthday: date
+    limit: int = Field(10, ge=1, le=100)
+
+    @field_validator("birthday")
+    @classmethod
+    def birthday_range(cls, v: date) -> date:
+        if v.year < 1900:
+            raise ValueError("Birthday must be after 1900")
+        if v > date.today():
+            raise ValueError("Birthday cannot be in the future")
+        return v
+
+
+class CompatibilityFeaturesResponse(BaseModel):
+    life_path: int
+    element: str
+    animal: str
+    moon_phase: str
+
+
+class CompatibleProfile(BaseModel):
+    user_id: int
+    name: str
+    overall_score: float
+    life_path_score: float
+    element_score: float
+    animal_score: float
+    moon_score: float
+    pattern_score: float
+    description: str
+    strengths: list[str] = []
+    challenges: list[str] = []
+
+
+class CompatibleProfilesResponse(BaseModel):
+    features: CompatibilityFeaturesResponse
+    matches: list[CompatibleProfile]
+    buckets: int = 0
+    candidates: int = 0
@@ -7,8 +7,10 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -31,6 +33,8 @@ class OracleReading(Base):
     sign_type: Mapped[str] = mapped_column(String(20), nullable=False)
     sign_value: Mapped[str] = mapped_column(String(100), nullable=False)
     reading_result: Mapped[str | None] = mapped_column(Text)  # JSONB as text
+    reading_result_packed: Mapped[bytes | None] = mapped_column(LargeBinary)  # reading_codec
+    confidence_score: Mapped[float | None] = mapped_column(Float)  # copied from reading_result
     ai_interpretation: Mapped[str | None] = mapped_column(Text)
     ai_interpretation_persian: Mapped[str | None] = mapped_column(Text)
     individual_results: Mapped[str | None] = mapped_column(Text)  # JSONB
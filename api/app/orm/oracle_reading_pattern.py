@@ -0,0 +1,45 @@
+"""SQLAlchemy ORM model for the oracle_reading_patterns side table."""
+
+from datetime import date
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class OracleReadingPattern(Base):
+    """One detected pattern of one reading (see migration 024)."""
+
+    __tablename__ = "oracle_reading_patterns"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    reading_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("oracle_readings.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("oracle_users.id", ondelete="SET NULL")
+    )
+    pattern_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    value: Mapped[str] = mapped_column(String(40), nullable=False)
+    occurrences: Mapped[int | None] = mapped_column(SmallInteger)
+    strength: Mapped[str] = mapped_column(String(20), nullable=False)
+    reading_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "reading_id", "pattern_type", "value", name="oracle_reading_patterns_unique"
+        ),
+        Index("idx_oracle_reading_patterns_type_value", "pattern_type", "value", "reading_date"),
+        Index("idx_oracle_reading_patterns_user_date", "user_id", "reading_date"),
+        Index("idx_oracle_reading_patterns_date", "reading_date"),
+    )
@@ -2,7 +2,17 @@
 
 from datetime import date, datetime
 
-from sqlalchemy import CheckConstraint, Date, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -28,6 +38,16 @@ class OracleUser(Base):
     # Note: coordinates is a PostgreSQL POINT type — not mapped in ORM.
     # Latitude/longitude are handled at the router layer via raw SQL helpers.
 
+    # Precomputed static numerology per system (JSONB as text; PostgreSQL reads
+    # back a dict); NULL = not yet built
+    numerology_static: Mapped[str | None] = mapped_column(Text)
+
+    # Birth compatibility features for profile search; NULL = not yet built
+    compat_life_path: Mapped[int | None] = mapped_column(SmallInteger)
+    compat_element: Mapped[str | None] = mapped_column(String(10))
+    compat_animal: Mapped[str | None] = mapped_column(String(10))
+    compat_moon_phase: Mapped[str | None] = mapped_column(String(20))
+
     # Session 3 column (ownership)
     created_by: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("users.id", ondelete="SET NULL")
@@ -42,4 +62,11 @@ class OracleUser(Base):
     __table_args__ = (
         CheckConstraint("length(name) >= 2", name="oracle_users_name_check"),
         CheckConstraint("birthday <= CURRENT_DATE", name="oracle_users_birthday_check"),
+        Index(
+            "idx_oracle_users_compat_bucket",
+            "compat_life_path",
+            "compat_element",
+            "compat_animal",
+            "compat_moon_phase",
+        ),
     )
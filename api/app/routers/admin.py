@@ -7,7 +7,7 @@ import logging
 import os
 import re
 import subprocess
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
@@ -20,6 +20,8 @@ from app.models.admin import (
     AdminOracleProfileResponse,
     AdminStatsResponse,
     PasswordResetResponse,
+    PatternBackfillResponse,
+    PatternStatsResponse,
     RoleUpdateRequest,
     StatusUpdateRequest,
     SystemUserListResponse,
@@ -36,6 +38,10 @@ from app.models.backup import (
 )
 from app.services.admin_service import AdminService
 from app.services.audit import AuditService, get_audit_service
+from app.services.reading_patterns import (
+    ReadingPatternService,
+    get_reading_pattern_service,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -216,6 +222,54 @@ def get_admin_stats(
     return AdminStatsResponse(**stats)
 
 
+@router.get(
+    "/patterns",
+    response_model=PatternStatsResponse,
+    dependencies=[Depends(require_scope("admin"))],
+)
+def get_pattern_stats(
+    date_from: date | None = Query(None, description="First reading date (inclusive)"),
+    date_to: date | None = Query(None, description="Last reading date (inclusive)"),
+    pattern_type: str | None = Query(None, max_length=30),
+    limit: int = Query(20, ge=1, le=100),
+    patterns: ReadingPatternService = Depends(get_reading_pattern_service),
+) -> PatternStatsResponse:
+    """Most frequent reading patterns over a date range (admin only)."""
+    stats = patterns.pattern_stats(
+        date_from=date_from, date_to=date_to, pattern_type=pattern_type, limit=limit
+    )
+    return PatternStatsResponse(**stats)
+
+
+@router.post(
+    "/patterns/backfill",
+    response_model=PatternBackfillResponse,
+    dependencies=[Depends(require_scope("admin"))],
+)
+def backfill_patterns(
+    request: Request,
+    batch_size: int = Query(500, ge=1, le=5000),
+    after_id: int = Query(0, ge=0, description="Resume after this reading id"),
+    max_batches: int = Query(20, ge=1, le=1000),
+    patterns: ReadingPatternService = Depends(get_reading_pattern_service),
+    audit: AuditService = Depends(get_audit_service),
+) -> PatternBackfillResponse:
+    """Index patterns of stored readings, a bounded number of batches per call.
+
+    Call again with the returned ``last_id`` until ``readings`` is 0, or run
+    ``scripts/backfill_reading_patterns.py`` for the whole table.
+    """
+    result = patterns.backfill(batch_size=batch_size, after_id=after_id, max_batches=max_batches)
+    audit.log(
+        "admin.patterns_backfill",
+        success=True,
+        ip_address=_get_client_ip(request),
+        details=result,
+    )
+    audit.db.commit()
+    return PatternBackfillResponse(**result)
+
+
 # ─── Oracle Profile Management ────────────────────────────────────
 
 
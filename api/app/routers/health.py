@@ -8,7 +8,7 @@ import time
 from datetime import date, datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Query, Request
-from sqlalchemy import cast, Date, Float, extract, func
+from sqlalchemy import cast, Date, extract, func
 from sqlalchemy.orm import Session
 
 from app.database import engine, get_db
@@ -168,23 +168,39 @@ async def detailed_health(
     else:
         checks["oracle_service"] = {"status": "direct_mode", "mode": "legacy"}
 
-    # 4. Scanner (stub)
+    # 4. Framework worker pool
+    framework_pool = getattr(request.app.state, "framework_pool", None)
+    if framework_pool:
+        checks["framework_workers"] = {"status": "healthy", **framework_pool.stats()}
+    else:
+        checks["framework_workers"] = {"status": "inline"}
+
+    # 5. AI response cache
+    try:
+        from engines.ai_client import cache_stats
+
+        ai_cache = cache_stats()
+        checks["ai_cache"] = {"status": "healthy" if ai_cache else "idle", **ai_cache}
+    except Exception as exc:
+        checks["ai_cache"] = {"status": "unavailable", "error": str(exc)}
+
+    # 6. Scanner (stub)
     checks["scanner_service"] = {"status": "not_deployed"}
 
-    # 5. API self-check
+    # 7. API self-check
     checks["api"] = {
         "status": "healthy",
         "version": "4.0.0",
         "python_version": platform.python_version(),
     }
 
-    # 6. Telegram
+    # 8. Telegram
     telegram_token = os.environ.get("NPS_BOT_TOKEN")
     checks["telegram"] = {
         "status": "configured" if telegram_token else "not_configured",
     }
 
-    # 7. Nginx (external)
+    # 9. Nginx (external)
     checks["nginx"] = {"status": "external", "note": "Check via Docker health"}
 
     uptime_seconds = time.time() - _server_start_time
@@ -318,34 +334,24 @@ async def reading_analytics(
         {"type": row.type or "unknown", "count": row.count} for row in readings_by_type_rows
     ]
 
-    # Confidence trend — JSONB path extraction (PostgreSQL only)
+    # Confidence trend — score stored per reading at write time
     confidence_trend: list[dict] = []
     try:
         confidence_rows = (
             db.query(
                 cast(OracleReading.created_at, Date).label("date"),
-                func.avg(
-                    cast(
-                        OracleReading.reading_result["confidence"]["score"].as_string(),
-                        Float,
-                    )
-                ).label("avg_confidence"),
+                func.avg(OracleReading.confidence_score).label("avg_confidence"),
             )
             .filter(
                 cast(OracleReading.created_at, Date) >= since,
-                OracleReading.reading_result.isnot(None),
+                OracleReading.confidence_score.isnot(None),
             )
             .group_by(cast(OracleReading.created_at, Date))
             .order_by(cast(OracleReading.created_at, Date))
             .all()
         )
         confidence_trend = [
-            {
-                "date": str(row.date),
-                "avg_confidence": (
-                    round(float(row.avg_confidence), 1) if row.avg_confidence is not None else 0.0
-                ),
-            }
+            {"date": str(row.date), "avg_confidence": round(float(row.avg_confidence), 1)}
             for row in confidence_rows
         ]
     except Exception:
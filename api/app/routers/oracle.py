@@ -1,5 +1,6 @@
 """Oracle endpoints — reading computation, history, user management."""
 
+import json
 import logging
 from datetime import datetime, timezone
 
@@ -20,6 +21,7 @@ from app.models.audit import AuditLogEntry, AuditLogResponse
 from pydantic import ValidationError
 
 from starlette.responses import Response as StarletteResponse
+from starlette.responses import StreamingResponse
 
 from app.models.dashboard import DashboardStatsResponse
 from app.models.oracle import (
@@ -40,6 +42,7 @@ from app.models.oracle import (
     ReadingRequest,
     ReadingResponse,
     ReadingStatsResponse,
+    SimilarReadingsResponse,
     StampValidateRequest,
     StampValidateResponse,
     StoredReadingListResponse,
@@ -47,17 +50,32 @@ from app.models.oracle import (
     TimeReadingRequest,
 )
 from app.models.oracle_user import (
+    CompatibleProfileSearchRequest,
+    CompatibleProfilesResponse,
     OracleUserCreate,
     OracleUserListResponse,
     OracleUserResponse,
     OracleUserUpdate,
 )
+from app.orm.oracle_reading import OracleReading
 from app.orm.oracle_user import OracleUser
 from app.services.audit import AuditService, get_audit_service
+from app.services.compatibility_search import (
+    CompatibilitySearchService,
+    feature_summary,
+    features_for_birthday,
+    get_compatibility_search_service,
+    refresh_compatibility_features,
+)
 from app.services.oracle_reading import (
     OracleReadingService,
+    WorkerPoolError,
     get_oracle_reading_service,
 )
+from app.services.reading_patterns import (
+    ReadingPatternService,
+    get_reading_pattern_service,
+)
 from app.services.websocket_manager import ws_manager
 from app.services.security import EncryptionService, get_encryption_service
 
@@ -211,6 +229,8 @@ def create_question_sign(
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    except WorkerPoolError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
 
     reading = svc.store_reading(
         user_id=body.user_id,
@@ -253,6 +273,8 @@ def create_name_reading(
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    except WorkerPoolError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
 
     reading = svc.store_reading(
         user_id=body.user_id,
@@ -448,6 +470,17 @@ async def create_framework_reading(
                 {"step": step_name, "progress": progress_pct, "message": message},
             )
 
+    # Interpretation sections go to the requesting user's sockets as they complete
+    section_callback = None
+    if _user.get("user_id"):
+
+        async def section_callback(section: str, content: str, rt: str = "time"):
+            await ws_manager.send_to_user(
+                _user["user_id"],
+                "reading_section",
+                {"reading_type": rt, "section": section, "content": content},
+            )
+
     try:
         if reading_type == "daily":
             body = DailyReadingRequest(**body_raw)
@@ -458,6 +491,7 @@ async def create_framework_reading(
                 numerology_system=body.numerology_system,
                 force_regenerate=body.force_regenerate,
                 progress_callback=progress_callback,
+                section_callback=section_callback,
             )
             audit.log_reading_created(
                 result["id"],
@@ -492,7 +526,7 @@ async def create_framework_reading(
             # Session 14 time reading (default)
             body = TimeReadingRequest(**body_raw)
 
-            async def time_progress(step: int, total: int, message: str):
+            async def time_progress(step: int, total: int, message: str, rt: str = "time"):
                 progress_pct = int((step / total) * 100) if total > 0 else 0
                 step_name = (
                     "calculating"
@@ -529,6 +563,7 @@ async def create_framework_reading(
                 locale=body.locale,
                 numerology_system=body.numerology_system,
                 progress_callback=time_progress,
+                section_callback=section_callback,
             )
             audit.log_reading_created(
                 result["id"],
@@ -549,6 +584,11 @@ async def create_framework_reading(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(exc),
         )
+    except WorkerPoolError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+        )
 
 
 # ─── Daily Reading Cache Endpoint (Session 16) ──────────────────────────────
@@ -591,6 +631,44 @@ def get_daily_framework_reading(
     )
 
 
+# ─── Best Moments Search ─────────────────────────────────────────────────────
+
+
+@router.get(
+    "/best-moments",
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def stream_best_moments(
+    user_id: int = Query(..., description="Oracle user ID"),
+    start: str | None = Query(None, description="Local ISO 8601 start, defaults to now"),
+    days: int = Query(7, ge=1, le=31),
+    k: int = Query(10, ge=1, le=100),
+    step_minutes: int = Query(1, ge=1, le=1440),
+    numerology_system: str = Query("pythagorean"),
+    _user: dict = Depends(get_current_user),
+    svc: OracleReadingService = Depends(get_oracle_reading_service),
+):
+    """Stream a user's top-k moments in a window as NDJSON.
+
+    One line per moment as it enters the running top-k
+    (``{"event": "candidate", "moment": ...}``), then a final
+    ``{"event": "result", "moments": [...]}`` line, best first.
+    """
+    try:
+        events = svc.stream_best_moments(user_id, start, days, k, step_minutes, numerology_system)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        )
+    # Persist a rebuilt static numerology profile before streaming starts
+    svc.db.commit()
+    return StreamingResponse(
+        (json.dumps(event) + "\n" for event in events),
+        media_type="application/x-ndjson",
+    )
+
+
 # ─── Dashboard Stats Endpoint (Session 22) ───────────────────────────────────
 
 
@@ -694,6 +772,32 @@ def get_stored_reading(
     return StoredReadingResponse(**data)
 
 
+@router.get(
+    "/readings/{reading_id}/similar",
+    response_model=SimilarReadingsResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def get_similar_readings(
+    reading_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    _user: dict = Depends(get_current_user),
+    patterns: ReadingPatternService = Depends(get_reading_pattern_service),
+):
+    """Readings sharing the most detected patterns with this one (pattern index)."""
+    exists = (
+        patterns.db.query(OracleReading.id)
+        .filter(OracleReading.id == reading_id, OracleReading.deleted_at.is_(None))
+        .first()
+    )
+    if not exists:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reading not found")
+    own = patterns.get_reading_patterns(reading_id)
+    similar = patterns.similar_readings(reading_id, limit=limit, patterns=own)
+    for entry in similar:
+        entry["reading_date"] = str(entry["reading_date"])
+    return SimilarReadingsResponse(reading_id=reading_id, patterns=own, similar=similar)
+
+
 @router.delete(
     "/readings/{reading_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -782,6 +886,7 @@ def create_user(
     user_data = body.model_dump(exclude={"latitude", "longitude"})
     user = OracleUser(**user_data)
     user.created_by = _user.get("user_id")
+    refresh_compatibility_features(user)
     _encrypt_user_fields(user, enc)
     db.add(user)
     db.flush()  # Get the ID before commit
@@ -943,6 +1048,12 @@ def update_user(
             value = enc.encrypt(value)
         setattr(user, field, value)
 
+    # Invalidate persisted static numerology; rebuilt on the next reading
+    if {"name", "birthday", "mother_name"} & updates.keys():
+        user.numerology_static = None
+    if "birthday" in updates:
+        refresh_compatibility_features(user)
+
     audit.log_user_updated(
         user.id,
         list(updates.keys()),
@@ -955,6 +1066,55 @@ def update_user(
     return _decrypt_user(user, enc, db)
 
 
+@router.get(
+    "/users/{user_id}/compatible",
+    response_model=CompatibleProfilesResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def get_compatible_profiles(
+    user_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    _user: dict = Depends(get_current_user),
+    search: CompatibilitySearchService = Depends(get_compatibility_search_service),
+):
+    """Saved profiles most compatible with this one (birth features)."""
+    user = (
+        search.db.query(OracleUser)
+        .filter(OracleUser.id == user_id, OracleUser.deleted_at.is_(None))
+        .first()
+    )
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    # Ownership: non-admin/moderator users search and see only their own profiles
+    owner_id = None
+    if _user["role"] not in ("admin", "moderator"):
+        if user.created_by != _user["user_id"]:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        owner_id = _user["user_id"]
+
+    target = features_for_birthday(user.birthday, user.id)
+    result = search.search(target, limit=limit, owner_id=owner_id, exclude_user_id=user.id)
+    return CompatibleProfilesResponse(features=feature_summary(target), **result)
+
+
+@router.post(
+    "/users/compatible",
+    response_model=CompatibleProfilesResponse,
+    dependencies=[Depends(require_scope("oracle:read"))],
+)
+def search_compatible_profiles(
+    body: CompatibleProfileSearchRequest,
+    _user: dict = Depends(get_current_user),
+    search: CompatibilitySearchService = Depends(get_compatibility_search_service),
+):
+    """Saved profiles most compatible with a person given by birthday."""
+    owner_id = None if _user["role"] in ("admin", "moderator") else _user["user_id"]
+    target = features_for_birthday(body.birthday)
+    result = search.search(target, limit=body.limit, owner_id=owner_id)
+    return CompatibleProfilesResponse(features=feature_summary(target), **result)
+
+
 @router.delete(
     "/users/{user_id}",
     response_model=OracleUserResponse,
@@ -1,6 +1,5 @@
 """Share link endpoints — create, view (public), and revoke share links for readings."""
 
-import json
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
@@ -14,6 +13,7 @@ from app.middleware.auth import get_current_user
 from app.models.share import ShareLinkCreate, ShareLinkResponse, SharedReadingResponse
 from app.orm.oracle_reading import OracleReading
 from app.orm.share_link import ShareLink
+from app.services.reading_codec import load_reading_result
 
 logger = logging.getLogger(__name__)
 
@@ -103,11 +103,10 @@ def get_shared_reading(token: str, db: Session = Depends(get_db)) -> SharedReadi
         "created_at": reading.created_at.isoformat() if reading.created_at else None,
         "is_favorite": reading.is_favorite,
     }
-    if reading.reading_result:
-        try:
-            reading_data["reading_result"] = json.loads(reading.reading_result)
-        except (json.JSONDecodeError, TypeError):
-            reading_data["reading_result"] = None
+    if reading.reading_result_packed is not None or reading.reading_result:
+        reading_data["reading_result"] = load_reading_result(
+            reading.reading_result_packed, reading.reading_result
+        )
 
     return SharedReadingResponse(
         reading=reading_data,
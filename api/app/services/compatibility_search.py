@@ -0,0 +1,251 @@
+"""Compatible-profile search — stored oracle users ranked by compatibility.
+
+Four of the five MultiUserAnalyzer compatibility dimensions depend only on
+a person's birth date: life path, birth-year element and animal, and the
+moon phase at birth. They are stored on each oracle_users row (compat_*
+columns) when the user is created or their birthday changes.
+
+Users with identical features form a bucket and score identically against
+any target, so a search never scores the whole table:
+
+1. list the distinct buckets in scope (idx_oracle_users_compat_bucket);
+2. score each bucket once against the target with calculate_pairwise();
+3. load at most ``limit`` users, from the best-scoring buckets only;
+4. return calculate_pairwise() results for that shortlist.
+
+Pattern overlap depends on a reading moment, not a person, so it is the
+neutral 0.5 for every candidate.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+from fastapi import Depends
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.orm.oracle_user import OracleUser
+
+logger = logging.getLogger(__name__)
+
+# ─── Engine imports via sys.path shim ────────────────────────────────────────
+
+_ORACLE_PARENT_DIR = str(Path(__file__).resolve().parents[3] / "services" / "oracle")
+if _ORACLE_PARENT_DIR not in sys.path:
+    sys.path.insert(0, _ORACLE_PARENT_DIR)
+
+import oracle_service  # noqa: E402, F401 — triggers shim for absolute imports
+
+from oracle_service.framework_bridge import birth_compatibility_features  # noqa: E402
+from oracle_service.models.reading_types import CompatibilityFeatures  # noqa: E402
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer  # noqa: E402
+
+BACKFILL_BATCH_SIZE = 500
+MAX_SEARCH_LIMIT = 100
+
+_FEATURE_COLUMNS = (
+    OracleUser.compat_life_path,
+    OracleUser.compat_element,
+    OracleUser.compat_animal,
+    OracleUser.compat_moon_phase,
+)
+
+
+def features_for_birthday(birthday: date | str, user_id: int = 0) -> CompatibilityFeatures:
+    """Birth compatibility features for a birthday (date or ISO string)."""
+    if isinstance(birthday, str):
+        birthday = date.fromisoformat(birthday)
+    return birth_compatibility_features(user_id, birthday.day, birthday.month, birthday.year)
+
+
+def refresh_compatibility_features(user: OracleUser) -> None:
+    """Set the user's compat_* columns from their birthday.
+
+    Called on create and whenever the birthday changes.
+    """
+    features = features_for_birthday(user.birthday, user.id or 0)
+    user.compat_life_path = features.life_path
+    user.compat_element = features.element
+    user.compat_animal = features.animal
+    user.compat_moon_phase = features.moon_phase
+
+
+def feature_summary(features: CompatibilityFeatures) -> dict:
+    """The stored (birth) features as a plain dict, for responses."""
+    return {
+        "life_path": features.life_path,
+        "element": features.element,
+        "animal": features.animal,
+        "moon_phase": features.moon_phase,
+    }
+
+
+def _bucket_features(bucket: tuple, user_id: int = 0) -> CompatibilityFeatures:
+    life_path, element, animal, moon_phase = bucket
+    return CompatibilityFeatures(
+        user_id=user_id,
+        life_path=life_path,
+        element=element,
+        animal=animal,
+        moon_phase=moon_phase,
+    )
+
+
+class CompatibilitySearchService:
+    """Maintain oracle_users compatibility features and search by them."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Writes ──
+
+    def backfill(
+        self,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        after_id: int = 0,
+        max_batches: int | None = None,
+    ) -> dict:
+        """Build missing features in id order, committing one batch at a time.
+
+        Only rows without features are touched, so the job is safe to
+        re-run; pass the returned ``last_id`` as ``after_id`` to resume.
+        """
+        users = batches = 0
+        last_id = after_id
+        while max_batches is None or batches < max_batches:
+            rows = (
+                self.db.query(OracleUser)
+                .filter(OracleUser.id > last_id, OracleUser.compat_life_path.is_(None))
+                .order_by(OracleUser.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for user in rows:
+                refresh_compatibility_features(user)
+            self.db.commit()
+
+            users += len(rows)
+            batches += 1
+            last_id = rows[-1].id
+            logger.info("Compatibility backfill: %d users built (last id %d)", users, last_id)
+
+        return {"users": users, "batches": batches, "last_id": last_id}
+
+    # ── Queries ──
+
+    def search(
+        self,
+        target: CompatibilityFeatures,
+        limit: int = 10,
+        owner_id: str | None = None,
+        exclude_user_id: int | None = None,
+    ) -> dict:
+        """The ``limit`` stored users most compatible with ``target``.
+
+        Args:
+            target: Features of the person to match (e.g. features_for_birthday()).
+            owner_id: Only search profiles created by this account.
+            exclude_user_id: Leave this user out (the target's own profile).
+
+        Returns:
+            {"matches": [...], "buckets": int, "candidates": int}. Matches are
+            ordered by overall score, then user id; each holds the
+            calculate_pairwise() fields plus user_id and name. ``buckets``
+            counts distinct feature buckets scored, ``candidates`` the
+            user rows loaded.
+        """
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        filters = [OracleUser.deleted_at.is_(None)]
+        if owner_id is not None:
+            filters.append(OracleUser.created_by == owner_id)
+        if exclude_user_id is not None:
+            filters.append(OracleUser.id != exclude_user_id)
+        self._build_missing(filters)
+
+        target_reading = MultiUserAnalyzer.features_reading(target)
+        buckets = []
+        for row in self.db.query(*_FEATURE_COLUMNS).filter(*filters).distinct().all():
+            bucket = tuple(row)
+            score = MultiUserAnalyzer.calculate_pairwise(
+                target_reading, MultiUserAnalyzer.features_reading(_bucket_features(bucket))
+            ).overall_score
+            buckets.append((score, bucket))
+        buckets.sort(key=lambda b: b[0], reverse=True)
+
+        # Walk score levels best-first; within a level, lowest user ids win
+        matches: list[dict] = []
+        candidates = 0
+        for _score, level in itertools.groupby(buckets, key=lambda b: b[0]):
+            needed = limit - len(matches)
+            if needed <= 0:
+                break
+            rows = (
+                self.db.query(OracleUser.id, OracleUser.name, *_FEATURE_COLUMNS)
+                .filter(
+                    *filters,
+                    or_(
+                        *(
+                            and_(*(col == value for col, value in zip(_FEATURE_COLUMNS, bucket)))
+                            for _, bucket in level
+                        )
+                    ),
+                )
+                .order_by(OracleUser.id)
+                .limit(needed)
+                .all()
+            )
+            candidates += len(rows)
+            matches.extend(self._match(target_reading, row) for row in rows)
+
+        return {"matches": matches, "buckets": len(buckets), "candidates": candidates}
+
+    @staticmethod
+    def _match(target_reading, row) -> dict:
+        """Exact calculate_pairwise() result for one shortlisted user row."""
+        features = _bucket_features(tuple(row[2:]), row.id)
+        result = MultiUserAnalyzer.calculate_pairwise(
+            target_reading, MultiUserAnalyzer.features_reading(features)
+        )
+        return {
+            "user_id": row.id,
+            "name": row.name,
+            "overall_score": result.overall_score,
+            "life_path_score": result.life_path_score,
+            "element_score": result.element_score,
+            "animal_score": result.animal_score,
+            "moon_score": result.moon_score,
+            "pattern_score": result.pattern_score,
+            "description": result.description,
+            "strengths": result.strengths,
+            "challenges": result.challenges,
+        }
+
+    def _build_missing(self, filters: list) -> None:
+        """Build features for rows in scope that predate migration 023."""
+        while True:
+            missing = (
+                self.db.query(OracleUser)
+                .filter(*filters, OracleUser.compat_life_path.is_(None))
+                .limit(BACKFILL_BATCH_SIZE)
+                .all()
+            )
+            if not missing:
+                return
+            for user in missing:
+                refresh_compatibility_features(user)
+            self.db.commit()
+
+
+def get_compatibility_search_service(
+    db: Session = Depends(get_db),
+) -> CompatibilitySearchService:
+    """FastAPI dependency — returns CompatibilitySearchService instance."""
+    return CompatibilitySearchService(db)
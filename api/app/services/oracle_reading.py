@@ -5,15 +5,18 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.orm.oracle_reading import OracleReading, OracleReadingUser
+from app.services.reading_codec import encode_reading_result, load_reading_result
+from app.services.reading_patterns import ReadingPatternService
 from app.services.security import EncryptionService, get_encryption_service
 
 if TYPE_CHECKING:
@@ -41,10 +44,13 @@ import oracle_service  # noqa: E402, F401 — triggers shim for absolute imports
 
 from oracle_service.framework_bridge import (  # noqa: E402
     ANIMAL_NAMES,
+    FrameworkBridgeError,
     STEM_ELEMENTS,
     STEM_NAMES,
     STEM_POLARITY,
+    build_static_profiles,
     encode_fc60,
+    iter_best_moments,
     ganzhi_year,
     LETTER_VALUES,
     LIFE_PATH_MEANINGS,
@@ -52,6 +58,7 @@ from oracle_service.framework_bridge import (  # noqa: E402
     numerology_reduce,
     personal_year,
 )
+from oracle_service.worker_pool import WorkerPoolError  # noqa: E402, F401 — used by routers
 from engines.oracle import (  # noqa: E402
     _get_zodiac,
     daily_insight,
@@ -86,6 +93,39 @@ def _parse_datetime(dt_str: str | None) -> datetime:
         return datetime.now(timezone.utc)
 
 
+def _confidence_score(reading_result: dict | None) -> float | None:
+    """The confidence score of a reading result ({"score": n} or a bare number)."""
+    conf = (reading_result or {}).get("confidence")
+    score = conf.get("score") if isinstance(conf, dict) else conf
+    try:
+        return float(score) if score is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _stored_result_columns(reading_result: dict | None) -> dict:
+    """OracleReading column values holding ``reading_result`` in the configured format."""
+    if not reading_result:
+        return {"reading_result": None, "reading_result_packed": None, "confidence_score": None}
+    columns = {"confidence_score": _confidence_score(reading_result)}
+    if settings.reading_result_format == "packed":
+        columns.update(
+            reading_result=None, reading_result_packed=encode_reading_result(reading_result)
+        )
+    else:
+        columns.update(reading_result=json.dumps(reading_result), reading_result_packed=None)
+    return columns
+
+
+def _stored_size(value: bytes | str | dict | None) -> int:
+    """Stored byte size of a reading_result / reading_result_packed value."""
+    if value is None:
+        return 0
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    return len(value.encode() if isinstance(value, str) else value)
+
+
 # ─── Oracle Reading Service ──────────────────────────────────────────────────
 
 
@@ -426,7 +466,7 @@ class OracleReadingService:
             question="",
             sign_type="multi_user",
             sign_value=f"{result_dict.get('user_count', 0)}-user analysis",
-            reading_result=json.dumps(result_dict),
+            **_stored_result_columns(result_dict),
             individual_results=json.dumps(result_dict.get("profiles", [])),
             compatibility_matrix=json.dumps(result_dict.get("pairwise_compatibility", [])),
             combined_energy=json.dumps(result_dict.get("group_energy", {})),
@@ -457,6 +497,7 @@ class OracleReadingService:
         numerology_system: str,
         force_regenerate: bool = False,
         progress_callback=None,
+        section_callback=None,
     ) -> dict:
         """Create a daily reading (or return cached version).
 
@@ -480,7 +521,9 @@ class OracleReadingService:
 
         from oracle_service.reading_orchestrator import ReadingOrchestrator
 
-        orchestrator = ReadingOrchestrator(progress_callback=progress_callback)
+        orchestrator = ReadingOrchestrator(
+            progress_callback=progress_callback, section_callback=section_callback
+        )
         result = await orchestrator.generate_daily_reading(user_profile, target_date, locale)
 
         # Store in oracle_readings
@@ -543,17 +586,9 @@ class OracleReadingService:
             return None
 
         # Reconstruct response from stored reading
-        reading_result = None
-        if reading.reading_result:
-            try:
-                reading_result = (
-                    json.loads(reading.reading_result)
-                    if isinstance(reading.reading_result, str)
-                    else reading.reading_result
-                )
-            except (json.JSONDecodeError, TypeError):
-                reading_result = {}
-        reading_result = reading_result or {}
+        reading_result = (
+            load_reading_result(reading.reading_result_packed, reading.reading_result) or {}
+        )
 
         created_at = reading.created_at
         created_str = (
@@ -705,6 +740,24 @@ class OracleReadingService:
         if self.enc and mother_name:
             mother_name = self.enc.decrypt_field(mother_name)
 
+        # Static numerology is persisted on the row; rebuild it when missing
+        # (new user, or cleared by an edit to name/birthday/mother_name).
+        # Stale entries are also rejected by fingerprint inside the bridge.
+        # The column is JSONB: PostgreSQL returns a dict, SQLite a string.
+        numerology_static = getattr(oracle_user, "numerology_static", None) or None
+        if isinstance(numerology_static, str):
+            try:
+                numerology_static = json.loads(numerology_static)
+            except ValueError:
+                numerology_static = None
+        if not isinstance(numerology_static, dict):
+            numerology_static = None
+        if numerology_static is None:
+            numerology_static = build_static_profiles(
+                oracle_user.name, birth_day, birth_month, birth_year, mother_name
+            )
+            oracle_user.numerology_static = json.dumps(numerology_static)
+
         return FrameworkUserProfile(
             user_id=oracle_user.id,
             full_name=oracle_user.name,
@@ -717,8 +770,53 @@ class OracleReadingService:
             timezone_hours=getattr(oracle_user, "timezone_hours", 0) or 0,
             timezone_minutes=getattr(oracle_user, "timezone_minutes", 0) or 0,
             numerology_system=numerology_system,
+            numerology_static=numerology_static,
         )
 
+    # ── Best moments search ──
+
+    def stream_best_moments(
+        self,
+        user_id: int,
+        start_str: str | None,
+        days: int,
+        k: int,
+        step_minutes: int,
+        numerology_system: str = "pythagorean",
+    ) -> Iterator[dict]:
+        """Stream best-moments search events for a user.
+
+        Yields {"event": "candidate", "moment": {...}} for each moment as it
+        enters the running top-k, then {"event": "result", "moments": [...]}
+        with the final ranking. ``start_str`` is a local ISO 8601 time in
+        the user's timezone (default: now there).
+
+        Raises:
+            ValueError: Unknown user or invalid window (before streaming).
+        """
+        oracle_user = self._get_oracle_user(user_id)
+        profile = self._build_user_profile(oracle_user, numerology_system)
+        if start_str:
+            start = datetime.fromisoformat(start_str).replace(tzinfo=None)
+        else:
+            offset = timedelta(hours=profile.timezone_hours, minutes=profile.timezone_minutes)
+            start = (datetime.now(timezone.utc) + offset).replace(tzinfo=None)
+        try:
+            moments = iter_best_moments(profile, start, days, k, step_minutes)
+        except FrameworkBridgeError as exc:
+            raise ValueError(str(exc)) from exc
+        return self._best_moment_events(moments, k)
+
+    @staticmethod
+    def _best_moment_events(moments: Iterator[dict], k: int) -> Iterator[dict]:
+        from numerology_ai_framework.synthesis.moment_search import MomentSearch
+
+        found = []
+        for moment in moments:
+            found.append(moment)
+            yield {"event": "candidate", "moment": moment}
+        yield {"event": "result", "moments": MomentSearch.rank(found, k)}
+
     async def create_framework_reading(
         self,
         user_id: int,
@@ -728,6 +826,7 @@ class OracleReadingService:
         locale: str,
         numerology_system: str,
         progress_callback=None,
+        section_callback=None,
     ) -> dict:
         """Create a reading using the framework pipeline.
 
@@ -760,7 +859,9 @@ class OracleReadingService:
         # 4. Orchestrate reading
         from oracle_service.reading_orchestrator import ReadingOrchestrator
 
-        orchestrator = ReadingOrchestrator(progress_callback=progress_callback)
+        orchestrator = ReadingOrchestrator(
+            progress_callback=progress_callback, section_callback=section_callback
+        )
         result = await orchestrator.generate_time_reading(
             user_profile, hour, minute, second, target_date, locale
         )
@@ -908,7 +1009,11 @@ class OracleReadingService:
         reading_result: dict | None,
         ai_interpretation: str | None,
     ) -> OracleReading:
-        """Create an OracleReading row with encrypted sensitive fields."""
+        """Create an OracleReading row with encrypted sensitive fields.
+
+        Detected patterns are indexed in oracle_reading_patterns in the same
+        transaction.
+        """
         enc_question = question or ""
         enc_ai = ai_interpretation
         if self.enc:
@@ -920,11 +1025,19 @@ class OracleReadingService:
             sign_type=sign_type,
             sign_value=sign_value,
             question=enc_question,
-            reading_result=json.dumps(reading_result) if reading_result else None,
+            **_stored_result_columns(reading_result),
             ai_interpretation=enc_ai,
         )
         self.db.add(reading)
         self.db.flush()
+        if reading_result:
+            ReadingPatternService(self.db).index_reading(
+                reading,
+                reading_result,
+                reading_date=datetime.now(timezone.utc).date(),
+                replace=False,
+            )
+            self.db.flush()
         return reading
 
     def get_reading_by_id(self, reading_id: int) -> dict | None:
@@ -983,6 +1096,7 @@ class OracleReadingService:
         if not row:
             return False
         row.deleted_at = datetime.now(timezone.utc)
+        ReadingPatternService(self.db).remove_reading(reading_id)
         self.db.flush()
         return True
 
@@ -1080,34 +1194,12 @@ class OracleReadingService:
         if readings_by_type:
             most_used_type = max(readings_by_type, key=readings_by_type.get)  # type: ignore[arg-type]
 
-        # Average confidence from reading_result JSONB
+        # Average confidence from the score stored alongside each result
         average_confidence: float | None = None
         try:
-            # PostgreSQL: extract confidence from JSONB reading_result
-            conf_rows = (
-                base.with_entities(OracleReading.reading_result)
-                .filter(OracleReading.reading_result.isnot(None))
-                .all()
-            )
-            conf_values: list[float] = []
-            for (result_str,) in conf_rows:
-                if not result_str:
-                    continue
-                try:
-                    import json as _json
-
-                    parsed = _json.loads(result_str) if isinstance(result_str, str) else result_str
-                    conf = parsed.get("confidence")
-                    if isinstance(conf, dict):
-                        score = conf.get("score")
-                    else:
-                        score = conf
-                    if score is not None:
-                        conf_values.append(float(score))
-                except (ValueError, TypeError, AttributeError):
-                    continue
-            if conf_values:
-                average_confidence = sum(conf_values) / len(conf_values)
+            avg = base.with_entities(sqla_func.avg(OracleReading.confidence_score)).scalar()
+            if avg is not None:
+                average_confidence = float(avg)
         except Exception:
             pass
 
@@ -1162,6 +1254,73 @@ class OracleReadingService:
             "readings_this_month": readings_this_month,
         }
 
+    def convert_stored_results(
+        self,
+        to_format: str = "packed",
+        batch_size: int = 500,
+        after_id: int = 0,
+        max_batches: int | None = None,
+    ) -> dict:
+        """Rewrite stored reading results into one column format, in id-ordered batches.
+
+        ``to_format="packed"`` moves JSON results into reading_result_packed;
+        ``"json"`` moves them back (before rolling back migration 025). Each
+        batch is committed; pass the returned ``last_id`` as ``after_id`` to
+        resume. Rows already in the target format are not selected.
+        """
+        if to_format not in ("packed", "json"):
+            raise ValueError(f"Unknown reading result format: {to_format}")
+        source = (
+            OracleReading.reading_result
+            if to_format == "packed"
+            else OracleReading.reading_result_packed
+        )
+        converted = skipped = batches = 0
+        bytes_before = bytes_after = 0
+        last_id = after_id
+        while max_batches is None or batches < max_batches:
+            rows = (
+                self.db.query(OracleReading)
+                .filter(OracleReading.id > last_id, source.isnot(None))
+                .order_by(OracleReading.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row in rows:
+                result = load_reading_result(row.reading_result_packed, row.reading_result)
+                if result is None:
+                    skipped += 1
+                    continue
+                bytes_before += _stored_size(row.reading_result_packed or row.reading_result)
+                if row.confidence_score is None:
+                    row.confidence_score = _confidence_score(result)
+                if to_format == "packed":
+                    row.reading_result_packed = encode_reading_result(result)
+                    row.reading_result = None
+                    bytes_after += _stored_size(row.reading_result_packed)
+                else:
+                    row.reading_result = json.dumps(result)
+                    row.reading_result_packed = None
+                    bytes_after += _stored_size(row.reading_result)
+                converted += 1
+            self.db.commit()
+            batches += 1
+            last_id = rows[-1].id
+            logger.info(
+                "Reading results -> %s: %d converted (last id %d)", to_format, converted, last_id
+            )
+
+        return {
+            "converted": converted,
+            "skipped": skipped,
+            "batches": batches,
+            "last_id": last_id,
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+        }
+
     def _decrypt_reading(self, row: OracleReading) -> dict:
         """ORM row → dict with decrypted fields + parsed JSON."""
         question = row.question
@@ -1174,12 +1333,7 @@ class OracleReadingService:
                 else ai_interpretation
             )
 
-        reading_result = None
-        if row.reading_result:
-            try:
-                reading_result = json.loads(row.reading_result)
-            except (json.JSONDecodeError, TypeError):
-                reading_result = None
+        reading_result = load_reading_result(row.reading_result_packed, row.reading_result)
 
         created_at = row.created_at
         if isinstance(created_at, datetime):
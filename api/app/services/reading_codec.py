@@ -0,0 +1,253 @@
+"""Compact, versioned storage codec for reading results.
+
+A stored reading result is a dict of top-level sections (``numerology``,
+``confidence``, ``translation``, ...). The packed form keeps every section
+as its own compact-JSON payload, zlib-compressed when that pays off, behind
+a small header indexing the sections. Readers that need one section
+(dashboard confidence, pattern backfill) decode only that section; the
+rest of the blob is never decompressed or parsed.
+
+Layout (big-endian):
+
+    magic    2 bytes  b"\\xa7R"  (never valid JSON or UTF-8 text)
+    version  u8       CODEC_VERSION
+    schema   u8       key table id (SCHEMAS)
+    count    u16      number of sections
+    count x  key u8 (index into the schema's key table, or INLINE_KEY
+             followed by u8 length + UTF-8 name), flags u8, length u32
+    payloads          concatenated section payloads, in header order
+
+Schema key tables are append-only: a new key goes into a new schema id so
+old blobs keep decoding. Keys missing from the table are stored inline.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+MAGIC = b"\xa7R"
+CODEC_VERSION = 1
+INLINE_KEY = 0xFF
+COMPRESS_MIN_BYTES = 1024
+FLAG_ZLIB = 0x01
+
+SCHEMAS: dict[int, tuple[str, ...]] = {
+    1: (
+        # MasterOrchestrator.generate_reading()
+        "person",
+        "birth",
+        "current",
+        "numerology",
+        "patterns",
+        "confidence",
+        "synthesis",
+        "fc60_stamp",
+        "moon",
+        "ganzhi",
+        "heartbeat",
+        "location",
+        "reading",
+        "translation",
+        # framework_bridge enrichment
+        "patterns_ai",
+        "patterns_frontend",
+        "patterns_db",
+        "confidence_ui",
+        "question_vibration",
+        # API reading responses
+        "ai_interpretation",
+        "name",
+        "question",
+        "question_number",
+        "numerology_system",
+        "detected_script",
+        "expression",
+        "soul_urge",
+        "personality",
+        "life_path",
+        "personal_year",
+        "letter_breakdown",
+        "daily_insights",
+        "generated_at",
+        "summary",
+    ),
+}
+CURRENT_SCHEMA = 1
+
+_PREFIX = struct.Struct(">2sBBH")
+_ENTRY = struct.Struct(">BI")
+_KEY_INDEX = {
+    schema: {key: index for index, key in enumerate(keys)} for schema, keys in SCHEMAS.items()
+}
+
+
+class ReadingCodecError(ValueError):
+    """Raised when a blob is not a readable packed reading result."""
+
+
+def is_packed(blob: Any) -> bool:
+    """True if ``blob`` is a packed reading result (not JSON text or a dict)."""
+    return isinstance(blob, (bytes, bytearray, memoryview)) and bytes(blob[:2]) == MAGIC
+
+
+def encode_reading_result(result: Mapping[str, Any], schema: int = CURRENT_SCHEMA) -> bytes:
+    """Pack a reading result dict.
+
+    Values must be JSON-serializable, as for ``json.dumps``.
+    """
+    key_index = _KEY_INDEX[schema]
+    header = [_PREFIX.pack(MAGIC, CODEC_VERSION, schema, len(result))]
+    payloads = []
+    for key, value in result.items():
+        raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+        flags = 0
+        if len(raw) >= COMPRESS_MIN_BYTES:
+            packed = zlib.compress(raw, 1)
+            if len(packed) < len(raw):
+                raw, flags = packed, FLAG_ZLIB
+        index = key_index.get(key)
+        if index is None:
+            name = str(key).encode()
+            if len(name) > 255:
+                raise ReadingCodecError(f"section name too long: {key!r}")
+            header.append(bytes((INLINE_KEY, len(name))) + name)
+        else:
+            header.append(bytes((index,)))
+        header.append(_ENTRY.pack(flags, len(raw)))
+        payloads.append(raw)
+    return b"".join(header + payloads)
+
+
+def _index(blob: bytes) -> dict[str, tuple[int, int, int]]:
+    """{section: (flags, offset, length)} from the header; payloads untouched."""
+    try:
+        magic, version, schema, count = _PREFIX.unpack_from(blob, 0)
+    except struct.error as exc:
+        raise ReadingCodecError("truncated header") from exc
+    if magic != MAGIC:
+        raise ReadingCodecError("not a packed reading result")
+    if version != CODEC_VERSION:
+        raise ReadingCodecError(f"unsupported codec version {version}")
+    keys = SCHEMAS.get(schema)
+    if keys is None:
+        raise ReadingCodecError(f"unknown schema {schema}")
+
+    entries = []
+    pos = _PREFIX.size
+    try:
+        for _ in range(count):
+            index = blob[pos]
+            pos += 1
+            if index == INLINE_KEY:
+                size = blob[pos]
+                key = bytes(blob[pos + 1 : pos + 1 + size]).decode()
+                pos += 1 + size
+            else:
+                key = keys[index]
+            flags, length = _ENTRY.unpack_from(blob, pos)
+            pos += _ENTRY.size
+            entries.append((key, flags, length))
+    except (IndexError, struct.error, UnicodeDecodeError) as exc:
+        raise ReadingCodecError("corrupt section table") from exc
+
+    sections = {}
+    for key, flags, length in entries:
+        sections[key] = (flags, pos, length)
+        pos += length
+    if pos != len(blob):
+        raise ReadingCodecError("payload length mismatch")
+    return sections
+
+
+def _decode_section(blob: bytes, flags: int, offset: int, length: int) -> Any:
+    raw = blob[offset : offset + length]
+    try:
+        if flags & FLAG_ZLIB:
+            raw = zlib.decompress(raw)
+        return json.loads(raw.decode())
+    except (zlib.error, ValueError) as exc:
+        raise ReadingCodecError("corrupt section payload") from exc
+
+
+def decode_reading_result(blob: bytes, sections: Iterable[str] | None = None) -> dict:
+    """Unpack a reading result, or only ``sections`` of it (missing ones skipped)."""
+    blob = bytes(blob)
+    index = _index(blob)
+    keys = index if sections is None else [key for key in sections if key in index]
+    return {key: _decode_section(blob, *index[key]) for key in keys}
+
+
+def read_section(blob: bytes, name: str, default: Any = None) -> Any:
+    """Decode a single top-level section of a packed reading result."""
+    blob = bytes(blob)
+    entry = _index(blob).get(name)
+    return default if entry is None else _decode_section(blob, *entry)
+
+
+class PackedReadingResult(Mapping):
+    """Read-only dict view over a packed blob; sections decode on first access."""
+
+    __slots__ = ("_blob", "_index", "_decoded")
+
+    def __init__(self, blob: bytes):
+        self._blob = bytes(blob)
+        self._index = _index(self._blob)
+        self._decoded: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        entry = self._index[key]
+        value = self._decoded[key] = _decode_section(self._blob, *entry)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self._index}
+
+    def __repr__(self) -> str:
+        return f"PackedReadingResult({list(self._index)!r}, {len(self._blob)} bytes)"
+
+
+def load_reading_result(
+    packed: bytes | None, text: str | dict | None, sections: Iterable[str] | None = None
+) -> dict | None:
+    """Stored reading result from either column, packed first.
+
+    Args:
+        packed: ``reading_result_packed`` value (codec blob) or None.
+        text: Legacy ``reading_result`` value (JSON text, or a dict from JSONB).
+        sections: Only these top-level sections (all when None).
+
+    Returns:
+        The result dict, or None when neither column holds a readable result.
+    """
+    if packed is not None:
+        try:
+            return decode_reading_result(packed, sections)
+        except ReadingCodecError:
+            return None
+    if isinstance(text, str):
+        try:
+            text = json.loads(text)
+        except ValueError:
+            return None
+    if not isinstance(text, dict):
+        return None
+    if sections is None:
+        return text
+    return {key: text[key] for key in sections if key in text}
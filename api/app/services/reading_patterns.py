@@ -0,0 +1,361 @@
+"""Reading pattern index — detected patterns of stored readings as rows.
+
+Patterns found by the framework (number repetitions, master numbers, animal
+repetitions) are copied out of the stored reading result into
+``oracle_reading_patterns`` when a reading is stored, and for older readings
+by the backfill job. Analytics and "readings like this one" then use index
+scans on the side table instead of parsing every stored JSON blob.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date, datetime, timezone
+
+from fastapi import Depends
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.orm.oracle_reading import OracleReading
+from app.orm.oracle_reading_pattern import OracleReadingPattern
+from app.services.reading_codec import load_reading_result
+
+logger = logging.getLogger(__name__)
+
+# Pattern type -> key holding the repeated value in the framework output
+PATTERN_VALUE_KEYS: dict[str, str] = {
+    "number_repetition": "number",
+    "master_number": "number",
+    "animal_repetition": "animal",
+}
+STRENGTHS = ("low", "medium", "high", "very_high")
+BACKFILL_BATCH_SIZE = 500
+
+
+def extract_patterns(reading_result: dict | str | None) -> list[dict]:
+    """Pattern rows of one stored reading result.
+
+    Accepts the framework shape (``{"patterns": {"detected": [...]}}``), a
+    bare ``patterns`` list, or the JSON text of either. Unknown pattern types
+    and malformed entries are skipped; duplicates keep the first occurrence.
+
+    Returns:
+        List of dicts with pattern_type, value, occurrences, strength.
+    """
+    if isinstance(reading_result, str):
+        try:
+            reading_result = json.loads(reading_result)
+        except ValueError:
+            return []
+    if not isinstance(reading_result, dict):
+        return []
+
+    patterns = reading_result.get("patterns")
+    detected = patterns.get("detected") if isinstance(patterns, dict) else patterns
+    if not isinstance(detected, list):
+        return []
+
+    rows: dict[tuple[str, str], dict] = {}
+    for pattern in detected:
+        if not isinstance(pattern, dict):
+            continue
+        pattern_type = pattern.get("type")
+        value = pattern.get(PATTERN_VALUE_KEYS.get(pattern_type, ""))
+        if value is None or value == "":
+            continue
+        occurrences = pattern.get("occurrences")
+        strength = pattern.get("strength")
+        rows.setdefault(
+            (pattern_type, str(value)),
+            {
+                "pattern_type": pattern_type,
+                "value": str(value)[:40],
+                "occurrences": occurrences if isinstance(occurrences, int) else None,
+                "strength": strength if strength in STRENGTHS else "medium",
+            },
+        )
+    return list(rows.values())
+
+
+def _as_date(created_at: datetime | date | str | None) -> date:
+    if isinstance(created_at, datetime):
+        return created_at.date()
+    if isinstance(created_at, date):
+        return created_at
+    if isinstance(created_at, str):
+        try:
+            return datetime.fromisoformat(created_at).date()
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc).date()
+
+
+class ReadingPatternService:
+    """Maintain and query the oracle_reading_patterns side table."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Writes ──
+
+    def index_reading(
+        self,
+        reading: OracleReading,
+        reading_result: dict | str | None = None,
+        reading_date: date | None = None,
+        replace: bool = True,
+    ) -> int:
+        """Write the pattern rows of one reading; returns the number written.
+
+        Args:
+            reading: Flushed OracleReading row (needs its id).
+            reading_result: Parsed result, to skip decoding the stored JSON.
+            reading_date: Defaults to the reading's created_at date.
+            replace: Delete existing rows first (False for a new reading).
+        """
+        if reading_result is None:
+            reading_result = load_reading_result(
+                reading.reading_result_packed, reading.reading_result, ("patterns",)
+            )
+        if replace:
+            self._delete(OracleReadingPattern.reading_id == reading.id)
+        return self._add(
+            reading.id,
+            reading.user_id if reading.user_id is not None else reading.primary_user_id,
+            reading_date or _as_date(reading.created_at),
+            extract_patterns(reading_result),
+        )
+
+    def remove_reading(self, reading_id: int) -> None:
+        """Drop a reading's rows (soft delete takes it out of analytics)."""
+        self._delete(OracleReadingPattern.reading_id == reading_id)
+
+    def backfill(
+        self,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        after_id: int = 0,
+        max_batches: int | None = None,
+    ) -> dict:
+        """Index stored readings in id order, committing one batch at a time.
+
+        Re-indexing replaces a reading's rows, so the job is safe to re-run;
+        pass the returned ``last_id`` as ``after_id`` to resume.
+        """
+        readings = patterns = batches = 0
+        last_id = after_id
+        while max_batches is None or batches < max_batches:
+            rows = (
+                self.db.query(
+                    OracleReading.id,
+                    OracleReading.user_id,
+                    OracleReading.primary_user_id,
+                    OracleReading.created_at,
+                    OracleReading.reading_result_packed,
+                    OracleReading.reading_result,
+                )
+                .filter(
+                    OracleReading.id > last_id,
+                    OracleReading.deleted_at.is_(None),
+                    or_(
+                        OracleReading.reading_result_packed.isnot(None),
+                        OracleReading.reading_result.isnot(None),
+                    ),
+                )
+                .order_by(OracleReading.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            ids = [row.id for row in rows]
+            self._delete(OracleReadingPattern.reading_id.in_(ids))
+            for row in rows:
+                patterns += self._add(
+                    row.id,
+                    row.user_id if row.user_id is not None else row.primary_user_id,
+                    _as_date(row.created_at),
+                    extract_patterns(
+                        load_reading_result(
+                            row.reading_result_packed, row.reading_result, ("patterns",)
+                        )
+                    ),
+                )
+            self.db.commit()
+
+            readings += len(rows)
+            batches += 1
+            last_id = ids[-1]
+            logger.info("Pattern backfill: %d readings indexed (last id %d)", readings, last_id)
+
+        return {
+            "readings": readings,
+            "patterns": patterns,
+            "batches": batches,
+            "last_id": last_id,
+        }
+
+    def _add(self, reading_id: int, user_id: int | None, reading_date: date, rows: list) -> int:
+        self.db.add_all(
+            OracleReadingPattern(
+                reading_id=reading_id, user_id=user_id, reading_date=reading_date, **row
+            )
+            for row in rows
+        )
+        return len(rows)
+
+    def _delete(self, criterion) -> None:
+        self.db.query(OracleReadingPattern).filter(criterion).delete(synchronize_session=False)
+
+    # ── Queries ──
+
+    def get_reading_patterns(self, reading_id: int) -> list[dict]:
+        """Patterns of one reading.
+
+        Readings not indexed yet (before the backfill) fall back to decoding
+        the stored result.
+        """
+        rows = (
+            self.db.query(OracleReadingPattern)
+            .filter(OracleReadingPattern.reading_id == reading_id)
+            .order_by(OracleReadingPattern.id)
+            .all()
+        )
+        if not rows:
+            row = (
+                self.db.query(OracleReading.reading_result_packed, OracleReading.reading_result)
+                .filter(OracleReading.id == reading_id)
+                .first()
+            )
+            if row is None:
+                return []
+            return extract_patterns(
+                load_reading_result(row.reading_result_packed, row.reading_result, ("patterns",))
+            )
+        return [
+            {
+                "pattern_type": row.pattern_type,
+                "value": row.value,
+                "occurrences": row.occurrences,
+                "strength": row.strength,
+            }
+            for row in rows
+        ]
+
+    def similar_readings(
+        self, reading_id: int, limit: int = 10, patterns: list[dict] | None = None
+    ) -> list[dict]:
+        """Readings sharing the most patterns with ``reading_id``.
+
+        Ties go to the most recent reading. ``patterns`` defaults to
+        get_reading_patterns(reading_id).
+        """
+        if patterns is None:
+            patterns = self.get_reading_patterns(reading_id)
+        own = {(p["pattern_type"], p["value"]) for p in patterns}
+        if not own:
+            return []
+
+        shared = func.count(OracleReadingPattern.id).label("shared")
+        latest = func.max(OracleReadingPattern.reading_date).label("reading_date")
+        rows = (
+            self.db.query(
+                OracleReadingPattern.reading_id,
+                func.max(OracleReadingPattern.user_id).label("user_id"),
+                shared,
+                latest,
+            )
+            .filter(
+                or_(
+                    *(
+                        and_(
+                            OracleReadingPattern.pattern_type == pattern_type,
+                            OracleReadingPattern.value == value,
+                        )
+                        for pattern_type, value in own
+                    )
+                ),
+                OracleReadingPattern.reading_id != reading_id,
+            )
+            .group_by(OracleReadingPattern.reading_id)
+            .order_by(shared.desc(), latest.desc(), OracleReadingPattern.reading_id.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
+                "reading_id": row.reading_id,
+                "user_id": row.user_id,
+                "shared_patterns": row.shared,
+                "reading_date": row.reading_date,
+            }
+            for row in rows
+        ]
+
+    def pattern_stats(
+        self,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        pattern_type: str | None = None,
+        limit: int = 20,
+    ) -> dict:
+        """Pattern frequencies over a date range: totals, per type, top values."""
+        filters = []
+        if date_from:
+            filters.append(OracleReadingPattern.reading_date >= date_from)
+        if date_to:
+            filters.append(OracleReadingPattern.reading_date <= date_to)
+        if pattern_type:
+            filters.append(OracleReadingPattern.pattern_type == pattern_type)
+
+        by_type = dict(
+            self.db.query(OracleReadingPattern.pattern_type, func.count(OracleReadingPattern.id))
+            .filter(*filters)
+            .group_by(OracleReadingPattern.pattern_type)
+            .all()
+        )
+        readings = (
+            self.db.query(func.count(func.distinct(OracleReadingPattern.reading_id)))
+            .filter(*filters)
+            .scalar()
+            or 0
+        )
+
+        count = func.count(OracleReadingPattern.id).label("readings")
+        top = (
+            self.db.query(
+                OracleReadingPattern.pattern_type,
+                OracleReadingPattern.value,
+                count,
+                func.count(func.distinct(OracleReadingPattern.user_id)).label("users"),
+                func.max(OracleReadingPattern.reading_date).label("last_seen"),
+            )
+            .filter(*filters)
+            .group_by(OracleReadingPattern.pattern_type, OracleReadingPattern.value)
+            .order_by(count.desc(), OracleReadingPattern.pattern_type, OracleReadingPattern.value)
+            .limit(limit)
+            .all()
+        )
+
+        return {
+            "total_patterns": sum(by_type.values()),
+            "readings_with_patterns": readings,
+            "by_type": by_type,
+            "top": [
+                {
+                    "pattern_type": row.pattern_type,
+                    "value": row.value,
+                    "readings": row.readings,
+                    "users": row.users,
+                    "last_seen": row.last_seen,
+                }
+                for row in top
+            ],
+        }
+
+
+def get_reading_pattern_service(db: Session = Depends(get_db)) -> ReadingPatternService:
+    """FastAPI dependency — returns ReadingPatternService instance."""
+    return ReadingPatternService(db)
@@ -0,0 +1,67 @@
+"""Tests for the best-moments streaming endpoint."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+
+def _moment(local_time: str, confidence: int, strength: int) -> dict:
+    return {
+        "local_time": local_time,
+        "fc60": "LU-OX-OXWA ☀TI-HOWU-RAWU",
+        "confidence": confidence,
+        "signal_strength": strength,
+        "hour_animal": "Tiger",
+        "minute_animal": "Rat",
+    }
+
+
+def _events():
+    first = _moment("2026-02-09T04:00:00", 80, 20)
+    second = _moment("2026-02-09T04:25:00", 85, 24)
+    yield {"event": "candidate", "moment": first}
+    yield {"event": "candidate", "moment": second}
+    yield {"event": "result", "moments": [second, first]}
+
+
+class TestBestMomentsStream:
+    @pytest.mark.anyio
+    async def test_streams_ndjson(self, client):
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.stream_best_moments",
+            return_value=_events(),
+        ) as mock_stream:
+            resp = await client.get(
+                "/api/oracle/best-moments",
+                params={"user_id": 1, "days": 2, "k": 2},
+            )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["event"] for line in lines] == ["candidate", "candidate", "result"]
+        assert lines[-1]["moments"][0]["confidence"] == 85
+        mock_stream.assert_called_once_with(1, None, 2, 2, 1, "pythagorean")
+
+    @pytest.mark.anyio
+    async def test_unknown_user_422(self, client):
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.stream_best_moments",
+            side_effect=ValueError("Oracle user 999 not found"),
+        ):
+            resp = await client.get("/api/oracle/best-moments", params={"user_id": 999})
+        assert resp.status_code == 422
+
+    @pytest.mark.anyio
+    async def test_window_limits(self, client):
+        resp = await client.get("/api/oracle/best-moments", params={"user_id": 1, "days": 60})
+        assert resp.status_code == 422
+
+    @pytest.mark.anyio
+    async def test_readonly_scope_allowed(self, readonly_client):
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.stream_best_moments",
+            return_value=_events(),
+        ):
+            resp = await readonly_client.get("/api/oracle/best-moments", params={"user_id": 1})
+        assert resp.status_code == 200
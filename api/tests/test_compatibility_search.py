@@ -0,0 +1,178 @@
+"""Tests for the compatible-profile search (oracle_users compat_* features)."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.orm.oracle_user import OracleUser
+from app.services.compatibility_search import (
+    CompatibilitySearchService,
+    features_for_birthday,
+    refresh_compatibility_features,
+)
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+from tests.conftest import TestSession
+
+
+def _add_users(db, count: int, owner: str | None = None, build: bool = True) -> list[int]:
+    """Insert users with spread-out birthdays; returns their ids."""
+    ids = []
+    for i in range(count):
+        user = OracleUser(
+            name=f"Person {chr(65 + i % 26)}{chr(65 + i // 26)}",
+            birthday=date(1950, 1, 1) + timedelta(days=211 * i + 13 * (i % 7)),
+            mother_name="Mother",
+            created_by=owner,
+        )
+        if build:
+            refresh_compatibility_features(user)
+        db.add(user)
+        db.flush()
+        ids.append(user.id)
+    db.commit()
+    return ids
+
+
+def _brute_force(db, target, limit: int, exclude: int | None = None) -> list[tuple]:
+    """(user_id, overall_score) of the best matches, scoring every user."""
+    target_reading = MultiUserAnalyzer.features_reading(target)
+    scored = []
+    for user in db.query(OracleUser).filter(OracleUser.deleted_at.is_(None)).all():
+        if user.id == exclude:
+            continue
+        other = features_for_birthday(user.birthday, user.id)
+        result = MultiUserAnalyzer.calculate_pairwise(
+            target_reading, MultiUserAnalyzer.features_reading(other)
+        )
+        scored.append((user.id, result.overall_score))
+    scored.sort(key=lambda s: (-s[1], s[0]))
+    return scored[:limit]
+
+
+# ─── Features ────────────────────────────────────────────────────────────────
+
+
+def test_features_for_birthday():
+    features = features_for_birthday(date(1990, 7, 15), user_id=3)
+    assert (features.user_id, features.life_path) == (3, 5)
+    assert (features.element, features.animal) == ("Metal", "Horse")
+    assert features.moon_phase in MultiUserAnalyzer.PHASE_ORDER
+    assert features_for_birthday("1990-07-15", 3) == features
+
+
+# ─── Search ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("limit", [1, 5, 25])
+def test_search_matches_brute_force(limit):
+    db = TestSession()
+    try:
+        _add_users(db, 80)
+        target = features_for_birthday(date(1985, 3, 21))
+        result = CompatibilitySearchService(db).search(target, limit=limit)
+        got = [(m["user_id"], m["overall_score"]) for m in result["matches"]]
+        assert got == _brute_force(db, target, limit)
+        assert result["candidates"] == limit
+        assert result["buckets"] <= 80
+    finally:
+        db.close()
+
+
+def test_search_scope_and_exclusion():
+    db = TestSession()
+    try:
+        mine = _add_users(db, 10, owner="owner-a")
+        _add_users(db, 10, owner="owner-b")
+        svc = CompatibilitySearchService(db)
+        target = features_for_birthday(date(1970, 1, 1))
+
+        result = svc.search(target, limit=50, owner_id="owner-a", exclude_user_id=mine[0])
+        assert sorted(m["user_id"] for m in result["matches"]) == mine[1:]
+    finally:
+        db.close()
+
+
+def test_search_builds_missing_features():
+    db = TestSession()
+    try:
+        ids = _add_users(db, 5, build=False)
+        result = CompatibilitySearchService(db).search(
+            features_for_birthday(date(2000, 1, 1)), limit=5
+        )
+        assert sorted(m["user_id"] for m in result["matches"]) == ids
+        assert db.query(OracleUser).filter(OracleUser.compat_life_path.is_(None)).count() == 0
+    finally:
+        db.close()
+
+
+def test_backfill():
+    db = TestSession()
+    try:
+        _add_users(db, 7, build=False)
+        svc = CompatibilitySearchService(db)
+        assert svc.backfill(batch_size=3) == {"users": 7, "batches": 3, "last_id": 7}
+        assert svc.backfill()["users"] == 0
+        user = db.query(OracleUser).first()
+        assert user.compat_life_path == features_for_birthday(user.birthday).life_path
+    finally:
+        db.close()
+
+
+# ─── Endpoints ───────────────────────────────────────────────────────────────
+
+_USER = {"name": "Alice Smith", "birthday": "1990-07-15", "mother_name": "Mary"}
+
+
+@pytest.mark.anyio
+async def test_features_maintained_on_create_and_update(client):
+    resp = await client.post("/api/oracle/users", json=_USER)
+    user_id = resp.json()["id"]
+    db = TestSession()
+    try:
+        row = db.get(OracleUser, user_id)
+        assert (row.compat_life_path, row.compat_animal) == (5, "Horse")
+    finally:
+        db.close()
+
+    await client.put(f"/api/oracle/users/{user_id}", json={"birthday": "1991-07-15"})
+    db = TestSession()
+    try:
+        row = db.get(OracleUser, user_id)
+        expected = features_for_birthday(date(1991, 7, 15))
+        assert (row.compat_life_path, row.compat_animal) == (expected.life_path, "Goat")
+        assert row.compat_moon_phase == expected.moon_phase
+    finally:
+        db.close()
+
+
+@pytest.mark.anyio
+async def test_compatible_endpoints(client):
+    db = TestSession()
+    try:
+        ids = _add_users(db, 30)
+    finally:
+        db.close()
+
+    resp = await client.get(f"/api/oracle/users/{ids[0]}/compatible", params={"limit": 5})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["matches"]) == 5
+    assert ids[0] not in [m["user_id"] for m in data["matches"]]
+    scores = [m["overall_score"] for m in data["matches"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["matches"][0]["pattern_score"] == 0.5
+
+    resp = await client.post(
+        "/api/oracle/users/compatible", json={"birthday": "1985-03-21", "limit": 3}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["features"] == {
+        "life_path": features_for_birthday(date(1985, 3, 21)).life_path,
+        "element": "Wood",
+        "animal": "Ox",
+        "moon_phase": features_for_birthday(date(1985, 3, 21)).moon_phase,
+    }
+    assert len(resp.json()["matches"]) == 3
+
+    resp = await client.get("/api/oracle/users/9999/compatible")
+    assert resp.status_code == 404
@@ -106,6 +106,29 @@ async def test_detailed_health_admin(client):
     assert "nginx" in services
 
 
+@pytest.mark.anyio
+async def test_detailed_health_ai_cache(client, monkeypatch):
+    from engines import ai_client
+
+    monkeypatch.setenv("NPS_AI_CACHE_BACKEND", "memory")
+    ai_client.reset_availability()
+    try:
+        cache = ai_client._get_cache()
+        cache.set_local("key", "response", 60)
+        cache.get_local("key")
+        cache.get_shared("other")
+
+        resp = await client.get("/api/health/detailed")
+        ai_cache = resp.json()["services"]["ai_cache"]
+        assert ai_cache["status"] == "healthy"
+        assert ai_cache["backend"] == "memory"
+        assert (ai_cache["local_hits"], ai_cache["misses"]) == (1, 1)
+        assert ai_cache["hit_ratio"] == 0.5
+        assert ai_cache["entries"] == 1
+    finally:
+        ai_client.reset_availability()
+
+
 @pytest.mark.anyio
 async def test_detailed_health_forbidden_readonly(readonly_client):
     resp = await readonly_client.get("/api/health/detailed")
@@ -156,6 +156,21 @@ class TestNameReadingEndpoint:
             assert "confidence" in data
             assert data["confidence"]["score"] == 72
 
+    @pytest.mark.anyio
+    async def test_name_reading_worker_pool_busy(self, client):
+        from app.services.oracle_reading import WorkerPoolError
+
+        with patch(
+            "app.services.oracle_reading.OracleReadingService.get_name_reading_v2",
+            new_callable=MagicMock,
+            side_effect=WorkerPoolError("Framework worker pool is busy"),
+        ):
+            resp = await client.post(
+                "/api/oracle/name",
+                json={"name": "Alice"},
+            )
+            assert resp.status_code == 503
+
 
 # ─── Question Reading Tests ──────────────────────────────────────────────────
 
@@ -0,0 +1,53 @@
+"""Tests for the persisted static numerology on oracle_users (numerology_static)."""
+
+import json
+from datetime import date
+
+import pytest
+
+from app.orm.oracle_user import OracleUser
+from app.services import oracle_reading
+from app.services.oracle_reading import OracleReadingService, build_static_profiles
+
+_STATIC = build_static_profiles("Alice Smith", 15, 7, 1990, "Mary")
+
+
+def _user(numerology_static=None) -> OracleUser:
+    return OracleUser(
+        id=1,
+        name="Alice Smith",
+        birthday=date(1990, 7, 15),
+        mother_name="Mary",
+        numerology_static=numerology_static,
+    )
+
+
+@pytest.fixture
+def builds(monkeypatch) -> list:
+    """Record calls to build_static_profiles made by the service."""
+    calls = []
+
+    def record(*args):
+        calls.append(args)
+        return build_static_profiles(*args)
+
+    monkeypatch.setattr(oracle_reading, "build_static_profiles", record)
+    return calls
+
+
+@pytest.mark.parametrize("stored", [_STATIC, json.dumps(_STATIC)], ids=["jsonb_dict", "text"])
+def test_stored_profile_reused(stored, builds):
+    user = _user(stored)
+    profile = OracleReadingService(None)._build_user_profile(user)
+    assert profile.numerology_static == _STATIC
+    assert builds == []
+    assert user.numerology_static is stored
+
+
+@pytest.mark.parametrize("stored", [None, "", "{not json", "[]"])
+def test_missing_or_unreadable_profile_rebuilt(stored, builds):
+    user = _user(stored)
+    profile = OracleReadingService(None)._build_user_profile(user)
+    assert profile.numerology_static == _STATIC
+    assert len(builds) == 1
+    assert json.loads(user.numerology_static) == _STATIC
@@ -0,0 +1,195 @@
+"""Tests for the packed reading-result codec and its storage path."""
+
+import json
+
+import pytest
+
+from app.config import settings
+from app.orm.oracle_reading import OracleReading
+from app.services.oracle_reading import OracleReadingService
+from app.services.reading_codec import (
+    MAGIC,
+    PackedReadingResult,
+    ReadingCodecError,
+    decode_reading_result,
+    encode_reading_result,
+    is_packed,
+    load_reading_result,
+    read_section,
+)
+from tests.conftest import TestSession
+
+RESULT = {
+    "numerology": {"life_path": {"number": 11, "title": "Visionary"}, "expression": 7},
+    "confidence": {"score": 80, "level": "high"},
+    "patterns": {"detected": [{"type": "master_number", "number": 11}], "count": 1},
+    "custom_section": ["kept", "by", "name"],
+    "ai_interpretation": "سلام",
+    "empty": None,
+    "synthesis": "Your path is lit by the moon. " * 60,
+}
+
+
+# ─── Codec ───────────────────────────────────────────────────────────────────
+
+
+def test_round_trip():
+    blob = encode_reading_result(RESULT)
+    assert is_packed(blob)
+    assert blob[:2] == MAGIC
+    assert decode_reading_result(blob) == RESULT
+    assert list(decode_reading_result(blob)) == list(RESULT)
+
+
+def test_packed_is_smaller_than_json():
+    blob = encode_reading_result(RESULT)
+    assert len(blob) < len(json.dumps(RESULT).encode()) / 2
+
+
+def test_partial_decode_skips_other_sections():
+    blob = bytearray(encode_reading_result(RESULT))
+    # Corrupt the last (compressed) payload's checksum; other sections still decode
+    blob[-1] ^= 0xFF
+    assert read_section(blob, "confidence") == {"score": 80, "level": "high"}
+    assert decode_reading_result(blob, ["confidence", "missing"]) == {
+        "confidence": RESULT["confidence"]
+    }
+    assert read_section(blob, "missing", default=0) == 0
+    with pytest.raises(ReadingCodecError):
+        read_section(blob, "synthesis")
+
+
+def test_lazy_view():
+    view = PackedReadingResult(encode_reading_result(RESULT))
+    assert len(view) == len(RESULT)
+    assert "confidence" in view and "nope" not in view
+    assert view["confidence"]["score"] == 80
+    assert view.get("nope") is None
+    assert view.to_dict() == RESULT
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [b"", b"{}", MAGIC, MAGIC + b"\x02\x01\x00\x00", MAGIC + b"\x01\x09\x00\x00"],
+)
+def test_rejects_bad_headers(blob):
+    with pytest.raises(ReadingCodecError):
+        decode_reading_result(blob)
+
+
+def test_rejects_truncated_payload():
+    with pytest.raises(ReadingCodecError):
+        decode_reading_result(encode_reading_result(RESULT)[:-1])
+
+
+def test_load_reading_result_prefers_packed_and_reads_legacy_json():
+    blob = encode_reading_result({"confidence": {"score": 1}})
+    assert load_reading_result(blob, json.dumps({"confidence": {"score": 2}})) == {
+        "confidence": {"score": 1}
+    }
+    assert load_reading_result(None, json.dumps(RESULT), ["confidence"]) == {
+        "confidence": RESULT["confidence"]
+    }
+    assert load_reading_result(None, RESULT) is RESULT
+    assert load_reading_result(None, "not json") is None
+    assert load_reading_result(b"\xa7Rbad", None) is None
+    assert load_reading_result(None, None) is None
+
+
+# ─── Storage ─────────────────────────────────────────────────────────────────
+
+
+def test_store_reading_writes_packed_column(monkeypatch):
+    monkeypatch.setattr(settings, "reading_result_format", "packed")
+    db = TestSession()
+    try:
+        svc = OracleReadingService(db)
+        reading = svc.store_reading(
+            user_id=None,
+            sign_type="time",
+            sign_value="12:00:00",
+            question=None,
+            reading_result=RESULT,
+            ai_interpretation=None,
+        )
+        db.commit()
+        row = db.query(OracleReading).filter(OracleReading.id == reading.id).one()
+        assert row.reading_result is None
+        assert is_packed(row.reading_result_packed)
+        assert row.confidence_score == 80
+        assert svc.get_reading_by_id(reading.id)["reading_result"] == RESULT
+        assert svc.get_dashboard_stats()["average_confidence"] == 80
+    finally:
+        db.close()
+
+
+def test_store_reading_defaults_to_json():
+    assert settings.reading_result_format == "json"
+    db = TestSession()
+    try:
+        reading = OracleReadingService(db).store_reading(
+            user_id=None,
+            sign_type="time",
+            sign_value="12:00:00",
+            question=None,
+            reading_result=RESULT,
+            ai_interpretation=None,
+        )
+        db.commit()
+        assert reading.reading_result_packed is None
+        assert json.loads(reading.reading_result) == RESULT
+        assert reading.confidence_score == 80
+    finally:
+        db.close()
+
+
+def test_dashboard_confidence_covers_both_formats(monkeypatch):
+    db = TestSession()
+    try:
+        svc = OracleReadingService(db)
+        for fmt, score in (("json", 70), ("packed", 90)):
+            monkeypatch.setattr(settings, "reading_result_format", fmt)
+            svc.store_reading(
+                None, "time", "12:00:00", None, dict(RESULT, confidence={"score": score}), None
+            )
+        db.commit()
+        assert svc.get_dashboard_stats()["average_confidence"] == 80
+    finally:
+        db.close()
+
+
+def test_convert_stored_results_round_trip():
+    db = TestSession()
+    try:
+        for score in (60, 70, 90):
+            db.add(
+                OracleReading(
+                    question="",
+                    sign_type="time",
+                    sign_value="12:00:00",
+                    reading_result=json.dumps(dict(RESULT, confidence={"score": score})),
+                )
+            )
+        db.add(OracleReading(question="", sign_type="time", sign_value="x", reading_result="{"))
+        db.commit()
+        svc = OracleReadingService(db)
+
+        packed = svc.convert_stored_results("packed", batch_size=2)
+        assert packed["converted"] == 3
+        assert packed["skipped"] == 1
+        assert packed["batches"] == 2
+        assert packed["bytes_after"] < packed["bytes_before"]
+        assert svc.convert_stored_results("packed")["converted"] == 0
+        rows = db.query(OracleReading).order_by(OracleReading.id).all()
+        assert [row.confidence_score for row in rows] == [60, 70, 90, None]
+        assert svc.get_dashboard_stats()["average_confidence"] == pytest.approx(220 / 3)
+
+        assert svc.convert_stored_results("json")["converted"] == 3
+        rows = db.query(OracleReading).order_by(OracleReading.id).all()
+        assert all(row.reading_result_packed is None for row in rows)
+        assert json.loads(rows[0].reading_result)["confidence"] == {"score": 60}
+
+        with pytest.raises(ValueError):
+            svc.convert_stored_results("msgpack")
+    finally:
+        db.close()
@@ -0,0 +1,260 @@
+"""Tests for the reading pattern index (oracle_reading_patterns)."""
+
+import json
+
+import pytest
+
+from app.orm.oracle_reading import OracleReading
+from app.orm.oracle_reading_pattern import OracleReadingPattern
+from app.services.oracle_reading import OracleReadingService
+from app.services.reading_patterns import ReadingPatternService, extract_patterns
+from tests.conftest import TestSession
+
+SEVEN_AND_OX = {
+    "patterns": {
+        "detected": [
+            {"type": "number_repetition", "number": 7, "occurrences": 2, "strength": "medium"},
+            {
+                "type": "animal_repetition",
+                "animal": "Ox",
+                "occurrences": 3,
+                "strength": "very_high",
+            },
+        ],
+        "count": 2,
+    }
+}
+MASTER_11 = {
+    "patterns": {
+        "detected": [{"type": "master_number", "number": 11, "strength": "very_high"}],
+        "count": 1,
+    }
+}
+
+
+def _create_reading(db, reading_result: dict | None) -> int:
+    """Insert a reading row directly (not indexed) and return its id."""
+    reading = OracleReading(
+        question="",
+        sign_type="time",
+        sign_value="12:00:00",
+        reading_result=json.dumps(reading_result) if reading_result else None,
+    )
+    db.add(reading)
+    db.commit()
+    db.refresh(reading)
+    return reading.id
+
+
+def _pattern_rows(db, reading_id: int) -> list[tuple]:
+    rows = (
+        db.query(OracleReadingPattern)
+        .filter(OracleReadingPattern.reading_id == reading_id)
+        .order_by(OracleReadingPattern.id)
+        .all()
+    )
+    return [(r.pattern_type, r.value, r.occurrences, r.strength) for r in rows]
+
+
+# ─── Extraction ──────────────────────────────────────────────────────────────
+
+
+def test_extract_framework_patterns():
+    assert extract_patterns(SEVEN_AND_OX) == [
+        {"pattern_type": "number_repetition", "value": "7", "occurrences": 2, "strength": "medium"},
+        {
+            "pattern_type": "animal_repetition",
+            "value": "Ox",
+            "occurrences": 3,
+            "strength": "very_high",
+        },
+    ]
+
+
+def test_extract_accepts_json_text_and_bare_list():
+    assert extract_patterns(json.dumps(MASTER_11)) == extract_patterns(MASTER_11)
+    assert extract_patterns({"patterns": MASTER_11["patterns"]["detected"]}) == extract_patterns(
+        MASTER_11
+    )
+
+
+def test_extract_skips_malformed():
+    assert extract_patterns(None) == []
+    assert extract_patterns("not json") == []
+    assert extract_patterns({"patterns": None}) == []
+    result = {
+        "patterns": {
+            "detected": [
+                "bad",
+                {"type": "unknown", "number": 3},
+                {"type": "number_repetition"},
+                {"type": "number_repetition", "number": 4, "strength": "huge"},
+                {"type": "number_repetition", "number": 4, "strength": "high"},
+            ]
+        }
+    }
+    assert extract_patterns(result) == [
+        {
+            "pattern_type": "number_repetition",
+            "value": "4",
+            "occurrences": None,
+            "strength": "medium",
+        }
+    ]
+
+
+# ─── Writes ──────────────────────────────────────────────────────────────────
+
+
+def test_store_reading_indexes_patterns():
+    db = TestSession()
+    try:
+        svc = OracleReadingService(db)
+        reading = svc.store_reading(
+            user_id=None,
+            sign_type="time",
+            sign_value="12:00:00",
+            question=None,
+            reading_result=SEVEN_AND_OX,
+            ai_interpretation=None,
+        )
+        db.commit()
+        assert _pattern_rows(db, reading.id) == [
+            ("number_repetition", "7", 2, "medium"),
+            ("animal_repetition", "Ox", 3, "very_high"),
+        ]
+
+        assert svc.soft_delete_reading(reading.id)
+        db.commit()
+        assert _pattern_rows(db, reading.id) == []
+    finally:
+        db.close()
+
+
+def test_backfill_is_resumable_and_idempotent():
+    db = TestSession()
+    try:
+        first = _create_reading(db, SEVEN_AND_OX)
+        _create_reading(db, None)
+        third = _create_reading(db, MASTER_11)
+        svc = ReadingPatternService(db)
+
+        result = svc.backfill(batch_size=1, max_batches=1)
+        assert result == {"readings": 1, "patterns": 2, "batches": 1, "last_id": first}
+
+        result = svc.backfill(batch_size=1, after_id=result["last_id"])
+        assert result["readings"] == 1
+        assert result["last_id"] == third
+
+        svc.backfill()
+        assert len(_pattern_rows(db, first)) == 2
+        assert _pattern_rows(db, third) == [("master_number", "11", None, "very_high")]
+    finally:
+        db.close()
+
+
+# ─── Queries ─────────────────────────────────────────────────────────────────
+
+
+def test_similar_readings_ranked_by_shared_patterns():
+    db = TestSession()
+    try:
+        source = _create_reading(db, SEVEN_AND_OX)
+        both = _create_reading(db, SEVEN_AND_OX)
+        one = _create_reading(
+            db, {"patterns": {"detected": [SEVEN_AND_OX["patterns"]["detected"][0]]}}
+        )
+        _create_reading(db, MASTER_11)
+        svc = ReadingPatternService(db)
+        svc.backfill()
+
+        similar = svc.similar_readings(source)
+        assert [(s["reading_id"], s["shared_patterns"]) for s in similar] == [(both, 2), (one, 1)]
+    finally:
+        db.close()
+
+
+def test_similar_readings_before_backfill_uses_stored_result():
+    db = TestSession()
+    try:
+        other = _create_reading(db, MASTER_11)
+        ReadingPatternService(db).backfill()
+        source = _create_reading(db, MASTER_11)
+
+        svc = ReadingPatternService(db)
+        assert svc.get_reading_patterns(source)[0]["value"] == "11"
+        assert [s["reading_id"] for s in svc.similar_readings(source)] == [other]
+    finally:
+        db.close()
+
+
+def test_pattern_stats():
+    db = TestSession()
+    try:
+        _create_reading(db, SEVEN_AND_OX)
+        _create_reading(db, SEVEN_AND_OX)
+        _create_reading(db, MASTER_11)
+        svc = ReadingPatternService(db)
+        svc.backfill()
+
+        stats = svc.pattern_stats()
+        assert stats["total_patterns"] == 5
+        assert stats["readings_with_patterns"] == 3
+        assert stats["by_type"] == {
+            "number_repetition": 2,
+            "animal_repetition": 2,
+            "master_number": 1,
+        }
+        assert [(t["pattern_type"], t["value"], t["readings"]) for t in stats["top"]] == [
+            ("animal_repetition", "Ox", 2),
+            ("number_repetition", "7", 2),
+            ("master_number", "11", 1),
+        ]
+        assert svc.pattern_stats(pattern_type="master_number")["total_patterns"] == 1
+    finally:
+        db.close()
+
+
+# ─── Endpoints ───────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_similar_readings_endpoint(client):
+    db = TestSession()
+    try:
+        source = _create_reading(db, SEVEN_AND_OX)
+        match = _create_reading(db, SEVEN_AND_OX)
+        ReadingPatternService(db).backfill()
+    finally:
+        db.close()
+
+    resp = await client.get(f"/api/oracle/readings/{source}/similar")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["reading_id"] == source
+    assert len(data["patterns"]) == 2
+    assert data["similar"][0]["reading_id"] == match
+    assert data["similar"][0]["shared_patterns"] == 2
+
+    resp = await client.get("/api/oracle/readings/99999/similar")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_admin_pattern_endpoints(client):
+    db = TestSession()
+    try:
+        _create_reading(db, SEVEN_AND_OX)
+        _create_reading(db, MASTER_11)
+    finally:
+        db.close()
+
+    resp = await client.post("/api/admin/patterns/backfill?batch_size=1")
+    assert resp.status_code == 200
+    assert resp.json()["readings"] == 2
+
+    resp = await client.get("/api/admin/patterns")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_patterns"] == 3
+    assert data["by_type"]["master_number"] == 1
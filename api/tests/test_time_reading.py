@@ -216,3 +216,31 @@ class TestTimeReadingEndpoint:
             data = resp.json()
             assert "created_at" in data
             assert data["created_at"] != ""
+
+    @pytest.mark.anyio
+    async def test_sections_sent_to_requesting_user(self, client):
+        """Interpretation sections are forwarded to the caller's WebSocket."""
+
+        async def create(**kwargs):
+            await kwargs["progress_callback"](1, 4, "Generating reading...", "time")
+            await kwargs["section_callback"]("header", "READING FOR TEST", "time")
+            return _mock_framework_result()
+
+        with (
+            patch(
+                "app.services.oracle_reading.OracleReadingService.create_framework_reading",
+                new_callable=AsyncMock,
+                side_effect=create,
+            ),
+            patch("app.routers.oracle.ws_manager.send_to_user", new_callable=AsyncMock) as send,
+        ):
+            resp = await client.post(
+                "/api/oracle/readings",
+                json={"user_id": 1, "sign_value": "14:30:00"},
+            )
+            assert resp.status_code == 200
+            send.assert_awaited_once_with(
+                "test-user-id",
+                "reading_section",
+                {"reading_type": "time", "section": "header", "content": "READING FOR TEST"},
+            )
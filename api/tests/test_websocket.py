@@ -221,6 +221,13 @@ class TestEventModels:
         assert event.step == "calculating"
         assert event.progress == 50
 
+    def test_reading_section_event(self):
+        from app.models.events import EVENT_TYPES, ReadingSectionEvent
+
+        event = ReadingSectionEvent(reading_type="time", section="message", content="Move.")
+        assert event.section == "message"
+        assert EVENT_TYPES["READING_SECTION"] == "reading_section"
+
     def test_reading_complete_event(self):
         from app.models.events import ReadingCompleteEvent
 
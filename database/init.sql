@@ -407,3 +407,28 @@ CREATE INDEX IF NOT EXISTS idx_oracle_daily_readings_result_gin
 
 CREATE INDEX IF NOT EXISTS idx_oracle_readings_numerology_system
     ON oracle_readings(numerology_system);
+
+-- ─── Oracle Reading Patterns (side index of detected patterns, migration 024) ───
+
+CREATE TABLE IF NOT EXISTS oracle_reading_patterns (
+    id BIGSERIAL PRIMARY KEY,
+    reading_id BIGINT NOT NULL REFERENCES oracle_readings(id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES oracle_users(id) ON DELETE SET NULL,
+    pattern_type VARCHAR(30) NOT NULL,
+    value VARCHAR(40) NOT NULL,
+    occurrences SMALLINT,
+    strength VARCHAR(20) NOT NULL,
+    reading_date DATE NOT NULL,
+    CONSTRAINT oracle_reading_patterns_unique UNIQUE (reading_id, pattern_type, value),
+    CONSTRAINT oracle_reading_patterns_strength_check
+        CHECK (strength IN ('low', 'medium', 'high', 'very_high'))
+);
+
+COMMENT ON TABLE oracle_reading_patterns IS 'Patterns detected in each oracle reading, one row per pattern';
+
+CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_type_value
+    ON oracle_reading_patterns(pattern_type, value, reading_date DESC);
+CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_user_date
+    ON oracle_reading_patterns(user_id, reading_date DESC);
+CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_date
+    ON oracle_reading_patterns(reading_date DESC);
@@ -0,0 +1,16 @@
+-- Migration 022: Persisted static numerology
+-- Date: 2026-10-17
+-- Description: Store the date-independent numerology profile per user so
+--              readings skip recomputing life path / expression / soul urge.
+--              Shape: {system: {"fingerprint": str, "profile": {...}}}.
+--              NULL means not yet built; the API rebuilds it on next use.
+
+BEGIN;
+
+ALTER TABLE oracle_users
+  ADD COLUMN IF NOT EXISTS numerology_static JSONB;
+
+COMMENT ON COLUMN oracle_users.numerology_static IS
+  'Cached static numerology per system; cleared when name, birthday or mother_name change';
+
+COMMIT;
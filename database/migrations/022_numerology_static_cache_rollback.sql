@@ -0,0 +1,7 @@
+-- Rollback migration 022: Persisted static numerology
+
+BEGIN;
+
+ALTER TABLE oracle_users DROP COLUMN IF EXISTS numerology_static;
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- Migration 023: Birth compatibility features on oracle_users
+-- Date: 2026-10-17
+-- Description: Life path, birth-year element/animal and birth-moon phase per
+--              user, maintained by the API on create/update. The bucket
+--              index lets the compatible-profile search group users by
+--              identical features and score each group once.
+--              NULL means not yet built; run scripts/build_compatibility_features.py
+--              after applying (searches also build missing rows on demand).
+
+BEGIN;
+
+ALTER TABLE oracle_users
+  ADD COLUMN IF NOT EXISTS compat_life_path SMALLINT,
+  ADD COLUMN IF NOT EXISTS compat_element VARCHAR(10),
+  ADD COLUMN IF NOT EXISTS compat_animal VARCHAR(10),
+  ADD COLUMN IF NOT EXISTS compat_moon_phase VARCHAR(20);
+
+CREATE INDEX IF NOT EXISTS idx_oracle_users_compat_bucket
+  ON oracle_users(compat_life_path, compat_element, compat_animal, compat_moon_phase)
+  WHERE deleted_at IS NULL;
+
+COMMENT ON COLUMN oracle_users.compat_life_path IS
+  'Birth compatibility features (with compat_element/animal/moon_phase); rebuilt when birthday changes';
+
+COMMIT;
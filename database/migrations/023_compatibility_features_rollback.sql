@@ -0,0 +1,13 @@
+-- Rollback migration 023: Birth compatibility features on oracle_users
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_oracle_users_compat_bucket;
+
+ALTER TABLE oracle_users
+  DROP COLUMN IF EXISTS compat_moon_phase,
+  DROP COLUMN IF EXISTS compat_animal,
+  DROP COLUMN IF EXISTS compat_element,
+  DROP COLUMN IF EXISTS compat_life_path;
+
+COMMIT;
@@ -0,0 +1,56 @@
+-- Migration 024: Reading pattern index — normalized side table for detected patterns
+-- Depends on: Migration 010 (oracle schema)
+--
+-- Patterns found by MasterOrchestrator._detect_patterns (number repetitions,
+-- master numbers, animal repetitions) otherwise live only inside the
+-- oracle_readings.reading_result JSON. One row per (reading, pattern) lets
+-- admin analytics and "readings like this one" use index scans.
+--
+-- New readings are indexed on write by the API. Existing readings are
+-- indexed by the batch job (resumable, safe to re-run):
+--     python3 scripts/backfill_reading_patterns.py
+
+DO $$
+BEGIN
+    -- Guard: skip if already applied
+    IF EXISTS (SELECT 1 FROM schema_migrations WHERE version = '024') THEN
+        RAISE NOTICE 'Migration 024 already applied, skipping.';
+        RETURN;
+    END IF;
+
+    CREATE TABLE IF NOT EXISTS oracle_reading_patterns (
+        id BIGSERIAL PRIMARY KEY,
+        reading_id BIGINT NOT NULL REFERENCES oracle_readings(id) ON DELETE CASCADE,
+        user_id INTEGER REFERENCES oracle_users(id) ON DELETE SET NULL,
+        pattern_type VARCHAR(30) NOT NULL,
+        -- value: the repeated number ("7", "11") or animal name ("Ox")
+        value VARCHAR(40) NOT NULL,
+        occurrences SMALLINT,
+        strength VARCHAR(20) NOT NULL,
+        reading_date DATE NOT NULL,
+        CONSTRAINT oracle_reading_patterns_unique UNIQUE (reading_id, pattern_type, value),
+        CONSTRAINT oracle_reading_patterns_strength_check
+            CHECK (strength IN ('low', 'medium', 'high', 'very_high'))
+    );
+
+    -- "readings like this one" and per-pattern analytics over a date range
+    CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_type_value
+        ON oracle_reading_patterns(pattern_type, value, reading_date DESC);
+    -- per-user pattern history
+    CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_user_date
+        ON oracle_reading_patterns(user_id, reading_date DESC);
+    -- date-windowed aggregates across all patterns
+    CREATE INDEX IF NOT EXISTS idx_oracle_reading_patterns_date
+        ON oracle_reading_patterns(reading_date DESC);
+
+    COMMENT ON TABLE oracle_reading_patterns IS 'Patterns detected in each oracle reading, one row per pattern';
+    COMMENT ON COLUMN oracle_reading_patterns.pattern_type IS 'number_repetition, master_number, or animal_repetition';
+    COMMENT ON COLUMN oracle_reading_patterns.value IS 'Repeated number or animal name, as text';
+    COMMENT ON COLUMN oracle_reading_patterns.reading_date IS 'Date the reading was created (copied for index-only range scans)';
+
+    -- Record migration
+    INSERT INTO schema_migrations (version, name)
+    VALUES ('024', 'Reading pattern index: oracle_reading_patterns');
+
+    RAISE NOTICE 'Migration 024 applied successfully.';
+END $$;
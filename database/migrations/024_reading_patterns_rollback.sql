@@ -0,0 +1,20 @@
+-- Rollback Migration 024: Reading pattern index
+-- Idempotent: safe to run if migration was never applied
+-- The source data stays in oracle_readings.reading_result; re-running 024 and
+-- the backfill job rebuilds the table.
+
+DO $$
+BEGIN
+    -- Guard: skip if not applied
+    IF NOT EXISTS (SELECT 1 FROM schema_migrations WHERE version = '024') THEN
+        RAISE NOTICE 'Migration 024 not applied, nothing to rollback.';
+        RETURN;
+    END IF;
+
+    DROP TABLE IF EXISTS oracle_reading_patterns CASCADE;
+
+    -- Remove migration record
+    DELETE FROM schema_migrations WHERE version = '024';
+
+    RAISE NOTICE 'Migration 024 rolled back successfully.';
+END $$;
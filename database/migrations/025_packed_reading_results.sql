@@ -0,0 +1,51 @@
+-- Migration 025: Packed reading results and a stored confidence score
+-- Depends on: Migration 010 (oracle schema)
+--
+-- reading_result_packed holds an optional compact form of reading_result
+-- (sectioned, per-section zlib-compressed JSON; see
+-- api/app/services/reading_codec.py). The API writes it only when
+-- READING_RESULT_FORMAT=packed; the default stays reading_result JSONB.
+-- Packed rows leave reading_result NULL, so idx_oracle_readings_result_gin
+-- and JSONB queries do not cover them. Readers take whichever column is set.
+-- Convert existing rows with the batch job (resumable, safe to re-run):
+--     python3 scripts/pack_reading_results.py
+-- Before rolling back, restore the JSON column with:
+--     python3 scripts/pack_reading_results.py --unpack
+--
+-- confidence_score copies reading_result.confidence.score at write time so
+-- dashboard and analytics averages stay SQL aggregates in either format.
+
+DO $$
+BEGIN
+    -- Guard: skip if already applied
+    IF EXISTS (SELECT 1 FROM schema_migrations WHERE version = '025') THEN
+        RAISE NOTICE 'Migration 025 already applied, skipping.';
+        RETURN;
+    END IF;
+
+    ALTER TABLE oracle_readings ADD COLUMN IF NOT EXISTS reading_result_packed BYTEA;
+
+    -- Packed blobs are already compressed; skip TOAST's pglz pass on them
+    ALTER TABLE oracle_readings ALTER COLUMN reading_result_packed SET STORAGE EXTERNAL;
+
+    ALTER TABLE oracle_readings ADD COLUMN IF NOT EXISTS confidence_score DOUBLE PRECISION;
+
+    -- Backfill from JSON rows; confidence is either {"score": n} or a bare number
+    UPDATE oracle_readings
+    SET confidence_score = CASE jsonb_typeof(reading_result->'confidence')
+            WHEN 'number' THEN (reading_result->>'confidence')::double precision
+            ELSE (reading_result->'confidence'->>'score')::double precision
+        END
+    WHERE confidence_score IS NULL
+      AND (jsonb_typeof(reading_result->'confidence') = 'number'
+           OR jsonb_typeof(reading_result->'confidence'->'score') = 'number');
+
+    COMMENT ON COLUMN oracle_readings.reading_result_packed IS 'Packed reading result (codec v1); NULL for rows stored as reading_result JSONB';
+    COMMENT ON COLUMN oracle_readings.confidence_score IS 'reading_result confidence score, copied at write time for SQL aggregates';
+
+    -- Record migration
+    INSERT INTO schema_migrations (version, name)
+    VALUES ('025', 'Packed reading results and oracle_readings.confidence_score');
+
+    RAISE NOTICE 'Migration 025 applied successfully.';
+END $$;
@@ -0,0 +1,28 @@
+-- Rollback Migration 025: Packed reading results and stored confidence score
+-- Idempotent: safe to run if migration was never applied
+-- Refuses to drop the column while rows still hold only a packed result;
+-- run `python3 scripts/pack_reading_results.py --unpack` first.
+
+DO $$
+BEGIN
+    -- Guard: skip if not applied
+    IF NOT EXISTS (SELECT 1 FROM schema_migrations WHERE version = '025') THEN
+        RAISE NOTICE 'Migration 025 not applied, nothing to rollback.';
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM oracle_readings
+        WHERE reading_result_packed IS NOT NULL AND reading_result IS NULL
+    ) THEN
+        RAISE EXCEPTION 'Packed rows remain; run scripts/pack_reading_results.py --unpack first.';
+    END IF;
+
+    ALTER TABLE oracle_readings DROP COLUMN IF EXISTS reading_result_packed;
+    ALTER TABLE oracle_readings DROP COLUMN IF EXISTS confidence_score;
+
+    -- Remove migration record
+    DELETE FROM schema_migrations WHERE version = '025';
+
+    RAISE NOTICE 'Migration 025 rolled back successfully.';
+END $$;
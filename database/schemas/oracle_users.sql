@@ -24,6 +24,15 @@ CREATE TABLE IF NOT EXISTS oracle_users (
     city VARCHAR(100),
     coordinates POINT,
 
+    -- Cached static numerology per system (Migration 022)
+    numerology_static JSONB,
+
+    -- Birth compatibility features (Migration 023)
+    compat_life_path SMALLINT,
+    compat_element VARCHAR(10),
+    compat_animal VARCHAR(10),
+    compat_moon_phase VARCHAR(20),
+
     -- Metadata
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
@@ -39,12 +48,19 @@ COMMENT ON COLUMN oracle_users.coordinates IS 'PostgreSQL geometric POINT type:
 COMMENT ON COLUMN oracle_users.name_persian IS 'Persian/Farsi name (RTL text, UTF-8)';
 COMMENT ON COLUMN oracle_users.mother_name IS 'Mother name for numerology calculations';
 
+COMMENT ON COLUMN oracle_users.numerology_static IS 'Cached static numerology per system; cleared when name, birthday or mother_name change';
+COMMENT ON COLUMN oracle_users.compat_life_path IS 'Birth compatibility features (with compat_element/animal/moon_phase); rebuilt when birthday changes';
 COMMENT ON COLUMN oracle_users.deleted_at IS 'Soft-delete timestamp; NULL means active';
 
 -- Partial unique index: prevent duplicate name+birthday among active (non-deleted) users
 CREATE UNIQUE INDEX IF NOT EXISTS idx_oracle_users_name_birthday_active
     ON oracle_users(name, birthday) WHERE deleted_at IS NULL;
 
+-- Bucket index for the compatible-profile search
+CREATE INDEX IF NOT EXISTS idx_oracle_users_compat_bucket
+    ON oracle_users(compat_life_path, compat_element, compat_animal, compat_moon_phase)
+    WHERE deleted_at IS NULL;
+
 -- Auto-update updated_at on row modification (requires update_updated_at() from init.sql)
 CREATE TRIGGER oracle_users_updated_at
     BEFORE UPDATE ON oracle_users
@@ -771,6 +771,7 @@ export type EventType =
   | "stats_update"
   | "reading_started"
   | "reading_progress"
+  | "reading_section"
   | "reading_complete"
   | "reading_error"
   | "daily_reading"
@@ -807,6 +808,21 @@ export interface ReadingProgressData {
   user_id: number | null;
 }
 
+export interface ReadingSectionData {
+  reading_type: string;
+  section:
+    | "header"
+    | "universal_address"
+    | "core_identity"
+    | "right_now"
+    | "patterns"
+    | "message"
+    | "advice"
+    | "caution"
+    | "footer";
+  content: string;
+}
+
 export interface ReadingCompleteData {
   reading_id: number;
   sign_type: string;
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""AI Cache Key Benchmark -- prompt-hash keys vs canonical feature keys.
+
+Replays reading traffic through the AI interpreter's cache keying without
+calling the AI, and reports the response-cache hit rate under:
+  - prompt keys: SHA-256 of the full reading prompt (build_reading_prompt)
+  - feature keys: SHA-256 of reading_features() (what ai_interpreter uses)
+
+Each request is a hit when its key was stored within the reading type's
+cache TTL (ai_client._CACHE_TTLS); the cache is otherwise unbounded.
+
+Traffic is a JSONL file with one request per line:
+    {"name": "...", "birthday": "1990-07-15", "at": "2026-02-09T14:30:00",
+     "reading_type": "time", "locale": "en", "question": ""}
+Without --traffic, seeded synthetic traffic is generated (users x days).
+
+Usage:
+    python3 integration/scripts/benchmark_ai_cache_keys.py
+    python3 integration/scripts/benchmark_ai_cache_keys.py --users 500 --days 14
+    python3 integration/scripts/benchmark_ai_cache_keys.py --traffic requests.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "services" / "oracle"))
+
+import oracle_service  # noqa: E402, F401 — sys.path shim for engines.*
+
+FIRST_NAMES = ["Alice", "Hamid", "Mary", "Sara", "John", "Reza", "Lena", "Omid", "Nora", "Ali"]
+LAST_NAMES = ["Johnson", "Rezaei", "Lee", "Ahmadi", "Smith", "Karimi", "Diaz", "Moradi"]
+QUESTIONS = [
+    "Should I take the new job?",
+    "Is this a good week to travel?",
+    "Will my project succeed?",
+    "آیا این تصمیم درست است؟",
+    "What should I focus on today?",
+]
+
+
+# ─── Traffic ────────────────────────────────────────────────────────────────
+
+
+def synthesize_traffic(users: int, days: int, seed: int) -> list[dict]:
+    """Seeded traffic: each user opens the app on ~60% of days."""
+    rng = random.Random(seed)
+    people = [
+        {
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "birthday": (date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 55))).isoformat(),
+            "locale": "fa" if rng.random() < 0.3 else "en",
+        }
+        for _ in range(users)
+    ]
+    start = datetime(2026, 2, 1)
+    traffic = []
+    for day in range(days):
+        for person in people:
+            if rng.random() >= 0.6:
+                continue
+            at = start + timedelta(days=day, minutes=rng.randrange(7 * 60, 23 * 60))
+            question = rng.choice(QUESTIONS) if rng.random() < 0.2 else ""
+            traffic.append(
+                {
+                    **person,
+                    "at": at.isoformat(),
+                    "reading_type": "question" if question else "time",
+                    "question": question,
+                }
+            )
+    traffic.sort(key=lambda r: r["at"])
+    return traffic
+
+
+def load_traffic(path: Path) -> list[dict]:
+    with path.open(encoding="utf-8") as f:
+        traffic = [json.loads(line) for line in f if line.strip()]
+    traffic.sort(key=lambda r: r["at"])
+    return traffic
+
+
+# ─── Keys ───────────────────────────────────────────────────────────────────
+
+
+def request_keys(request: dict) -> tuple[str, str]:
+    """(prompt key, feature key) for one traffic request."""
+    from engines.ai_client import _cache_key
+    from engines.ai_interpreter import _reading_prompts
+    from engines.prompt_templates import get_system_prompt
+    from numerology_ai_framework.synthesis.master_orchestrator import MasterOrchestrator
+    from oracle_service.ai_prompt_builder import build_reading_prompt
+
+    birthday = date.fromisoformat(request["birthday"])
+    at = datetime.fromisoformat(request["at"])
+    reading = MasterOrchestrator.generate_reading(
+        full_name=request["name"],
+        birth_day=birthday.day,
+        birth_month=birthday.month,
+        birth_year=birthday.year,
+        current_date=at,
+        current_hour=at.hour,
+        current_minute=at.minute,
+        current_second=at.second,
+    )
+    reading_type = request.get("reading_type", "time")
+    question = request.get("question", "")
+    locale = request.get("locale", "en")
+
+    prompt = build_reading_prompt(reading, reading_type, question, locale)
+    prompt_key = _cache_key(prompt, get_system_prompt(locale))
+    feature_key = _reading_prompts(reading, reading_type, question, locale)[2]
+    return prompt_key, feature_key
+
+
+def simulate(traffic: list[dict]) -> dict:
+    """Hits per keying scheme, honoring per-reading-type cache TTLs."""
+    from engines.ai_client import _CACHE_TTL, _CACHE_TTLS
+
+    stored: dict[str, dict[str, float]] = {"prompt": {}, "features": {}}
+    hits: Counter = Counter()
+    for request in traffic:
+        now = datetime.fromisoformat(request["at"]).timestamp()
+        ttl = _CACHE_TTLS.get(request.get("reading_type", "time"), _CACHE_TTL)
+        for scheme, key in zip(("prompt", "features"), request_keys(request)):
+            expires = stored[scheme].get(key)
+            if expires is not None and expires > now:
+                hits[scheme] += 1
+            else:
+                stored[scheme][key] = now + ttl
+    return {"requests": len(traffic), "hits": dict(hits)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark AI response cache keying")
+    parser.add_argument("--traffic", type=Path, help="JSONL traffic to replay")
+    parser.add_argument("--users", type=int, default=300, help="Synthetic users")
+    parser.add_argument("--days", type=int, default=7, help="Synthetic days")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.traffic:
+        traffic = load_traffic(args.traffic)
+        source = str(args.traffic)
+    else:
+        traffic = synthesize_traffic(args.users, args.days, args.seed)
+        source = f"synthetic ({args.users} users x {args.days} days, seed {args.seed})"
+
+    result = simulate(traffic)
+    requests = result["requests"]
+    print(f"Traffic: {source}, {requests} requests")
+    print(f"  {'':<16}{'hits':>8}{'hit rate':>10}{'AI calls':>10}")
+    for scheme, label in (("prompt", "prompt keys"), ("features", "feature keys")):
+        hits = result["hits"].get(scheme, 0)
+        rate = hits / requests if requests else 0.0
+        print(f"  {label:<16}{hits:>8}{rate:>10.1%}{requests - hits:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
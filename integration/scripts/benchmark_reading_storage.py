@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Reading Storage Benchmark -- JSON vs packed reading_result storage.
+
+Generates real framework readings, then reports:
+  - stored bytes per reading (JSON text vs packed codec)
+  - encode / full decode / confidence-only decode time per reading
+  - list_readings and get_dashboard_stats latency over N stored rows,
+    once with every row in JSON and once with every row packed
+
+Runs in-process against an in-memory SQLite database; no server needed.
+
+Usage:
+    python3 integration/scripts/benchmark_reading_storage.py
+    python3 integration/scripts/benchmark_reading_storage.py -n 2000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "api"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+NAMES = ["Alice Johnson", "Hamid Rezaei", "Mary Ann Lee", "Sara Ahmadi", "John Smith"]
+
+
+# ─── Readings ───────────────────────────────────────────────────────────────
+
+
+def generate_results(count: int) -> list[dict]:
+    """``count`` distinct full framework readings, JSON-normalized."""
+    from numerology_ai_framework.synthesis.master_orchestrator import MasterOrchestrator
+
+    start = datetime(2024, 1, 1, 9, 0, 0)
+    results = []
+    for i in range(count):
+        moment = start + timedelta(hours=7 * i, minutes=13 * i)
+        reading = MasterOrchestrator.generate_reading(
+            full_name=NAMES[i % len(NAMES)],
+            birth_day=1 + i % 28,
+            birth_month=1 + i % 12,
+            birth_year=1960 + i % 40,
+            current_date=moment,
+            current_hour=moment.hour,
+            current_minute=moment.minute,
+            current_second=0,
+        )
+        results.append(json.loads(json.dumps(reading, default=str)))
+    return results
+
+
+def _per_item_us(func, items: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(items) * 1e6
+
+
+def bench_codec(results: list[dict], repeat: int) -> None:
+    from app.services.reading_codec import (
+        decode_reading_result,
+        encode_reading_result,
+        read_section,
+    )
+
+    texts = [json.dumps(r) for r in results]
+    blobs = [encode_reading_result(r) for r in results]
+    json_bytes = statistics.mean(len(t.encode()) for t in texts)
+    packed_bytes = statistics.mean(len(b) for b in blobs)
+
+    print("Storage per reading")
+    print(f"  JSON text        {json_bytes:10,.0f} bytes")
+    print(f"  packed           {packed_bytes:10,.0f} bytes  ({packed_bytes / json_bytes:.0%})")
+    print()
+    print("Codec time per reading (best of %d)" % repeat)
+    rows = [
+        ("json.dumps", _per_item_us(json.dumps, results, repeat)),
+        ("encode (packed)", _per_item_us(encode_reading_result, results, repeat)),
+        ("json.loads", _per_item_us(json.loads, texts, repeat)),
+        ("decode (packed)", _per_item_us(decode_reading_result, blobs, repeat)),
+        (
+            "confidence: json",
+            _per_item_us(lambda t: json.loads(t).get("confidence"), texts, repeat),
+        ),
+        (
+            "confidence: packed",
+            _per_item_us(lambda b: read_section(b, "confidence"), blobs, repeat),
+        ),
+    ]
+    for label, us in rows:
+        print(f"  {label:<18} {us:10.1f} us")
+    print()
+
+
+# ─── Service latency ────────────────────────────────────────────────────────
+
+
+def _time_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def bench_service(results: list[dict], rows: int, repeat: int) -> None:
+    from sqlalchemy import StaticPool, create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import app.main  # noqa: F401 -- registers every ORM table
+    from app.database import Base
+    from app.orm.oracle_reading import OracleReading
+    from app.services.oracle_reading import OracleReadingService, _confidence_score
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        for i in range(rows):
+            db.add(
+                OracleReading(
+                    question="",
+                    sign_type="time",
+                    sign_value="12:00:00",
+                    reading_result=json.dumps(results[i % len(results)]),
+                    confidence_score=_confidence_score(results[i % len(results)]),
+                )
+            )
+        db.commit()
+        svc = OracleReadingService(db)
+
+        def measure() -> tuple[float, float]:
+            db.expire_all()
+            listing = _time_ms(lambda: svc.list_readings(None, True, 50, 0), repeat)
+            stats = _time_ms(svc.get_dashboard_stats, repeat)
+            return listing, stats
+
+        json_list, json_stats = measure()
+        svc.convert_stored_results("packed")
+        packed_list, packed_stats = measure()
+    finally:
+        db.close()
+
+    print(f"Service latency over {rows} rows (SQLite, median of {repeat})")
+    print(f"  {'':<28}{'JSON':>10}{'packed':>10}")
+    print(f"  {'list_readings (50/page)':<28}{json_list:>8.1f}ms{packed_list:>8.1f}ms")
+    print(f"  {'get_dashboard_stats':<28}{json_stats:>8.1f}ms{packed_stats:>8.1f}ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark reading result storage formats")
+    parser.add_argument("-n", "--rows", type=int, default=1000, help="Stored readings")
+    parser.add_argument("--readings", type=int, default=50, help="Distinct readings generated")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = generate_results(args.readings)
+    bench_codec(results, args.repeat)
+    bench_service(results, args.rows, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,7 @@ class TestDatabaseSchema:
         "oracle_readings",
         "oracle_reading_users",
         "oracle_audit_log",
+        "oracle_reading_patterns",
     ]
 
     def test_all_tables_exist(self, db_engine):
@@ -7,6 +7,31 @@ __version__ = "2.0.0"
 __author__ = "FC60 Project"
 __license__ = "CC0 1.0 Universal"
 
-from .synthesis.master_orchestrator import MasterOrchestrator
+import sys
+from importlib import import_module
 
-__all__ = ["MasterOrchestrator"]
+# Exported name -> defining module, loaded on first attribute access
+# (PEP 562) so `import numerology_ai_framework.core.x` stays light
+_EXPORTS = {
+    "MasterOrchestrator": ".synthesis.master_orchestrator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__: import eagerly
+    for _name in _EXPORTS:
+        __getattr__(_name)
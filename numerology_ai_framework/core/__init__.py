@@ -1,15 +1,34 @@
 """Core tier modules for FC60 Numerology AI Framework."""
 
-from .julian_date_engine import JulianDateEngine
-from .base60_codec import Base60Codec
-from .weekday_calculator import WeekdayCalculator
-from .checksum_validator import ChecksumValidator
-from .fc60_stamp_engine import FC60StampEngine
-
-__all__ = [
-    "JulianDateEngine",
-    "Base60Codec",
-    "WeekdayCalculator",
-    "ChecksumValidator",
-    "FC60StampEngine",
-]
+import sys
+from importlib import import_module
+
+# Exported name -> defining module. Submodules load on first attribute
+# access (PEP 562), so importing one engine does not import the others.
+_EXPORTS = {
+    "JulianDateEngine": ".julian_date_engine",
+    "Base60Codec": ".base60_codec",
+    "WeekdayCalculator": ".weekday_calculator",
+    "ChecksumValidator": ".checksum_validator",
+    "FC60StampEngine": ".fc60_stamp_engine",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__: import eagerly
+    for _name in _EXPORTS:
+        __getattr__(_name)
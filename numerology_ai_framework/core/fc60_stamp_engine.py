@@ -11,12 +11,7 @@ Critical encoding rules:
   - HALF: ☀ if hour < 12, 🌙 if hour >= 12
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 try:
     from .julian_date_engine import JulianDateEngine
@@ -30,6 +25,36 @@ except ImportError:
     from core.checksum_validator import ChecksumValidator
 
 
+# Precomputed token tables for batch encoding (index = value)
+_TOKENS = tuple(Base60Codec.token60(i) for i in range(60))
+_TOKEN_PAIRS = tuple([f"{high}-{low}" for high in _TOKENS for low in _TOKENS])
+
+# Column order of encode_batch() output — identical to encode() key order
+BATCH_COLUMNS = (
+    "fc60",
+    "iso",
+    "tz60",
+    "y60",
+    "y2k",
+    "j60",
+    "mjd60",
+    "rd60",
+    "u60",
+    "chk",
+    "_jdn",
+    "_weekday_index",
+    "_weekday_token",
+    "_weekday_name",
+    "_planet",
+    "_domain",
+    "_half_marker",
+    "_hour_animal",
+    "_minute_token",
+    "_month_animal",
+    "_dom_token",
+)
+
+
 class FC60StampEngine:
     """Complete FC60 Mode A encoding pipeline."""
 
@@ -230,6 +255,208 @@ class FC60StampEngine:
             "_dom_token": dom_token,
         }
 
+    @staticmethod
+    def _fast_base60(n: int) -> str:
+        """Table-driven equivalent of Base60Codec.encode_base60()."""
+        if n < 0:
+            return "NEG-" + FC60StampEngine._fast_base60(-n)
+        if n < 60:
+            return _TOKENS[n]
+        if n < 3600:
+            return _TOKEN_PAIRS[n]
+        # Peel off two base-60 digits at a time (least significant first)
+        parts = []
+        while n >= 3600:
+            n, low = divmod(n, 3600)
+            parts.append(_TOKEN_PAIRS[low])
+        parts.append(_TOKENS[n] if n < 60 else _TOKEN_PAIRS[n])
+        parts.reverse()
+        return "-".join(parts)
+
+    @staticmethod
+    def encode_batch(
+        years: Sequence[int],
+        months: Sequence[int],
+        days: Sequence[int],
+        hours: Optional[Sequence[int]] = None,
+        minutes: Optional[Sequence[int]] = None,
+        seconds: Optional[Sequence[int]] = None,
+        tz_hours: Union[int, Sequence[int]] = 0,
+        tz_minutes: Union[int, Sequence[int]] = 0,
+        has_time: bool = True,
+    ) -> Dict[str, List]:
+        """
+        Encode many moments at once, returning columnar results.
+
+        Row i of every column is byte-for-byte identical to
+        encode(years[i], months[i], days[i], ...)[column]. Date-derived
+        fields (JDN, weekday, y60/j60/mjd60/rd60, CHK base) are computed once
+        per distinct date, timezone fields once per distinct offset, and all
+        base-60 formatting goes through precomputed token tables.
+
+        Args:
+            years, months, days: Equal-length sequences (lists, tuples, array.array)
+            hours, minutes, seconds: Optional sequences (default all zero)
+            tz_hours, tz_minutes: A single offset for the batch, or a sequence
+            has_time: Whether time component is present (whole batch)
+
+        Returns:
+            Dict mapping each encode() key (see BATCH_COLUMNS) to a list
+
+        Raises:
+            ValueError: On length mismatch or any invalid moment (same
+                        messages as encode())
+        """
+        n = len(years)
+
+        def _column(values, name):
+            if values is None:
+                return [0] * n
+            if isinstance(values, int):
+                return [values] * n
+            if len(values) != n:
+                raise ValueError(f"{name} has length {len(values)}, expected {n}")
+            return values
+
+        months = _column(months, "months")
+        days = _column(days, "days")
+        hours = _column(hours, "hours")
+        minutes = _column(minutes, "minutes")
+        seconds = _column(seconds, "seconds")
+        tz_hours = _column(tz_hours, "tz_hours")
+        tz_minutes = _column(tz_minutes, "tz_minutes")
+
+        cols = {key: [] for key in BATCH_COLUMNS}
+        out_fc60 = cols["fc60"].append
+        out_iso = cols["iso"].append
+        out_tz60 = cols["tz60"].append
+        out_u60 = cols["u60"].append
+        out_chk = cols["chk"].append
+        out_half = cols["_half_marker"].append
+        out_hour = cols["_hour_animal"].append
+        out_minute = cols["_minute_token"].append
+        date_cols = [
+            cols[key].append
+            for key in (
+                "y60",
+                "y2k",
+                "j60",
+                "mjd60",
+                "rd60",
+                "_jdn",
+                "_weekday_index",
+                "_weekday_token",
+                "_weekday_name",
+                "_planet",
+                "_domain",
+                "_month_animal",
+                "_dom_token",
+            )
+        ]
+
+        animals = Base60Codec.ANIMALS
+        tokens = _TOKENS
+        b60 = FC60StampEngine._fast_base60
+        date_cache: Dict = {}
+        tz_cache: Dict = {}
+
+        for year, month, day, hour, minute, second, tzh, tzm in zip(
+            years, months, days, hours, minutes, seconds, tz_hours, tz_minutes
+        ):
+            date_key = (year, month, day)
+            entry = date_cache.get(date_key)
+            if entry is None:
+                if not JulianDateEngine.is_valid_date(year, month, day):
+                    raise ValueError(f"Invalid date: {year:04d}-{month:02d}-{day:02d}")
+                jdn = JulianDateEngine.gregorian_to_jdn(year, month, day)
+                wd_idx = WeekdayCalculator.weekday_from_jdn(jdn)
+                wd_token = WeekdayCalculator.WEEKDAY_TOKENS[wd_idx]
+                month_animal = animals[month - 1]
+                dom_token = tokens[day]
+                fields = (
+                    b60(year),
+                    tokens[(year - 2000) % 60],
+                    b60(jdn),
+                    b60(jdn - JulianDateEngine.EPOCH_MJD),
+                    b60(jdn - JulianDateEngine.EPOCH_RD),
+                    jdn,
+                    wd_idx,
+                    wd_token,
+                    WeekdayCalculator.WEEKDAY_NAMES[wd_idx],
+                    WeekdayCalculator.PLANETS[wd_idx],
+                    WeekdayCalculator.DOMAINS[wd_idx],
+                    month_animal,
+                    dom_token,
+                )
+                entry = (
+                    fields,
+                    f"{wd_token}-{month_animal}-{dom_token}",
+                    f"{year:04d}-{month:02d}-{day:02d}",
+                    (jdn - JulianDateEngine.EPOCH_UNIX) * 86400,
+                    (year % 60) + 2 * month + 3 * day + 7 * (jdn % 60),
+                )
+                date_cache[date_key] = entry
+            fields, date_stamp, iso_date, unix_base, chk_base = entry
+
+            if not (0 <= hour <= 23):
+                raise ValueError(f"Hour must be 0-23, got {hour}")
+            if not (0 <= minute <= 59):
+                raise ValueError(f"Minute must be 0-59, got {minute}")
+            if not (0 <= second <= 59):
+                raise ValueError(f"Second must be 0-59, got {second}")
+
+            tz_key = (tzh, tzm)
+            tz_entry = tz_cache.get(tz_key)
+            if tz_entry is None:
+                if not (-12 <= tzh <= 14):
+                    raise ValueError(f"TZ hours must be -12 to +14, got {tzh}")
+                if not (0 <= abs(tzm) <= 59):
+                    raise ValueError(f"TZ minutes must be 0-59, got {tzm}")
+                if tzh == 0 and tzm == 0:
+                    tz_entry = ("Z", "Z", 0)
+                else:
+                    sign = "+" if tzh >= 0 else "-"
+                    tz_entry = (
+                        f"{sign}{tokens[abs(tzh)]}-{tokens[abs(tzm)]}",
+                        f"{sign}{abs(tzh):02d}:{abs(tzm):02d}",
+                        tzh * 3600 + tzm * 60,
+                    )
+                tz_cache[tz_key] = tz_entry
+            tz60, tz_iso, tz_offset = tz_entry
+
+            for append, value in zip(date_cols, fields):
+                append(value)
+
+            if not has_time:
+                out_fc60(date_stamp)
+                out_iso(iso_date)
+                out_tz60("")
+                out_u60(b60(max(0, unix_base)))
+                out_chk(tokens[chk_base % 60])
+                out_half("")
+                out_hour("")
+                out_minute("")
+                continue
+
+            half = "☀" if hour < 12 else "🌙"
+            hour_animal = animals[hour % 12]
+            min_token = tokens[minute]
+
+            out_fc60(
+                f"{date_stamp} {half}{hour_animal}-{min_token}-{tokens[second]}"
+            )
+            out_iso(f"{iso_date}T{hour:02d}:{minute:02d}:{second:02d}{tz_iso}")
+            out_tz60(tz60)
+            out_u60(
+                b60(max(0, unix_base + hour * 3600 + minute * 60 + second - tz_offset))
+            )
+            out_chk(tokens[(chk_base + 4 * hour + 5 * minute + 6 * second) % 60])
+            out_half(half)
+            out_hour(hour_animal)
+            out_minute(min_token)
+
+        return cols
+
     @staticmethod
     def encode_integer(n: int) -> str:
         """Convenience: encode an integer to FC60 base-60 tokens."""
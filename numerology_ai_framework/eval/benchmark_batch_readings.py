@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Batch Reading Benchmark
+=======================
+Daily-job throughput: N synthetic people read at one moment (noon, like
+the daily reading), comparing a generate_reading() loop against
+MasterOrchestrator.generate_readings() in-process and with a process pool.
+Reports readings per minute; the target is 10k/min on one core.
+
+Usage:
+    python3 eval/benchmark_batch_readings.py
+    python3 eval/benchmark_batch_readings.py --people 20000 --processes 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from synthesis.master_orchestrator import MasterOrchestrator
+
+FIRST = ["Alice", "Bob", "Cara", "Dariush", "Elena", "Farid", "Grace", "Hana", "Ivan"]
+LAST = ["Johnson", "Smith", "Diaz", "Rahimi", "Chen", "Novak", "Okafor", "Berg"]
+
+MOMENT = dict(
+    current_date=datetime(2026, 2, 9),
+    current_hour=12,
+    current_minute=0,
+    current_second=0,
+)
+
+
+def build_people(n: int, seed: int = 60):
+    rng = random.Random(seed)
+    return [
+        {
+            "full_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            "birth_day": rng.randint(1, 28),
+            "birth_month": rng.randint(1, 12),
+            "birth_year": rng.randint(1940, 2010),
+            "tz_hours": rng.choice([-5, 0, 1, 3]),
+        }
+        for _ in range(n)
+    ]
+
+
+def per_minute(n: int, seconds: float) -> float:
+    return n / seconds * 60
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--people", type=int, default=10_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    people = build_people(args.people)
+    print("=" * 60)
+    print(f"BATCH READING BENCHMARK ({args.people:,} people)")
+    print("=" * 60)
+
+    MasterOrchestrator.clear_moment_cache()
+    t0 = time.perf_counter()
+    looped = [MasterOrchestrator.generate_reading(**MOMENT, **p) for p in people]
+    loop_s = time.perf_counter() - t0
+    print(f"{'generate_reading loop':>28}: {per_minute(len(people), loop_s):>10,.0f} /min")
+
+    MasterOrchestrator.clear_moment_cache()
+    t0 = time.perf_counter()
+    batch = MasterOrchestrator.generate_readings(people, **MOMENT)
+    batch_s = time.perf_counter() - t0
+    print(f"{'generate_readings':>28}: {per_minute(len(people), batch_s):>10,.0f} /min")
+
+    ok = batch == looped
+    if args.processes > 1:
+        t0 = time.perf_counter()
+        pooled = MasterOrchestrator.generate_readings(
+            people, processes=args.processes, **MOMENT
+        )
+        pool_s = time.perf_counter() - t0
+        label = f"generate_readings ({args.processes} proc)"
+        print(f"{label:>28}: {per_minute(len(people), pool_s):>10,.0f} /min")
+        ok = ok and pooled == looped
+
+    print("-" * 60)
+    print(f"Equivalence check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Best Moments Benchmark
+======================
+Top-k moment search over a window at minute resolution:
+
+    brute force   one full generate_reading() per candidate minute
+    search        MomentSearch.best_moments() (per-day tables, no readings)
+
+The brute force runs over --brute-days (default 1); the search also runs
+over the full --days window. Checks that both return the same top-k.
+
+Usage:
+    python3 eval/benchmark_best_moments.py
+    python3 eval/benchmark_best_moments.py --days 31 --k 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from synthesis.master_orchestrator import MasterOrchestrator
+from synthesis.moment_search import MomentSearch
+
+PERSON = dict(
+    full_name="Alice Johnson",
+    birth_day=15,
+    birth_month=7,
+    birth_year=1990,
+    mother_name="Barbara Johnson",
+    latitude=40.7,
+    longitude=-74.0,
+    actual_bpm=68,
+)
+START = datetime(2026, 2, 9, 8, 0)
+
+
+def brute_force(days: int, k: int):
+    scored = []
+    for i in range(days * 1440):
+        when = START + timedelta(minutes=i)
+        reading = MasterOrchestrator.generate_reading(
+            current_date=when,
+            current_hour=when.hour,
+            current_minute=when.minute,
+            current_second=0,
+            **PERSON,
+        )
+        strength = MomentSearch._signal_strength(reading["reading"]["signals"])
+        scored.append((-reading["confidence"]["score"], -strength, when.isoformat()))
+    scored.sort()
+    return [(-c, -s, t) for c, s, t in scored[:k]]
+
+
+def summary(moments):
+    return [(m["confidence"], m["signal_strength"], m["local_time"]) for m in moments]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--brute-days", type=int, default=1)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"BEST MOMENTS BENCHMARK (k={args.k}, minute resolution)")
+    print("=" * 60)
+
+    t0 = time.perf_counter()
+    expected = brute_force(args.brute_days, args.k)
+    brute_s = time.perf_counter() - t0
+    print(f"{'brute force':>14} {args.brute_days:>3}d: {brute_s * 1000:>10.1f} ms")
+
+    MasterOrchestrator.clear_moment_cache()
+    t0 = time.perf_counter()
+    found = MomentSearch.best_moments(**PERSON, start=START, days=args.brute_days, k=args.k)
+    search_s = time.perf_counter() - t0
+    print(
+        f"{'search':>14} {args.brute_days:>3}d: {search_s * 1000:>10.1f} ms  "
+        f"({brute_s / search_s:.0f}x)"
+    )
+
+    MasterOrchestrator.clear_moment_cache()
+    t0 = time.perf_counter()
+    MomentSearch.best_moments(**PERSON, start=START, days=args.days, k=args.k)
+    window_s = time.perf_counter() - t0
+    print(f"{'search':>14} {args.days:>3}d: {window_s * 1000:>10.1f} ms")
+
+    ok = summary(found) == expected
+    print("-" * 60)
+    print(f"Equivalence check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
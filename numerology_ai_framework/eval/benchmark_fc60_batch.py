@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+FC60 Batch Encoder Benchmark
+============================
+Measures per-stamp cost of FC60StampEngine.encode_batch() against a loop
+over FC60StampEngine.encode() at 1k, 100k and 1M moments, and checks that
+both produce identical output on the benchmarked inputs.
+
+Moments are consecutive minutes starting 2026-01-01T00:00 (+03:30), which
+mirrors the scheduler / "best time" search workload: many moments sharing
+a handful of dates.
+
+Usage:
+    python3 eval/benchmark_fc60_batch.py
+    python3 eval/benchmark_fc60_batch.py --sizes 1000 100000 --scalar-max 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.fc60_stamp_engine import FC60StampEngine
+
+TZ_HOURS = 3
+TZ_MINUTES = 30
+
+
+def build_moments(n: int):
+    """Return columnar int arrays for n consecutive minutes."""
+    cols = [array("i") for _ in range(6)]
+    start = datetime(2026, 1, 1)
+    for i in range(n):
+        dt = start + timedelta(minutes=i)
+        for col, value in zip(
+            cols, (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+        ):
+            col.append(value)
+    return cols
+
+
+def bench_batch(cols) -> float:
+    t0 = time.perf_counter()
+    FC60StampEngine.encode_batch(*cols, tz_hours=TZ_HOURS, tz_minutes=TZ_MINUTES)
+    return time.perf_counter() - t0
+
+
+def bench_scalar(cols) -> float:
+    encode = FC60StampEngine.encode
+    t0 = time.perf_counter()
+    for y, m, d, h, mi, s in zip(*cols):
+        encode(y, m, d, h, mi, s, TZ_HOURS, TZ_MINUTES)
+    return time.perf_counter() - t0
+
+
+def verify(cols, limit: int = 5000) -> bool:
+    """Check the first `limit` rows of the batch against encode()."""
+    head = [col[:limit] for col in cols]
+    batch = FC60StampEngine.encode_batch(*head, tz_hours=TZ_HOURS, tz_minutes=TZ_MINUTES)
+    for i, row in enumerate(zip(*head)):
+        expected = FC60StampEngine.encode(*row, TZ_HOURS, TZ_MINUTES)
+        if any(batch[key][i] != value for key, value in expected.items()):
+            return False
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--scalar-max",
+        type=int,
+        default=1_000_000,
+        help="Skip the encode() loop above this size",
+    )
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("FC60 BATCH ENCODER BENCHMARK")
+    print("=" * 72)
+    print(f"{'moments':>10}  {'encode() µs/stamp':>18}  {'batch µs/stamp':>15}  {'speedup':>8}")
+
+    ok = True
+    for n in args.sizes:
+        cols = build_moments(n)
+        ok = ok and verify(cols)
+        batch_s = bench_batch(cols)
+        batch_us = batch_s / n * 1e6
+        if n <= args.scalar_max:
+            scalar_us = bench_scalar(cols) / n * 1e6
+            print(
+                f"{n:>10,}  {scalar_us:>18.2f}  {batch_us:>15.2f}  "
+                f"{scalar_us / batch_us:>7.1f}x"
+            )
+        else:
+            print(f"{n:>10,}  {'(skipped)':>18}  {batch_us:>15.2f}  {'-':>8}")
+
+    print("-" * 72)
+    print(f"Equivalence check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
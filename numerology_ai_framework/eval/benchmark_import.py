@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Import Benchmark
+================
+Cold-start cost of importing the framework, from `python -X importtime`
+in fresh interpreters (best of --runs). Bytecode goes to a private cache
+that is warmed first, as in a deployed service or a forked worker.
+
+For each entry point prints the total import time, the framework's own
+share (self time of numerology_ai_framework.* modules) and how many
+framework modules were loaded; then the slowest modules of the first
+entry point. Fails if any entry point loads a framework module twice
+(also as a top-level `core.*` / `synthesis.*` module) or if the first
+entry point exceeds --budget-ms.
+
+Usage:
+    python3 eval/benchmark_import.py
+    python3 eval/benchmark_import.py --runs 10 --budget-ms 40
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+PACKAGE = "numerology_ai_framework"
+ENTRY_POINTS = (
+    f"{PACKAGE}.synthesis.master_orchestrator",
+    f"{PACKAGE}.synthesis.moment_search",
+    f"{PACKAGE}.personal.numerology_engine",
+    f"{PACKAGE}.core.fc60_stamp_engine",
+    PACKAGE,
+)
+TIERS = ("core", "personal", "universal", "synthesis")
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_times(module: str, env: dict) -> dict:
+    """{module name: self time in µs} for one fresh `import module`."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in err.splitlines():
+        match = LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(1))
+    return times
+
+
+def measure(module: str, env: dict, runs: int) -> dict:
+    """Best run of `import module` by total time."""
+    subprocess.run([sys.executable, "-c", f"import {module}"], cwd=REPO_ROOT, env=env, check=True)
+    return min((import_times(module, env) for _ in range(runs)), key=lambda t: sum(t.values()))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=40.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(prefix="fc60_pyc_")
+
+    print("=" * 60)
+    print(f"IMPORT BENCHMARK (best of {args.runs}, python {sys.version.split()[0]})")
+    print("=" * 60)
+
+    ok = True
+    results = {}
+    for module in ENTRY_POINTS:
+        times = measure(module, env, args.runs)
+        results[module] = times
+        own = {name: us for name, us in times.items() if name.startswith(PACKAGE)}
+        duplicates = [name for name in times if name.split(".")[0] in TIERS]
+        ok = ok and not duplicates
+        print(
+            f"{module:<54} {sum(times.values()) / 1000:>6.1f} ms total  "
+            f"{sum(own.values()) / 1000:>5.1f} ms framework  {len(own):>2} modules"
+            + (f"  DUPLICATES: {', '.join(duplicates)}" if duplicates else "")
+        )
+
+    first = ENTRY_POINTS[0]
+    print("-" * 60)
+    print(f"Slowest modules for {first}:")
+    for name, us in sorted(results[first].items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {us / 1000:>6.2f} ms  {name}")
+
+    total_ms = sum(results[first].values()) / 1000
+    within = total_ms <= args.budget_ms
+    print("-" * 60)
+    print(f"Budget ({args.budget_ms:.0f} ms for {first}): {'PASS' if within else 'FAIL'}")
+    print(f"No duplicate module loads: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok and within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
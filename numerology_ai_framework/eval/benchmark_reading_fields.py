@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Field-Selective Reading Benchmark
+=================================
+Measures MasterOrchestrator.generate_reading() per-call cost for the full
+reading against two field selections that skip most of the pipeline:
+
+    full              every output key (default)
+    numerology-only   fields={"numerology"}
+    stamp+moon        fields={"fc60_stamp", "moon"}
+
+Each call uses a new minute so the moment cache does not hide the stamp
+and moon work. Also checks that each selection equals the matching keys
+of the full reading.
+
+Usage:
+    python3 eval/benchmark_reading_fields.py
+    python3 eval/benchmark_reading_fields.py --calls 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from synthesis.master_orchestrator import MasterOrchestrator
+
+PERSON = dict(
+    full_name="Alice Johnson",
+    birth_day=15,
+    birth_month=7,
+    birth_year=1990,
+    mother_name="Barbara Johnson",
+    latitude=40.7,
+    longitude=-74.0,
+    actual_bpm=68,
+)
+
+SELECTIONS = [
+    ("full", None),
+    ("numerology-only", {"numerology"}),
+    ("stamp+moon", {"fc60_stamp", "moon"}),
+]
+
+
+def moment(i: int) -> dict:
+    """Distinct minute per call within one day."""
+    return dict(
+        current_date=datetime(2026, 2, 9),
+        current_hour=(i // 60) % 24,
+        current_minute=i % 60,
+        current_second=0,
+    )
+
+
+def bench(fields, calls: int) -> float:
+    MasterOrchestrator.clear_moment_cache()
+    generate = MasterOrchestrator.generate_reading
+    t0 = time.perf_counter()
+    for i in range(calls):
+        generate(fields=fields, **PERSON, **moment(i))
+    return time.perf_counter() - t0
+
+
+def verify() -> bool:
+    full = MasterOrchestrator.generate_reading(**PERSON, **moment(0))
+    for _, fields in SELECTIONS[1:]:
+        partial = MasterOrchestrator.generate_reading(fields=fields, **PERSON, **moment(0))
+        if partial != {key: full[key] for key in fields}:
+            return False
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=1440)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FIELD-SELECTIVE READING BENCHMARK")
+    print("=" * 60)
+    print(f"{'selection':>16}  {'µs/reading':>12}  {'speedup':>8}")
+
+    baseline_us = None
+    for label, fields in SELECTIONS:
+        us = bench(fields, args.calls) / args.calls * 1e6
+        baseline_us = baseline_us or us
+        print(f"{label:>16}  {us:>12.1f}  {baseline_us / us:>7.1f}x")
+
+    ok = verify()
+    print("-" * 60)
+    print(f"Equivalence check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
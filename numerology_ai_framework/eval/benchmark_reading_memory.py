@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Reading Memory Benchmark
+========================
+Per-reading memory (tracemalloc) when holding many readings at one moment,
+as multi-user runs and scheduler batches do:
+
+    dict      generate_readings(...)               plain nested dicts
+    compact   generate_readings(..., compact=True)  slotted records, with
+              stamp/moon/Gānzhī shared by every reading at the moment
+
+Reports total and per-reading bytes for the whole reading and for the
+fixed-shape parts alone (fc60_stamp + moon + ganzhi + numerology), and
+checks that compact readings convert back to the same dicts.
+
+Usage:
+    python3 eval/benchmark_reading_memory.py
+    python3 eval/benchmark_reading_memory.py --people 5000
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from synthesis.master_orchestrator import MasterOrchestrator
+from eval.benchmark_batch_readings import MOMENT, build_people
+
+FIXED_SHAPE = {"fc60_stamp", "moon", "ganzhi", "numerology"}
+
+
+def measure(people, **kwargs):
+    """(readings, bytes still allocated after generating them)."""
+    MasterOrchestrator.clear_moment_cache()
+    # Warm the moment so its shared context is not charged to the readings
+    MasterOrchestrator.generate_readings(people[:1], **MOMENT, **kwargs)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    readings = MasterOrchestrator.generate_readings(people, **MOMENT, **kwargs)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return readings, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--people", type=int, default=2000)
+    args = parser.parse_args()
+    people = build_people(args.people)
+    n = len(people)
+
+    print("=" * 68)
+    print(f"READING MEMORY BENCHMARK ({n:,} readings, one moment)")
+    print("=" * 68)
+    print(f"{'':>22}  {'dict B/reading':>15}  {'compact B/reading':>18}  {'saved':>6}")
+
+    ok = True
+    for label, fields in (("full reading", None), ("fixed-shape parts", FIXED_SHAPE)):
+        plain, plain_bytes = measure(people, fields=fields)
+        compact, compact_bytes = measure(people, fields=fields, compact=True)
+        ok = ok and [r.to_dict() for r in compact] == plain
+        saved = 1 - compact_bytes / plain_bytes
+        print(
+            f"{label:>22}  {plain_bytes / n:>15,.0f}  {compact_bytes / n:>18,.0f}  "
+            f"{saved:>5.0%}"
+        )
+        del plain, compact
+
+    print("-" * 68)
+    print(f"Round-trip check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Translator Benchmark
+====================
+UniverseTranslator.translate() throughput on readings taken from the
+daily job: N synthetic people read at a few moments. The inputs are built
+once up front, so only translate() is timed. Each pass runs twice:
+
+    cold   section cache cleared before the pass
+    warm   same inputs again (repeat views of a reading, retimes)
+
+Usage:
+    python3 eval/benchmark_translator.py
+    python3 eval/benchmark_translator.py --people 5000 --moments 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from synthesis.master_orchestrator import MasterOrchestrator
+from synthesis.universe_translator import UniverseTranslator
+
+FIRST = ["Alice", "Bob", "Cara", "Dariush", "Elena", "Farid", "Grace", "Hana", "Ivan"]
+LAST = ["Johnson", "Smith", "Diaz", "Rahimi", "Chen", "Novak", "Okafor", "Berg"]
+MOTHERS = [None, "Barbara Johnson", "Maryam Rahimi", "Lena Berg"]
+
+
+def build_inputs(people: int, moments: int, seed: int = 60):
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(people):
+        person = {
+            "full_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            "birth_day": rng.randint(1, 28),
+            "birth_month": rng.randint(1, 12),
+            "birth_year": rng.randint(1940, 2010),
+            "mother_name": rng.choice(MOTHERS),
+        }
+        for m in range(moments):
+            when = datetime(2026, 2, 9 + m)
+            full = MasterOrchestrator.generate_reading(
+                **person,
+                current_date=when,
+                current_hour=12,
+                current_minute=0,
+                current_second=0,
+                fields=("reading", "fc60_stamp", "numerology", "confidence"),
+            )
+            inputs.append(
+                dict(
+                    reading=full["reading"],
+                    fc60_stamp=full["fc60_stamp"],
+                    numerology_profile=full["numerology"],
+                    person_name=person["full_name"],
+                    current_date_str=when.strftime("%Y-%m-%d"),
+                    confidence_override=full["confidence"]["score"],
+                )
+            )
+    return inputs
+
+
+def run(inputs):
+    t0 = time.perf_counter()
+    out = [UniverseTranslator.translate(**kw)["full_text"] for kw in inputs]
+    return time.perf_counter() - t0, out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--moments", type=int, default=3)
+    args = parser.parse_args()
+
+    inputs = build_inputs(args.people, args.moments)
+    print("=" * 60)
+    print(f"TRANSLATOR BENCHMARK ({len(inputs):,} readings)")
+    print("=" * 60)
+
+    clear = getattr(UniverseTranslator, "clear_section_cache", None)
+    if clear:
+        clear()
+    cold_s, cold = run(inputs)
+    warm_s, warm = run(inputs)
+    for label, seconds in (("cold", cold_s), ("warm", warm_s)):
+        print(
+            f"{label:>6}: {len(inputs) / seconds:>10,.0f} translations/s  "
+            f"({seconds / len(inputs) * 1e6:.1f} µs each)"
+        )
+    stats = getattr(UniverseTranslator, "section_cache_stats", None)
+    if stats:
+        print(f"cache : {stats()}")
+
+    ok = cold == warm
+    print("-" * 60)
+    print(f"Equivalence check: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
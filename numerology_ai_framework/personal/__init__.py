@@ -1,6 +1,31 @@
 """Personal tier numerology calculations."""
 
-from .numerology_engine import NumerologyEngine
-from .heartbeat_engine import HeartbeatEngine
+import sys
+from importlib import import_module
 
-__all__ = ["NumerologyEngine", "HeartbeatEngine"]
+# Exported name -> defining module. Submodules load on first attribute
+# access (PEP 562), so importing one engine does not import the others.
+_EXPORTS = {
+    "NumerologyEngine": ".numerology_engine",
+    "HeartbeatEngine": ".heartbeat_engine",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__: import eagerly
+    for _name in _EXPORTS:
+        __getattr__(_name)
@@ -7,11 +7,6 @@ Purpose: Estimate heartbeat metrics and encode them in FC60 tokens
 Dependencies: Base60Codec (for token encoding)
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from typing import Dict
 
 try:
@@ -12,14 +12,48 @@ Core Numbers:
 - Personal Year/Month/Day: Current cycle themes
 """
 
-from typing import Dict
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from personal.abjad_table import get_abjad_value
+from .abjad_table import get_abjad_value
+
+# Bounded LRU of static (name/birthdate-derived) profile parts
+_static_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+_static_lock = threading.Lock()
+_static_stats = {"hits": 0, "misses": 0}
+
+# Name kernel: every character maps to one int packing its contribution to
+# all nine sums (system x expression/soul urge/personality, 32 bits each),
+# so one sum() over per-character lookups yields every sum at once.
+NAME_SYSTEMS = ("pythagorean", "chaldean", "abjad")
+NAME_SUMS = ("expression", "soul_urge", "personality")
+_FIELD_BITS = 32
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_FIELD_SHIFTS = tuple(i * _FIELD_BITS for i in range(9))
+# Max per-character field value is 1000 (ghain), so 2**20 characters per
+# partial sum can never carry into the neighbouring field.
+_PACK_CHUNK = 1 << 20
+
+
+class _LetterCodes(dict):
+    """char -> packed contributions, filled on first sight of each char."""
+
+    def __missing__(self, char: str) -> int:
+        code = NumerologyEngine._pack_letter(char)
+        self[char] = code
+        return code
+
+
+_letter_codes = _LetterCodes()
 
 
 class NumerologyEngine:
     """Complete numerology calculator with tri-system support."""
 
+    STATIC_CACHE_SIZE = 4096
+    STATIC_PROFILE_VERSION = 1  # bump when static_profile() output changes
+
     # Pythagorean Letter Values
     PYTHAGOREAN = {
         "A": 1,
@@ -128,62 +162,121 @@ class NumerologyEngine:
         y = NumerologyEngine.digital_root(sum(int(c) for c in str(year)))
         return NumerologyEngine.digital_root(d + m + y)
 
+    @staticmethod
+    def _system_index(system: str) -> int:
+        """Kernel slot for a system name (unknown names use Chaldean)."""
+        if system == "pythagorean":
+            return 0
+        if system == "abjad":
+            return 2
+        return 1
+
+    @staticmethod
+    def _pack_letter(char: str) -> int:
+        """
+        Packed contributions of one character to all nine sums.
+
+        Mirrors the per-system rules exactly: Latin systems look up the
+        uppercased form (which may expand, e.g. "ß" -> "SS"), Abjad uses
+        the character as-is with long-vowel letters as its "vowels".
+        """
+        fields = []
+        upper = char.upper()
+        for table in (NumerologyEngine.PYTHAGOREAN, NumerologyEngine.CHALDEAN):
+            vowels = consonants = 0
+            for c in upper:
+                if c in NumerologyEngine.VOWELS:
+                    vowels += table.get(c, 0)
+                elif c.isalpha():
+                    consonants += table.get(c, 0)
+            fields += [vowels + consonants, vowels, consonants]
+        value = get_abjad_value(char)
+        if char in NumerologyEngine.ABJAD_VOWEL_LETTERS:
+            fields += [value, value, 0]
+        else:
+            fields += [value, 0, value]
+        code = 0
+        for shift, value in zip(_FIELD_SHIFTS, fields):
+            code |= value << shift
+        return code
+
+    @staticmethod
+    def _name_fields(full_name: str) -> List[int]:
+        """All nine raw sums, system-major (see NAME_SYSTEMS, NAME_SUMS)."""
+        lookup = _letter_codes.__getitem__
+        if len(full_name) <= _PACK_CHUNK:
+            packed = sum(map(lookup, full_name))
+            return [(packed >> shift) & _FIELD_MASK for shift in _FIELD_SHIFTS]
+        totals = [0] * 9
+        for start in range(0, len(full_name), _PACK_CHUNK):
+            packed = sum(map(lookup, full_name[start : start + _PACK_CHUNK]))
+            for i, shift in enumerate(_FIELD_SHIFTS):
+                totals[i] += (packed >> shift) & _FIELD_MASK
+        return totals
+
+    @staticmethod
+    def _name_field(full_name: str, index: int) -> int:
+        """One raw sum; short names skip unpacking the other eight."""
+        if len(full_name) <= _PACK_CHUNK:
+            packed = sum(map(_letter_codes.__getitem__, full_name))
+            return (packed >> _FIELD_SHIFTS[index]) & _FIELD_MASK
+        return NumerologyEngine._name_fields(full_name)[index]
+
+    @staticmethod
+    def name_sums(full_name: str) -> Dict[str, Dict[str, int]]:
+        """
+        Raw (unreduced) letter sums for every system in one pass.
+
+        Returns:
+            {system: {"expression", "soul_urge", "personality"}} for
+            pythagorean, chaldean and abjad
+        """
+        fields = NumerologyEngine._name_fields(full_name)
+        return {
+            system: dict(zip(NAME_SUMS, fields[i * 3 : i * 3 + 3]))
+            for i, system in enumerate(NAME_SYSTEMS)
+        }
+
+    @staticmethod
+    def name_sums_bulk(names: Iterable[str]) -> List[Dict[str, Dict[str, int]]]:
+        """name_sums() for each name, in order."""
+        return [NumerologyEngine.name_sums(name) for name in names]
+
+    @staticmethod
+    def name_numbers(full_name: str, system: str = "pythagorean") -> Dict[str, int]:
+        """Reduced expression, soul urge and personality from one pass."""
+        base = NumerologyEngine._system_index(system) * 3
+        fields = NumerologyEngine._name_fields(full_name)
+        root = NumerologyEngine.digital_root
+        return {
+            "expression": root(fields[base]),
+            "soul_urge": root(fields[base + 1]),
+            "personality": root(fields[base + 2]),
+        }
+
     @staticmethod
     def expression_number(full_name: str, system: str = "pythagorean") -> int:
         """Expression from full name. Supports pythagorean, chaldean, abjad."""
-        if system == "abjad":
-            value = sum(get_abjad_value(c) for c in full_name)
-            return NumerologyEngine.digital_root(value) if value > 0 else 0
-        table = (
-            NumerologyEngine.PYTHAGOREAN
-            if system == "pythagorean"
-            else NumerologyEngine.CHALDEAN
+        index = NumerologyEngine._system_index(system) * 3
+        return NumerologyEngine.digital_root(
+            NumerologyEngine._name_field(full_name, index)
         )
-        value = sum(table.get(c, 0) for c in full_name.upper() if c.isalpha())
-        return NumerologyEngine.digital_root(value)
 
     @staticmethod
     def soul_urge(full_name: str, system: str = "pythagorean") -> int:
         """Soul Urge from vowels (or long vowel letters for Abjad)."""
-        if system == "abjad":
-            value = sum(
-                get_abjad_value(c)
-                for c in full_name
-                if c in NumerologyEngine.ABJAD_VOWEL_LETTERS
-            )
-            return NumerologyEngine.digital_root(value) if value > 0 else 0
-        table = (
-            NumerologyEngine.PYTHAGOREAN
-            if system == "pythagorean"
-            else NumerologyEngine.CHALDEAN
-        )
-        value = sum(
-            table.get(c, 0) for c in full_name.upper() if c in NumerologyEngine.VOWELS
+        index = NumerologyEngine._system_index(system) * 3 + 1
+        return NumerologyEngine.digital_root(
+            NumerologyEngine._name_field(full_name, index)
         )
-        return NumerologyEngine.digital_root(value)
 
     @staticmethod
     def personality_number(full_name: str, system: str = "pythagorean") -> int:
         """Personality from consonants (or non-vowel letters for Abjad)."""
-        if system == "abjad":
-            value = sum(
-                get_abjad_value(c)
-                for c in full_name
-                if c not in NumerologyEngine.ABJAD_VOWEL_LETTERS
-                and get_abjad_value(c) > 0
-            )
-            return NumerologyEngine.digital_root(value) if value > 0 else 0
-        table = (
-            NumerologyEngine.PYTHAGOREAN
-            if system == "pythagorean"
-            else NumerologyEngine.CHALDEAN
-        )
-        value = sum(
-            table.get(c, 0)
-            for c in full_name.upper()
-            if c.isalpha() and c not in NumerologyEngine.VOWELS
+        index = NumerologyEngine._system_index(system) * 3 + 2
+        return NumerologyEngine.digital_root(
+            NumerologyEngine._name_field(full_name, index)
         )
-        return NumerologyEngine.digital_root(value)
 
     @staticmethod
     def personal_year(birth_month: int, birth_day: int, current_year: int) -> int:
@@ -228,30 +321,108 @@ class NumerologyEngine:
         return {"gender": gender, "polarity": 0, "label": "Neutral"}
 
     @staticmethod
-    def complete_profile(
+    def static_profile_key(
+        full_name: str,
+        birth_day: int,
+        birth_month: int,
+        birth_year: int,
+        mother_name: str = None,
+        system: str = "pythagorean",
+    ) -> Tuple:
+        """
+        Cache key for the static profile part.
+
+        Names are whitespace-normalized (whitespace never contributes to
+        any system's sums); an empty mother name is kept distinct from None
+        so the "mother_influence" key behaves exactly as before.
+        """
+        mother_key = " ".join(mother_name.split()) if mother_name else None
+        return (
+            " ".join(full_name.split()),
+            mother_key,
+            birth_year,
+            birth_month,
+            birth_day,
+            system,
+        )
+
+    @staticmethod
+    def static_profile_fingerprint(
+        full_name: str,
+        birth_day: int,
+        birth_month: int,
+        birth_year: int,
+        mother_name: str = None,
+        system: str = "pythagorean",
+    ) -> str:
+        """Stable hash of the static profile inputs (for persisted copies)."""
+        key = NumerologyEngine.static_profile_key(
+            full_name, birth_day, birth_month, birth_year, mother_name, system
+        )
+        import hashlib
+
+        raw = repr((NumerologyEngine.STATIC_PROFILE_VERSION,) + key)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def static_profile(
         full_name: str,
         birth_day: int,
         birth_month: int,
         birth_year: int,
-        current_year: int,
-        current_month: int,
-        current_day: int,
         mother_name: str = None,
         system: str = "pythagorean",
-        gender: str = None,
     ) -> Dict:
-        """Generate complete numerology profile."""
-        lp = NumerologyEngine.life_path(birth_day, birth_month, birth_year)
+        """
+        Name- and birthdate-derived part of the profile (LRU-cached).
+
+        Returns:
+            Dict with life_path, expression, soul_urge, personality and,
+            when mother_name is given, mother_influence. Always a fresh copy.
+        """
+        key = NumerologyEngine.static_profile_key(
+            full_name, birth_day, birth_month, birth_year, mother_name, system
+        )
+        with _static_lock:
+            cached = _static_cache.get(key)
+            if cached is not None:
+                _static_cache.move_to_end(key)
+                _static_stats["hits"] += 1
+            else:
+                _static_stats["misses"] += 1
+        if cached is None:
+            lp = NumerologyEngine.life_path(birth_day, birth_month, birth_year)
+            cached = {
+                "life_path": {
+                    "number": lp,
+                    "title": NumerologyEngine.LIFE_PATH_MEANINGS[lp][0],
+                    "message": NumerologyEngine.LIFE_PATH_MEANINGS[lp][1],
+                },
+            }
+            cached.update(NumerologyEngine.name_numbers(full_name, system))
+            if mother_name:
+                cached["mother_influence"] = NumerologyEngine.expression_number(
+                    mother_name, system
+                )
+            with _static_lock:
+                _static_cache[key] = cached
+                while len(_static_cache) > NumerologyEngine.STATIC_CACHE_SIZE:
+                    _static_cache.popitem(last=False)
+
+        static = dict(cached)
+        static["life_path"] = dict(cached["life_path"])
+        return static
 
-        profile = {
-            "life_path": {
-                "number": lp,
-                "title": NumerologyEngine.LIFE_PATH_MEANINGS[lp][0],
-                "message": NumerologyEngine.LIFE_PATH_MEANINGS[lp][1],
-            },
-            "expression": NumerologyEngine.expression_number(full_name, system),
-            "soul_urge": NumerologyEngine.soul_urge(full_name, system),
-            "personality": NumerologyEngine.personality_number(full_name, system),
+    @staticmethod
+    def dynamic_profile(
+        birth_day: int,
+        birth_month: int,
+        current_year: int,
+        current_month: int,
+        current_day: int,
+    ) -> Dict:
+        """Date-dependent part of the profile (personal year/month/day)."""
+        return {
             "personal_year": NumerologyEngine.personal_year(
                 birth_month, birth_day, current_year
             ),
@@ -261,13 +432,74 @@ class NumerologyEngine:
             "personal_day": NumerologyEngine.personal_day(
                 birth_month, birth_day, current_year, current_month, current_day
             ),
-            "gender_polarity": NumerologyEngine._gender_polarity(gender),
         }
 
-        if mother_name:
-            profile["mother_influence"] = NumerologyEngine.expression_number(
-                mother_name, system
+    @staticmethod
+    def static_cache_stats() -> Dict:
+        """Hit/miss counters and current size of the static profile cache."""
+        with _static_lock:
+            hits = _static_stats["hits"]
+            misses = _static_stats["misses"]
+            size = len(_static_cache)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "max_size": NumerologyEngine.STATIC_CACHE_SIZE,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+
+    @staticmethod
+    def clear_static_cache() -> None:
+        """Drop all cached static profiles and reset the counters."""
+        with _static_lock:
+            _static_cache.clear()
+            _static_stats["hits"] = 0
+            _static_stats["misses"] = 0
+
+    @staticmethod
+    def complete_profile(
+        full_name: str,
+        birth_day: int,
+        birth_month: int,
+        birth_year: int,
+        current_year: int,
+        current_month: int,
+        current_day: int,
+        mother_name: str = None,
+        system: str = "pythagorean",
+        gender: str = None,
+        static: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Generate complete numerology profile.
+
+        Args:
+            static: Precomputed static_profile() for these inputs (e.g. a copy
+                    persisted with the user record); skips name analysis.
+        """
+        if static is None:
+            static = NumerologyEngine.static_profile(
+                full_name, birth_day, birth_month, birth_year, mother_name, system
             )
+        dynamic = NumerologyEngine.dynamic_profile(
+            birth_day, birth_month, current_year, current_month, current_day
+        )
+
+        profile = {
+            "life_path": dict(static["life_path"]),
+            "expression": static["expression"],
+            "soul_urge": static["soul_urge"],
+            "personality": static["personality"],
+            "personal_year": dynamic["personal_year"],
+            "personal_month": dynamic["personal_month"],
+            "personal_day": dynamic["personal_day"],
+            "gender_polarity": NumerologyEngine._gender_polarity(gender),
+        }
+
+        if "mother_influence" in static:
+            profile["mother_influence"] = static["mother_influence"]
 
         return profile
 
@@ -1,13 +1,41 @@
 """Synthesis tier - integration and orchestration."""
 
-from .master_orchestrator import MasterOrchestrator
-from .reading_engine import ReadingEngine
-from .universe_translator import UniverseTranslator
-from .signal_combiner import SignalCombiner
-
-__all__ = [
-    "MasterOrchestrator",
-    "ReadingEngine",
-    "UniverseTranslator",
-    "SignalCombiner",
-]
+import sys
+from importlib import import_module
+
+# Exported name -> defining module. Submodules load on first attribute
+# access (PEP 562), so importing one engine does not import the others.
+_EXPORTS = {
+    "MasterOrchestrator": ".master_orchestrator",
+    "MomentContext": ".master_orchestrator",
+    "MomentSearch": ".moment_search",
+    "CompactReading": ".result_types",
+    "FC60Stamp": ".result_types",
+    "MoonInfo": ".result_types",
+    "GanzhiInfo": ".result_types",
+    "NumerologyProfile": ".result_types",
+    "ReadingEngine": ".reading_engine",
+    "UniverseTranslator": ".universe_translator",
+    "Signal": ".signal_combiner",
+    "SignalCombiner": ".signal_combiner",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__: import eagerly
+    for _name in _EXPORTS:
+        __getattr__(_name)
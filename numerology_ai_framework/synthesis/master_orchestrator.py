@@ -11,34 +11,106 @@ Pipeline (10 steps):
 1. Validate inputs + resolve current_date/time
 2. FC60 stamp (Mode A) via FC60StampEngine
 3. Numerology via NumerologyEngine
-4. Moon phase via MoonEngine
+4. Moon phase via MoonEngine (CalendarAlmanac table when built)
 5. Ganzhi (year + day + hour) via GanzhiEngine
 6. Heartbeat via HeartbeatEngine
 7. Location via LocationEngine (if coords given)
 8. Reading via ReadingEngine
 9. Translation via UniverseTranslator
 10. Assemble final dict
+
+generate_reading(fields=...) runs only the steps the requested output
+keys depend on (see PIPELINE_DEPENDENCIES / READING_FIELDS).
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from core.julian_date_engine import JulianDateEngine
-from core.base60_codec import Base60Codec
-from core.weekday_calculator import WeekdayCalculator
-from core.checksum_validator import ChecksumValidator
-from core.fc60_stamp_engine import FC60StampEngine
-from personal.numerology_engine import NumerologyEngine
-from personal.heartbeat_engine import HeartbeatEngine
-from universal.moon_engine import MoonEngine
-from universal.ganzhi_engine import GanzhiEngine
-from universal.location_engine import LocationEngine
-from synthesis.reading_engine import ReadingEngine
-from synthesis.universe_translator import UniverseTranslator
+try:
+    from ..core.julian_date_engine import JulianDateEngine
+    from ..core.base60_codec import Base60Codec
+    from ..core.weekday_calculator import WeekdayCalculator
+    from ..core.checksum_validator import ChecksumValidator
+    from ..core.fc60_stamp_engine import FC60StampEngine
+    from ..personal.numerology_engine import NumerologyEngine
+    from ..personal.heartbeat_engine import HeartbeatEngine
+    from ..universal.ganzhi_engine import GanzhiEngine
+    from ..universal.location_engine import LocationEngine
+    from ..universal.almanac import CalendarAlmanac
+except ImportError:
+    from core.julian_date_engine import JulianDateEngine
+    from core.base60_codec import Base60Codec
+    from core.weekday_calculator import WeekdayCalculator
+    from core.checksum_validator import ChecksumValidator
+    from core.fc60_stamp_engine import FC60StampEngine
+    from personal.numerology_engine import NumerologyEngine
+    from personal.heartbeat_engine import HeartbeatEngine
+    from universal.ganzhi_engine import GanzhiEngine
+    from universal.location_engine import LocationEngine
+    from universal.almanac import CalendarAlmanac
+from .reading_engine import ReadingEngine
+from .universe_translator import UniverseTranslator
+from .result_types import (
+    CompactReading,
+    FC60Stamp,
+    GanzhiInfo,
+    MoonInfo,
+    NumerologyProfile,
+)
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class MomentContext:
+    """
+    Person-independent data for one moment: FC60 stamp, moon, Gānzhī
+    (year/day/hour) and weekday. Shared between readings via the LRU in
+    MasterOrchestrator.moment_context(); callers get copies so cached
+    values are never mutated. Compact readings share immutable records
+    of the stamp, moon and Gānzhī instead (see records()).
+    """
+
+    __slots__ = ("key", "fc60_stamp", "moon", "ganzhi", "weekday", "_records")
+
+    def __init__(
+        self, key: Tuple, fc60_stamp: Dict, moon: Dict, ganzhi: Dict, weekday: Dict
+    ):
+        self.key = key
+        self.fc60_stamp = fc60_stamp
+        self.moon = moon
+        self.ganzhi = ganzhi
+        self.weekday = weekday
+        self._records = None
+
+    def stamp_copy(self) -> Dict:
+        """Fresh copy of the FC60 stamp dict."""
+        return dict(self.fc60_stamp)
+
+    def moon_copy(self) -> Dict:
+        """Fresh copy of the moon info dict."""
+        return dict(self.moon)
+
+    def ganzhi_copy(self) -> Dict:
+        """Fresh copy of the Gānzhī dict (year/day/hour sub-dicts copied)."""
+        return {part: dict(info) for part, info in self.ganzhi.items()}
+
+    def records(self) -> Dict:
+        """
+        {"fc60_stamp": FC60Stamp, "moon": MoonInfo, "ganzhi": GanzhiInfo},
+        built on first use so plain-dict readings never pay for them.
+        """
+        if self._records is None:
+            self._records = {
+                "fc60_stamp": FC60Stamp.from_dict(self.fc60_stamp),
+                "moon": MoonInfo.from_dict(self.moon),
+                "ganzhi": GanzhiInfo.from_dict(self.ganzhi),
+            }
+        return self._records
+
+
+# Bounded LRU of MomentContext objects, shared by all threads in the process
+_moment_cache: "OrderedDict[Tuple, MomentContext]" = OrderedDict()
+_moment_lock = threading.Lock()
+_moment_stats = {"hits": 0, "misses": 0}
 
 
 class MasterOrchestrator:
@@ -48,6 +120,170 @@ class MasterOrchestrator:
     This is the AI's main interface to the framework.
     """
 
+    MOMENT_CACHE_SIZE = 512
+    POOL_MIN_BATCH = 2000  # generate_readings(): smaller batches stay in-process
+
+    # Keys that define the shared moment in generate_readings()
+    MOMENT_KEYS = frozenset(
+        {"current_date", "current_hour", "current_minute", "current_second"}
+    )
+
+    # Pipeline steps -> steps whose results they consume. "moment" is the
+    # shared FC60 stamp + moon + Gānzhī + weekday context (steps 2, 4, 5).
+    PIPELINE_DEPENDENCIES = {
+        "moment": (),
+        "numerology": (),
+        "birth": (),
+        "age": ("moment", "birth"),
+        "heartbeat": ("age",),
+        "location": (),
+        "reading": ("moment", "numerology", "heartbeat", "location"),
+        "confidence": ("moment", "numerology", "heartbeat", "location", "reading"),
+        "patterns": ("moment", "numerology", "reading"),
+        "translation": ("moment", "numerology", "reading", "confidence"),
+    }
+
+    # Output key -> step producing it (in output order)
+    READING_FIELDS = {
+        "person": "age",
+        "birth": "birth",
+        "current": "moment",
+        "numerology": "numerology",
+        "patterns": "patterns",
+        "confidence": "confidence",
+        "synthesis": "translation",
+        "fc60_stamp": "moment",
+        "moon": "moment",
+        "ganzhi": "moment",
+        "heartbeat": "heartbeat",
+        "location": "location",
+        "reading": "reading",
+        "translation": "translation",
+    }
+
+    @staticmethod
+    def pipeline_steps(fields: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        Steps needed to produce the given output keys (all steps if None).
+
+        Raises:
+            ValueError: If a field is not a generate_reading() output key
+        """
+        if fields is None:
+            return set(MasterOrchestrator.PIPELINE_DEPENDENCIES)
+        fields = set(fields)
+        unknown = fields - set(MasterOrchestrator.READING_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown reading field(s): {', '.join(sorted(unknown))}")
+        steps = set()
+        pending = [MasterOrchestrator.READING_FIELDS[f] for f in fields]
+        while pending:
+            step = pending.pop()
+            if step not in steps:
+                steps.add(step)
+                pending.extend(MasterOrchestrator.PIPELINE_DEPENDENCIES[step])
+        return steps
+
+    @staticmethod
+    def moment_context(
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        tz_hours: int = 0,
+        tz_minutes: int = 0,
+        has_time: bool = True,
+    ) -> MomentContext:
+        """
+        Get the (memoized) person-independent context for a moment.
+
+        Keyed by (date, hour, minute, second, tz, has_time); the daily
+        scheduler and multi-user readings pay for the sky once per moment.
+
+        Raises:
+            ValueError: If the moment is invalid (same as FC60StampEngine.encode)
+        """
+        key = (year, month, day, hour, minute, second, tz_hours, tz_minutes, has_time)
+        with _moment_lock:
+            ctx = _moment_cache.get(key)
+            if ctx is not None:
+                _moment_cache.move_to_end(key)
+                _moment_stats["hits"] += 1
+                return ctx
+            _moment_stats["misses"] += 1
+
+        fc60_stamp = FC60StampEngine.encode(
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            tz_hours,
+            tz_minutes,
+            has_time=has_time,
+        )
+        jdn = fc60_stamp["_jdn"]
+
+        ganzhi_data = {
+            "year": GanzhiEngine.full_year_info(year),
+            "day": GanzhiEngine.full_day_info(jdn),
+        }
+        if has_time:
+            ganzhi_data["hour"] = MasterOrchestrator._hour_pillar(
+                hour, ganzhi_data["day"]["stem_index"]
+            )
+
+        ctx = MomentContext(
+            key,
+            fc60_stamp,
+            CalendarAlmanac.full_moon_info(jdn),
+            ganzhi_data,
+            WeekdayCalculator.full_info(jdn),
+        )
+        with _moment_lock:
+            _moment_cache[key] = ctx
+            _moment_cache.move_to_end(key)
+            while len(_moment_cache) > MasterOrchestrator.MOMENT_CACHE_SIZE:
+                _moment_cache.popitem(last=False)
+        return ctx
+
+    @staticmethod
+    def _hour_pillar(hour: int, day_stem_idx: int) -> Dict:
+        """Gānzhī hour pillar for a local hour on a day with the given stem."""
+        stem_idx, branch_idx = GanzhiEngine.hour_ganzhi(hour, day_stem_idx)
+        return {
+            "stem_token": GanzhiEngine.STEMS[stem_idx],
+            "branch_token": GanzhiEngine.ANIMALS[branch_idx],
+            "animal_name": GanzhiEngine.ANIMAL_NAMES[branch_idx],
+        }
+
+    @staticmethod
+    def moment_cache_stats() -> Dict:
+        """Hit/miss counters and current size of the moment cache."""
+        with _moment_lock:
+            hits = _moment_stats["hits"]
+            misses = _moment_stats["misses"]
+            size = len(_moment_cache)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "max_size": MasterOrchestrator.MOMENT_CACHE_SIZE,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+
+    @staticmethod
+    def clear_moment_cache() -> None:
+        """Drop all cached moment contexts and reset the counters."""
+        with _moment_lock:
+            _moment_cache.clear()
+            _moment_stats["hits"] = 0
+            _moment_stats["misses"] = 0
+
     @staticmethod
     def generate_reading(
         full_name: str,
@@ -67,6 +303,9 @@ class MasterOrchestrator:
         tz_minutes: int = 0,
         numerology_system: str = "pythagorean",
         mode: str = "full",
+        numerology_static: Optional[Dict] = None,
+        fields: Optional[Iterable[str]] = None,
+        compact: bool = False,
     ) -> Dict:
         """
         Generate complete numerological reading.
@@ -83,10 +322,26 @@ class MasterOrchestrator:
             tz_hours, tz_minutes: Timezone offset (default UTC)
             numerology_system: 'pythagorean' or 'chaldean'
             mode: 'full' or 'stamp_only'
+            numerology_static: Precomputed NumerologyEngine.static_profile()
+                for this person/system (optional; skips name analysis)
+            fields: Output keys to produce, e.g. {"numerology", "moon",
+                "confidence"} (optional; default is every key). Only the
+                pipeline steps those keys depend on are run, and the
+                values are identical to the full reading's.
+            compact: Return a CompactReading (slotted records, stamp/moon/
+                Gānzhī shared with other readings at this moment) instead
+                of a dict; .to_dict() gives the regular output
 
         Returns:
             Complete reading dictionary with all calculated values
+            (only the requested keys when fields is given)
+
+        Raises:
+            ValueError: Invalid date/time, or an unknown field name
         """
+        wanted = MasterOrchestrator.READING_FIELDS if fields is None else set(fields)
+        steps = MasterOrchestrator.pipeline_steps(fields)
+
         # Step 1: Validate + resolve current date/time
         if current_date is None:
             current_date = datetime.now()
@@ -99,118 +354,126 @@ class MasterOrchestrator:
         second = current_second if current_second is not None else current_date.second
         has_time = current_hour is not None or current_minute is not None
 
-        # Step 2: FC60 stamp (Mode A)
-        fc60_stamp = FC60StampEngine.encode(
-            year,
-            month,
-            day,
-            hour,
-            minute,
-            second,
-            tz_hours,
-            tz_minutes,
-            has_time=has_time,
-        )
+        # Step 2: FC60 stamp (Mode A) — with moon/ganzhi/weekday, shared per moment
+        if "moment" in steps or mode == "stamp_only":
+            moment = MasterOrchestrator.moment_context(
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                tz_hours,
+                tz_minutes,
+                has_time=has_time,
+            )
+            fc60_stamp = moment.stamp_copy()
+            current_jdn = fc60_stamp["_jdn"]
 
         if mode == "stamp_only":
             return {"fc60_stamp": fc60_stamp}
 
         # Step 3: Numerology
-        numerology = NumerologyEngine.complete_profile(
-            full_name=full_name,
-            birth_day=birth_day,
-            birth_month=birth_month,
-            birth_year=birth_year,
-            current_year=year,
-            current_month=month,
-            current_day=day,
-            mother_name=mother_name,
-            system=numerology_system,
-            gender=gender,
-        )
+        numerology = None
+        if "numerology" in steps:
+            numerology = NumerologyEngine.complete_profile(
+                full_name=full_name,
+                birth_day=birth_day,
+                birth_month=birth_month,
+                birth_year=birth_year,
+                current_year=year,
+                current_month=month,
+                current_day=day,
+                mother_name=mother_name,
+                system=numerology_system,
+                gender=gender,
+                static=numerology_static,
+            )
 
-        # Step 4: Moon phase
-        current_jdn = fc60_stamp["_jdn"]
-        moon_data = MoonEngine.full_moon_info(current_jdn)
-
-        # Step 5: Ganzhi (year + day + hour)
-        ganzhi_data = {
-            "year": GanzhiEngine.full_year_info(year),
-            "day": GanzhiEngine.full_day_info(current_jdn),
-        }
-        if has_time:
-            day_stem_idx = ganzhi_data["day"]["stem_index"]
-            stem_idx, branch_idx = GanzhiEngine.hour_ganzhi(hour, day_stem_idx)
-            ganzhi_data["hour"] = {
-                "stem_token": GanzhiEngine.STEMS[stem_idx],
-                "branch_token": GanzhiEngine.ANIMALS[branch_idx],
-                "animal_name": GanzhiEngine.ANIMAL_NAMES[branch_idx],
-            }
+        # Step 4 + 5: Moon phase, Ganzhi (year + day + hour)
+        moon_data = ganzhi_data = None
+        if "moment" in steps:
+            moon_data = moment.moon_copy()
+            ganzhi_data = moment.ganzhi_copy()
 
         # Step 6: Heartbeat
-        birth_jdn = JulianDateEngine.gregorian_to_jdn(
-            birth_year, birth_month, birth_day
-        )
-        age_days = current_jdn - birth_jdn
-        age_years = int(age_days // 365.25)
-        heartbeat_data = HeartbeatEngine.heartbeat_profile(age_years, actual_bpm)
+        if "birth" in steps:
+            birth_jdn = JulianDateEngine.gregorian_to_jdn(
+                birth_year, birth_month, birth_day
+            )
+        if "age" in steps:
+            age_days = current_jdn - birth_jdn
+            age_years = int(age_days // 365.25)
+        heartbeat_data = None
+        if "heartbeat" in steps:
+            heartbeat_data = HeartbeatEngine.heartbeat_profile(age_years, actual_bpm)
 
         # Step 7: Location (if coordinates given)
         location_data = None
-        if latitude is not None and longitude is not None:
+        if "location" in steps and latitude is not None and longitude is not None:
             location_data = LocationEngine.location_signature(latitude, longitude)
 
         # Step 8: Reading
-        reading = ReadingEngine.generate_reading(
-            fc60_stamp=fc60_stamp,
-            numerology_profile=numerology,
-            moon_data=moon_data,
-            ganzhi_data=ganzhi_data,
-            heartbeat_data=heartbeat_data,
-            location_data=location_data,
-        )
+        reading = None
+        if "reading" in steps:
+            reading = ReadingEngine.generate_reading(
+                fc60_stamp=fc60_stamp,
+                numerology_profile=numerology,
+                moon_data=moon_data,
+                ganzhi_data=ganzhi_data,
+                heartbeat_data=heartbeat_data,
+                location_data=location_data,
+            )
 
         # Step 9: Calculate confidence (before translation so we can pass it)
-        confidence_data = MasterOrchestrator._calculate_confidence(
-            numerology,
-            moon_data,
-            ganzhi_data,
-            heartbeat_data,
-            location_data,
-            reading,
-        )
+        confidence_data = None
+        if "confidence" in steps:
+            confidence_data = MasterOrchestrator._calculate_confidence(
+                numerology,
+                moon_data,
+                ganzhi_data,
+                heartbeat_data,
+                location_data,
+                reading,
+            )
 
         # Step 10: Translation (with unified confidence)
-        translation = UniverseTranslator.translate(
-            reading=reading,
-            fc60_stamp=fc60_stamp,
-            numerology_profile=numerology,
-            person_name=full_name,
-            current_date_str=current_date.strftime("%Y-%m-%d"),
-            confidence_override=confidence_data["score"],
-        )
+        translation = None
+        if "translation" in steps:
+            translation = UniverseTranslator.translate(
+                reading=reading,
+                fc60_stamp=fc60_stamp,
+                numerology_profile=numerology,
+                person_name=full_name,
+                current_date_str=current_date.strftime("%Y-%m-%d"),
+                confidence_override=confidence_data["score"],
+            )
 
         # Step 10: Assemble final dict
         # Preserve backward-compatible keys
-        birth_weekday = WeekdayCalculator.full_info(birth_jdn)
-        current_weekday = WeekdayCalculator.full_info(current_jdn)
+        if "moment" in steps:
+            current_weekday = dict(moment.weekday)
 
-        result = {
-            # Backward-compatible keys
-            "person": {
+        result = {}
+        # Backward-compatible keys
+        if "person" in wanted:
+            result["person"] = {
                 "name": full_name,
                 "birthdate": f"{birth_year:04d}-{birth_month:02d}-{birth_day:02d}",
                 "age_years": age_years,
                 "age_days": age_days,
-            },
-            "birth": {
+            }
+        if "birth" in wanted:
+            birth_weekday = WeekdayCalculator.full_info(birth_jdn)
+            result["birth"] = {
                 "jdn": birth_jdn,
                 "jdn_fc60": Base60Codec.encode_base60(birth_jdn),
                 "weekday": birth_weekday["name"],
                 "planet": birth_weekday["planet"],
                 "year_fc60": Base60Codec.encode_base60(birth_year),
-            },
-            "current": {
+            }
+        if "current" in wanted:
+            result["current"] = {
                 "date": current_date.strftime("%Y-%m-%d"),
                 "jdn": current_jdn,
                 "jdn_fc60": fc60_stamp["j60"],
@@ -218,14 +481,212 @@ class MasterOrchestrator:
                 "planet": current_weekday["planet"],
                 "domain": current_weekday["domain"],
                 "year_fc60": fc60_stamp["y60"],
-            },
-            "numerology": numerology,
-            "patterns": MasterOrchestrator._detect_patterns(
+            }
+        if "numerology" in wanted:
+            result["numerology"] = numerology
+        if "patterns" in wanted:
+            result["patterns"] = MasterOrchestrator._detect_patterns(
                 numerology, current_weekday, reading
+            )
+        if "confidence" in wanted:
+            result["confidence"] = confidence_data
+        if "synthesis" in wanted:
+            result["synthesis"] = translation.get("full_text", "")
+        # New keys (v2.0)
+        if "fc60_stamp" in wanted:
+            result["fc60_stamp"] = fc60_stamp
+        if "moon" in wanted:
+            result["moon"] = moon_data
+        if "ganzhi" in wanted:
+            result["ganzhi"] = ganzhi_data
+        if "heartbeat" in wanted:
+            result["heartbeat"] = heartbeat_data
+        if "location" in wanted:
+            result["location"] = location_data
+        if "reading" in wanted:
+            result["reading"] = reading
+        if "translation" in wanted:
+            result["translation"] = translation
+
+        if compact:
+            if "numerology" in result:
+                result["numerology"] = NumerologyProfile.from_dict(numerology)
+            if "moment" in steps:
+                for key, record in moment.records().items():
+                    if key in result:
+                        result[key] = record
+            return CompactReading(**result)
+        return result
+
+    @staticmethod
+    def generate_readings(
+        people: List[Dict],
+        current_date: Optional[datetime] = None,
+        current_hour: Optional[int] = None,
+        current_minute: Optional[int] = None,
+        current_second: Optional[int] = None,
+        tz_hours: int = 0,
+        tz_minutes: int = 0,
+        numerology_system: str = "pythagorean",
+        fields: Optional[Iterable[str]] = None,
+        processes: int = 0,
+        compact: bool = False,
+    ) -> List[Dict]:
+        """
+        Generate readings for many people at one moment.
+
+        The moment is resolved once (current_date defaults to now) and its
+        context is built once per timezone; the per-person work then runs
+        in a tight loop, or across a process pool when processes > 1 and
+        the batch has at least POOL_MIN_BATCH people.
+
+        Args:
+            people: generate_reading() person kwargs per person (full_name,
+                    birth_day/month/year, mother_name, gender, latitude,
+                    longitude, actual_bpm, numerology_static). tz_hours,
+                    tz_minutes and numerology_system may be set per person.
+            processes: Worker processes for large batches (0/1 = in-process)
+            compact: Return CompactReading objects (see generate_reading);
+                     the cheapest way to hold thousands of readings
+
+        Returns:
+            One reading per person, in order — identical to calling
+            generate_reading() for each person at the same moment
+
+        Raises:
+            ValueError: Invalid moment or person data, or a person dict
+                        carrying its own current_* time
+        """
+        if current_date is None:
+            current_date = datetime.now()
+        shared = {
+            "current_date": current_date,
+            "current_hour": current_hour,
+            "current_minute": current_minute,
+            "current_second": current_second,
+            "tz_hours": tz_hours,
+            "tz_minutes": tz_minutes,
+            "numerology_system": numerology_system,
+            "fields": None if fields is None else frozenset(fields),
+            "compact": compact,
+        }
+        for person in people:
+            clash = MasterOrchestrator.MOMENT_KEYS.intersection(person)
+            if clash:
+                raise ValueError(
+                    f"Person data must not set the moment: {', '.join(sorted(clash))}"
+                )
+
+        if processes > 1 and len(people) >= MasterOrchestrator.POOL_MIN_BATCH:
+            size = -(-len(people) // (processes * 4))
+            chunks = [
+                (people[i : i + size], shared) for i in range(0, len(people), size)
+            ]
+            # Imported here: concurrent.futures pulls in multiprocessing,
+            # which most callers never need
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                return [
+                    reading
+                    for chunk in pool.map(_generate_readings_chunk, chunks)
+                    for reading in chunk
+                ]
+        return _generate_readings_chunk((people, shared))
+
+    @staticmethod
+    def retime_reading(
+        previous: Dict,
+        current_hour: int,
+        current_minute: int,
+        current_second: int = 0,
+        tz_hours: int = 0,
+        tz_minutes: int = 0,
+    ) -> Dict:
+        """
+        Re-evaluate a reading for a new time of day on the same date.
+
+        Only the parts that depend on the time are recomputed: the FC60
+        stamp, the Gānzhī hour pillar, the time-dependent reading signals
+        (hour/minute animals, time context, opening), and what is derived
+        from them (patterns, confidence, translation, synthesis). The
+        numerology, birth, age, heartbeat, moon, location and the other
+        date-only sections are reused from ``previous``.
+
+        Args:
+            previous: Full generate_reading() output (dict, every key) for the
+                      same person and date, at any time or none
+            current_hour, current_minute, current_second: New local time
+            tz_hours, tz_minutes: Timezone offset (default UTC)
+
+        Returns:
+            Reading equal to generate_reading() with the new time. Unchanged
+            sections are the same objects as in ``previous`` (treat both as
+            read-only, or copy before mutating).
+
+        Raises:
+            ValueError: Invalid time, or ``previous`` is not a full reading
+        """
+        missing = [key for key in MasterOrchestrator.READING_FIELDS if key not in previous]
+        if missing:
+            raise ValueError(
+                f"previous is not a full reading (missing: {', '.join(missing)})"
+            )
+
+        year, month, day = map(int, previous["current"]["date"].split("-"))
+        fc60_stamp = FC60StampEngine.encode(
+            year,
+            month,
+            day,
+            current_hour,
+            current_minute,
+            current_second,
+            tz_hours,
+            tz_minutes,
+        )
+
+        numerology = previous["numerology"]
+        moon_data = previous["moon"]
+        previous_ganzhi = previous["ganzhi"]
+        ganzhi_data = {
+            "year": previous_ganzhi["year"],
+            "day": previous_ganzhi["day"],
+            "hour": MasterOrchestrator._hour_pillar(
+                current_hour, previous_ganzhi["day"]["stem_index"]
             ),
+        }
+        heartbeat_data = previous["heartbeat"]
+        location_data = previous["location"]
+
+        reading = ReadingEngine.retime_reading(
+            previous["reading"], fc60_stamp, numerology, moon_data, ganzhi_data
+        )
+        confidence_data = MasterOrchestrator._calculate_confidence(
+            numerology,
+            moon_data,
+            ganzhi_data,
+            heartbeat_data,
+            location_data,
+            reading,
+        )
+        translation = UniverseTranslator.translate(
+            reading=reading,
+            fc60_stamp=fc60_stamp,
+            numerology_profile=numerology,
+            person_name=previous["person"]["name"],
+            current_date_str=previous["current"]["date"],
+            confidence_override=confidence_data["score"],
+        )
+        weekday = WeekdayCalculator.full_info(fc60_stamp["_jdn"])
+
+        return {
+            "person": previous["person"],
+            "birth": previous["birth"],
+            "current": previous["current"],
+            "numerology": numerology,
+            "patterns": MasterOrchestrator._detect_patterns(numerology, weekday, reading),
             "confidence": confidence_data,
             "synthesis": translation.get("full_text", ""),
-            # New keys (v2.0)
             "fc60_stamp": fc60_stamp,
             "moon": moon_data,
             "ganzhi": ganzhi_data,
@@ -235,8 +696,6 @@ class MasterOrchestrator:
             "translation": translation,
         }
 
-        return result
-
     @staticmethod
     def _detect_patterns(numerology: Dict, weekday: Dict, reading: Dict = None) -> Dict:
         """Detect meaningful patterns across all numbers and animals."""
@@ -353,6 +812,13 @@ class MasterOrchestrator:
         }
 
 
+def _generate_readings_chunk(args: Tuple[List[Dict], Dict]) -> List[Dict]:
+    """Readings for one slice of a batch (module-level so it pickles)."""
+    people, shared = args
+    generate = MasterOrchestrator.generate_reading
+    return [generate(**{**shared, **person}) for person in people]
+
+
 def demo():
     """Run a demonstration of the master orchestrator."""
     print("=" * 70)
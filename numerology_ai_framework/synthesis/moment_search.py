@@ -0,0 +1,328 @@
+"""
+Moment Search - Synthesis Tier Module
+=====================================
+Purpose: Find one person's strongest moments in a time window
+         ("best moments" over e.g. the next 7 days at minute resolution)
+
+A moment is scored like a full reading at that time would be: first by
+the reading confidence (MasterOrchestrator._calculate_confidence), then
+by signal strength (sum of SignalCombiner.PRIORITY_RANK over the
+ReadingEngine signals). No reading dicts are built per candidate:
+
+    per day     stamp, moon, Gānzhī year/day, numerology, heartbeat and the
+                date-only signals are evaluated once
+    per 12x12   within a day a moment's score depends only on the hour
+                animal and the minute animal (minute // 5), so the 144
+                time-dependent signal sets are scored once into a table
+    per minute  one table lookup and a comparison with the current k-th
+                best; days whose best table entry cannot enter are skipped
+
+Results stream from iter_best_moments() as they enter the running top-k;
+best_moments() returns the final ranking.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from ..core.julian_date_engine import JulianDateEngine
+    from ..core.base60_codec import Base60Codec
+    from ..core.fc60_stamp_engine import FC60StampEngine
+    from ..personal.numerology_engine import NumerologyEngine
+    from ..personal.heartbeat_engine import HeartbeatEngine
+    from ..universal.location_engine import LocationEngine
+except ImportError:
+    from core.julian_date_engine import JulianDateEngine
+    from core.base60_codec import Base60Codec
+    from core.fc60_stamp_engine import FC60StampEngine
+    from personal.numerology_engine import NumerologyEngine
+    from personal.heartbeat_engine import HeartbeatEngine
+    from universal.location_engine import LocationEngine
+from .master_orchestrator import MasterOrchestrator
+from .reading_engine import ReadingEngine
+from .signal_combiner import SignalCombiner
+
+
+class MomentSearch:
+    """Top-k moment search over a window, scored like full readings."""
+
+    MAX_DAYS = 31
+    MINUTES_PER_DAY = 1440
+
+    @staticmethod
+    def _signal_strength(signals: List[Dict]) -> int:
+        rank = SignalCombiner.PRIORITY_RANK
+        return sum(rank.get(signal.get("priority", ""), 0) for signal in signals)
+
+    @staticmethod
+    def _day_table(
+        year: int,
+        month: int,
+        day: int,
+        person: Dict,
+        tz_hours: int,
+        tz_minutes: int,
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        (confidence, signal strength) for every hour animal x minute animal
+        on one local date: table[hour % 12][minute // 5].
+        """
+        moment = MasterOrchestrator.moment_context(
+            year, month, day, tz_hours=tz_hours, tz_minutes=tz_minutes, has_time=False
+        )
+        stamp = moment.fc60_stamp
+        ganzhi = moment.ganzhi
+        numerology = NumerologyEngine.complete_profile(
+            full_name=person["full_name"],
+            birth_day=person["birth_day"],
+            birth_month=person["birth_month"],
+            birth_year=person["birth_year"],
+            current_year=year,
+            current_month=month,
+            current_day=day,
+            mother_name=person["mother_name"],
+            system=person["numerology_system"],
+            gender=person["gender"],
+            static=person["numerology_static"],
+        )
+        age_years = int((stamp["_jdn"] - person["birth_jdn"]) // 365.25)
+        heartbeat = HeartbeatEngine.heartbeat_profile(age_years, person["actual_bpm"])
+        location = person["location"]
+
+        # Date-only signals: a date stamp has no hour/minute animals, so
+        # dropping the time signal types leaves exactly the shared part.
+        date_signals = [
+            signal
+            for signal in ReadingEngine.generate_reading(
+                stamp, numerology, moment.moon, ganzhi, heartbeat, location
+            )["signals"]
+            if signal["type"] not in ReadingEngine.TIME_SIGNAL_TYPES
+        ]
+        date_strength = MomentSearch._signal_strength(date_signals)
+
+        confidence = {}
+        for repeated in (False, True):
+            reading = {"animal_repetitions": [None]} if repeated else None
+            confidence[repeated] = MasterOrchestrator._calculate_confidence(
+                numerology, moment.moon, ganzhi, heartbeat, location, reading
+            )["score"]
+
+        table = []
+        for hour_idx in range(12):
+            row = []
+            for minute_idx in range(12):
+                timed = ReadingEngine._time_sections(
+                    {
+                        "_month_animal": stamp["_month_animal"],
+                        "_dom_token": stamp["_dom_token"],
+                        "_hour_animal": Base60Codec.ANIMALS[hour_idx],
+                        "_minute_token": Base60Codec.token60(minute_idx * 5),
+                    },
+                    ganzhi,
+                )
+                # Signal records carry their rank; messages are never rendered
+                strength = date_strength
+                for signal in timed["repetition_signals"] + timed["hour_signals"]:
+                    strength += signal.rank
+                row.append((confidence[bool(timed["animal_repetitions"])], strength))
+            table.append(row)
+        return table
+
+    @staticmethod
+    def _describe(
+        local: datetime, score: Tuple[int, int], tz_hours: int, tz_minutes: int
+    ) -> Dict:
+        """Result entry for one moment (only built for moments that rank)."""
+        stamp = FC60StampEngine.encode(
+            local.year,
+            local.month,
+            local.day,
+            local.hour,
+            local.minute,
+            0,
+            tz_hours,
+            tz_minutes,
+        )
+        return {
+            "local_time": local.isoformat(),
+            "fc60": stamp["fc60"],
+            "confidence": score[0],
+            "signal_strength": score[1],
+            "hour_animal": ReadingEngine.ANIMAL_TRAITS[stamp["_hour_animal"]]["name"],
+            "minute_animal": ReadingEngine.ANIMAL_TRAITS[stamp["_minute_token"][:2]]["name"],
+        }
+
+    @staticmethod
+    def iter_best_moments(
+        full_name: str,
+        birth_day: int,
+        birth_month: int,
+        birth_year: int,
+        start: datetime,
+        days: int = 7,
+        k: int = 10,
+        step_minutes: int = 1,
+        mother_name: Optional[str] = None,
+        gender: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        actual_bpm: Optional[int] = None,
+        tz_hours: int = 0,
+        tz_minutes: int = 0,
+        numerology_system: str = "pythagorean",
+        numerology_static: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream moments as they enter the running top-k.
+
+        Candidates are the local times start, start + step, ... for ``days``
+        days (seconds are dropped from ``start``). Each yielded dict was in
+        the top-k when found; later ones may push it out. Ties keep the
+        earliest moment.
+
+        Yields:
+            {"local_time", "fc60", "confidence", "signal_strength",
+             "hour_animal", "minute_animal"}
+
+        Raises:
+            ValueError: Window, k or step out of range (raised by the call,
+                before anything is yielded)
+        """
+        if not 1 <= days <= MomentSearch.MAX_DAYS:
+            raise ValueError(f"days must be 1..{MomentSearch.MAX_DAYS}, got {days}")
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        if not 1 <= step_minutes <= MomentSearch.MINUTES_PER_DAY:
+            raise ValueError(f"step_minutes must be 1..1440, got {step_minutes}")
+
+        location = None
+        if latitude is not None and longitude is not None:
+            location = LocationEngine.location_signature(latitude, longitude)
+        person = {
+            "full_name": full_name,
+            "birth_day": birth_day,
+            "birth_month": birth_month,
+            "birth_year": birth_year,
+            "mother_name": mother_name,
+            "gender": gender,
+            "actual_bpm": actual_bpm,
+            "numerology_system": numerology_system,
+            "numerology_static": numerology_static,
+            "birth_jdn": JulianDateEngine.gregorian_to_jdn(birth_year, birth_month, birth_day),
+            "location": location,
+        }
+        return MomentSearch._search(person, start, days, k, step_minutes, tz_hours, tz_minutes)
+
+    @staticmethod
+    def _search(
+        person: Dict,
+        start: datetime,
+        days: int,
+        k: int,
+        step_minutes: int,
+        tz_hours: int,
+        tz_minutes: int,
+    ) -> Iterator[Dict]:
+        """Generator behind iter_best_moments() (arguments already checked)."""
+        start = start.replace(second=0, microsecond=0, tzinfo=None)
+        first_day = start.replace(hour=0, minute=0)
+        offset = start.hour * 60 + start.minute
+        total = days * MomentSearch.MINUTES_PER_DAY
+
+        heap: List[Tuple[int, int, int]] = []  # (confidence, strength, -minute)
+        minute = offset
+        end = offset + total
+        while minute < end:
+            day_index, day_start = divmod(minute, MomentSearch.MINUTES_PER_DAY)
+            day_end = min(end, (day_index + 1) * MomentSearch.MINUTES_PER_DAY)
+            date = first_day + timedelta(days=day_index)
+            table = MomentSearch._day_table(
+                date.year, date.month, date.day, person, tz_hours, tz_minutes
+            )
+            if len(heap) == k and max(map(max, table)) <= heap[0][:2]:
+                # Nothing today can beat the k-th best (ties keep the earlier)
+                minute += -(-(day_end - minute) // step_minutes) * step_minutes
+                continue
+
+            base = day_index * MomentSearch.MINUTES_PER_DAY
+            while minute < day_end:
+                of_day = minute - base
+                hour = of_day // 60
+                score = table[hour % 12][(of_day % 60) // 5]
+                entry = (score[0], score[1], -minute)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                else:
+                    minute += step_minutes
+                    continue
+                local = date + timedelta(minutes=of_day)
+                yield MomentSearch._describe(local, score, tz_hours, tz_minutes)
+                minute += step_minutes
+
+    @staticmethod
+    def rank(moments: List[Dict], k: int) -> List[Dict]:
+        """Best k of streamed moments: confidence, strength, then earliest."""
+        ranked = sorted(
+            moments, key=lambda m: (-m["confidence"], -m["signal_strength"], m["local_time"])
+        )
+        return ranked[:k]
+
+    @staticmethod
+    def best_moments(*args, k: int = 10, **kwargs) -> List[Dict]:
+        """
+        Top-k moments in the window, best first (same arguments as
+        iter_best_moments).
+        """
+        return MomentSearch.rank(list(MomentSearch.iter_best_moments(*args, k=k, **kwargs)), k)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MOMENT SEARCH - SELF TEST")
+    print("=" * 60)
+
+    passed = 0
+    failed = 0
+
+    # Test 1: Ranked moments score the same as full readings at that time
+    person = dict(full_name="Alice Johnson", birth_day=15, birth_month=7, birth_year=1990)
+    best = MomentSearch.best_moments(**person, start=datetime(2026, 2, 9), days=1, k=3)
+    ok = len(best) == 3
+    for moment in best:
+        when = datetime.fromisoformat(moment["local_time"])
+        reading = MasterOrchestrator.generate_reading(
+            **person,
+            current_date=when,
+            current_hour=when.hour,
+            current_minute=when.minute,
+            current_second=0,
+        )
+        ok = ok and moment["confidence"] == reading["confidence"]["score"]
+        ok = ok and moment["signal_strength"] == MomentSearch._signal_strength(
+            reading["reading"]["signals"]
+        )
+    if ok:
+        print(f"✓ Top-3 match full readings (best {best[0]['local_time']})")
+        passed += 1
+    else:
+        print(f"✗ Top-3 differ from full readings: {best}")
+        failed += 1
+
+    # Test 2: A week at minute resolution
+    import time
+
+    t0 = time.perf_counter()
+    week = MomentSearch.best_moments(**person, start=datetime(2026, 2, 9), days=7, k=10)
+    elapsed = (time.perf_counter() - t0) * 1000
+    if len(week) == 10:
+        print(f"✓ 7 days x 1440 minutes searched in {elapsed:.0f}ms")
+        passed += 1
+    else:
+        print(f"✗ Week search returned {len(week)} moments")
+        failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    exit(0 if failed == 0 else 1)
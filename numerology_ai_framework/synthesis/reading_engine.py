@@ -7,14 +7,15 @@ Purpose: Generate symbolic readings from FC60 stamps and related data
 Dependencies: All core + universal + personal modules
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from typing import Dict, List, Optional
 from collections import Counter
 
+try:
+    from ..core.base60_codec import Base60Codec
+except ImportError:
+    from core.base60_codec import Base60Codec
+from .signal_combiner import Signal, SignalCombiner
+
 
 class ReadingEngine:
     """Signal-based reading generator using FC60 stamp components."""
@@ -176,6 +177,15 @@ class ReadingEngine:
         "PIWA": "Pig Water — Deep abundance. Emotional generosity flowing without limit; the completion that comes from giving everything.",
     }
 
+    # Signals that depend on the time of day (see retime_reading)
+    TIME_SIGNAL_TYPES = frozenset({"animal_repetition", "hour_animal"})
+
+    # Signal message templates (rendered lazily, see Signal)
+    REPETITION_SIGNAL = "The {0} appears {1} times — {2}. The instruction: {3}"
+    HOUR_SIGNAL = "The {0} hour carries the energy of {1}."
+    PLANET_SIGNAL = "This is a {0} day, governing {1}."
+    DOM_SIGNAL = "Today's day-of-month energy: {0} {1} — {2}."
+
     # Time-of-day context (§12.3)
     TIME_BANDS = [
         (5, "The hour of silence", "Deep night — subconscious surfaces"),
@@ -256,37 +266,139 @@ class ReadingEngine:
         if not numerology_profile:
             return insights
 
-        try:
-            from synthesis.signal_combiner import SignalCombiner
+        lp = numerology_profile.get("life_path", {}).get("number", 0)
+        py = numerology_profile.get("personal_year", 0)
 
-            lp = numerology_profile.get("life_path", {}).get("number", 0)
-            py = numerology_profile.get("personal_year", 0)
+        if lp and py:
+            lp_py = SignalCombiner.lifepath_meets_year(lp, py)
+            insights.append(
+                {
+                    "type": "lifepath_year",
+                    "theme": lp_py["theme"],
+                    "message": lp_py["message"],
+                }
+            )
 
-            if lp and py:
-                lp_py = SignalCombiner.lifepath_meets_year(lp, py)
+        if planet and moon_data:
+            phase = moon_data.get("phase_name", "")
+            if phase:
+                pm = SignalCombiner.planet_meets_moon(planet, phase)
                 insights.append(
                     {
-                        "type": "lifepath_year",
-                        "theme": lp_py["theme"],
-                        "message": lp_py["message"],
+                        "type": "planet_moon",
+                        "theme": pm["theme"],
+                        "message": pm["message"],
                     }
                 )
 
-            if planet and moon_data:
-                phase = moon_data.get("phase_name", "")
-                if phase:
-                    pm = SignalCombiner.planet_meets_moon(planet, phase)
-                    insights.append(
-                        {
-                            "type": "planet_moon",
-                            "theme": pm["theme"],
-                            "message": pm["message"],
-                        }
+        return insights
+
+    @staticmethod
+    def _time_sections(fc60_stamp: Dict, ganzhi_data: Dict = None) -> Dict:
+        """
+        Reading parts that change with the time of day: the hour and minute
+        animals feed the repetition signals, the hour animal signal, the
+        time-of-day context, the Sun/Moon paradox, the opening and the core
+        signal. Everything else in a reading depends only on the date.
+        """
+        # Collect and analyze animals
+        animals = ReadingEngine._collect_animals(fc60_stamp, ganzhi_data)
+        repetitions = ReadingEngine._detect_animal_repetitions(animals)
+
+        repetition_signals = [
+            Signal.from_template(
+                "animal_repetition",
+                rep["priority"],
+                ReadingEngine.REPETITION_SIGNAL,
+                rep["animal_name"],
+                rep["count"],
+                rep["trait"],
+                rep["action"],
+            )
+            for rep in repetitions
+        ]
+
+        # Hour animal
+        hour_signals = []
+        hour_animal = fc60_stamp.get("_hour_animal", "")
+        if hour_animal:
+            hour_info = ReadingEngine.ANIMAL_TRAITS.get(hour_animal, {})
+            if hour_info:
+                hour_signals.append(
+                    Signal.from_template(
+                        "hour_animal",
+                        "Low-Medium",
+                        ReadingEngine.HOUR_SIGNAL,
+                        hour_info["name"],
+                        hour_info["trait"].lower(),
                     )
-        except ImportError:
-            pass
+                )
 
-        return insights
+        # Time context
+        hour = 0
+        if fc60_stamp.get("_half_marker"):
+            # Extract hour from the stamp
+            hour_animal_token = fc60_stamp.get("_hour_animal", "RA")
+            hour_idx = Base60Codec.ANIMAL_TO_INDEX.get(hour_animal_token, 0)
+            if fc60_stamp.get("_half_marker") == "🌙":
+                hour = hour_idx + 12 if hour_idx != 0 else 12
+            else:
+                hour = hour_idx
+
+        time_ctx = ReadingEngine._time_context(hour)
+
+        # Sun/Moon paradox
+        paradox = ReadingEngine._check_sun_moon_paradox(fc60_stamp, hour)
+
+        # Build opening
+        planet = fc60_stamp.get("_planet", "")
+        weekday_name = fc60_stamp.get("_weekday_name", "Unknown")
+        opening = (
+            f"At this moment on this {planet} {weekday_name}, "
+            f"the {time_ctx['context'].lower()} shapes the energy. "
+            f"{time_ctx['energy']}."
+        )
+
+        # Build core signal
+        core_signal = ""
+        if repetitions:
+            rep = repetitions[0]
+            core_signal = (
+                f"The {rep['animal_name']} appears {rep['count']} times — "
+                f"this is the loudest signal. "
+                f"{rep['trait']}. The instruction: {rep['action']}"
+            )
+
+        return {
+            "animals_collected": animals,
+            "animal_repetitions": repetitions,
+            "repetition_signals": repetition_signals,
+            "hour_signals": hour_signals,
+            "time_context": time_ctx,
+            "paradox": paradox,
+            "opening": opening,
+            "core_signal": core_signal,
+        }
+
+    @staticmethod
+    def _signal_confidence(signals: List) -> int:
+        """Reading confidence from the number of signals."""
+        return min(95, 50 + len(signals) * 5)
+
+    @staticmethod
+    def _combine_signals(
+        signals: List[Signal],
+        numerology_profile: Dict = None,
+        moon_data: Dict = None,
+        ganzhi_data: Dict = None,
+    ) -> Dict:
+        """Signal combination for a reading."""
+        return SignalCombiner.combine_signals(
+            signals,
+            numerology_profile or {},
+            moon_data or {},
+            ganzhi_data or {},
+        )
 
     @staticmethod
     def generate_reading(
@@ -311,32 +423,17 @@ class ReadingEngine:
         Returns:
             Dict with reading sections and metadata
         """
-        signals = []
-
-        # Collect and analyze animals
-        animals = ReadingEngine._collect_animals(fc60_stamp, ganzhi_data)
-        repetitions = ReadingEngine._detect_animal_repetitions(animals)
-
-        for rep in repetitions:
-            signals.append(
-                {
-                    "type": "animal_repetition",
-                    "priority": rep["priority"],
-                    "message": f"The {rep['animal_name']} appears {rep['count']} times — "
-                    f"{rep['trait']}. The instruction: {rep['action']}",
-                }
-            )
+        timed = ReadingEngine._time_sections(fc60_stamp, ganzhi_data)
+        signals = list(timed["repetition_signals"])
 
         # Day planet signal
         planet = fc60_stamp.get("_planet", "")
         domain = fc60_stamp.get("_domain", "")
         if planet:
             signals.append(
-                {
-                    "type": "day_planet",
-                    "priority": "Medium",
-                    "message": f"This is a {planet} day, governing {domain.lower()}.",
-                }
+                Signal.from_template(
+                    "day_planet", "Medium", ReadingEngine.PLANET_SIGNAL, planet, domain.lower()
+                )
             )
 
         # Moon phase signal
@@ -348,13 +445,7 @@ class ReadingEngine:
                 f"Energy: {moon_data['energy']}. "
                 f"Best for: {moon_data['best_for']}."
             )
-            signals.append(
-                {
-                    "type": "moon_phase",
-                    "priority": "Medium",
-                    "message": moon_context,
-                }
-            )
+            signals.append(Signal("moon_phase", "Medium", moon_context))
 
         # DOM token analysis
         dom_token = fc60_stamp.get("_dom_token", "")
@@ -365,46 +456,17 @@ class ReadingEngine:
             element_info = ReadingEngine.ELEMENT_MEANINGS.get(element_part, {})
             if animal_info and element_info:
                 signals.append(
-                    {
-                        "type": "dom_animal_element",
-                        "priority": "Medium",
-                        "message": f"Today's day-of-month energy: "
-                        f"{animal_info['name']} {element_info['name']} — "
-                        f"{element_info['meaning']}.",
-                    }
-                )
-
-        # Hour animal
-        hour_animal = fc60_stamp.get("_hour_animal", "")
-        if hour_animal:
-            hour_info = ReadingEngine.ANIMAL_TRAITS.get(hour_animal, {})
-            if hour_info:
-                signals.append(
-                    {
-                        "type": "hour_animal",
-                        "priority": "Low-Medium",
-                        "message": f"The {hour_info['name']} hour carries the energy of "
-                        f"{hour_info['trait'].lower()}.",
-                    }
+                    Signal.from_template(
+                        "dom_animal_element",
+                        "Medium",
+                        ReadingEngine.DOM_SIGNAL,
+                        animal_info["name"],
+                        element_info["name"],
+                        element_info["meaning"],
+                    )
                 )
 
-        # Time context
-        hour = 0
-        if fc60_stamp.get("_half_marker"):
-            # Extract hour from the stamp
-            hour_animal_token = fc60_stamp.get("_hour_animal", "RA")
-            from core.base60_codec import Base60Codec
-
-            hour_idx = Base60Codec.ANIMAL_TO_INDEX.get(hour_animal_token, 0)
-            if fc60_stamp.get("_half_marker") == "🌙":
-                hour = hour_idx + 12 if hour_idx != 0 else 12
-            else:
-                hour = hour_idx
-
-        time_ctx = ReadingEngine._time_context(hour)
-
-        # Sun/Moon paradox
-        paradox = ReadingEngine._check_sun_moon_paradox(fc60_stamp, hour)
+        signals.extend(timed["hour_signals"])
 
         # Personal overlay
         personal_overlay = ""
@@ -449,24 +511,6 @@ class ReadingEngine:
                 f"with {gy.get('polarity', '')} polarity."
             )
 
-        # Build opening
-        weekday_name = fc60_stamp.get("_weekday_name", "Unknown")
-        opening = (
-            f"At this moment on this {planet} {weekday_name}, "
-            f"the {time_ctx['context'].lower()} shapes the energy. "
-            f"{time_ctx['energy']}."
-        )
-
-        # Build core signal
-        core_signal = ""
-        if repetitions:
-            rep = repetitions[0]
-            core_signal = (
-                f"The {rep['animal_name']} appears {rep['count']} times — "
-                f"this is the loudest signal. "
-                f"{rep['trait']}. The instruction: {rep['action']}"
-            )
-
         # Day energy
         day_energy = ""
         if dom_token:
@@ -485,9 +529,6 @@ class ReadingEngine:
         # Closing
         closing = "The numbers suggest this energy is present — not as prediction, but as pattern."
 
-        # Calculate confidence from signals
-        confidence = min(95, 50 + len(signals) * 5)
-
         # Enrichment: animal×element description
         animal_element_description = ""
         if dom_token:
@@ -517,46 +558,83 @@ class ReadingEngine:
                     "message": ci["message"],
                 }
 
-        # Signal combination (if combiner available)
-        combined_signals = None
-        try:
-            from synthesis.signal_combiner import SignalCombiner
-
-            combined_signals = SignalCombiner.combine_signals(
-                signals,
-                numerology_profile or {},
-                moon_data or {},
-                ganzhi_data or {},
-            )
-        except ImportError:
-            pass
+        combined_signals = ReadingEngine._combine_signals(
+            signals, numerology_profile, moon_data, ganzhi_data
+        )
 
         return {
-            "opening": opening,
-            "core_signal": core_signal,
+            "opening": timed["opening"],
+            "core_signal": timed["core_signal"],
             "day_energy": day_energy,
             "moon_context": moon_context,
             "personal_overlay": personal_overlay,
             "heartbeat_context": heartbeat_context,
             "location_context": location_context,
             "year_context": year_context,
-            "time_context": time_ctx,
-            "paradox": paradox,
+            "time_context": timed["time_context"],
+            "paradox": timed["paradox"],
             "closing": closing,
-            "signals": signals,
-            "animal_repetitions": repetitions,
-            "confidence": confidence,
+            "signals": [signal.to_dict() for signal in signals],
+            "animal_repetitions": timed["animal_repetitions"],
+            "confidence": ReadingEngine._signal_confidence(signals),
             # Enriched fields (v2.1)
             "animal_element_description": animal_element_description,
             "planet_moon_insight": planet_moon_insight,
             "lifepath_year_insight": lifepath_year_insight,
             "planet_moon_insight_dict": planet_moon_insight_dict,
             "lifepath_year_insight_dict": lifepath_year_insight_dict,
-            "animals_collected": animals,
+            "animals_collected": timed["animals_collected"],
             "combined_signals": combined_signals,
         }
 
 
+    @staticmethod
+    def retime_reading(
+        reading: Dict,
+        fc60_stamp: Dict,
+        numerology_profile: Dict = None,
+        moon_data: Dict = None,
+        ganzhi_data: Dict = None,
+    ) -> Dict:
+        """
+        Re-evaluate a reading for a new time on the same date.
+
+        Only the time-dependent parts (see _time_sections) and what is
+        derived from the signal list (confidence, combined signals) are
+        recomputed; date-only sections are taken from ``reading``.
+
+        Args:
+            reading: Output of generate_reading() for the same date and inputs
+            fc60_stamp: Stamp for the new time
+            numerology_profile, moon_data, ganzhi_data: As for
+                generate_reading() (ganzhi_data with the new hour pillar)
+
+        Returns:
+            Dict equal to generate_reading() with the new stamp
+        """
+        timed = ReadingEngine._time_sections(fc60_stamp, ganzhi_data)
+        date_signals = [
+            Signal.from_dict(signal)
+            for signal in reading["signals"]
+            if signal["type"] not in ReadingEngine.TIME_SIGNAL_TYPES
+        ]
+        signals = timed["repetition_signals"] + date_signals + timed["hour_signals"]
+
+        result = dict(reading)
+        result["opening"] = timed["opening"]
+        result["core_signal"] = timed["core_signal"]
+        result["time_context"] = timed["time_context"]
+        result["paradox"] = timed["paradox"]
+        result["signals"] = [signal.to_dict() for signal in signals]
+        result["animal_repetitions"] = timed["animal_repetitions"]
+        result["confidence"] = ReadingEngine._signal_confidence(signals)
+        result["animals_collected"] = timed["animals_collected"]
+        result["combined_signals"] = ReadingEngine._combine_signals(
+            signals, numerology_profile, moon_data, ganzhi_data
+        )
+        return result
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("READING ENGINE - SELF TEST")
@@ -0,0 +1,326 @@
+"""
+Result Types - Synthesis Tier
+=============================
+Purpose: Compact, immutable records for the fixed-shape parts of a reading
+         (FC60 stamp, moon, Gānzhī, numerology profile)
+
+Each record keeps its values in __slots__ instead of a per-instance dict,
+so it carries no hash table and can be shared safely: every reading at
+one moment points at the same FC60Stamp / MoonInfo / GanzhiInfo objects
+held by MomentContext. Plain dicts are produced only at the serialization
+edge with to_dict(), which returns exactly the dict the engines build.
+
+Records also support read-only mapping access (record["fc60"],
+record.get("hour")) so read-side code works with either form.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Tuple
+
+try:
+    from ..core.fc60_stamp_engine import BATCH_COLUMNS
+except ImportError:
+    from core.fc60_stamp_engine import BATCH_COLUMNS
+
+
+class _Missing:
+    """Marker for a field absent from the source dict (omitted by to_dict)."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+class SlottedRecord:
+    """
+    Base for fixed-shape records. Subclasses set FIELDS (in dict key order)
+    as their __slots__ and NESTED to map a field to the record type of its
+    sub-dict.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    NESTED: Dict[str, type] = {}
+
+    def __init__(self, **values: Any):
+        for name in self.FIELDS:
+            object.__setattr__(self, name, values.pop(name, MISSING))
+        if values:
+            raise TypeError(
+                f"{type(self).__name__} has no field(s): {', '.join(sorted(values))}"
+            )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SlottedRecord":
+        """Build from an engine dict, converting nested sub-dicts."""
+        values = dict(data)
+        for name, record_type in cls.NESTED.items():
+            value = values.get(name)
+            if isinstance(value, dict):
+                values[name] = record_type.from_dict(value)
+        return cls(**values)
+
+    def to_dict(self) -> Dict:
+        """Fresh plain dict, identical to the one the record was built from."""
+        result = {}
+        for name, value in zip(self.FIELDS, self._values()):
+            if value is MISSING:
+                continue
+            if isinstance(value, SlottedRecord):
+                value = value.to_dict()
+            result[name] = value
+        return result
+
+    def _values(self) -> Tuple:
+        values = type(self)._getter(self)
+        return values if len(self.FIELDS) > 1 else (values,)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.FIELDS:
+            cls._getter = staticmethod(attrgetter(*cls.FIELDS))
+
+    # ── read-only mapping access ──
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not MISSING:
+                return value
+        raise KeyError(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.FIELDS and getattr(self, name) is not MISSING
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        parts = (
+            f"{name}={value!r}"
+            for name, value in zip(self.FIELDS, self._values())
+            if value is not MISSING
+        )
+        return f"{type(self).__name__}({', '.join(parts)})"
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), self._values()))
+
+
+def _rebuild(cls: type, values: Tuple) -> SlottedRecord:
+    """Unpickle helper (records are immutable, so __setstate__ is not used)."""
+    record = cls.__new__(cls)
+    for name, value in zip(cls.FIELDS, values):
+        object.__setattr__(record, name, value)
+    return record
+
+
+# ════════════════════════════════════════════════════════════
+# FC60 stamp / moon
+# ════════════════════════════════════════════════════════════
+
+
+class FC60Stamp(SlottedRecord):
+    """FC60StampEngine.encode() output."""
+
+    FIELDS = BATCH_COLUMNS
+    __slots__ = FIELDS
+
+
+class MoonInfo(SlottedRecord):
+    """MoonEngine.full_moon_info() output."""
+
+    FIELDS = (
+        "phase_name",
+        "emoji",
+        "age",
+        "illumination",
+        "energy",
+        "best_for",
+        "avoid",
+    )
+    __slots__ = FIELDS
+
+
+# ════════════════════════════════════════════════════════════
+# Gānzhī
+# ════════════════════════════════════════════════════════════
+
+
+class GanzhiYear(SlottedRecord):
+    """GanzhiEngine.full_year_info() output."""
+
+    FIELDS = (
+        "year",
+        "stem_index",
+        "branch_index",
+        "stem_token",
+        "branch_token",
+        "gz_token",
+        "stem_name",
+        "animal_name",
+        "element",
+        "polarity",
+        "traditional_name",
+    )
+    __slots__ = FIELDS
+
+
+class GanzhiDay(SlottedRecord):
+    """GanzhiEngine.full_day_info() output."""
+
+    FIELDS = (
+        "jdn",
+        "stem_index",
+        "branch_index",
+        "stem_token",
+        "branch_token",
+        "gz_token",
+        "stem_name",
+        "animal_name",
+        "element",
+        "polarity",
+    )
+    __slots__ = FIELDS
+
+
+class GanzhiHour(SlottedRecord):
+    """Hour pillar as assembled by MasterOrchestrator."""
+
+    FIELDS = ("stem_token", "branch_token", "animal_name")
+    __slots__ = FIELDS
+
+
+class GanzhiInfo(SlottedRecord):
+    """Year, day and (when the time is known) hour pillars."""
+
+    FIELDS = ("year", "day", "hour")
+    __slots__ = FIELDS
+    NESTED = {"year": GanzhiYear, "day": GanzhiDay, "hour": GanzhiHour}
+
+
+# ════════════════════════════════════════════════════════════
+# Numerology
+# ════════════════════════════════════════════════════════════
+
+
+class LifePath(SlottedRecord):
+    FIELDS = ("number", "title", "message")
+    __slots__ = FIELDS
+
+
+class GenderPolarity(SlottedRecord):
+    FIELDS = ("gender", "polarity", "label")
+    __slots__ = FIELDS
+
+
+class NumerologyProfile(SlottedRecord):
+    """NumerologyEngine.complete_profile() output."""
+
+    FIELDS = (
+        "life_path",
+        "expression",
+        "soul_urge",
+        "personality",
+        "personal_year",
+        "personal_month",
+        "personal_day",
+        "gender_polarity",
+        "mother_influence",
+    )
+    __slots__ = FIELDS
+    NESTED = {"life_path": LifePath, "gender_polarity": GenderPolarity}
+
+
+# ════════════════════════════════════════════════════════════
+# Whole reading
+# ════════════════════════════════════════════════════════════
+
+
+class CompactReading(SlottedRecord):
+    """
+    MasterOrchestrator.generate_reading(compact=True) output. Fixed-shape
+    parts are records (stamp/moon/Gānzhī shared per moment); the free-form
+    parts (reading, translation, patterns, ...) stay plain dicts.
+    """
+
+    FIELDS = (
+        "person",
+        "birth",
+        "current",
+        "numerology",
+        "patterns",
+        "confidence",
+        "synthesis",
+        "fc60_stamp",
+        "moon",
+        "ganzhi",
+        "heartbeat",
+        "location",
+        "reading",
+        "translation",
+    )
+    __slots__ = FIELDS
+    NESTED = {
+        "numerology": NumerologyProfile,
+        "fc60_stamp": FC60Stamp,
+        "moon": MoonInfo,
+        "ganzhi": GanzhiInfo,
+    }
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("RESULT TYPES - SELF TEST")
+    print("=" * 60)
+
+    from datetime import datetime
+
+    from .master_orchestrator import MasterOrchestrator
+
+    passed = 0
+    failed = 0
+    full = MasterOrchestrator.generate_reading(
+        "Alice Johnson",
+        15,
+        7,
+        1990,
+        current_date=datetime(2026, 2, 9),
+        mother_name="Barbara Johnson",
+        current_hour=14,
+        current_minute=30,
+    )
+    compact = CompactReading.from_dict(full)
+    if compact.to_dict() == full:
+        print("✓ CompactReading round-trips the full reading")
+        passed += 1
+    else:
+        print("✗ CompactReading round-trip differs")
+        failed += 1
+    if compact["fc60_stamp"]["fc60"] == full["fc60_stamp"]["fc60"]:
+        print("✓ Mapping-style access works")
+        passed += 1
+    else:
+        print("✗ Mapping-style access failed")
+        failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    exit(0 if failed == 0 else 1)
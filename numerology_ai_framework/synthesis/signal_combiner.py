@@ -8,730 +8,56 @@ Purpose: Combine and cross-reference signals from multiple engines
 Dependencies: ReadingEngine output, NumerologyEngine profile, MoonEngine data
 """
 
-import sys
-import os
+import heapq
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from ..core.base60_codec import Base60Codec
+    from ..core.weekday_calculator import WeekdayCalculator
+    from ..universal.moon_engine import MoonEngine
+except ImportError:
+    from core.base60_codec import Base60Codec
+    from core.weekday_calculator import WeekdayCalculator
+    from universal.moon_engine import MoonEngine
 
-from typing import Dict, List
 
+class _LazyTable:
+    """
+    Class attribute built by ``build()`` on first access and then stored on
+    the class in its place, so importing the module does not build it.
+    """
 
-class SignalCombiner:
-    """Cross-reference and combine signals from all framework engines."""
+    def __init__(self, build):
+        self._build = build
+        self._name = None
 
-    # ----------------------------------------------------------------
-    # 1. PLANET_MOON_COMBOS  (7 planets x 8 moon phases = 56 entries)
-    # ----------------------------------------------------------------
-    PLANET_MOON_COMBOS: Dict[tuple, Dict[str, str]] = {
-        # --- Sun ---
-        ("Sun", "New Moon"): {
-            "theme": "Hidden Potential",
-            "message": "Your core identity is being seeded in darkness. Set intentions aligned with your truest self.",
-        },
-        ("Sun", "Waxing Crescent"): {
-            "theme": "Emerging Will",
-            "message": "A spark of purpose is catching flame. Feed your confidence with small, deliberate actions.",
-        },
-        ("Sun", "First Quarter"): {
-            "theme": "Identity Tested",
-            "message": "Who you are meets who you must become. Resistance now is a forge, not a wall.",
-        },
-        ("Sun", "Waxing Gibbous"): {
-            "theme": "Refining Purpose",
-            "message": "Your sense of self is nearly crystallized. Polish the rough edges before the spotlight arrives.",
-        },
-        ("Sun", "Full Moon"): {
-            "theme": "Radiant Revelation",
-            "message": "Everything about your identity is illuminated now. Others see you clearly — make sure you see yourself too.",
-        },
-        ("Sun", "Waning Gibbous"): {
-            "theme": "Generous Glow",
-            "message": "Your light is warm and giving. Share your confidence — it replenishes by being offered.",
-        },
-        ("Sun", "Last Quarter"): {
-            "theme": "Core Reckoning",
-            "message": "Strip away what is performance. The Sun asks what remains when the audience leaves.",
-        },
-        ("Sun", "Waning Crescent"): {
-            "theme": "Quiet Sovereignty",
-            "message": "Power rests in stillness now. You do not need to prove your light — it simply is.",
-        },
-        # --- Moon ---
-        ("Moon", "New Moon"): {
-            "theme": "Deep Reset",
-            "message": "Emotions are in a cocoon. This is not numbness — it is preparation. Honor the silence.",
-        },
-        ("Moon", "Waxing Crescent"): {
-            "theme": "Emotional Seedling",
-            "message": "New feelings are tender and fragile. Protect them from harsh judgement — yours or others'.",
-        },
-        ("Moon", "First Quarter"): {
-            "theme": "Feeling the Friction",
-            "message": "Emotions push against habit. Let yourself feel the discomfort — it is growth in motion.",
-        },
-        ("Moon", "Waxing Gibbous"): {
-            "theme": "Emotional Refinement",
-            "message": "Your inner world is becoming clearer. Journaling or reflection brings surprising insight now.",
-        },
-        ("Moon", "Full Moon"): {
-            "theme": "Emotional Flood",
-            "message": "Feelings are at maximum intensity. What surfaces now has been building for weeks. Witness it fully.",
-        },
-        ("Moon", "Waning Gibbous"): {
-            "theme": "Grateful Heart",
-            "message": "Emotional abundance flows outward. Gratitude is not just a practice — it is the frequency you carry.",
-        },
-        ("Moon", "Last Quarter"): {
-            "theme": "Emotional Release",
-            "message": "Old feelings are ready to be let go. Forgiveness is not forgetting — it is freeing your own heart.",
-        },
-        ("Moon", "Waning Crescent"): {
-            "theme": "Inner Sanctuary",
-            "message": "Retreat into the quiet places within. The world can wait while you replenish your emotional reserves.",
-        },
-        # --- Mars ---
-        ("Mars", "New Moon"): {
-            "theme": "Coiled Spring",
-            "message": "Energy gathers in the dark. Do not strike yet — but sharpen your blade. Timing is everything.",
-        },
-        ("Mars", "Waxing Crescent"): {
-            "theme": "First Strike",
-            "message": "The warrior makes the opening move. Start small but start bold. Hesitation is the only enemy.",
-        },
-        ("Mars", "First Quarter"): {
-            "theme": "Battle Decision",
-            "message": "Action meets resistance. Push through with courage, not force. The obstacle reveals your true strength.",
-        },
-        ("Mars", "Waxing Gibbous"): {
-            "theme": "Sharpening the Edge",
-            "message": "Raw force transforms into precision. Discipline your energy — the battle is almost won through preparation.",
-        },
-        ("Mars", "Full Moon"): {
-            "theme": "Warrior Illuminated",
-            "message": "Your drive is fully visible. Channel aggression into passion. Fight for something, not against everything.",
-        },
-        ("Mars", "Waning Gibbous"): {
-            "theme": "Teaching Strength",
-            "message": "Your battles have earned you wisdom. Mentor others in courage. Strength shared is strength multiplied.",
-        },
-        ("Mars", "Last Quarter"): {
-            "theme": "Laying Down Arms",
-            "message": "Not every hill deserves a fight. Strategic retreat is wisdom, not weakness. Choose your battles.",
-        },
-        ("Mars", "Waning Crescent"): {
-            "theme": "Resting Warrior",
-            "message": "Even the fiercest flame needs fuel. Rest now so you may rise again with renewed purpose.",
-        },
-        # --- Mercury ---
-        ("Mercury", "New Moon"): {
-            "theme": "Silent Mind",
-            "message": "Thoughts incubate in darkness. Do not force clarity — let ideas gestate. The answer forms in quiet.",
-        },
-        ("Mercury", "Waxing Crescent"): {
-            "theme": "First Words",
-            "message": "New ideas begin to form. Speak tentatively and listen carefully — the conversation is just beginning.",
-        },
-        ("Mercury", "First Quarter"): {
-            "theme": "Debate Within",
-            "message": "Logic clashes with intuition. Both have merit. The resolution lies in listening to both voices.",
-        },
-        ("Mercury", "Waxing Gibbous"): {
-            "theme": "Crafting the Message",
-            "message": "Your thoughts are nearly ready for the world. Edit, refine, and clarify before you publish or present.",
-        },
-        ("Mercury", "Full Moon"): {
-            "theme": "Crystal Clarity",
-            "message": "Communication peaks. Words land with precision. Important conversations held now carry lasting impact.",
-        },
-        ("Mercury", "Waning Gibbous"): {
-            "theme": "Sharing Knowledge",
-            "message": "What you've learned is ready to be taught. Communication flows outward. Write, speak, connect.",
-        },
-        ("Mercury", "Last Quarter"): {
-            "theme": "Revising Thought",
-            "message": "Old ideas need updating. Question assumptions that once served you. Mental flexibility is your ally.",
-        },
-        ("Mercury", "Waning Crescent"): {
-            "theme": "Mental Rest",
-            "message": "The mind needs sleep as much as the body. Reduce input. Let the subconscious sort what the conscious cannot.",
-        },
-        # --- Jupiter ---
-        ("Jupiter", "New Moon"): {
-            "theme": "Seeding Abundance",
-            "message": "Plant the seed of a grand vision. Do not worry about the harvest — the soil is rich and waiting.",
-        },
-        ("Jupiter", "Waxing Crescent"): {
-            "theme": "Growing Faith",
-            "message": "Optimism stirs. Trust the process even when evidence is scarce. The universe rewards belief backed by action.",
-        },
-        ("Jupiter", "First Quarter"): {
-            "theme": "Expanding Through Challenge",
-            "message": "Growth requires discomfort. The expansion you seek is on the other side of this obstacle. Lean in.",
-        },
-        ("Jupiter", "Waxing Gibbous"): {
-            "theme": "Refining Abundance",
-            "message": "Wisdom is almost fully formed. Fine-tune your expansion plans before the breakthrough arrives.",
-        },
-        ("Jupiter", "Full Moon"): {
-            "theme": "Harvest of Wisdom",
-            "message": "Everything you have learned comes together now. Abundance is not just material — it is understanding made manifest.",
-        },
-        ("Jupiter", "Waning Gibbous"): {
-            "theme": "Philanthropic Flow",
-            "message": "Your abundance is meant to circulate. Give generously — not from obligation, but from overflow.",
-        },
-        ("Jupiter", "Last Quarter"): {
-            "theme": "Philosophical Pruning",
-            "message": "Not all beliefs serve your growth. Release outdated philosophies that have become cages instead of wings.",
-        },
-        ("Jupiter", "Waning Crescent"): {
-            "theme": "Quiet Gratitude",
-            "message": "Before the next expansion, pause to appreciate how far you have come. Gratitude fuels the next cycle.",
-        },
-        # --- Venus ---
-        ("Venus", "New Moon"): {
-            "theme": "Love Incubating",
-            "message": "Desire stirs beneath the surface. Do not chase — attract. What you value most is taking shape in the unseen.",
-        },
-        ("Venus", "Waxing Crescent"): {
-            "theme": "Beauty Budding",
-            "message": "New attractions and creative impulses emerge. Follow what delights you — pleasure is a compass now.",
-        },
-        ("Venus", "First Quarter"): {
-            "theme": "Values Tested",
-            "message": "What you love meets what is practical. Compromise does not mean surrender — it means artful integration.",
-        },
-        ("Venus", "Waxing Gibbous"): {
-            "theme": "Perfecting Harmony",
-            "message": "Relationships and creative works approach their best form. Small adjustments yield disproportionate beauty.",
-        },
-        ("Venus", "Full Moon"): {
-            "theme": "Love Illuminated",
-            "message": "Relationships and values are fully visible. Beauty demands attention. What you love is loving you back.",
-        },
-        ("Venus", "Waning Gibbous"): {
-            "theme": "Graceful Generosity",
-            "message": "Share your beauty, your art, your love. The aesthetic gifts you carry are medicine for those around you.",
-        },
-        ("Venus", "Last Quarter"): {
-            "theme": "Releasing Attachment",
-            "message": "Love without clinging. Beauty without possession. The heart grows larger when it opens its grip.",
-        },
-        ("Venus", "Waning Crescent"): {
-            "theme": "Self-Love Retreat",
-            "message": "Turn the love you give others inward. You cannot pour from an empty cup. Rest in your own beauty.",
-        },
-        # --- Saturn ---
-        ("Saturn", "New Moon"): {
-            "theme": "Foundation in Darkness",
-            "message": "Discipline begins before anyone is watching. The structures you build now in silence will hold the most weight.",
-        },
-        ("Saturn", "Waxing Crescent"): {
-            "theme": "Early Commitment",
-            "message": "The first steps of discipline feel heavy. This is normal. Consistency now creates freedom later.",
-        },
-        ("Saturn", "First Quarter"): {
-            "theme": "Test of Resolve",
-            "message": "The structure you are building meets its first real test. Hold firm — the challenge proves the design is sound.",
-        },
-        ("Saturn", "Waxing Gibbous"): {
-            "theme": "Mastering the Details",
-            "message": "Discipline matures into craftsmanship. Pay attention to the fine points. Excellence lives in the margins.",
-        },
-        ("Saturn", "Full Moon"): {
-            "theme": "Earned Authority",
-            "message": "Your discipline is now visible to all. The respect you receive was built brick by brick. Stand in it fully.",
-        },
-        ("Saturn", "Waning Gibbous"): {
-            "theme": "Elder Wisdom",
-            "message": "Your experience is a gift to those still climbing. Teach through example. Mentorship is Saturn's highest calling.",
-        },
-        ("Saturn", "Last Quarter"): {
-            "theme": "Structural Release",
-            "message": "Some walls are no longer load-bearing. Identify the rules you follow from habit, not necessity, and let them go.",
-        },
-        ("Saturn", "Waning Crescent"): {
-            "theme": "Final Lesson",
-            "message": "The discipline cycle completes. Release what you've outgrown. Rest is not weakness — it is wisdom earned.",
-        },
-    }
+    def __set_name__(self, owner, name):
+        self._name = name
 
-    # ----------------------------------------------------------------
-    # 2. LP_PY_COMBOS  (Life Path 1-9 x Personal Year 1-9 = 81 entries)
-    # ----------------------------------------------------------------
-    LP_PY_COMBOS: Dict[tuple, Dict[str, str]] = {
-        # LP 1
-        (1, 1): {
-            "theme": "Double Ignition",
-            "message": "Pioneer entering a year of new beginnings — this is your most powerful launch window. Start what matters most.",
-        },
-        (1, 2): {
-            "theme": "Leader Listens",
-            "message": "The Pioneer pauses to build partnerships. Your independence is strengthened, not weakened, by collaboration.",
-        },
-        (1, 3): {
-            "theme": "Creative Spark",
-            "message": "The Pioneer finds a voice. Your ideas demand expression now. Write, speak, perform — let originality flow.",
-        },
-        (1, 4): {
-            "theme": "Building the Vision",
-            "message": "The Pioneer lays foundations. Your bold ideas need structure. This year rewards planning over impulse.",
-        },
-        (1, 5): {
-            "theme": "Pioneer Unleashed",
-            "message": "The Pioneer meets freedom. Every direction calls. Choose the adventure that aligns with your core mission.",
-        },
-        (1, 6): {
-            "theme": "Leader as Guardian",
-            "message": "The Pioneer tends to home and heart. Leadership begins with those closest to you. Nurture your roots.",
-        },
-        (1, 7): {
-            "theme": "Solitary Strategy",
-            "message": "The Pioneer retreats to plan. Solitude sharpens your vision. The world can wait while you recalibrate.",
-        },
-        (1, 8): {
-            "theme": "Power Surge",
-            "message": "The Pioneer steps into authority. Material success and leadership converge. Claim your earned position.",
-        },
-        (1, 9): {
-            "theme": "Pioneer's Completion",
-            "message": "The Pioneer reaches an ending. Release old identities so a truer version of yourself can emerge.",
-        },
-        # LP 2
-        (2, 1): {
-            "theme": "Diplomat Steps Forward",
-            "message": "The Bridge takes the lead for once. Initiate what you have been mediating. Your turn to begin.",
-        },
-        (2, 2): {
-            "theme": "Double Harmony",
-            "message": "The Bridge in a year of partnership — your natural gifts peak. Deep connections form effortlessly.",
-        },
-        (2, 3): {
-            "theme": "Harmony Expressed",
-            "message": "The Bridge finds creative joy. Your sensitivity becomes art. Express the feelings you usually hold for others.",
-        },
-        (2, 4): {
-            "theme": "Patient Foundation",
-            "message": "The Bridge builds slowly and surely. Your patience is your superpower this year. Trust the quiet progress.",
-        },
-        (2, 5): {
-            "theme": "Gentle Adventurer",
-            "message": "The Bridge explores new territory. Change feels uncomfortable but necessary. Your adaptability surprises you.",
-        },
-        (2, 6): {
-            "theme": "Heart of Home",
-            "message": "The Bridge nurtures deeply. Family and community need your gift for harmony. Love is your primary currency.",
-        },
-        (2, 7): {
-            "theme": "Intuitive Depths",
-            "message": "The Bridge turns inward. Your natural sensitivity meets spiritual inquiry. Deep truths surface through meditation.",
-        },
-        (2, 8): {
-            "theme": "Cooperative Power",
-            "message": "The Bridge enters the arena of authority. Success comes through alliances, not solo effort. Build your team.",
-        },
-        (2, 9): {
-            "theme": "Releasing Bonds",
-            "message": "The Bridge must let some connections go. Completion frees you for deeper, more aligned relationships ahead.",
-        },
-        # LP 3
-        (3, 1): {
-            "theme": "Creative Launch",
-            "message": "The Voice begins a new project. Your creative vision demands a fresh start. Initiate with joy and boldness.",
-        },
-        (3, 2): {
-            "theme": "Collaborative Art",
-            "message": "The Voice finds a duet partner. Creative partnerships flourish. Two imaginations are better than one.",
-        },
-        (3, 3): {
-            "theme": "Triple Expression",
-            "message": "The Voice in its power year. Creativity is unstoppable. Every medium calls you. Express without restraint.",
-        },
-        (3, 4): {
-            "theme": "Disciplined Creativity",
-            "message": "The Voice learns structure. Your art needs a container. Craft and discipline elevate raw talent into mastery.",
-        },
-        (3, 5): {
-            "theme": "Joyful Exploration",
-            "message": "The Voice seeks new audiences. Travel, new social circles, and adventurous expression light up this year.",
-        },
-        (3, 6): {
-            "theme": "Creative Nurturing",
-            "message": "The Voice serves family and community. Your words heal. Use your gift of expression to uplift those around you.",
-        },
-        (3, 7): {
-            "theme": "Artist in Solitude",
-            "message": "The Voice turns reflective. Your deepest creative work emerges from silence. Seek solitude to find your masterpiece.",
-        },
-        (3, 8): {
-            "theme": "Creative Empire",
-            "message": "The Voice builds a platform. Your art meets commerce. This year rewards turning creativity into sustainable success.",
-        },
-        (3, 9): {
-            "theme": "Final Performance",
-            "message": "The Voice completes a creative chapter. Share your accumulated wisdom generously. The best art serves others.",
-        },
-        # LP 4
-        (4, 1): {
-            "theme": "New Blueprint",
-            "message": "The Architect drafts a new plan. Begin the next major structure of your life. Design before you build.",
-        },
-        (4, 2): {
-            "theme": "Building Together",
-            "message": "The Architect finds a partner. Collaboration strengthens the foundation. Two sets of hands build faster.",
-        },
-        (4, 3): {
-            "theme": "Playful Structure",
-            "message": "The Architect discovers joy in the work. Creativity softens rigidity. Let the building process itself be beautiful.",
-        },
-        (4, 4): {
-            "theme": "Double Foundation",
-            "message": "The Architect in their power year. Everything built now has quadruple staying power. Work hard — it all lasts.",
-        },
-        (4, 5): {
-            "theme": "Flexible Framework",
-            "message": "The Architect faces disruption. Your structures need to flex, not just hold. Adaptability is the new strength.",
-        },
-        (4, 6): {
-            "theme": "Home Builder",
-            "message": "The Architect focuses on domestic foundations. Home, family, and security are the projects that matter most.",
-        },
-        (4, 7): {
-            "theme": "Inner Architecture",
-            "message": "The Architect builds within. Spiritual and psychological frameworks need attention. Build the inner temple.",
-        },
-        (4, 8): {
-            "theme": "Material Mastery",
-            "message": "The Architect meets material reward. Years of disciplined work pay tangible dividends. Accept the harvest.",
-        },
-        (4, 9): {
-            "theme": "Demolition and Design",
-            "message": "The Architect tears down to rebuild. Some structures have served their purpose. Clear the lot for new plans.",
-        },
-        # LP 5
-        (5, 1): {
-            "theme": "Adventure Begins",
-            "message": "The Explorer launches into unknown territory. A fresh cycle of freedom and discovery opens wide before you.",
-        },
-        (5, 2): {
-            "theme": "Explorer Settles In",
-            "message": "The Explorer finds a traveling companion. Freedom is sweeter when shared. Let partnership ground your wanderlust.",
-        },
-        (5, 3): {
-            "theme": "Storyteller's Journey",
-            "message": "The Explorer gathers tales. Every experience becomes material for expression. Live fully, then share the story.",
-        },
-        (5, 4): {
-            "theme": "Freedom Meets Form",
-            "message": "The Explorer needs a base camp. Freedom without structure scatters energy. Build the launchpad for your next leap.",
-        },
-        (5, 5): {
-            "theme": "Maximum Velocity",
-            "message": "The Explorer in peak freedom. Change accelerates from every direction. Ride the wave — do not fight the current.",
-        },
-        (5, 6): {
-            "theme": "Rooted Wanderer",
-            "message": "The Explorer comes home. Responsibility calls you back to center. Find adventure within commitment.",
-        },
-        (5, 7): {
-            "theme": "Inner Expedition",
-            "message": "The Explorer journeys inward. The most exotic territory is your own consciousness. Meditate, study, question.",
-        },
-        (5, 8): {
-            "theme": "Freedom and Fortune",
-            "message": "The Explorer monetizes experience. Your diverse adventures become assets. The world pays for what you know.",
-        },
-        (5, 9): {
-            "theme": "Freedom Through Release",
-            "message": "The Explorer reaches a year of completion. Let go of adventures that no longer serve growth. Make room for the next chapter.",
-        },
-        # LP 6
-        (6, 1): {
-            "theme": "Guardian's New Chapter",
-            "message": "The Guardian begins something for themselves. Self-care is not selfish — it is the foundation of all your giving.",
-        },
-        (6, 2): {
-            "theme": "Deepening Devotion",
-            "message": "The Guardian's relationships deepen. Love becomes more nuanced. Partnership thrives through mutual understanding.",
-        },
-        (6, 3): {
-            "theme": "Joyful Service",
-            "message": "The Guardian expresses love creatively. Art, beauty, and nurturing merge. Your care becomes an art form.",
-        },
-        (6, 4): {
-            "theme": "Strengthening the Nest",
-            "message": "The Guardian fortifies home and family. Practical improvements to your environment bring lasting security.",
-        },
-        (6, 5): {
-            "theme": "Guardian Unchained",
-            "message": "The Guardian needs breathing room. Duty and freedom negotiate. Healthy boundaries are acts of love, not betrayal.",
-        },
-        (6, 6): {
-            "theme": "Double Devotion",
-            "message": "The Guardian in full power. Love, responsibility, and beauty converge. You are the heart of every room you enter.",
-        },
-        (6, 7): {
-            "theme": "Sacred Service",
-            "message": "The Guardian seeks spiritual meaning in duty. Your caregiving becomes a spiritual practice. Find God in the everyday.",
-        },
-        (6, 8): {
-            "theme": "Abundant Caretaker",
-            "message": "The Guardian receives material reward for service. Prosperity flows through generosity. Give and receive in equal measure.",
-        },
-        (6, 9): {
-            "theme": "Completing the Circle",
-            "message": "The Guardian releases old obligations. Some duties have been fulfilled. Let others carry what you have held too long.",
-        },
-        # LP 7
-        (7, 1): {
-            "theme": "Seeker's Fresh Start",
-            "message": "The Seeker begins a new inquiry. A question you have never asked before leads you to answers that reshape everything.",
-        },
-        (7, 2): {
-            "theme": "Wisdom in Partnership",
-            "message": "The Seeker finds a mirror in another. Deep conversation and emotional intelligence expand your understanding.",
-        },
-        (7, 3): {
-            "theme": "Inner Wisdom Expressed",
-            "message": "The Seeker enters a year of creative expression. Your deep insights are ready to be shared. Speak the truth you've found.",
-        },
-        (7, 4): {
-            "theme": "Systematic Discovery",
-            "message": "The Seeker builds a method. Your intuitions need a framework. Organize your findings into something teachable.",
-        },
-        (7, 5): {
-            "theme": "Nomadic Philosopher",
-            "message": "The Seeker explores through movement. Travel and new experiences crack open old assumptions. Embrace the disruption.",
-        },
-        (7, 6): {
-            "theme": "Wisdom Serves Love",
-            "message": "The Seeker applies insight to relationships. Your analytical gifts serve the heart this year. Think less, feel more.",
-        },
-        (7, 7): {
-            "theme": "Double Depth",
-            "message": "The Seeker in peak contemplation. Spiritual breakthroughs are possible. Retreat, meditate, and let truth find you.",
-        },
-        (7, 8): {
-            "theme": "Monetized Insight",
-            "message": "The Seeker finds material reward for wisdom. Your knowledge has value in the marketplace. Teach, consult, advise.",
-        },
-        (7, 9): {
-            "theme": "Philosopher's Completion",
-            "message": "The Seeker finishes a cycle of inquiry. Share your conclusions before beginning the next question.",
-        },
-        # LP 8
-        (8, 1): {
-            "theme": "Empire Begins",
-            "message": "The Powerhouse launches a new venture. Authority and initiative combine. Build something that outlasts you.",
-        },
-        (8, 2): {
-            "theme": "Strategic Alliance",
-            "message": "The Powerhouse partners wisely. True power comes from collaboration. Choose allies whose strengths complement yours.",
-        },
-        (8, 3): {
-            "theme": "Charismatic Authority",
-            "message": "The Powerhouse finds a public voice. Leadership meets charm. Your vision inspires others to follow willingly.",
-        },
-        (8, 4): {
-            "theme": "Fortified Empire",
-            "message": "The Powerhouse builds infrastructure. Systems, processes, and foundations make the difference between flash and legacy.",
-        },
-        (8, 5): {
-            "theme": "Dynamic Power",
-            "message": "The Powerhouse adapts rapidly. Markets shift, circumstances change — your ability to pivot determines your success.",
-        },
-        (8, 6): {
-            "theme": "Benevolent Authority",
-            "message": "The Powerhouse serves community. True power is measured by how many you lift, not how high you climb alone.",
-        },
-        (8, 7): {
-            "theme": "Strategic Retreat",
-            "message": "The Powerhouse pauses to think deeply. Before the next move, understand the deeper currents. Wisdom precedes action.",
-        },
-        (8, 8): {
-            "theme": "Maximum Authority",
-            "message": "The Powerhouse at full capacity. Achievement, recognition, and material mastery converge. Step into your full power.",
-        },
-        (8, 9): {
-            "theme": "Legacy Completion",
-            "message": "The Powerhouse finishes a major cycle. What you have built speaks for itself. Release control and let it stand.",
-        },
-        # LP 9
-        (9, 1): {
-            "theme": "Sage's New Dawn",
-            "message": "The Sage begins again. After completion comes rebirth. Start fresh with all the wisdom of your previous cycles.",
-        },
-        (9, 2): {
-            "theme": "Compassionate Connection",
-            "message": "The Sage builds bridges. Your understanding of endings makes you the perfect partner. Share your depth.",
-        },
-        (9, 3): {
-            "theme": "Universal Voice",
-            "message": "The Sage speaks for all. Your creative expression carries humanitarian weight. Art as service reaches its zenith.",
-        },
-        (9, 4): {
-            "theme": "Wisdom Made Practical",
-            "message": "The Sage grounds the vision. Spiritual insight needs earthly form. Build something tangible from your understanding.",
-        },
-        (9, 5): {
-            "theme": "Sage's Wandering",
-            "message": "The Sage explores without attachment. Every experience completes a circle. Move freely and release as you go.",
-        },
-        (9, 6): {
-            "theme": "Healing Presence",
-            "message": "The Sage nurtures through wisdom. Your presence alone is medicine. Be with those who need understanding, not fixing.",
-        },
-        (9, 7): {
-            "theme": "Ultimate Contemplation",
-            "message": "The Sage meets the mystic. Deepest spiritual insight is available. Seek silence — the answers live there.",
-        },
-        (9, 8): {
-            "theme": "Humanitarian Power",
-            "message": "The Sage wields influence for the greater good. Material success serves a higher purpose. Lead with compassion.",
-        },
-        (9, 9): {
-            "theme": "Grand Completion",
-            "message": "The Sage completes the ultimate cycle. Everything resolves. Surrender to the ending — the next beginning is already forming.",
-        },
-    }
+    def __get__(self, obj, owner):
+        value = self._build()
+        setattr(owner, self._name, value)
+        return value
 
-    # ----------------------------------------------------------------
-    # 3. ANIMAL_HARMONY  (frozenset keys for symmetric lookup)
-    # ----------------------------------------------------------------
-    ANIMAL_HARMONY: Dict[frozenset, Dict[str, str]] = {
-        # --- Traditional Harmonies (6 pairs) ---
-        frozenset({"RA", "OX"}): {
-            "type": "harmony",
-            "meaning": "Resourcefulness meets endurance. Together these energies create unstoppable momentum through patience and perception.",
-        },
-        frozenset({"TI", "PI"}): {
-            "type": "harmony",
-            "meaning": "Courage meets generosity. The bold tiger finds softness in the pig's abundance, creating noble strength.",
-        },
-        frozenset({"RU", "DO"}): {
-            "type": "harmony",
-            "meaning": "Intuition meets loyalty. The rabbit's gentle instinct paired with the dog's devotion creates trustworthy guidance.",
-        },
-        frozenset({"DR", "RO"}): {
-            "type": "harmony",
-            "meaning": "Transformation meets truth. The dragon's destiny and the rooster's honesty forge a path of authentic power.",
-        },
-        frozenset({"SN", "MO"}): {
-            "type": "harmony",
-            "meaning": "Wisdom meets cleverness. The snake's depth and the monkey's agility create brilliant strategic insight.",
-        },
-        frozenset({"HO", "GO"}): {
-            "type": "harmony",
-            "meaning": "Freedom meets creativity. The horse's passionate movement and the goat's artistic vision produce inspired action.",
-        },
-        # --- Traditional Clashes (6 pairs) ---
-        frozenset({"RA", "HO"}): {
-            "type": "clash",
-            "meaning": "Cunning perception clashes with unbridled freedom. One calculates while the other charges forward without looking.",
-        },
-        frozenset({"OX", "GO"}): {
-            "type": "clash",
-            "meaning": "Stubborn endurance meets sensitive artistry. Rigidity and fluidity struggle to find common ground.",
-        },
-        frozenset({"TI", "MO"}): {
-            "type": "clash",
-            "meaning": "Bold authority confronts clever defiance. Power and trickery create friction that demands resolution.",
-        },
-        frozenset({"RU", "RO"}): {
-            "type": "clash",
-            "meaning": "Gentle diplomacy versus blunt truth. The rabbit's softness feels wounded by the rooster's sharp honesty.",
-        },
-        frozenset({"DR", "DO"}): {
-            "type": "clash",
-            "meaning": "Grand destiny meets grounded loyalty. The dragon's ambition feels constrained by the dog's call to duty.",
-        },
-        frozenset({"SN", "PI"}): {
-            "type": "clash",
-            "meaning": "Deep precision meets open generosity. The snake's calculated nature distrusts the pig's unconditional giving.",
-        },
-        # --- Resonance pairs (same animal) ---
-        frozenset({"RA"}): {
-            "type": "resonance",
-            "meaning": "Double Rat amplifies resourcefulness and sharp perception. Hyper-awareness — trust your instincts completely.",
-        },
-        frozenset({"OX"}): {
-            "type": "resonance",
-            "meaning": "Double Ox amplifies endurance and determination. Immovable resolve — nothing can shake your foundation today.",
-        },
-        frozenset({"TI"}): {
-            "type": "resonance",
-            "meaning": "Double Tiger amplifies courage and boldness. Fearless energy — but beware of recklessness in the intensity.",
-        },
-        frozenset({"RU"}): {
-            "type": "resonance",
-            "meaning": "Double Rabbit amplifies intuition and sensitivity. Deep knowing flows through you — listen to the whispers.",
-        },
-        frozenset({"DR"}): {
-            "type": "resonance",
-            "meaning": "Double Dragon amplifies transformation and destiny. Monumental shifts are underway — embrace the magnitude.",
-        },
-        frozenset({"SN"}): {
-            "type": "resonance",
-            "meaning": "Double Snake amplifies wisdom and precision. Penetrating insight — you see what others cannot.",
-        },
-        frozenset({"HO"}): {
-            "type": "resonance",
-            "meaning": "Double Horse amplifies freedom and passionate energy. Unstoppable movement — but remember where home is.",
-        },
-        frozenset({"GO"}): {
-            "type": "resonance",
-            "meaning": "Double Goat amplifies creativity and artistic vision. Beauty saturates everything — let yourself be moved.",
-        },
-        frozenset({"MO"}): {
-            "type": "resonance",
-            "meaning": "Double Monkey amplifies adaptability and wit. Quick thinking dominates — use your cleverness wisely.",
-        },
-        frozenset({"RO"}): {
-            "type": "resonance",
-            "meaning": "Double Rooster amplifies truth and discipline. Absolute clarity — speak with confidence and precision.",
-        },
-        frozenset({"DO"}): {
-            "type": "resonance",
-            "meaning": "Double Dog amplifies loyalty and protection. Fierce devotion — guard what matters most with everything you have.",
-        },
-        frozenset({"PI"}): {
-            "type": "resonance",
-            "meaning": "Double Pig amplifies abundance and generosity. Overflowing warmth — share freely without fear of scarcity.",
-        },
-        # --- Notable neutral pairs ---
-        frozenset({"RA", "DR"}): {
-            "type": "neutral",
-            "meaning": "Rat and Dragon coexist with mutual respect. Resourcefulness acknowledges destiny without interference.",
-        },
-        frozenset({"OX", "SN"}): {
-            "type": "neutral",
-            "meaning": "Ox and Snake find quiet companionship. Both value patience and depth, operating on parallel tracks.",
-        },
-        frozenset({"TI", "HO"}): {
-            "type": "neutral",
-            "meaning": "Tiger and Horse share energetic independence. Both need freedom but express it through different channels.",
-        },
-        frozenset({"RU", "GO"}): {
-            "type": "neutral",
-            "meaning": "Rabbit and Goat share artistic sensitivity. Both appreciate beauty, creating a gentle, aesthetic atmosphere.",
-        },
-        frozenset({"MO", "DR"}): {
-            "type": "neutral",
-            "meaning": "Monkey and Dragon share ambition without conflict. Cleverness serves destiny in a productive alliance.",
-        },
-        frozenset({"RO", "SN"}): {
-            "type": "neutral",
-            "meaning": "Rooster and Snake share analytical precision. Both value truth, though they seek it through different methods.",
-        },
-        frozenset({"DO", "TI"}): {
-            "type": "neutral",
-            "meaning": "Dog and Tiger share a sense of justice. Both protect the vulnerable, though their methods differ.",
-        },
-        frozenset({"PI", "RU"}): {
-            "type": "neutral",
-            "meaning": "Pig and Rabbit share gentle warmth. Both value comfort and kindness, creating a peaceful environment.",
-        },
-    }
+
+def _signal_tables():
+    from . import signal_tables
+
+    return signal_tables
+
+
+class SignalCombiner:
+    """Cross-reference and combine signals from all framework engines."""
+
+    # Text tables (synthesis/signal_tables.py) and the dense tables derived
+    # from them are loaded on first access:
+    #   PLANET_MOON_COMBOS   (7 planets x 8 moon phases = 56 entries)
+    #   LP_PY_COMBOS         (Life Path 1-9 x Personal Year 1-9 = 81 entries)
+    #   ANIMAL_HARMONY       (frozenset keys for symmetric lookup)
+    PLANET_MOON_COMBOS = _LazyTable(lambda: _signal_tables().PLANET_MOON_COMBOS)
+    LP_PY_COMBOS = _LazyTable(lambda: _signal_tables().LP_PY_COMBOS)
+    ANIMAL_HARMONY = _LazyTable(lambda: _signal_tables().ANIMAL_HARMONY)
 
     # Priority hierarchy for signal sorting
     PRIORITY_RANK: Dict[str, int] = {
@@ -743,6 +69,21 @@ class SignalCombiner:
         "Background": 1,
     }
 
+    # Signal types emitted by ReadingEngine; Signal.code indexes this tuple
+    SIGNAL_TYPES = (
+        "animal_repetition",
+        "day_planet",
+        "moon_phase",
+        "dom_animal_element",
+        "hour_animal",
+    )
+
+    # Signals shown by combine_signals (primary + supporting)
+    TOP_SIGNALS = 4
+
+    # Element words searched for in signal messages (bit i of Signal.elements)
+    ELEMENT_WORDS = ("fire", "water", "wood", "metal", "earth")
+
     # Element clash pairs
     ELEMENT_CLASHES: Dict[frozenset, str] = {
         frozenset(
@@ -759,6 +100,20 @@ class SignalCombiner:
         ): "Wood and Metal oppose — growth meets cutting refinement.",
     }
 
+    # Dense tables built from the text tables:
+    #   PLANET_MOON_TABLE[planet][phase]        7 x 8, WeekdayCalculator.PLANETS
+    #                                           x MoonEngine.PHASE_NAMES order
+    #   LP_PY_TABLE[life_path][personal_year]   34 x 34, indexed by the numbers
+    #                                           (0..33), master fallback applied
+    #   ANIMAL_HARMONY_TABLE[a][b]              12 x 12, Base60Codec.ANIMALS order
+    #   ANIMAL_HARMONY_CODES[a][b]              index into HARMONY_TYPES
+    HARMONY_TYPES = ("neutral", "harmony", "clash", "resonance")
+    MAX_TABLE_NUMBER = 33
+    PLANET_MOON_TABLE = _LazyTable(lambda: _planet_moon_table())
+    LP_PY_TABLE = _LazyTable(lambda: _lp_py_table())
+    ANIMAL_HARMONY_TABLE = _LazyTable(lambda: _animal_harmony_table())
+    ANIMAL_HARMONY_CODES = _LazyTable(lambda: _animal_harmony_codes())
+
     @staticmethod
     def planet_meets_moon(planet: str, moon_phase: str) -> Dict[str, str]:
         """
@@ -771,13 +126,11 @@ class SignalCombiner:
         Returns:
             Dict with 'theme' and 'message' keys
         """
-        result = SignalCombiner.PLANET_MOON_COMBOS.get((planet, moon_phase))
-        if result:
-            return dict(result)
-        return {
-            "theme": "Uncharted Alignment",
-            "message": f"The combination of {planet} and {moon_phase} is rare and personal. Observe what arises without expectation.",
-        }
+        p = _PLANET_INDEX.get(planet)
+        m = _PHASE_INDEX.get(moon_phase)
+        if p is None or m is None:
+            return SignalCombiner._lookup_planet_moon(planet, moon_phase)
+        return dict(SignalCombiner.PLANET_MOON_TABLE[p][m])
 
     @staticmethod
     def lifepath_meets_year(life_path: int, personal_year: int) -> Dict[str, str]:
@@ -794,6 +147,51 @@ class SignalCombiner:
         Returns:
             Dict with 'theme' and 'message' keys
         """
+        top = SignalCombiner.MAX_TABLE_NUMBER
+        if (
+            type(life_path) is int
+            and type(personal_year) is int
+            and 0 <= life_path <= top
+            and 0 <= personal_year <= top
+        ):
+            return dict(SignalCombiner.LP_PY_TABLE[life_path][personal_year])
+        return SignalCombiner._lookup_lifepath_year(life_path, personal_year)
+
+    @staticmethod
+    def animal_harmony(animal1: str, animal2: str) -> Dict[str, str]:
+        """
+        Determine the harmony relationship between two animal tokens.
+
+        Symmetric — animal_harmony("RA", "OX") == animal_harmony("OX", "RA").
+        Same animal returns resonance type.
+
+        Args:
+            animal1: 2-char animal token (e.g. "RA", "OX")
+            animal2: 2-char animal token
+
+        Returns:
+            Dict with 'type' (harmony/clash/resonance/neutral) and 'meaning'
+        """
+        a = _ANIMAL_INDEX.get(animal1)
+        b = _ANIMAL_INDEX.get(animal2)
+        if a is None or b is None:
+            return SignalCombiner._lookup_animal_harmony(animal1, animal2)
+        return dict(SignalCombiner.ANIMAL_HARMONY_TABLE[a][b])
+
+    # ── dict lookups (table source and fallback for other inputs) ──
+
+    @staticmethod
+    def _lookup_planet_moon(planet: str, moon_phase: str) -> Dict[str, str]:
+        result = SignalCombiner.PLANET_MOON_COMBOS.get((planet, moon_phase))
+        if result:
+            return dict(result)
+        return {
+            "theme": "Uncharted Alignment",
+            "message": f"The combination of {planet} and {moon_phase} is rare and personal. Observe what arises without expectation.",
+        }
+
+    @staticmethod
+    def _lookup_lifepath_year(life_path: int, personal_year: int) -> Dict[str, str]:
         master_reduction = {11: 2, 22: 4, 33: 6}
 
         # Direct lookup first
@@ -821,20 +219,7 @@ class SignalCombiner:
         }
 
     @staticmethod
-    def animal_harmony(animal1: str, animal2: str) -> Dict[str, str]:
-        """
-        Determine the harmony relationship between two animal tokens.
-
-        Symmetric — animal_harmony("RA", "OX") == animal_harmony("OX", "RA").
-        Same animal returns resonance type.
-
-        Args:
-            animal1: 2-char animal token (e.g. "RA", "OX")
-            animal2: 2-char animal token
-
-        Returns:
-            Dict with 'type' (harmony/clash/resonance/neutral) and 'meaning'
-        """
+    def _lookup_animal_harmony(animal1: str, animal2: str) -> Dict[str, str]:
         key = frozenset({animal1, animal2})
         result = SignalCombiner.ANIMAL_HARMONY.get(key)
         if result:
@@ -845,45 +230,74 @@ class SignalCombiner:
         }
 
     @staticmethod
-    def _detect_tensions(signals: List[Dict], ganzhi: Dict) -> List[str]:
+    def verify_tables() -> List[str]:
+        """
+        Check every dense table cell against the dict lookup it replaces.
+
+        Returns:
+            Descriptions of mismatching cells (empty when the tables agree)
+        """
+        errors = []
+        for p, planet in enumerate(WeekdayCalculator.PLANETS):
+            for m, phase in enumerate(MoonEngine.PHASE_NAMES):
+                if SignalCombiner.PLANET_MOON_TABLE[p][m] != SignalCombiner._lookup_planet_moon(
+                    planet, phase
+                ):
+                    errors.append(f"PLANET_MOON_TABLE[{p}][{m}] ({planet}, {phase})")
+        numbers = range(SignalCombiner.MAX_TABLE_NUMBER + 1)
+        for lp in numbers:
+            for py in numbers:
+                if SignalCombiner.LP_PY_TABLE[lp][py] != SignalCombiner._lookup_lifepath_year(
+                    lp, py
+                ):
+                    errors.append(f"LP_PY_TABLE[{lp}][{py}]")
+        for a, first in enumerate(Base60Codec.ANIMALS):
+            for b, second in enumerate(Base60Codec.ANIMALS):
+                expected = SignalCombiner._lookup_animal_harmony(first, second)
+                if SignalCombiner.ANIMAL_HARMONY_TABLE[a][b] != expected:
+                    errors.append(f"ANIMAL_HARMONY_TABLE[{a}][{b}] ({first}, {second})")
+                code = SignalCombiner.ANIMAL_HARMONY_CODES[a][b]
+                if SignalCombiner.HARMONY_TYPES[code] != expected["type"]:
+                    errors.append(f"ANIMAL_HARMONY_CODES[{a}][{b}] ({first}, {second})")
+        return errors
+
+    @staticmethod
+    def _detect_tensions(signals: Sequence["Signal"], ganzhi: Dict) -> List[str]:
         """Detect conflicting energies in signal data."""
         tensions = []
 
-        # Collect elements from signals
-        elements_found = []
+        # Check element clashes against the elements named in any message
+        seen_elements = 0
         for s in signals:
-            msg = s.get("message", "").lower()
-            for el_name in ("fire", "water", "wood", "metal", "earth"):
-                if el_name in msg:
-                    elements_found.append(el_name.capitalize())
-
-        # Check element clashes
-        seen_elements = set(elements_found)
-        for clash_pair, description in SignalCombiner.ELEMENT_CLASHES.items():
-            if clash_pair.issubset(seen_elements):
+            seen_elements |= s.elements
+        for clash_mask, description in _ELEMENT_CLASH_MASKS:
+            if seen_elements & clash_mask == clash_mask:
                 tensions.append(description)
 
-        # Check animal clashes from ganzhi data
+        # Check animal clashes from ganzhi data (tokens outside
+        # Base60Codec.ANIMALS are neutral to everything)
         animals_in_play = []
         if ganzhi:
             for period in ("year", "day", "hour"):
                 branch = ganzhi.get(period, {}).get("branch_token", "")
-                if branch:
-                    animals_in_play.append(branch)
-
-        for i in range(len(animals_in_play)):
-            for j in range(i + 1, len(animals_in_play)):
-                pair_result = SignalCombiner.animal_harmony(
-                    animals_in_play[i], animals_in_play[j]
-                )
-                if pair_result["type"] == "clash":
-                    tensions.append(pair_result["meaning"])
+                index = _ANIMAL_INDEX.get(branch)
+                if index is not None:
+                    animals_in_play.append(index)
+
+        if len(animals_in_play) > 1:
+            codes = SignalCombiner.ANIMAL_HARMONY_CODES
+            table = SignalCombiner.ANIMAL_HARMONY_TABLE
+            for i in range(len(animals_in_play)):
+                for j in range(i + 1, len(animals_in_play)):
+                    a, b = animals_in_play[i], animals_in_play[j]
+                    if codes[a][b] == _CLASH:
+                        tensions.append(table[a][b]["meaning"])
 
         return tensions
 
     @staticmethod
     def _generate_actions(
-        signals: List[Dict], numerology: Dict, moon: Dict
+        signals: Sequence["Signal"], numerology: Dict, moon: Dict
     ) -> List[str]:
         """Generate 3 recommended actions based on the strongest signals."""
         actions = []
@@ -891,16 +305,16 @@ class SignalCombiner:
         # Action from strongest signal
         if signals:
             top = signals[0]
-            msg = top.get("message", "")
-            if "repetition" in top.get("type", "") or "animal" in top.get("type", ""):
+            msg = top.message
+            if "repetition" in top.type or "animal" in top.type:
                 actions.append(
                     "Pay attention to the repeated pattern — it is the loudest signal. Align your actions with its energy."
                 )
-            elif "planet" in top.get("type", ""):
+            elif "planet" in top.type:
                 actions.append(
                     f"Lean into today's planetary theme. {msg.split('.')[0]}."
                 )
-            elif "moon" in top.get("type", ""):
+            elif "moon" in top.type:
                 actions.append(
                     "Follow the moon's guidance for timing. Work with the lunar rhythm, not against it."
                 )
@@ -938,9 +352,21 @@ class SignalCombiner:
 
         return actions[:3]
 
+    @staticmethod
+    def top_signals(signals: Sequence["Signal"], k: int) -> List["Signal"]:
+        """
+        The k highest-ranked signals, ties in input order.
+
+        Heap selection for long lists; a reading's handful of signals is
+        cheaper to sort outright.
+        """
+        if len(signals) > 2 * k:
+            return heapq.nsmallest(k, signals, key=Signal.sort_key)
+        return sorted(signals, key=Signal.sort_key)[:k]
+
     @staticmethod
     def combine_signals(
-        signals: List[Dict],
+        signals: Sequence[Union["Signal", Dict]],
         numerology: Dict,
         moon: Dict,
         ganzhi: Dict,
@@ -948,8 +374,11 @@ class SignalCombiner:
         """
         Combine and prioritize signals from all engines.
 
+        Only the top TOP_SIGNALS signals by priority are selected (ties in
+        input order), and only their messages are rendered.
+
         Args:
-            signals: List of signal dicts from ReadingEngine
+            signals: Signal records from ReadingEngine, or signal dicts
                      (each has 'type', 'priority', 'message')
             numerology: Output from NumerologyEngine.complete_profile()
             moon: Output from MoonEngine.full_moon_info()
@@ -959,32 +388,19 @@ class SignalCombiner:
             Dict with primary_message, supporting_messages,
             tensions, and recommended_actions
         """
-        rank = SignalCombiner.PRIORITY_RANK
+        records = [s if isinstance(s, Signal) else Signal.from_dict(s) for s in signals]
 
-        # Sort signals by priority (highest first)
-        sorted_signals = sorted(
-            signals,
-            key=lambda s: rank.get(s.get("priority", ""), 0),
-            reverse=True,
-        )
-
-        # Primary message from highest priority signal
-        primary_message = ""
-        if sorted_signals:
-            primary_message = sorted_signals[0].get("message", "")
-
-        # Supporting messages from next 2-3 signals
-        supporting_messages = []
-        for s in sorted_signals[1:4]:
-            supporting_messages.append(s.get("message", ""))
+        # Primary message from highest priority signal, supporting
+        # messages from the next 3
+        top = SignalCombiner.top_signals(records, SignalCombiner.TOP_SIGNALS)
+        primary_message = top[0].message if top else ""
+        supporting_messages = [s.message for s in top[1:]]
 
         # Detect tensions
-        tensions = SignalCombiner._detect_tensions(sorted_signals, ganzhi)
+        tensions = SignalCombiner._detect_tensions(records, ganzhi)
 
         # Generate recommended actions
-        recommended_actions = SignalCombiner._generate_actions(
-            sorted_signals, numerology, moon
-        )
+        recommended_actions = SignalCombiner._generate_actions(top, numerology, moon)
 
         return {
             "primary_message": primary_message,
@@ -994,6 +410,203 @@ class SignalCombiner:
         }
 
 
+# ════════════════════════════════════════════════════════════
+# Dense lookup tables
+# ════════════════════════════════════════════════════════════
+
+_PLANET_INDEX = {name: i for i, name in enumerate(WeekdayCalculator.PLANETS)}
+_PHASE_INDEX = {name: i for i, name in enumerate(MoonEngine.PHASE_NAMES)}
+_ANIMAL_INDEX = {token: i for i, token in enumerate(Base60Codec.ANIMALS)}
+
+_CLASH = SignalCombiner.HARMONY_TYPES.index("clash")
+
+
+def _planet_moon_table():
+    return tuple(
+        tuple(
+            SignalCombiner._lookup_planet_moon(planet, phase)
+            for phase in MoonEngine.PHASE_NAMES
+        )
+        for planet in WeekdayCalculator.PLANETS
+    )
+
+
+def _lp_py_table():
+    numbers = range(SignalCombiner.MAX_TABLE_NUMBER + 1)
+    return tuple(
+        tuple(SignalCombiner._lookup_lifepath_year(lp, py) for py in numbers)
+        for lp in numbers
+    )
+
+
+def _animal_harmony_table():
+    return tuple(
+        tuple(SignalCombiner._lookup_animal_harmony(a, b) for b in Base60Codec.ANIMALS)
+        for a in Base60Codec.ANIMALS
+    )
+
+
+def _animal_harmony_codes():
+    return tuple(
+        tuple(SignalCombiner.HARMONY_TYPES.index(cell["type"]) for cell in row)
+        for row in SignalCombiner.ANIMAL_HARMONY_TABLE
+    )
+
+
+# ════════════════════════════════════════════════════════════
+# Integer-coded signals
+# ════════════════════════════════════════════════════════════
+
+_SIGNAL_CODES = {name: code for code, name in enumerate(SignalCombiner.SIGNAL_TYPES)}
+_PRIORITY_RANK = SignalCombiner.PRIORITY_RANK
+
+# Element clash pairs as masks over ELEMENT_WORDS. Pairs that are not both
+# element words (the {"FI", "WA"} token forms) never match a message scan.
+_ELEMENT_BITS = {
+    word.capitalize(): 1 << bit for bit, word in enumerate(SignalCombiner.ELEMENT_WORDS)
+}
+_ELEMENT_CLASH_MASKS: Tuple[Tuple[int, str], ...] = tuple(
+    (sum(_ELEMENT_BITS[name] for name in pair), description)
+    for pair, description in SignalCombiner.ELEMENT_CLASHES.items()
+    if pair <= _ELEMENT_BITS.keys()
+)
+
+# Shared template signals per (type, priority, template, args), and the
+# element mask per message of eagerly built ones (e.g. the moon phase, one
+# per date). Keys come from the engines' fixed tables and dates, so the
+# key sets stay small; the cap only guards against unexpected input.
+_template_signals: Dict[Tuple, "Signal"] = {}
+_message_elements: Dict[str, int] = {}
+SHARED_SIGNALS_MAX = 4096
+
+_ELEMENT_WORD_BITS = tuple(
+    (word, 1 << bit) for bit, word in enumerate(SignalCombiner.ELEMENT_WORDS)
+)
+
+
+def _scan_elements(text: str) -> int:
+    lowered = text.lower()
+    mask = 0
+    for word, bit in _ELEMENT_WORD_BITS:
+        if word in lowered:
+            mask |= bit
+    return mask
+
+
+# A placeholder touching a letter ("{0}fire") could complete an element word
+# across the boundary; such templates are scanned after rendering instead.
+_GLUED_PLACEHOLDER = re.compile(r"[A-Za-z]\{|\}[A-Za-z]")
+
+
+def _element_mask(text: str) -> int:
+    mask = _message_elements.get(text)
+    if mask is None:
+        mask = _scan_elements(text)
+        if len(_message_elements) < SHARED_SIGNALS_MAX:
+            _message_elements[text] = mask
+    return mask
+
+
+class Signal:
+    """
+    One reading signal with integer codes: ``code`` indexes
+    SignalCombiner.SIGNAL_TYPES (-1 for other types) and ``rank`` is the
+    SignalCombiner.PRIORITY_RANK of its priority (0 if unknown).
+
+    A signal built from a template renders its message the first time it
+    is read, so signals that are only ranked never format text. Template
+    signals are shared between readings (one record per type, priority,
+    template and args), so they must not be modified.
+
+    Supports the read-only mapping access of the dict form
+    (signal["message"], signal.get("priority")); to_dict() returns it.
+    """
+
+    __slots__ = ("type", "priority", "code", "rank", "_template", "_args", "_message", "_elements")
+
+    def __init__(
+        self,
+        type: str,
+        priority: str,
+        message: Optional[str] = None,
+        template: Optional[str] = None,
+        args: Tuple = (),
+    ):
+        self.type = type
+        self.priority = priority
+        self.code = _SIGNAL_CODES.get(type, -1)
+        self.rank = _PRIORITY_RANK.get(priority, 0)
+        self._template = template
+        self._args = args
+        self._message = message
+        self._elements = None
+
+    @staticmethod
+    def from_template(type: str, priority: str, template: str, *args) -> "Signal":
+        """Shared signal whose message is template.format(*args), rendered on demand."""
+        key = (type, priority, template, args)
+        signal = _template_signals.get(key)
+        if signal is None:
+            signal = Signal(type, priority, None, template, args)
+            if len(_template_signals) < SHARED_SIGNALS_MAX:
+                _template_signals[key] = signal
+        return signal
+
+    @staticmethod
+    def from_dict(data: Dict) -> "Signal":
+        return Signal(data.get("type", ""), data.get("priority", ""), data.get("message", ""))
+
+    @staticmethod
+    def sort_key(signal: "Signal") -> int:
+        """Key for highest priority first."""
+        return -signal.rank
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._template.format(*self._args)
+        return self._message
+
+    @property
+    def elements(self) -> int:
+        """
+        Bit mask of SignalCombiner.ELEMENT_WORDS named in the message.
+
+        For a template signal the template text and each argument are
+        scanned separately, so the message is not rendered for it.
+        """
+        if self._elements is None:
+            if self._template is None:
+                self._elements = _element_mask(self._message)
+            elif _GLUED_PLACEHOLDER.search(self._template):
+                self._elements = _scan_elements(self.message)
+            else:
+                mask = _element_mask(self._template)
+                for arg in self._args:
+                    mask |= _element_mask(str(arg))
+                self._elements = mask
+        return self._elements
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"type": self.type, "priority": self.priority, "message": self.message}
+
+    # ── read-only mapping access ──
+
+    def __getitem__(self, name: str) -> str:
+        if name in ("type", "priority", "message"):
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"Signal({self.type!r}, {self.priority!r}, {self.message!r})"
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("SIGNAL COMBINER - SELF TEST")
@@ -1175,5 +788,14 @@ if __name__ == "__main__":
         )
         failed += 1
 
+    # Test 11: dense tables reproduce the dict lookups cell for cell
+    table_errors = SignalCombiner.verify_tables()
+    if not table_errors:
+        print(f"PASS [11] Dense planet x moon, LP x PY and animal tables match lookups")
+        passed += 1
+    else:
+        print(f"FAIL [11] {len(table_errors)} table cells differ, e.g. {table_errors[0]}")
+        failed += 1
+
     print(f"\n{passed} passed, {failed} failed")
     exit(0 if failed == 0 else 1)
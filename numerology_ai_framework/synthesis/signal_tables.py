@@ -0,0 +1,725 @@
+"""
+Signal Tables - Synthesis Tier Data
+===================================
+Purpose: Text tables behind SignalCombiner (planet x moon, Life Path x
+         Personal Year, animal harmony)
+
+Loaded on first use of the matching SignalCombiner attribute, so
+importing the framework does not read them.
+"""
+
+from typing import Dict
+
+# ----------------------------------------------------------------
+# 1. PLANET_MOON_COMBOS  (7 planets x 8 moon phases = 56 entries)
+# ----------------------------------------------------------------
+PLANET_MOON_COMBOS: Dict[tuple, Dict[str, str]] = {
+    # --- Sun ---
+    ("Sun", "New Moon"): {
+        "theme": "Hidden Potential",
+        "message": "Your core identity is being seeded in darkness. Set intentions aligned with your truest self.",
+    },
+    ("Sun", "Waxing Crescent"): {
+        "theme": "Emerging Will",
+        "message": "A spark of purpose is catching flame. Feed your confidence with small, deliberate actions.",
+    },
+    ("Sun", "First Quarter"): {
+        "theme": "Identity Tested",
+        "message": "Who you are meets who you must become. Resistance now is a forge, not a wall.",
+    },
+    ("Sun", "Waxing Gibbous"): {
+        "theme": "Refining Purpose",
+        "message": "Your sense of self is nearly crystallized. Polish the rough edges before the spotlight arrives.",
+    },
+    ("Sun", "Full Moon"): {
+        "theme": "Radiant Revelation",
+        "message": "Everything about your identity is illuminated now. Others see you clearly — make sure you see yourself too.",
+    },
+    ("Sun", "Waning Gibbous"): {
+        "theme": "Generous Glow",
+        "message": "Your light is warm and giving. Share your confidence — it replenishes by being offered.",
+    },
+    ("Sun", "Last Quarter"): {
+        "theme": "Core Reckoning",
+        "message": "Strip away what is performance. The Sun asks what remains when the audience leaves.",
+    },
+    ("Sun", "Waning Crescent"): {
+        "theme": "Quiet Sovereignty",
+        "message": "Power rests in stillness now. You do not need to prove your light — it simply is.",
+    },
+    # --- Moon ---
+    ("Moon", "New Moon"): {
+        "theme": "Deep Reset",
+        "message": "Emotions are in a cocoon. This is not numbness — it is preparation. Honor the silence.",
+    },
+    ("Moon", "Waxing Crescent"): {
+        "theme": "Emotional Seedling",
+        "message": "New feelings are tender and fragile. Protect them from harsh judgement — yours or others'.",
+    },
+    ("Moon", "First Quarter"): {
+        "theme": "Feeling the Friction",
+        "message": "Emotions push against habit. Let yourself feel the discomfort — it is growth in motion.",
+    },
+    ("Moon", "Waxing Gibbous"): {
+        "theme": "Emotional Refinement",
+        "message": "Your inner world is becoming clearer. Journaling or reflection brings surprising insight now.",
+    },
+    ("Moon", "Full Moon"): {
+        "theme": "Emotional Flood",
+        "message": "Feelings are at maximum intensity. What surfaces now has been building for weeks. Witness it fully.",
+    },
+    ("Moon", "Waning Gibbous"): {
+        "theme": "Grateful Heart",
+        "message": "Emotional abundance flows outward. Gratitude is not just a practice — it is the frequency you carry.",
+    },
+    ("Moon", "Last Quarter"): {
+        "theme": "Emotional Release",
+        "message": "Old feelings are ready to be let go. Forgiveness is not forgetting — it is freeing your own heart.",
+    },
+    ("Moon", "Waning Crescent"): {
+        "theme": "Inner Sanctuary",
+        "message": "Retreat into the quiet places within. The world can wait while you replenish your emotional reserves.",
+    },
+    # --- Mars ---
+    ("Mars", "New Moon"): {
+        "theme": "Coiled Spring",
+        "message": "Energy gathers in the dark. Do not strike yet — but sharpen your blade. Timing is everything.",
+    },
+    ("Mars", "Waxing Crescent"): {
+        "theme": "First Strike",
+        "message": "The warrior makes the opening move. Start small but start bold. Hesitation is the only enemy.",
+    },
+    ("Mars", "First Quarter"): {
+        "theme": "Battle Decision",
+        "message": "Action meets resistance. Push through with courage, not force. The obstacle reveals your true strength.",
+    },
+    ("Mars", "Waxing Gibbous"): {
+        "theme": "Sharpening the Edge",
+        "message": "Raw force transforms into precision. Discipline your energy — the battle is almost won through preparation.",
+    },
+    ("Mars", "Full Moon"): {
+        "theme": "Warrior Illuminated",
+        "message": "Your drive is fully visible. Channel aggression into passion. Fight for something, not against everything.",
+    },
+    ("Mars", "Waning Gibbous"): {
+        "theme": "Teaching Strength",
+        "message": "Your battles have earned you wisdom. Mentor others in courage. Strength shared is strength multiplied.",
+    },
+    ("Mars", "Last Quarter"): {
+        "theme": "Laying Down Arms",
+        "message": "Not every hill deserves a fight. Strategic retreat is wisdom, not weakness. Choose your battles.",
+    },
+    ("Mars", "Waning Crescent"): {
+        "theme": "Resting Warrior",
+        "message": "Even the fiercest flame needs fuel. Rest now so you may rise again with renewed purpose.",
+    },
+    # --- Mercury ---
+    ("Mercury", "New Moon"): {
+        "theme": "Silent Mind",
+        "message": "Thoughts incubate in darkness. Do not force clarity — let ideas gestate. The answer forms in quiet.",
+    },
+    ("Mercury", "Waxing Crescent"): {
+        "theme": "First Words",
+        "message": "New ideas begin to form. Speak tentatively and listen carefully — the conversation is just beginning.",
+    },
+    ("Mercury", "First Quarter"): {
+        "theme": "Debate Within",
+        "message": "Logic clashes with intuition. Both have merit. The resolution lies in listening to both voices.",
+    },
+    ("Mercury", "Waxing Gibbous"): {
+        "theme": "Crafting the Message",
+        "message": "Your thoughts are nearly ready for the world. Edit, refine, and clarify before you publish or present.",
+    },
+    ("Mercury", "Full Moon"): {
+        "theme": "Crystal Clarity",
+        "message": "Communication peaks. Words land with precision. Important conversations held now carry lasting impact.",
+    },
+    ("Mercury", "Waning Gibbous"): {
+        "theme": "Sharing Knowledge",
+        "message": "What you've learned is ready to be taught. Communication flows outward. Write, speak, connect.",
+    },
+    ("Mercury", "Last Quarter"): {
+        "theme": "Revising Thought",
+        "message": "Old ideas need updating. Question assumptions that once served you. Mental flexibility is your ally.",
+    },
+    ("Mercury", "Waning Crescent"): {
+        "theme": "Mental Rest",
+        "message": "The mind needs sleep as much as the body. Reduce input. Let the subconscious sort what the conscious cannot.",
+    },
+    # --- Jupiter ---
+    ("Jupiter", "New Moon"): {
+        "theme": "Seeding Abundance",
+        "message": "Plant the seed of a grand vision. Do not worry about the harvest — the soil is rich and waiting.",
+    },
+    ("Jupiter", "Waxing Crescent"): {
+        "theme": "Growing Faith",
+        "message": "Optimism stirs. Trust the process even when evidence is scarce. The universe rewards belief backed by action.",
+    },
+    ("Jupiter", "First Quarter"): {
+        "theme": "Expanding Through Challenge",
+        "message": "Growth requires discomfort. The expansion you seek is on the other side of this obstacle. Lean in.",
+    },
+    ("Jupiter", "Waxing Gibbous"): {
+        "theme": "Refining Abundance",
+        "message": "Wisdom is almost fully formed. Fine-tune your expansion plans before the breakthrough arrives.",
+    },
+    ("Jupiter", "Full Moon"): {
+        "theme": "Harvest of Wisdom",
+        "message": "Everything you have learned comes together now. Abundance is not just material — it is understanding made manifest.",
+    },
+    ("Jupiter", "Waning Gibbous"): {
+        "theme": "Philanthropic Flow",
+        "message": "Your abundance is meant to circulate. Give generously — not from obligation, but from overflow.",
+    },
+    ("Jupiter", "Last Quarter"): {
+        "theme": "Philosophical Pruning",
+        "message": "Not all beliefs serve your growth. Release outdated philosophies that have become cages instead of wings.",
+    },
+    ("Jupiter", "Waning Crescent"): {
+        "theme": "Quiet Gratitude",
+        "message": "Before the next expansion, pause to appreciate how far you have come. Gratitude fuels the next cycle.",
+    },
+    # --- Venus ---
+    ("Venus", "New Moon"): {
+        "theme": "Love Incubating",
+        "message": "Desire stirs beneath the surface. Do not chase — attract. What you value most is taking shape in the unseen.",
+    },
+    ("Venus", "Waxing Crescent"): {
+        "theme": "Beauty Budding",
+        "message": "New attractions and creative impulses emerge. Follow what delights you — pleasure is a compass now.",
+    },
+    ("Venus", "First Quarter"): {
+        "theme": "Values Tested",
+        "message": "What you love meets what is practical. Compromise does not mean surrender — it means artful integration.",
+    },
+    ("Venus", "Waxing Gibbous"): {
+        "theme": "Perfecting Harmony",
+        "message": "Relationships and creative works approach their best form. Small adjustments yield disproportionate beauty.",
+    },
+    ("Venus", "Full Moon"): {
+        "theme": "Love Illuminated",
+        "message": "Relationships and values are fully visible. Beauty demands attention. What you love is loving you back.",
+    },
+    ("Venus", "Waning Gibbous"): {
+        "theme": "Graceful Generosity",
+        "message": "Share your beauty, your art, your love. The aesthetic gifts you carry are medicine for those around you.",
+    },
+    ("Venus", "Last Quarter"): {
+        "theme": "Releasing Attachment",
+        "message": "Love without clinging. Beauty without possession. The heart grows larger when it opens its grip.",
+    },
+    ("Venus", "Waning Crescent"): {
+        "theme": "Self-Love Retreat",
+        "message": "Turn the love you give others inward. You cannot pour from an empty cup. Rest in your own beauty.",
+    },
+    # --- Saturn ---
+    ("Saturn", "New Moon"): {
+        "theme": "Foundation in Darkness",
+        "message": "Discipline begins before anyone is watching. The structures you build now in silence will hold the most weight.",
+    },
+    ("Saturn", "Waxing Crescent"): {
+        "theme": "Early Commitment",
+        "message": "The first steps of discipline feel heavy. This is normal. Consistency now creates freedom later.",
+    },
+    ("Saturn", "First Quarter"): {
+        "theme": "Test of Resolve",
+        "message": "The structure you are building meets its first real test. Hold firm — the challenge proves the design is sound.",
+    },
+    ("Saturn", "Waxing Gibbous"): {
+        "theme": "Mastering the Details",
+        "message": "Discipline matures into craftsmanship. Pay attention to the fine points. Excellence lives in the margins.",
+    },
+    ("Saturn", "Full Moon"): {
+        "theme": "Earned Authority",
+        "message": "Your discipline is now visible to all. The respect you receive was built brick by brick. Stand in it fully.",
+    },
+    ("Saturn", "Waning Gibbous"): {
+        "theme": "Elder Wisdom",
+        "message": "Your experience is a gift to those still climbing. Teach through example. Mentorship is Saturn's highest calling.",
+    },
+    ("Saturn", "Last Quarter"): {
+        "theme": "Structural Release",
+        "message": "Some walls are no longer load-bearing. Identify the rules you follow from habit, not necessity, and let them go.",
+    },
+    ("Saturn", "Waning Crescent"): {
+        "theme": "Final Lesson",
+        "message": "The discipline cycle completes. Release what you've outgrown. Rest is not weakness — it is wisdom earned.",
+    },
+}
+
+# ----------------------------------------------------------------
+# 2. LP_PY_COMBOS  (Life Path 1-9 x Personal Year 1-9 = 81 entries)
+# ----------------------------------------------------------------
+LP_PY_COMBOS: Dict[tuple, Dict[str, str]] = {
+    # LP 1
+    (1, 1): {
+        "theme": "Double Ignition",
+        "message": "Pioneer entering a year of new beginnings — this is your most powerful launch window. Start what matters most.",
+    },
+    (1, 2): {
+        "theme": "Leader Listens",
+        "message": "The Pioneer pauses to build partnerships. Your independence is strengthened, not weakened, by collaboration.",
+    },
+    (1, 3): {
+        "theme": "Creative Spark",
+        "message": "The Pioneer finds a voice. Your ideas demand expression now. Write, speak, perform — let originality flow.",
+    },
+    (1, 4): {
+        "theme": "Building the Vision",
+        "message": "The Pioneer lays foundations. Your bold ideas need structure. This year rewards planning over impulse.",
+    },
+    (1, 5): {
+        "theme": "Pioneer Unleashed",
+        "message": "The Pioneer meets freedom. Every direction calls. Choose the adventure that aligns with your core mission.",
+    },
+    (1, 6): {
+        "theme": "Leader as Guardian",
+        "message": "The Pioneer tends to home and heart. Leadership begins with those closest to you. Nurture your roots.",
+    },
+    (1, 7): {
+        "theme": "Solitary Strategy",
+        "message": "The Pioneer retreats to plan. Solitude sharpens your vision. The world can wait while you recalibrate.",
+    },
+    (1, 8): {
+        "theme": "Power Surge",
+        "message": "The Pioneer steps into authority. Material success and leadership converge. Claim your earned position.",
+    },
+    (1, 9): {
+        "theme": "Pioneer's Completion",
+        "message": "The Pioneer reaches an ending. Release old identities so a truer version of yourself can emerge.",
+    },
+    # LP 2
+    (2, 1): {
+        "theme": "Diplomat Steps Forward",
+        "message": "The Bridge takes the lead for once. Initiate what you have been mediating. Your turn to begin.",
+    },
+    (2, 2): {
+        "theme": "Double Harmony",
+        "message": "The Bridge in a year of partnership — your natural gifts peak. Deep connections form effortlessly.",
+    },
+    (2, 3): {
+        "theme": "Harmony Expressed",
+        "message": "The Bridge finds creative joy. Your sensitivity becomes art. Express the feelings you usually hold for others.",
+    },
+    (2, 4): {
+        "theme": "Patient Foundation",
+        "message": "The Bridge builds slowly and surely. Your patience is your superpower this year. Trust the quiet progress.",
+    },
+    (2, 5): {
+        "theme": "Gentle Adventurer",
+        "message": "The Bridge explores new territory. Change feels uncomfortable but necessary. Your adaptability surprises you.",
+    },
+    (2, 6): {
+        "theme": "Heart of Home",
+        "message": "The Bridge nurtures deeply. Family and community need your gift for harmony. Love is your primary currency.",
+    },
+    (2, 7): {
+        "theme": "Intuitive Depths",
+        "message": "The Bridge turns inward. Your natural sensitivity meets spiritual inquiry. Deep truths surface through meditation.",
+    },
+    (2, 8): {
+        "theme": "Cooperative Power",
+        "message": "The Bridge enters the arena of authority. Success comes through alliances, not solo effort. Build your team.",
+    },
+    (2, 9): {
+        "theme": "Releasing Bonds",
+        "message": "The Bridge must let some connections go. Completion frees you for deeper, more aligned relationships ahead.",
+    },
+    # LP 3
+    (3, 1): {
+        "theme": "Creative Launch",
+        "message": "The Voice begins a new project. Your creative vision demands a fresh start. Initiate with joy and boldness.",
+    },
+    (3, 2): {
+        "theme": "Collaborative Art",
+        "message": "The Voice finds a duet partner. Creative partnerships flourish. Two imaginations are better than one.",
+    },
+    (3, 3): {
+        "theme": "Triple Expression",
+        "message": "The Voice in its power year. Creativity is unstoppable. Every medium calls you. Express without restraint.",
+    },
+    (3, 4): {
+        "theme": "Disciplined Creativity",
+        "message": "The Voice learns structure. Your art needs a container. Craft and discipline elevate raw talent into mastery.",
+    },
+    (3, 5): {
+        "theme": "Joyful Exploration",
+        "message": "The Voice seeks new audiences. Travel, new social circles, and adventurous expression light up this year.",
+    },
+    (3, 6): {
+        "theme": "Creative Nurturing",
+        "message": "The Voice serves family and community. Your words heal. Use your gift of expression to uplift those around you.",
+    },
+    (3, 7): {
+        "theme": "Artist in Solitude",
+        "message": "The Voice turns reflective. Your deepest creative work emerges from silence. Seek solitude to find your masterpiece.",
+    },
+    (3, 8): {
+        "theme": "Creative Empire",
+        "message": "The Voice builds a platform. Your art meets commerce. This year rewards turning creativity into sustainable success.",
+    },
+    (3, 9): {
+        "theme": "Final Performance",
+        "message": "The Voice completes a creative chapter. Share your accumulated wisdom generously. The best art serves others.",
+    },
+    # LP 4
+    (4, 1): {
+        "theme": "New Blueprint",
+        "message": "The Architect drafts a new plan. Begin the next major structure of your life. Design before you build.",
+    },
+    (4, 2): {
+        "theme": "Building Together",
+        "message": "The Architect finds a partner. Collaboration strengthens the foundation. Two sets of hands build faster.",
+    },
+    (4, 3): {
+        "theme": "Playful Structure",
+        "message": "The Architect discovers joy in the work. Creativity softens rigidity. Let the building process itself be beautiful.",
+    },
+    (4, 4): {
+        "theme": "Double Foundation",
+        "message": "The Architect in their power year. Everything built now has quadruple staying power. Work hard — it all lasts.",
+    },
+    (4, 5): {
+        "theme": "Flexible Framework",
+        "message": "The Architect faces disruption. Your structures need to flex, not just hold. Adaptability is the new strength.",
+    },
+    (4, 6): {
+        "theme": "Home Builder",
+        "message": "The Architect focuses on domestic foundations. Home, family, and security are the projects that matter most.",
+    },
+    (4, 7): {
+        "theme": "Inner Architecture",
+        "message": "The Architect builds within. Spiritual and psychological frameworks need attention. Build the inner temple.",
+    },
+    (4, 8): {
+        "theme": "Material Mastery",
+        "message": "The Architect meets material reward. Years of disciplined work pay tangible dividends. Accept the harvest.",
+    },
+    (4, 9): {
+        "theme": "Demolition and Design",
+        "message": "The Architect tears down to rebuild. Some structures have served their purpose. Clear the lot for new plans.",
+    },
+    # LP 5
+    (5, 1): {
+        "theme": "Adventure Begins",
+        "message": "The Explorer launches into unknown territory. A fresh cycle of freedom and discovery opens wide before you.",
+    },
+    (5, 2): {
+        "theme": "Explorer Settles In",
+        "message": "The Explorer finds a traveling companion. Freedom is sweeter when shared. Let partnership ground your wanderlust.",
+    },
+    (5, 3): {
+        "theme": "Storyteller's Journey",
+        "message": "The Explorer gathers tales. Every experience becomes material for expression. Live fully, then share the story.",
+    },
+    (5, 4): {
+        "theme": "Freedom Meets Form",
+        "message": "The Explorer needs a base camp. Freedom without structure scatters energy. Build the launchpad for your next leap.",
+    },
+    (5, 5): {
+        "theme": "Maximum Velocity",
+        "message": "The Explorer in peak freedom. Change accelerates from every direction. Ride the wave — do not fight the current.",
+    },
+    (5, 6): {
+        "theme": "Rooted Wanderer",
+        "message": "The Explorer comes home. Responsibility calls you back to center. Find adventure within commitment.",
+    },
+    (5, 7): {
+        "theme": "Inner Expedition",
+        "message": "The Explorer journeys inward. The most exotic territory is your own consciousness. Meditate, study, question.",
+    },
+    (5, 8): {
+        "theme": "Freedom and Fortune",
+        "message": "The Explorer monetizes experience. Your diverse adventures become assets. The world pays for what you know.",
+    },
+    (5, 9): {
+        "theme": "Freedom Through Release",
+        "message": "The Explorer reaches a year of completion. Let go of adventures that no longer serve growth. Make room for the next chapter.",
+    },
+    # LP 6
+    (6, 1): {
+        "theme": "Guardian's New Chapter",
+        "message": "The Guardian begins something for themselves. Self-care is not selfish — it is the foundation of all your giving.",
+    },
+    (6, 2): {
+        "theme": "Deepening Devotion",
+        "message": "The Guardian's relationships deepen. Love becomes more nuanced. Partnership thrives through mutual understanding.",
+    },
+    (6, 3): {
+        "theme": "Joyful Service",
+        "message": "The Guardian expresses love creatively. Art, beauty, and nurturing merge. Your care becomes an art form.",
+    },
+    (6, 4): {
+        "theme": "Strengthening the Nest",
+        "message": "The Guardian fortifies home and family. Practical improvements to your environment bring lasting security.",
+    },
+    (6, 5): {
+        "theme": "Guardian Unchained",
+        "message": "The Guardian needs breathing room. Duty and freedom negotiate. Healthy boundaries are acts of love, not betrayal.",
+    },
+    (6, 6): {
+        "theme": "Double Devotion",
+        "message": "The Guardian in full power. Love, responsibility, and beauty converge. You are the heart of every room you enter.",
+    },
+    (6, 7): {
+        "theme": "Sacred Service",
+        "message": "The Guardian seeks spiritual meaning in duty. Your caregiving becomes a spiritual practice. Find God in the everyday.",
+    },
+    (6, 8): {
+        "theme": "Abundant Caretaker",
+        "message": "The Guardian receives material reward for service. Prosperity flows through generosity. Give and receive in equal measure.",
+    },
+    (6, 9): {
+        "theme": "Completing the Circle",
+        "message": "The Guardian releases old obligations. Some duties have been fulfilled. Let others carry what you have held too long.",
+    },
+    # LP 7
+    (7, 1): {
+        "theme": "Seeker's Fresh Start",
+        "message": "The Seeker begins a new inquiry. A question you have never asked before leads you to answers that reshape everything.",
+    },
+    (7, 2): {
+        "theme": "Wisdom in Partnership",
+        "message": "The Seeker finds a mirror in another. Deep conversation and emotional intelligence expand your understanding.",
+    },
+    (7, 3): {
+        "theme": "Inner Wisdom Expressed",
+        "message": "The Seeker enters a year of creative expression. Your deep insights are ready to be shared. Speak the truth you've found.",
+    },
+    (7, 4): {
+        "theme": "Systematic Discovery",
+        "message": "The Seeker builds a method. Your intuitions need a framework. Organize your findings into something teachable.",
+    },
+    (7, 5): {
+        "theme": "Nomadic Philosopher",
+        "message": "The Seeker explores through movement. Travel and new experiences crack open old assumptions. Embrace the disruption.",
+    },
+    (7, 6): {
+        "theme": "Wisdom Serves Love",
+        "message": "The Seeker applies insight to relationships. Your analytical gifts serve the heart this year. Think less, feel more.",
+    },
+    (7, 7): {
+        "theme": "Double Depth",
+        "message": "The Seeker in peak contemplation. Spiritual breakthroughs are possible. Retreat, meditate, and let truth find you.",
+    },
+    (7, 8): {
+        "theme": "Monetized Insight",
+        "message": "The Seeker finds material reward for wisdom. Your knowledge has value in the marketplace. Teach, consult, advise.",
+    },
+    (7, 9): {
+        "theme": "Philosopher's Completion",
+        "message": "The Seeker finishes a cycle of inquiry. Share your conclusions before beginning the next question.",
+    },
+    # LP 8
+    (8, 1): {
+        "theme": "Empire Begins",
+        "message": "The Powerhouse launches a new venture. Authority and initiative combine. Build something that outlasts you.",
+    },
+    (8, 2): {
+        "theme": "Strategic Alliance",
+        "message": "The Powerhouse partners wisely. True power comes from collaboration. Choose allies whose strengths complement yours.",
+    },
+    (8, 3): {
+        "theme": "Charismatic Authority",
+        "message": "The Powerhouse finds a public voice. Leadership meets charm. Your vision inspires others to follow willingly.",
+    },
+    (8, 4): {
+        "theme": "Fortified Empire",
+        "message": "The Powerhouse builds infrastructure. Systems, processes, and foundations make the difference between flash and legacy.",
+    },
+    (8, 5): {
+        "theme": "Dynamic Power",
+        "message": "The Powerhouse adapts rapidly. Markets shift, circumstances change — your ability to pivot determines your success.",
+    },
+    (8, 6): {
+        "theme": "Benevolent Authority",
+        "message": "The Powerhouse serves community. True power is measured by how many you lift, not how high you climb alone.",
+    },
+    (8, 7): {
+        "theme": "Strategic Retreat",
+        "message": "The Powerhouse pauses to think deeply. Before the next move, understand the deeper currents. Wisdom precedes action.",
+    },
+    (8, 8): {
+        "theme": "Maximum Authority",
+        "message": "The Powerhouse at full capacity. Achievement, recognition, and material mastery converge. Step into your full power.",
+    },
+    (8, 9): {
+        "theme": "Legacy Completion",
+        "message": "The Powerhouse finishes a major cycle. What you have built speaks for itself. Release control and let it stand.",
+    },
+    # LP 9
+    (9, 1): {
+        "theme": "Sage's New Dawn",
+        "message": "The Sage begins again. After completion comes rebirth. Start fresh with all the wisdom of your previous cycles.",
+    },
+    (9, 2): {
+        "theme": "Compassionate Connection",
+        "message": "The Sage builds bridges. Your understanding of endings makes you the perfect partner. Share your depth.",
+    },
+    (9, 3): {
+        "theme": "Universal Voice",
+        "message": "The Sage speaks for all. Your creative expression carries humanitarian weight. Art as service reaches its zenith.",
+    },
+    (9, 4): {
+        "theme": "Wisdom Made Practical",
+        "message": "The Sage grounds the vision. Spiritual insight needs earthly form. Build something tangible from your understanding.",
+    },
+    (9, 5): {
+        "theme": "Sage's Wandering",
+        "message": "The Sage explores without attachment. Every experience completes a circle. Move freely and release as you go.",
+    },
+    (9, 6): {
+        "theme": "Healing Presence",
+        "message": "The Sage nurtures through wisdom. Your presence alone is medicine. Be with those who need understanding, not fixing.",
+    },
+    (9, 7): {
+        "theme": "Ultimate Contemplation",
+        "message": "The Sage meets the mystic. Deepest spiritual insight is available. Seek silence — the answers live there.",
+    },
+    (9, 8): {
+        "theme": "Humanitarian Power",
+        "message": "The Sage wields influence for the greater good. Material success serves a higher purpose. Lead with compassion.",
+    },
+    (9, 9): {
+        "theme": "Grand Completion",
+        "message": "The Sage completes the ultimate cycle. Everything resolves. Surrender to the ending — the next beginning is already forming.",
+    },
+}
+
+# ----------------------------------------------------------------
+# 3. ANIMAL_HARMONY  (frozenset keys for symmetric lookup)
+# ----------------------------------------------------------------
+ANIMAL_HARMONY: Dict[frozenset, Dict[str, str]] = {
+    # --- Traditional Harmonies (6 pairs) ---
+    frozenset({"RA", "OX"}): {
+        "type": "harmony",
+        "meaning": "Resourcefulness meets endurance. Together these energies create unstoppable momentum through patience and perception.",
+    },
+    frozenset({"TI", "PI"}): {
+        "type": "harmony",
+        "meaning": "Courage meets generosity. The bold tiger finds softness in the pig's abundance, creating noble strength.",
+    },
+    frozenset({"RU", "DO"}): {
+        "type": "harmony",
+        "meaning": "Intuition meets loyalty. The rabbit's gentle instinct paired with the dog's devotion creates trustworthy guidance.",
+    },
+    frozenset({"DR", "RO"}): {
+        "type": "harmony",
+        "meaning": "Transformation meets truth. The dragon's destiny and the rooster's honesty forge a path of authentic power.",
+    },
+    frozenset({"SN", "MO"}): {
+        "type": "harmony",
+        "meaning": "Wisdom meets cleverness. The snake's depth and the monkey's agility create brilliant strategic insight.",
+    },
+    frozenset({"HO", "GO"}): {
+        "type": "harmony",
+        "meaning": "Freedom meets creativity. The horse's passionate movement and the goat's artistic vision produce inspired action.",
+    },
+    # --- Traditional Clashes (6 pairs) ---
+    frozenset({"RA", "HO"}): {
+        "type": "clash",
+        "meaning": "Cunning perception clashes with unbridled freedom. One calculates while the other charges forward without looking.",
+    },
+    frozenset({"OX", "GO"}): {
+        "type": "clash",
+        "meaning": "Stubborn endurance meets sensitive artistry. Rigidity and fluidity struggle to find common ground.",
+    },
+    frozenset({"TI", "MO"}): {
+        "type": "clash",
+        "meaning": "Bold authority confronts clever defiance. Power and trickery create friction that demands resolution.",
+    },
+    frozenset({"RU", "RO"}): {
+        "type": "clash",
+        "meaning": "Gentle diplomacy versus blunt truth. The rabbit's softness feels wounded by the rooster's sharp honesty.",
+    },
+    frozenset({"DR", "DO"}): {
+        "type": "clash",
+        "meaning": "Grand destiny meets grounded loyalty. The dragon's ambition feels constrained by the dog's call to duty.",
+    },
+    frozenset({"SN", "PI"}): {
+        "type": "clash",
+        "meaning": "Deep precision meets open generosity. The snake's calculated nature distrusts the pig's unconditional giving.",
+    },
+    # --- Resonance pairs (same animal) ---
+    frozenset({"RA"}): {
+        "type": "resonance",
+        "meaning": "Double Rat amplifies resourcefulness and sharp perception. Hyper-awareness — trust your instincts completely.",
+    },
+    frozenset({"OX"}): {
+        "type": "resonance",
+        "meaning": "Double Ox amplifies endurance and determination. Immovable resolve — nothing can shake your foundation today.",
+    },
+    frozenset({"TI"}): {
+        "type": "resonance",
+        "meaning": "Double Tiger amplifies courage and boldness. Fearless energy — but beware of recklessness in the intensity.",
+    },
+    frozenset({"RU"}): {
+        "type": "resonance",
+        "meaning": "Double Rabbit amplifies intuition and sensitivity. Deep knowing flows through you — listen to the whispers.",
+    },
+    frozenset({"DR"}): {
+        "type": "resonance",
+        "meaning": "Double Dragon amplifies transformation and destiny. Monumental shifts are underway — embrace the magnitude.",
+    },
+    frozenset({"SN"}): {
+        "type": "resonance",
+        "meaning": "Double Snake amplifies wisdom and precision. Penetrating insight — you see what others cannot.",
+    },
+    frozenset({"HO"}): {
+        "type": "resonance",
+        "meaning": "Double Horse amplifies freedom and passionate energy. Unstoppable movement — but remember where home is.",
+    },
+    frozenset({"GO"}): {
+        "type": "resonance",
+        "meaning": "Double Goat amplifies creativity and artistic vision. Beauty saturates everything — let yourself be moved.",
+    },
+    frozenset({"MO"}): {
+        "type": "resonance",
+        "meaning": "Double Monkey amplifies adaptability and wit. Quick thinking dominates — use your cleverness wisely.",
+    },
+    frozenset({"RO"}): {
+        "type": "resonance",
+        "meaning": "Double Rooster amplifies truth and discipline. Absolute clarity — speak with confidence and precision.",
+    },
+    frozenset({"DO"}): {
+        "type": "resonance",
+        "meaning": "Double Dog amplifies loyalty and protection. Fierce devotion — guard what matters most with everything you have.",
+    },
+    frozenset({"PI"}): {
+        "type": "resonance",
+        "meaning": "Double Pig amplifies abundance and generosity. Overflowing warmth — share freely without fear of scarcity.",
+    },
+    # --- Notable neutral pairs ---
+    frozenset({"RA", "DR"}): {
+        "type": "neutral",
+        "meaning": "Rat and Dragon coexist with mutual respect. Resourcefulness acknowledges destiny without interference.",
+    },
+    frozenset({"OX", "SN"}): {
+        "type": "neutral",
+        "meaning": "Ox and Snake find quiet companionship. Both value patience and depth, operating on parallel tracks.",
+    },
+    frozenset({"TI", "HO"}): {
+        "type": "neutral",
+        "meaning": "Tiger and Horse share energetic independence. Both need freedom but express it through different channels.",
+    },
+    frozenset({"RU", "GO"}): {
+        "type": "neutral",
+        "meaning": "Rabbit and Goat share artistic sensitivity. Both appreciate beauty, creating a gentle, aesthetic atmosphere.",
+    },
+    frozenset({"MO", "DR"}): {
+        "type": "neutral",
+        "meaning": "Monkey and Dragon share ambition without conflict. Cleverness serves destiny in a productive alliance.",
+    },
+    frozenset({"RO", "SN"}): {
+        "type": "neutral",
+        "meaning": "Rooster and Snake share analytical precision. Both value truth, though they seek it through different methods.",
+    },
+    frozenset({"DO", "TI"}): {
+        "type": "neutral",
+        "meaning": "Dog and Tiger share a sense of justice. Both protect the vulnerable, though their methods differ.",
+    },
+    frozenset({"PI", "RU"}): {
+        "type": "neutral",
+        "meaning": "Pig and Rabbit share gentle warmth. Both value comfort and kindness, creating a peaceful environment.",
+    },
+}
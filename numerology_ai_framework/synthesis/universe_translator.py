@@ -8,12 +8,20 @@ Purpose: Transform reading data into final human-readable output
 Dependencies: ReadingEngine output, FC60 stamp, numerology profile
 """
 
-import sys
-import os
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Optional, Tuple
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .reading_engine import ReadingEngine
+from .signal_combiner import SignalCombiner
 
-from typing import Dict, Optional
+# Bounded LRU of built sections, shared by all threads in the process
+_section_cache: "OrderedDict[Tuple, Tuple[str, str]]" = OrderedDict()
+_section_lock = threading.Lock()
+_section_stats = {"hits": 0, "misses": 0}
+
+_repetition_fields = itemgetter("animal", "animal_name", "count", "priority", "trait")
 
 
 class UniverseTranslator:
@@ -102,6 +110,67 @@ class UniverseTranslator:
         "_minute_token": "the minute",
     }
 
+    # Section headings in full_text: each section enters full_text as
+    # "<prefix><section text>" (header first, with no prefix)
+    _DIVIDER = "\n" + "—" * 50 + "\n"
+    _FRAGMENT_PREFIX = {
+        "universal_address": f"\n{_DIVIDER}\nYOUR UNIVERSAL ADDRESS\n",
+        "core_identity": f"\n{_DIVIDER}\nCORE IDENTITY\n",
+        "foundation": f"\n{_DIVIDER}\nFOUNDATION\n",
+        "right_now": f"\n{_DIVIDER}\nRIGHT NOW\n",
+        "patterns": f"\n{_DIVIDER}\nPATTERNS DETECTED\n",
+        "message": f"\n{_DIVIDER}\nTHE MESSAGE\n",
+        "advice": f"\n{_DIVIDER}\nTODAY'S ADVICE\n",
+        "caution": f"\n{_DIVIDER}\nCAUTION\n",
+        "footer": f"\n{_DIVIDER}\n",
+    }
+
+    # Precompiled section templates
+    _UNIVERSAL_ADDRESS_TEMPLATE = (
+        "Every moment has a unique signature — like coordinates that place you "
+        "precisely in the flow of time. This is yours for today.\n\n"
+        "FC60: {fc60}\n"
+        "J60:  {j60}\n"
+        "Y60:  {y60}"
+    )
+    _LIFE_PATH_TEMPLATE = "Life Path {number} — {title}\n{description}"
+    _EXPRESSION_FALLBACK = "\n\nExpression {0}: This shapes how you manifest your potential in the world."
+    _SOUL_URGE_FALLBACK = "\nSoul Urge {0}: This reveals what your heart truly desires."
+    _PERSONALITY_FALLBACK = "\n\nPersonality {0}: This is how others first perceive you — the impression you make before they know you deeply."
+    _PERSONAL_YEAR_TEMPLATE = "\n\nPersonal Year {0}: {1}. This theme colors every experience and decision you face this year."
+    _LIFEPATH_YEAR_TEMPLATE = (
+        "\n\nYour Life Path {lp} meets Personal Year {py} in a moment "
+        'the numbers call "{theme}." '
+        "The {title} reaches a year shaped by that intersection. "
+        "{message}"
+    )
+    _FOUNDATION_ALIGNED_TEMPLATE = (
+        "Your mother's name carries Expression {mi}, which matches your Life Path. "
+        "This deep alignment suggests your foundation and your purpose are woven from the same thread. "
+        "The values instilled in you are the very ones you are here to live. "
+        "Lean into this alignment — it is a source of quiet strength."
+    )
+    _FOUNDATION_TEMPLATE = (
+        "Your mother's name carries Expression {mi}, providing the foundation upon which your Life Path {lp} was built. "
+        "This influence shaped your earliest understanding of the world and continues to inform your deepest instincts. "
+        "Notice where these two energies create a productive tension in your life."
+    )
+    _ADVICE_TEMPLATE = "{0}. **{1}**: {2}"
+    _ADVICE_LABELS = ("Focus here first", "Keep this in mind", "Before the day ends")
+    _ADVICE_DEFAULTS = (
+        "Stay present and observe the patterns unfolding around you.",
+        "Journal about what feels resonant — the signals are personal.",
+        "Take one small action aligned with the strongest energy you feel.",
+    )
+    _SIGNAL_ORDER = {"Very High": 4, "High": 3, "Medium": 2, "Low-Medium": 1}
+    _ELEMENT_COUNTERS = {
+        "Wood": "Ground yourself with one concrete task before chasing the next idea.",
+        "Fire": "Step away from intensity for ten minutes. Cool water, a slow breath.",
+        "Earth": "Shake up one small routine today. Movement prevents stagnation.",
+        "Metal": "Let something be imperfect on purpose. Flexibility is strength too.",
+        "Water": "Write down the three things that matter most right now. Clarity cuts through overwhelm.",
+    }
+
     @staticmethod
     def _split_insight(insight_str: str) -> tuple:
         """Parse 'Theme: Message' string into (theme, message) tuple."""
@@ -121,371 +190,340 @@ class UniverseTranslator:
         return positions
 
     @staticmethod
-    def translate(
-        reading: Dict,
-        fc60_stamp: Dict,
-        numerology_profile: Dict = None,
-        person_name: str = "",
-        current_date_str: str = "",
-        confidence_override: Optional[int] = None,
-    ) -> Dict:
-        """
-        Translate a reading into final 9-section human output.
+    def _insight(reading: Dict, name: str) -> Tuple[str, Optional[str]]:
+        """(theme, message) of a combo insight, from its dict or 'Theme: Message' form."""
+        insight = reading.get(f"{name}_dict", {})
+        if not insight and reading.get(name):
+            t, m = UniverseTranslator._split_insight(reading[name])
+            insight = {"theme": t, "message": m}
+        theme = insight.get("theme")
+        return (theme, insight["message"] if theme else None)
 
-        Args:
-            reading: Output from ReadingEngine.generate_reading()
-            fc60_stamp: Output from FC60StampEngine.encode()
-            numerology_profile: Output from NumerologyEngine.complete_profile()
-            person_name: Person's name for header
-            current_date_str: Formatted date string
-            confidence_override: If provided, use this confidence score instead
-                                 of the reading_engine's internal estimate.
+    # ════════════════════════════════════════════════════════════
+    # Section cache
+    # ════════════════════════════════════════════════════════════
 
-        Returns:
-            Dict with each section as string + full_text concatenation
+    SECTION_CACHE_SIZE = 4096
+
+    @staticmethod
+    def _cached_section(name: str, key: Tuple) -> Tuple[str, str]:
         """
-        sections = {}
+        (text, full_text fragment) of a section, memoized on its inputs.
 
-        # Section 1: Header
-        confidence = (
-            confidence_override
-            if confidence_override is not None
-            else reading.get("confidence", 50)
-        )
-        if confidence >= 85:
-            conf_label = "very_high"
-        elif confidence >= 75:
-            conf_label = "high"
-        elif confidence >= 65:
-            conf_label = "medium"
-        else:
-            conf_label = "developing"
-        sections["header"] = (
-            f"READING FOR {person_name.upper() or 'YOU'}\n"
-            f"Date: {current_date_str or fc60_stamp.get('iso', 'Unknown')}\n"
-            f"Confidence: {confidence}% ({conf_label})"
-        )
+        ``key`` is the argument tuple of the section's builder
+        (UniverseTranslator._build_<name>), so a section is only ever
+        shared between translations with identical inputs.
+        """
+        cache_key = (name, key)
+        with _section_lock:
+            hit = _section_cache.get(cache_key)
+            if hit is not None:
+                _section_cache.move_to_end(cache_key)
+                _section_stats["hits"] += 1
+                return hit
+            _section_stats["misses"] += 1
+
+        text = getattr(UniverseTranslator, f"_build_{name}")(*key)
+        entry = (text, UniverseTranslator._FRAGMENT_PREFIX[name] + text)
+        with _section_lock:
+            _section_cache[cache_key] = entry
+            while len(_section_cache) > UniverseTranslator.SECTION_CACHE_SIZE:
+                _section_cache.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def section_cache_stats() -> Dict:
+        """Hit/miss counters and current size of the section cache."""
+        with _section_lock:
+            hits = _section_stats["hits"]
+            misses = _section_stats["misses"]
+            size = len(_section_cache)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "max_size": UniverseTranslator.SECTION_CACHE_SIZE,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+
+    @staticmethod
+    def clear_section_cache() -> None:
+        """Drop all cached sections and reset the counters."""
+        with _section_lock:
+            _section_cache.clear()
+            _section_stats["hits"] = 0
+            _section_stats["misses"] = 0
+
+    # ════════════════════════════════════════════════════════════
+    # Section builders (pure functions of their arguments)
+    # ════════════════════════════════════════════════════════════
 
+    @staticmethod
+    def _build_universal_address(fc60: str, j60: str, y60: str) -> str:
         # Section 2: Universal Address
-        sections["universal_address"] = (
-            "Every moment has a unique signature — like coordinates that place you "
-            "precisely in the flow of time. This is yours for today.\n\n"
-            f"FC60: {fc60_stamp.get('fc60', 'N/A')}\n"
-            f"J60:  {fc60_stamp.get('j60', 'N/A')}\n"
-            f"Y60:  {fc60_stamp.get('y60', 'N/A')}"
-        )
+        return UniverseTranslator._UNIVERSAL_ADDRESS_TEMPLATE.format(fc60=fc60, j60=j60, y60=y60)
 
+    @staticmethod
+    def _build_core_identity(
+        lp_num: int,
+        lp_title: str,
+        combo_title: str,
+        exp: int,
+        soul: int,
+        pers: int,
+        py: int,
+        lpy_theme: Optional[str],
+        lpy_message: Optional[str],
+    ) -> str:
         # Section 3: Core Identity
-        core_identity = ""
-        if numerology_profile:
-            lp = numerology_profile.get("life_path", {})
-            lp_num = lp.get("number", 0)
-            lp_desc = UniverseTranslator.LIFE_PATH_DESCRIPTIONS.get(lp_num, "")
-            exp = numerology_profile.get("expression", 0)
-            soul = numerology_profile.get("soul_urge", 0)
-            pers = numerology_profile.get("personality", 0)
-            py = numerology_profile.get("personal_year", 0)
-
-            core_identity = f"Life Path {lp_num} — {lp.get('title', '')}\n{lp_desc}"
-
-            exp_desc = UniverseTranslator.EXPRESSION_DESCRIPTIONS.get(exp, "")
-            if exp_desc:
-                core_identity += f"\n\n{exp_desc}"
-            else:
-                core_identity += f"\n\nExpression {exp}: This shapes how you manifest your potential in the world."
-
-            soul_desc = UniverseTranslator.SOUL_URGE_DESCRIPTIONS.get(soul, "")
-            if soul_desc:
-                core_identity += f"\n\n{soul_desc}"
-            else:
-                core_identity += (
-                    f"\nSoul Urge {soul}: This reveals what your heart truly desires."
-                )
+        ut = UniverseTranslator
+        parts = [
+            ut._LIFE_PATH_TEMPLATE.format(
+                number=lp_num,
+                title=lp_title,
+                description=ut.LIFE_PATH_DESCRIPTIONS.get(lp_num, ""),
+            )
+        ]
 
-            pers_desc = UniverseTranslator.PERSONALITY_DESCRIPTIONS.get(pers, "")
-            if pers_desc:
-                core_identity += f"\n\n{pers_desc}"
-            else:
-                core_identity += f"\n\nPersonality {pers}: This is how others first perceive you — the impression you make before they know you deeply."
-
-            py_theme = UniverseTranslator.PERSONAL_YEAR_THEMES.get(py, "")
-            if py_theme:
-                core_identity += f"\n\nPersonal Year {py}: {py_theme}. This theme colors every experience and decision you face this year."
-
-            # LP x PY combo insight
-            lpy_dict = reading.get("lifepath_year_insight_dict", {})
-            if not lpy_dict and reading.get("lifepath_year_insight"):
-                t, m = UniverseTranslator._split_insight(
-                    reading["lifepath_year_insight"]
-                )
-                lpy_dict = {"theme": t, "message": m}
-            if lpy_dict.get("theme"):
-                lp_title = lp.get("title", f"Life Path {lp_num}")
-                core_identity += (
-                    f"\n\nYour Life Path {lp_num} meets Personal Year {py} in a moment "
-                    f"the numbers call \"{lpy_dict['theme']}.\" "
-                    f"The {lp_title} reaches a year shaped by that intersection. "
-                    f"{lpy_dict['message']}"
+        exp_desc = ut.EXPRESSION_DESCRIPTIONS.get(exp, "")
+        parts.append(f"\n\n{exp_desc}" if exp_desc else ut._EXPRESSION_FALLBACK.format(exp))
+
+        soul_desc = ut.SOUL_URGE_DESCRIPTIONS.get(soul, "")
+        parts.append(f"\n\n{soul_desc}" if soul_desc else ut._SOUL_URGE_FALLBACK.format(soul))
+
+        pers_desc = ut.PERSONALITY_DESCRIPTIONS.get(pers, "")
+        parts.append(f"\n\n{pers_desc}" if pers_desc else ut._PERSONALITY_FALLBACK.format(pers))
+
+        py_theme = ut.PERSONAL_YEAR_THEMES.get(py, "")
+        if py_theme:
+            parts.append(ut._PERSONAL_YEAR_TEMPLATE.format(py, py_theme))
+
+        # LP x PY combo insight
+        if lpy_theme:
+            parts.append(
+                ut._LIFEPATH_YEAR_TEMPLATE.format(
+                    lp=lp_num, py=py, theme=lpy_theme, title=combo_title, message=lpy_message
                 )
-        sections["core_identity"] = core_identity
+            )
+        return "".join(parts)
 
+    @staticmethod
+    def _build_foundation(mi: int, lp_num: int) -> str:
         # Section 3.5: Foundation (Mother's Name)
-        foundation = ""
-        if numerology_profile and numerology_profile.get("mother_influence"):
-            mi = numerology_profile["mother_influence"]
-            lp_num = numerology_profile.get("life_path", {}).get("number", 0)
-            if mi == lp_num:
-                foundation = (
-                    f"Your mother's name carries Expression {mi}, which matches your Life Path. "
-                    f"This deep alignment suggests your foundation and your purpose are woven from the same thread. "
-                    f"The values instilled in you are the very ones you are here to live. "
-                    f"Lean into this alignment — it is a source of quiet strength."
-                )
-            elif mi and lp_num:
-                foundation = (
-                    f"Your mother's name carries Expression {mi}, providing the foundation upon which your Life Path {lp_num} was built. "
-                    f"This influence shaped your earliest understanding of the world and continues to inform your deepest instincts. "
-                    f"Notice where these two energies create a productive tension in your life."
-                )
-        sections["foundation"] = foundation
+        if mi == lp_num:
+            return UniverseTranslator._FOUNDATION_ALIGNED_TEMPLATE.format(mi=mi)
+        if mi and lp_num:
+            return UniverseTranslator._FOUNDATION_TEMPLATE.format(mi=mi, lp=lp_num)
+        return ""
 
+    @staticmethod
+    def _build_right_now(
+        planet: str,
+        domain: str,
+        moon_context: Optional[str],
+        hour_message: Optional[str],
+        pm_theme: Optional[str],
+        pm_message: Optional[str],
+    ) -> str:
         # Section 4: Right Now
         right_now_parts = []
-        planet = fc60_stamp.get("_planet", "")
-        domain = fc60_stamp.get("_domain", "")
         if planet:
             right_now_parts.append(
                 f"Today is governed by {planet}, shaping the domain of {domain.lower()}. "
                 f"Every conversation, decision, and impulse today carries a hint of this influence."
             )
-        if reading.get("moon_context"):
-            right_now_parts.append(reading["moon_context"])
-        hour_signals = [
-            s for s in reading.get("signals", []) if s.get("type") == "hour_animal"
-        ]
-        if hour_signals:
+        if moon_context:
+            right_now_parts.append(moon_context)
+        if hour_message is not None:
             right_now_parts.append(
-                f"{hour_signals[0]['message']} Let this shape how you spend the next few hours."
+                f"{hour_message} Let this shape how you spend the next few hours."
             )
         # Planet-moon combo insight
-        pm_dict = reading.get("planet_moon_insight_dict", {})
-        if not pm_dict and reading.get("planet_moon_insight"):
-            t, m = UniverseTranslator._split_insight(reading["planet_moon_insight"])
-            pm_dict = {"theme": t, "message": m}
-        if pm_dict.get("theme"):
+        if pm_theme:
             right_now_parts.append(
                 f"When {planet or 'the planet'} meets this moon phase, the theme is "
-                f"\"{pm_dict['theme']}.\" {pm_dict['message']}"
+                f'"{pm_theme}." {pm_message}'
             )
-        sections["right_now"] = "\n\n".join(right_now_parts)
+        return "\n\n".join(right_now_parts)
+
+    @staticmethod
+    def _repeated_numbers(numerology_profile: Dict) -> Tuple[Tuple[int, int], ...]:
+        """(number, count) for core numbers appearing 2+ times, in first-seen order."""
+        nums = (
+            numerology_profile.get("life_path", {}).get("number", 0),
+            numerology_profile.get("expression", 0),
+            numerology_profile.get("soul_urge", 0),
+            numerology_profile.get("personality", 0),
+            numerology_profile.get("personal_year", 0),
+        )
+        if len(set(nums)) == len(nums):
+            return ()
+        counts = {}
+        for num in nums:
+            counts[num] = counts.get(num, 0) + 1
+        return tuple((num, count) for num, count in counts.items() if count >= 2)
 
+    @staticmethod
+    def _build_patterns(
+        reps: Tuple[Tuple, ...],
+        positions: Tuple[str, ...],
+        repeated_numbers: Tuple[Tuple[int, int], ...],
+    ) -> str:
         # Section 5: Patterns Detected
+        # reps: (animal, animal_name, count, priority, trait) per repetition;
+        # positions: animal codes of the stamp's month/day/hour/minute fields
+        stamp = dict(zip(UniverseTranslator._POSITION_MAP, positions))
         patterns_parts = []
-        reps = reading.get("animal_repetitions", [])
         if reps:
             patterns_parts.append(
                 "When the same animal appears more than once, it is speaking louder "
                 "than the rest. Here is what stands out today."
             )
-        for rep in reps:
-            positions = UniverseTranslator._position_names(fc60_stamp, rep["animal"])
+        for animal, animal_name, count, priority, trait in reps:
+            names = UniverseTranslator._position_names(stamp, animal)
             pos_str = ""
-            if positions:
-                pos_str = f" It shows up in {', '.join(positions)}."
+            if names:
+                pos_str = f" It shows up in {', '.join(names)}."
             patterns_parts.append(
-                f"The {rep['animal_name']} appears {rep['count']} times "
-                f"({rep['priority']} signal): {rep['trait']}.{pos_str}"
+                f"The {animal_name} appears {count} times ({priority} signal): {trait}.{pos_str}"
             )
         # Animal harmony between different repeated animals
         if len(reps) >= 2:
-            try:
-                from synthesis.signal_combiner import SignalCombiner
-
-                a1, a2 = reps[0]["animal"], reps[1]["animal"]
-                if a1 != a2:
-                    harmony = SignalCombiner.animal_harmony(a1, a2)
-                    patterns_parts.append(
-                        f"The {reps[0]['animal_name']} and {reps[1]['animal_name']} "
-                        f"share a {harmony['type']} relationship. {harmony['meaning']}"
-                    )
-            except ImportError:
-                pass
-        if numerology_profile:
-            nums = [
-                numerology_profile.get("life_path", {}).get("number", 0),
-                numerology_profile.get("expression", 0),
-                numerology_profile.get("soul_urge", 0),
-                numerology_profile.get("personality", 0),
-                numerology_profile.get("personal_year", 0),
-            ]
-            from collections import Counter
-
-            num_counts = Counter(nums)
-            for num, count in num_counts.items():
-                if count >= 2:
-                    patterns_parts.append(
-                        f"The number {num} appears {count} times in your profile — "
-                        f"major thematic emphasis."
-                    )
-        sections["patterns"] = (
+            a1, a2 = reps[0][0], reps[1][0]
+            if a1 != a2:
+                harmony = SignalCombiner.animal_harmony(a1, a2)
+                patterns_parts.append(
+                    f"The {reps[0][1]} and {reps[1][1]} "
+                    f"share a {harmony['type']} relationship. {harmony['meaning']}"
+                )
+        for num, count in repeated_numbers:
+            patterns_parts.append(
+                f"The number {num} appears {count} times in your profile — "
+                f"major thematic emphasis."
+            )
+        return (
             "\n\n".join(patterns_parts)
             if patterns_parts
             else "No strong patterns detected at this time."
         )
 
+    @staticmethod
+    def _build_message(
+        core_signal: Optional[str],
+        day_energy: Optional[str],
+        personal_overlay: Optional[str],
+        year_context: Optional[str],
+        animal_element_description: Optional[str],
+        heartbeat_context: Optional[str],
+        location_context: Optional[str],
+    ) -> str:
         # Section 6: The Message (structured paragraphs)
-        msg_paragraphs = []
-        # Opening framing line
-        msg_paragraphs.append(
+        msg_paragraphs = [
+            # Opening framing line
             "Here is what the numbers, the animals, and the elements are saying when "
             "woven together into a single thread."
-        )
-        # Paragraph 1: Loudest signal + day energy
-        p1_parts = []
-        if reading.get("core_signal"):
-            p1_parts.append(reading["core_signal"])
-        if reading.get("day_energy"):
-            p1_parts.append(reading["day_energy"])
-        if p1_parts:
-            msg_paragraphs.append(" ".join(p1_parts))
-        # Paragraph 2: Personal context woven with universal rhythm
-        p2_parts = []
-        if reading.get("personal_overlay"):
-            p2_parts.append(reading["personal_overlay"])
-        if reading.get("year_context"):
-            p2_parts.append(reading["year_context"])
-        if reading.get("animal_element_description"):
-            p2_parts.append(reading["animal_element_description"])
-        if p2_parts:
-            msg_paragraphs.append(" ".join(p2_parts))
-        # Paragraph 3: Body and place — heartbeat + location
-        p3_parts = []
-        if reading.get("heartbeat_context"):
-            p3_parts.append(reading["heartbeat_context"])
-        if reading.get("location_context"):
-            p3_parts.append(reading["location_context"])
-        if p3_parts:
-            msg_paragraphs.append(" ".join(p3_parts))
-        sections["message"] = (
-            "\n\n".join(msg_paragraphs)
-            if msg_paragraphs
-            else "The current moment carries a balanced energy without strong directional signals."
-        )
+        ]
+        for group in (
+            # Paragraph 1: Loudest signal + day energy
+            (core_signal, day_energy),
+            # Paragraph 2: Personal context woven with universal rhythm
+            (personal_overlay, year_context, animal_element_description),
+            # Paragraph 3: Body and place — heartbeat + location
+            (heartbeat_context, location_context),
+        ):
+            parts = [part for part in group if part]
+            if parts:
+                msg_paragraphs.append(" ".join(parts))
+        return "\n\n".join(msg_paragraphs)
 
+    @staticmethod
+    def _build_advice(
+        actions: Tuple[str, ...], signals: Tuple[Tuple[str, str], ...]
+    ) -> str:
         # Section 7: Today's Advice (guaranteed 3+ items)
-        advice = []
-        action_labels = [
-            "Focus here first",
-            "Keep this in mind",
-            "Before the day ends",
-        ]
-        # Prefer combined_signals recommended_actions (more actionable)
-        combined = reading.get("combined_signals")
-        if combined and combined.get("recommended_actions"):
-            for i, action in enumerate(combined["recommended_actions"][:3]):
-                label = action_labels[i] if i < len(action_labels) else f"Also"
-                advice.append(f"{i + 1}. **{label}**: {action}")
-        # Fill from strongest signals if needed
-        if len(advice) < 3:
-            strongest_signals = sorted(
-                reading.get("signals", []),
-                key=lambda s: {
-                    "Very High": 4,
-                    "High": 3,
-                    "Medium": 2,
-                    "Low-Medium": 1,
-                }.get(s.get("priority", ""), 0),
-                reverse=True,
+        # actions: combined_signals recommended_actions (more actionable);
+        # signals: (priority, message) to fill from the strongest
+        ut = UniverseTranslator
+        labels = ut._ADVICE_LABELS
+        messages = list(actions[:3])
+        if len(messages) < 3:
+            strongest = sorted(
+                signals, key=lambda s: ut._SIGNAL_ORDER.get(s[0], 0), reverse=True
             )
-            for signal in strongest_signals:
-                if len(advice) >= 3:
-                    break
-                idx = len(advice)
-                label = action_labels[idx] if idx < len(action_labels) else "Also"
-                advice.append(f"{idx + 1}. **{label}**: {signal['message']}")
+            messages.extend(message for _, message in strongest[: 3 - len(messages)])
         # Guarantee minimum 3
-        defaults = [
-            "Stay present and observe the patterns unfolding around you.",
-            "Journal about what feels resonant — the signals are personal.",
-            "Take one small action aligned with the strongest energy you feel.",
-        ]
-        for d in defaults:
-            if len(advice) >= 3:
-                break
-            idx = len(advice)
-            label = action_labels[idx] if idx < len(action_labels) else "Also"
-            advice.append(f"{idx + 1}. **{label}**: {d}")
-        sections["advice"] = "\n\n".join(advice)
+        messages.extend(ut._ADVICE_DEFAULTS[: max(0, 3 - len(messages))])
+        return "\n\n".join(
+            ut._ADVICE_TEMPLATE.format(i + 1, labels[i] if i < len(labels) else "Also", message)
+            for i, message in enumerate(messages)
+        )
 
+    @staticmethod
+    def _build_caution(
+        paradox: Optional[str], dom_token: str, tensions: Tuple[str, ...]
+    ) -> str:
         # Section 8: Caution
-        caution_parts = []
-        caution_parts.append(
+        caution_parts = [
             "Every energy has a shadow. Knowing yours helps you work with it instead of against it."
-        )
-        if reading.get("paradox"):
-            caution_parts.append(reading["paradox"])
+        ]
+        if paradox:
+            caution_parts.append(paradox)
         # Add shadow from day energy element with counter-strategy
-        element_counters = {
-            "Wood": "Ground yourself with one concrete task before chasing the next idea.",
-            "Fire": "Step away from intensity for ten minutes. Cool water, a slow breath.",
-            "Earth": "Shake up one small routine today. Movement prevents stagnation.",
-            "Metal": "Let something be imperfect on purpose. Flexibility is strength too.",
-            "Water": "Write down the three things that matter most right now. Clarity cuts through overwhelm.",
-        }
-        dom_token = fc60_stamp.get("_dom_token", "")
         if dom_token and len(dom_token) >= 4:
             element_part = dom_token[2:]
-            from synthesis.reading_engine import ReadingEngine
-
             element_info = ReadingEngine.ELEMENT_MEANINGS.get(element_part, {})
             if element_info.get("shadow"):
                 shadow_text = (
                     f"Watch for {element_info['shadow'].lower()} — the shadow side "
                     f"of today's {element_info['name']} energy."
                 )
-                counter = element_counters.get(element_info["name"], "")
+                counter = UniverseTranslator._ELEMENT_COUNTERS.get(element_info["name"], "")
                 if counter:
                     shadow_text += f" {counter}"
                 caution_parts.append(shadow_text)
         # Add tensions from signal combination
-        combined = reading.get("combined_signals")
-        if combined and combined.get("tensions"):
-            for tension in combined["tensions"]:
-                caution_parts.append(
-                    f"Tension: {tension} Sit with this rather than forcing a resolution."
-                )
-        sections["caution"] = (
-            "\n\n".join(caution_parts)
-            if caution_parts
-            else "No specific cautions for this moment."
-        )
+        for tension in tensions:
+            caution_parts.append(
+                f"Tension: {tension} Sit with this rather than forcing a resolution."
+            )
+        return "\n\n".join(caution_parts)
 
+    @staticmethod
+    def _build_footer(
+        confidence: int,
+        conf_label: str,
+        has_numerology: bool,
+        has_moon: bool,
+        has_year: bool,
+        has_heartbeat: bool,
+        has_location: bool,
+        has_mother: bool,
+        has_hour: bool,
+    ) -> str:
         # Section 9: Footer
         data_sources = ["FC60 stamp", "weekday calculation"]
-        if numerology_profile:
+        if has_numerology:
             data_sources.append("Pythagorean numerology")
-        if reading.get("moon_context"):
+        if has_moon:
             data_sources.append("lunar phase")
-        if reading.get("year_context"):
+        if has_year:
             data_sources.append("Gānzhī cycle")
-        if reading.get("heartbeat_context"):
+        if has_heartbeat:
             data_sources.append("heartbeat estimation")
-        if reading.get("location_context"):
+        if has_location:
             data_sources.append("location encoding")
 
         # Determine missing data dimensions
         missing_data = []
-        if not reading.get("location_context"):
+        if not has_location:
             missing_data.append("location")
-        if not numerology_profile or not numerology_profile.get("mother_influence"):
+        if not has_mother:
             missing_data.append("mother's name")
-        if not reading.get("heartbeat_context"):
+        if not has_heartbeat:
             missing_data.append("heartbeat")
-        # Check if hour/time was provided (hour_animal signal present)
-        hour_signals = [
-            s for s in reading.get("signals", []) if s.get("type") == "hour_animal"
-        ]
-        if not hour_signals:
+        # Hour/time was provided when an hour_animal signal is present
+        if not has_hour:
             missing_data.append("exact time of day")
 
         footer_text = (
@@ -498,43 +536,194 @@ class UniverseTranslator:
             f"\nDisclaimer: This reading suggests patterns, not predictions. "
             f"Use as one input among many for reflection and decision-making."
         )
-        sections["footer"] = footer_text
+        return footer_text
 
-        # Build full text
-        divider = "\n" + "—" * 50 + "\n"
-        full_parts = [
-            sections["header"],
-            divider,
-            "YOUR UNIVERSAL ADDRESS",
-            sections["universal_address"],
-            divider,
-            "CORE IDENTITY",
-            sections["core_identity"],
-        ]
-        if sections.get("foundation"):
-            full_parts.extend([divider, "FOUNDATION", sections["foundation"]])
-        full_parts.extend(
-            [
-                divider,
-                "RIGHT NOW",
-                sections["right_now"],
-                divider,
-                "PATTERNS DETECTED",
-                sections["patterns"],
-                divider,
-                "THE MESSAGE",
-                sections["message"],
-                divider,
-                "TODAY'S ADVICE",
-                sections["advice"],
-                divider,
-                "CAUTION",
-                sections["caution"],
-                divider,
-                sections["footer"],
-            ]
+    # ════════════════════════════════════════════════════════════
+    # Translation
+    # ════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def translate(
+        reading: Dict,
+        fc60_stamp: Dict,
+        numerology_profile: Dict = None,
+        person_name: str = "",
+        current_date_str: str = "",
+        confidence_override: Optional[int] = None,
+    ) -> Dict:
+        """
+        Translate a reading into final 9-section human output.
+
+        Each section comes from a builder that only sees that section's
+        inputs. Sections that are costly to build and repeat across people
+        or moments (address, core identity, foundation, patterns, advice,
+        caution) are memoized on those inputs in a bounded LRU (see
+        section_cache_stats()); the rest are cheaper to build than to key.
+        full_text is one join over the per-section fragments.
+
+        Args:
+            reading: Output from ReadingEngine.generate_reading()
+            fc60_stamp: Output from FC60StampEngine.encode()
+            numerology_profile: Output from NumerologyEngine.complete_profile()
+            person_name: Person's name for header
+            current_date_str: Formatted date string
+            confidence_override: If provided, use this confidence score instead
+                                 of the reading_engine's internal estimate.
+
+        Returns:
+            Dict with each section as string + full_text concatenation
+        """
+        ut = UniverseTranslator
+        section = ut._cached_section
+        sections = {}
+        fragments = []
+
+        # Section 1: Header (per person, not cached)
+        confidence = (
+            confidence_override
+            if confidence_override is not None
+            else reading.get("confidence", 50)
         )
-        sections["full_text"] = "\n".join(full_parts)
+        if confidence >= 85:
+            conf_label = "very_high"
+        elif confidence >= 75:
+            conf_label = "high"
+        elif confidence >= 65:
+            conf_label = "medium"
+        else:
+            conf_label = "developing"
+        sections["header"] = (
+            f"READING FOR {person_name.upper() or 'YOU'}\n"
+            f"Date: {current_date_str or fc60_stamp.get('iso', 'Unknown')}\n"
+            f"Confidence: {confidence}% ({conf_label})"
+        )
+        fragments.append(sections["header"])
+
+        sections["universal_address"], fragment = section(
+            "universal_address",
+            (
+                fc60_stamp.get("fc60", "N/A"),
+                fc60_stamp.get("j60", "N/A"),
+                fc60_stamp.get("y60", "N/A"),
+            ),
+        )
+        fragments.append(fragment)
+
+        core_identity = fragment = ""
+        if numerology_profile:
+            lp = numerology_profile.get("life_path", {})
+            lp_num = lp.get("number", 0)
+            core_identity, fragment = section(
+                "core_identity",
+                (
+                    lp_num,
+                    lp.get("title", ""),
+                    lp.get("title", f"Life Path {lp_num}"),
+                    numerology_profile.get("expression", 0),
+                    numerology_profile.get("soul_urge", 0),
+                    numerology_profile.get("personality", 0),
+                    numerology_profile.get("personal_year", 0),
+                )
+                + ut._insight(reading, "lifepath_year_insight"),
+            )
+        sections["core_identity"] = core_identity
+        fragments.append(fragment or ut._FRAGMENT_PREFIX["core_identity"])
+
+        foundation = ""
+        if numerology_profile and numerology_profile.get("mother_influence"):
+            foundation, fragment = section(
+                "foundation",
+                (
+                    numerology_profile["mother_influence"],
+                    numerology_profile.get("life_path", {}).get("number", 0),
+                ),
+            )
+            if foundation:
+                fragments.append(fragment)
+        sections["foundation"] = foundation
+
+        signals = reading.get("signals", [])
+        hour_message = None
+        for s in signals:
+            if s.get("type") == "hour_animal":
+                hour_message = s["message"]
+                break
+        sections["right_now"] = ut._build_right_now(
+            fc60_stamp.get("_planet", ""),
+            fc60_stamp.get("_domain", ""),
+            reading.get("moon_context"),
+            hour_message,
+            *ut._insight(reading, "planet_moon_insight"),
+        )
+        fragments.append(ut._FRAGMENT_PREFIX["right_now"] + sections["right_now"])
+
+        reps = reading.get("animal_repetitions", [])
+        sections["patterns"], fragment = section(
+            "patterns",
+            (
+                tuple(map(_repetition_fields, reps)),
+                # Positions only name repeated animals, by their 2-letter code
+                (
+                    tuple(fc60_stamp.get(field, "")[:2] for field in ut._POSITION_MAP)
+                    if reps
+                    else ()
+                ),
+                ut._repeated_numbers(numerology_profile) if numerology_profile else (),
+            ),
+        )
+        fragments.append(fragment)
+
+        sections["message"] = ut._build_message(
+            reading.get("core_signal"),
+            reading.get("day_energy"),
+            reading.get("personal_overlay"),
+            reading.get("year_context"),
+            reading.get("animal_element_description"),
+            reading.get("heartbeat_context"),
+            reading.get("location_context"),
+        )
+        fragments.append(ut._FRAGMENT_PREFIX["message"] + sections["message"])
+
+        combined = reading.get("combined_signals") or {}
+        actions = tuple((combined.get("recommended_actions") or ())[:3])
+        sections["advice"], fragment = section(
+            "advice",
+            (
+                actions,
+                (
+                    tuple((s.get("priority", ""), s["message"]) for s in signals)
+                    if len(actions) < 3
+                    else ()
+                ),
+            ),
+        )
+        fragments.append(fragment)
+
+        sections["caution"], fragment = section(
+            "caution",
+            (
+                reading.get("paradox"),
+                fc60_stamp.get("_dom_token", ""),
+                tuple(combined.get("tensions") or ()),
+            ),
+        )
+        fragments.append(fragment)
+
+        sections["footer"] = ut._build_footer(
+            confidence,
+            conf_label,
+            bool(numerology_profile),
+            bool(reading.get("moon_context")),
+            bool(reading.get("year_context")),
+            bool(reading.get("heartbeat_context")),
+            bool(reading.get("location_context")),
+            bool(numerology_profile and numerology_profile.get("mother_influence")),
+            hour_message is not None,
+        )
+        fragments.append(ut._FRAGMENT_PREFIX["footer"] + sections["footer"])
+
+        # Build full text
+        sections["full_text"] = "".join(fragments)
 
         return sections
 
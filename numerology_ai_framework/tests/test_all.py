@@ -376,6 +376,46 @@ class TestFC60StampEngine(unittest.TestCase):
         ]:
             self.assertIn(key, r, f"Missing internal field: {key}")
 
+    def test_encode_batch_matches_encode(self):
+        """encode_batch columns equal encode() field-by-field."""
+        moments = [
+            (2026, 2, 6, 1, 15, 0, 8, 0),
+            (2000, 1, 1, 0, 0, 0, 0, 0),
+            (2024, 2, 29, 12, 0, 0, 0, 0),
+            (2025, 12, 31, 23, 59, 59, 0, 0),
+            (1969, 12, 31, 23, 0, 0, 5, 30),
+            (2026, 2, 9, 14, 30, 0, -5, 0),
+            (2026, 2, 9, 14, 30, 0, 0, -30),
+            (1, 1, 1, 6, 7, 8, 14, 59),
+        ]
+        for has_time in (True, False):
+            cols = FC60StampEngine.encode_batch(*zip(*moments), has_time=has_time)
+            for i, moment in enumerate(moments):
+                expected = FC60StampEngine.encode(*moment, has_time=has_time)
+                self.assertEqual(list(cols), list(expected))
+                for key, value in expected.items():
+                    self.assertEqual(cols[key][i], value, f"{key} @ {moment}")
+
+    def test_encode_batch_scalar_timezone(self):
+        """A scalar tz applies to every row; omitted times default to 0."""
+        cols = FC60StampEngine.encode_batch([2026, 2026], [2, 2], [6, 7], tz_hours=8)
+        self.assertEqual(cols["tz60"], ["+OXMT-RAWU"] * 2)
+        self.assertEqual(cols["fc60"][0], FC60StampEngine.encode(2026, 2, 6, 0, 0, 0, 8)["fc60"])
+
+    def test_encode_batch_empty(self):
+        """Empty input yields empty columns."""
+        cols = FC60StampEngine.encode_batch([], [], [])
+        self.assertTrue(all(col == [] for col in cols.values()))
+
+    def test_encode_batch_invalid_raises(self):
+        """Invalid rows and mismatched lengths raise ValueError."""
+        with self.assertRaises(ValueError):
+            FC60StampEngine.encode_batch([2025], [2], [29])
+        with self.assertRaises(ValueError):
+            FC60StampEngine.encode_batch([2026], [1], [1], hours=[24])
+        with self.assertRaises(ValueError):
+            FC60StampEngine.encode_batch([2026, 2026], [1], [1, 2])
+
 
 class TestMoonEngine(unittest.TestCase):
     """Test lunar phase calculations."""
@@ -642,6 +682,61 @@ class TestNumerologyEngine(unittest.TestCase):
         )
         self.assertIn("mother_influence", p)
 
+    def test_static_profile_cached(self):
+        """Second lookup for the same person is a cache hit."""
+        NumerologyEngine.clear_static_cache()
+        NumerologyEngine.complete_profile("Test User", 1, 1, 2000, 2026, 2, 9)
+        NumerologyEngine.complete_profile("Test  User ", 1, 1, 2000, 2027, 5, 3)
+        stats = NumerologyEngine.static_cache_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+
+    def test_static_dynamic_split_matches_direct(self):
+        """Composed profile equals the per-number functions for every system."""
+        for system, name, mother in [
+            ("pythagorean", "Alice Johnson", "Barbara Johnson"),
+            ("chaldean", "Alice Johnson", None),
+            ("abjad", "\u0639\u0644\u06cc \u0631\u0636\u0627", "\u0641\u0627\u0637\u0645\u0647"),
+        ]:
+            p = NumerologyEngine.complete_profile(
+                name, 15, 7, 1990, 2026, 2, 9, mother_name=mother, system=system
+            )
+            self.assertEqual(p["expression"], NumerologyEngine.expression_number(name, system))
+            self.assertEqual(p["soul_urge"], NumerologyEngine.soul_urge(name, system))
+            self.assertEqual(p["personality"], NumerologyEngine.personality_number(name, system))
+            self.assertEqual(p["personal_day"], NumerologyEngine.personal_day(7, 15, 2026, 2, 9))
+            if mother:
+                self.assertEqual(
+                    p["mother_influence"], NumerologyEngine.expression_number(mother, system)
+                )
+            else:
+                self.assertNotIn("mother_influence", p)
+
+    def test_precomputed_static_is_used(self):
+        """complete_profile(static=...) skips name analysis entirely."""
+        static = NumerologyEngine.static_profile("Test User", 1, 1, 2000)
+        NumerologyEngine.clear_static_cache()
+        p = NumerologyEngine.complete_profile(
+            "Test User", 1, 1, 2000, 2026, 2, 9, static=static
+        )
+        self.assertEqual(p["expression"], static["expression"])
+        self.assertEqual(NumerologyEngine.static_cache_stats()["misses"], 0)
+
+    def test_static_profile_returns_copies(self):
+        """Mutating a returned profile does not affect the cache."""
+        p = NumerologyEngine.complete_profile("Copy Test", 2, 2, 2002, 2026, 2, 9)
+        p["life_path"]["number"] = -1
+        p2 = NumerologyEngine.complete_profile("Copy Test", 2, 2, 2002, 2026, 2, 9)
+        self.assertNotEqual(p2["life_path"]["number"], -1)
+
+    def test_static_fingerprint(self):
+        """Fingerprint ignores whitespace but tracks every real input."""
+        fp = NumerologyEngine.static_profile_fingerprint
+        base = fp("Test User", 1, 1, 2000, "Mary")
+        self.assertEqual(base, fp(" Test   User", 1, 1, 2000, "Mary "))
+        self.assertNotEqual(base, fp("Test User", 1, 1, 2000, "Maria"))
+        self.assertNotEqual(base, fp("Test User", 2, 1, 2000, "Mary"))
+        self.assertNotEqual(base, fp("Test User", 1, 1, 2000, "Mary", "chaldean"))
+
 
 class TestReadingEngine(unittest.TestCase):
     """Test reading generation."""
@@ -742,6 +837,84 @@ class TestUniverseTranslator(unittest.TestCase):
         result = UniverseTranslator.translate(mock_reading, mock_stamp)
         self.assertGreater(len(result["full_text"]), 100)
 
+    def _translate_args(self, **overrides):
+        reading = MasterOrchestrator.generate_reading(
+            "Alice Johnson",
+            15,
+            7,
+            1990,
+            current_date=datetime(2026, 2, 9),
+            mother_name="Barbara Johnson",
+            current_hour=14,
+            current_minute=30,
+        )
+        args = dict(
+            reading=reading["reading"],
+            fc60_stamp=reading["fc60_stamp"],
+            numerology_profile=reading["numerology"],
+            person_name="Alice Johnson",
+            current_date_str="2026-02-09",
+            confidence_override=reading["confidence"]["score"],
+        )
+        args.update(overrides)
+        return args
+
+    def test_full_text_joins_sections(self):
+        """full_text is every section under its heading, in order."""
+        result = UniverseTranslator.translate(**self._translate_args())
+        divider = "\n" + "—" * 50 + "\n"
+        parts = [result["header"]]
+        for heading, key in [
+            ("YOUR UNIVERSAL ADDRESS", "universal_address"),
+            ("CORE IDENTITY", "core_identity"),
+            ("FOUNDATION", "foundation"),
+            ("RIGHT NOW", "right_now"),
+            ("PATTERNS DETECTED", "patterns"),
+            ("THE MESSAGE", "message"),
+            ("TODAY'S ADVICE", "advice"),
+            ("CAUTION", "caution"),
+        ]:
+            parts.extend([divider, heading, result[key]])
+        parts.extend([divider, result["footer"]])
+        self.assertEqual(result["full_text"], "\n".join(parts))
+
+    def test_cached_sections_identical(self):
+        """A warm translation equals a cold one; sections come from the cache."""
+        args = self._translate_args()
+        UniverseTranslator.clear_section_cache()
+        cold = UniverseTranslator.translate(**args)
+        misses = UniverseTranslator.section_cache_stats()["misses"]
+        warm = UniverseTranslator.translate(**dict(args, person_name="Bob"))
+        stats = UniverseTranslator.section_cache_stats()
+        self.assertEqual(stats["misses"], misses)
+        self.assertEqual(stats["hits"], misses)
+        self.assertEqual(
+            {k: v for k, v in warm.items() if k not in ("header", "full_text")},
+            {k: v for k, v in cold.items() if k not in ("header", "full_text")},
+        )
+        self.assertIn("BOB", warm["header"])
+
+    def test_sections_keyed_by_inputs(self):
+        """Changing one section's input rebuilds that section only."""
+        args = self._translate_args()
+        before = UniverseTranslator.translate(**args)
+        profile = dict(args["numerology_profile"], expression=4, mother_influence=9)
+        after = UniverseTranslator.translate(**dict(args, numerology_profile=profile))
+        self.assertNotEqual(after["core_identity"], before["core_identity"])
+        self.assertIn("Your Expression 4", after["core_identity"])
+        self.assertNotEqual(after["foundation"], before["foundation"])
+        self.assertEqual(after["universal_address"], before["universal_address"])
+
+    def test_section_cache_is_bounded(self):
+        UniverseTranslator.clear_section_cache()
+        limit = UniverseTranslator.SECTION_CACHE_SIZE
+        stamp = {"fc60": "X", "j60": "Y"}
+        for i in range(limit + 10):
+            UniverseTranslator.translate({"signals": []}, dict(stamp, y60=str(i)))
+        self.assertEqual(UniverseTranslator.section_cache_stats()["size"], limit)
+        UniverseTranslator.clear_section_cache()
+        self.assertEqual(UniverseTranslator.section_cache_stats()["size"], 0)
+
 
 class TestMasterOrchestrator(unittest.TestCase):
     """End-to-end orchestrator tests."""
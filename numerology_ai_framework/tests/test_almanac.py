@@ -0,0 +1,141 @@
+"""Tests for the memory-mapped calendar almanac.
+
+Covers: build/load round-trip, equivalence with the arithmetic engines
+inside and outside the table, per-field fallback, rejection of bad files,
+concurrent load/unload, and unchanged MasterOrchestrator output when the
+table is loaded.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.julian_date_engine import JulianDateEngine
+from core.weekday_calculator import WeekdayCalculator
+from universal.moon_engine import MoonEngine
+from universal.ganzhi_engine import GanzhiEngine
+from universal.almanac import CalendarAlmanac
+from synthesis.master_orchestrator import MasterOrchestrator
+
+
+class TestCalendarAlmanac(unittest.TestCase):
+    """Table lookups must equal the arithmetic engines exactly."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = CalendarAlmanac.build(os.path.join(cls.tmp.name, "almanac.bin"), 1999, 2001)
+
+    @classmethod
+    def tearDownClass(cls):
+        CalendarAlmanac.unload()
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        self.assertTrue(CalendarAlmanac.load(self.path))
+
+    def tearDown(self):
+        CalendarAlmanac.unload()
+
+    def test_coverage(self):
+        """Table spans Jan 1 of the first year to Dec 31 of the last."""
+        first, last = CalendarAlmanac.coverage()
+        self.assertEqual(first, JulianDateEngine.gregorian_to_jdn(1999, 1, 1))
+        self.assertEqual(last, JulianDateEngine.gregorian_to_jdn(2001, 12, 31))
+
+    def test_file_size(self):
+        """Fixed-width records: 18-byte header + 26 bytes per day."""
+        first, last = CalendarAlmanac.coverage()
+        self.assertEqual(os.path.getsize(self.path), 18 + 26 * (last - first + 1))
+
+    def test_matches_engines_in_and_out_of_range(self):
+        """Every day in the table plus fallback days on both sides."""
+        first, last = CalendarAlmanac.coverage()
+        for jdn in range(first - 3, last + 4):
+            self.assertEqual(CalendarAlmanac.full_moon_info(jdn), MoonEngine.full_moon_info(jdn))
+            self.assertEqual(CalendarAlmanac.full_day_info(jdn), GanzhiEngine.full_day_info(jdn))
+            self.assertEqual(CalendarAlmanac.weekday_info(jdn), WeekdayCalculator.full_info(jdn))
+
+    def test_record_fields(self):
+        """Raw record carries year Gānzhī and unrounded moon values."""
+        jdn = JulianDateEngine.gregorian_to_jdn(2000, 6, 15)
+        record = CalendarAlmanac.day_record(jdn)
+        self.assertEqual(record[0], jdn)
+        self.assertEqual(record[5:7], GanzhiEngine.year_ganzhi(2000))
+        self.assertEqual(record[7], MoonEngine.moon_age(jdn))
+        self.assertEqual(record, CalendarAlmanac.compute_record(jdn))
+
+    def test_missing_file_falls_back(self):
+        """No table → arithmetic results, not an error."""
+        self.assertFalse(CalendarAlmanac.load(os.path.join(self.tmp.name, "nope.bin")))
+        self.assertIsNone(CalendarAlmanac.coverage())
+        self.assertEqual(CalendarAlmanac.full_moon_info(2461078), MoonEngine.full_moon_info(2461078))
+
+    def test_fallback_computes_only_the_requested_field(self):
+        """Without the table, lookups go straight to the field's engine."""
+        CalendarAlmanac.load(os.path.join(self.tmp.name, "nope.bin"))
+        jdn = 2461078
+        with mock.patch.object(CalendarAlmanac, "compute_record", side_effect=AssertionError):
+            self.assertEqual(CalendarAlmanac.full_moon_info(jdn), MoonEngine.full_moon_info(jdn))
+            self.assertEqual(CalendarAlmanac.full_day_info(jdn), GanzhiEngine.full_day_info(jdn))
+            self.assertEqual(CalendarAlmanac.weekday_info(jdn), WeekdayCalculator.full_info(jdn))
+
+    def test_concurrent_load_unload(self):
+        """Lookups stay correct while another thread remaps the table."""
+        first, last = CalendarAlmanac.coverage()
+        expected = {jdn: MoonEngine.full_moon_info(jdn) for jdn in range(first, first + 50)}
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    for jdn, info in expected.items():
+                        if CalendarAlmanac.full_moon_info(jdn) != info:
+                            errors.append(jdn)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for _ in range(200):
+            CalendarAlmanac.unload()
+            CalendarAlmanac.load(self.path)
+        stop.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_corrupt_file_rejected(self):
+        """A file with a bad header or size is not mapped."""
+        bad = os.path.join(self.tmp.name, "bad.bin")
+        with open(self.path, "rb") as src, open(bad, "wb") as dst:
+            dst.write(src.read()[:-1])
+        self.assertFalse(CalendarAlmanac.load(bad))
+
+    def test_orchestrator_output_unchanged(self):
+        """Readings are identical with and without the table."""
+        kwargs = dict(
+            full_name="Test User",
+            birth_day=22,
+            birth_month=4,
+            birth_year=1999,
+            current_date=datetime(2000, 3, 1),
+            current_hour=10,
+            current_minute=5,
+        )
+        with_table = MasterOrchestrator.generate_reading(**kwargs)
+        CalendarAlmanac.load(os.path.join(self.tmp.name, "nope.bin"))
+        without_table = MasterOrchestrator.generate_reading(**kwargs)
+        self.assertEqual(with_table, without_table)
+
+
+if __name__ == "__main__":
+    unittest.main()
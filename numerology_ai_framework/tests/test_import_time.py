@@ -0,0 +1,108 @@
+"""Import-time tests: package-relative imports, lazy loading, time budget.
+
+Each check runs in a fresh interpreter from the repository root, importing
+the framework as the services do (``numerology_ai_framework.*``).
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+PACKAGE = "numerology_ai_framework"
+ORCHESTRATOR = f"{PACKAGE}.synthesis.master_orchestrator"
+
+# Self time of the framework's own modules when importing the orchestrator
+# (about 7-10 ms with warm bytecode; generous for slow CI machines)
+FRAMEWORK_IMPORT_BUDGET_MS = 40
+
+
+def _run(code: str, *flags: str, env: dict = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _modules_after(statement: str) -> set:
+    """sys.modules after running ``statement`` in a fresh interpreter."""
+    out = _run(f"import sys\n{statement}\nprint('\\n'.join(sys.modules))").stdout
+    return set(out.split())
+
+
+class TestImportStructure(unittest.TestCase):
+    def test_no_duplicate_top_level_modules(self):
+        """Engines load once, under the package name only."""
+        modules = _modules_after(f"import {ORCHESTRATOR}")
+        top_level = sorted(
+            m for m in modules if m.split(".")[0] in ("core", "personal", "universal", "synthesis")
+        )
+        self.assertEqual(top_level, [])
+        self.assertIn(f"{PACKAGE}.synthesis.signal_combiner", modules)
+
+    def test_orchestrator_import_is_lazy(self):
+        modules = _modules_after(f"import {ORCHESTRATOR}")
+        for lazy in (
+            f"{PACKAGE}.synthesis.signal_tables",
+            f"{PACKAGE}.synthesis.moment_search",
+            "concurrent.futures",
+            "hashlib",
+        ):
+            self.assertNotIn(lazy, modules)
+
+    def test_engine_import_skips_synthesis(self):
+        """Importing one engine does not go through the package exports."""
+        modules = _modules_after(f"from {PACKAGE}.personal.numerology_engine import NumerologyEngine")
+        self.assertFalse([m for m in modules if m.startswith(f"{PACKAGE}.synthesis")])
+
+    def test_package_exports_resolve(self):
+        modules = _modules_after(
+            f"from {PACKAGE} import MasterOrchestrator\n"
+            f"from {PACKAGE}.synthesis import Signal, MomentSearch\n"
+            f"from {PACKAGE}.universal import CalendarAlmanac"
+        )
+        self.assertIn(f"{PACKAGE}.synthesis.moment_search", modules)
+
+    def test_signal_tables_load_on_first_use(self):
+        out = _run(
+            "import sys\n"
+            f"from {PACKAGE}.synthesis.signal_combiner import SignalCombiner\n"
+            f"name = '{PACKAGE}.synthesis.signal_tables'\n"
+            "before = name in sys.modules\n"
+            "theme = SignalCombiner.planet_meets_moon('Sun', 'Full Moon')['theme']\n"
+            "print(before, name in sys.modules, theme)"
+        ).stdout.split(None, 2)
+        self.assertEqual(out, ["False", "True", "Radiant Revelation\n"])
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime needs Python 3.7+")
+class TestImportTime(unittest.TestCase):
+    def test_framework_import_budget(self):
+        env = dict(os.environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        with tempfile.TemporaryDirectory() as cache:
+            env["PYTHONPYCACHEPREFIX"] = cache
+            _run(f"import {ORCHESTRATOR}", env=env)  # warm the bytecode cache
+            best = None
+            for _ in range(3):
+                err = _run(f"import {ORCHESTRATOR}", "-X", "importtime", env=env).stderr
+                own = sum(
+                    int(m.group(1))
+                    for m in re.finditer(r"import time:\s+(\d+) \|\s+\d+ \| \s*(\S+)", err)
+                    if m.group(2).startswith(PACKAGE)
+                )
+                best = own if best is None else min(best, own)
+        self.assertLess(best / 1000, FRAMEWORK_IMPORT_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
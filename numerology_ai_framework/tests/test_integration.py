@@ -184,5 +184,373 @@ class TestSpecTestVectors(unittest.TestCase):
         self.assertEqual(stamp["chk"], "TIMT")
 
 
+
+class TestMomentContextCache(unittest.TestCase):
+    """Person-independent moment data is computed once and shared safely."""
+
+    KWARGS = dict(
+        current_date=datetime(2026, 2, 9),
+        current_hour=14,
+        current_minute=30,
+        current_second=0,
+        tz_hours=-5,
+    )
+
+    def setUp(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        MasterOrchestrator.clear_moment_cache()
+
+    def test_second_person_hits_cache(self):
+        """Two people at the same moment → 1 miss, 1 hit, same sky."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        a = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        b = MasterOrchestrator.generate_reading("Bob Smith", 1, 1, 1985, **self.KWARGS)
+        stats = MasterOrchestrator.moment_cache_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+        self.assertEqual(a["fc60_stamp"], b["fc60_stamp"])
+        self.assertEqual(a["moon"], b["moon"])
+        self.assertEqual(a["ganzhi"], b["ganzhi"])
+
+    def test_cached_reading_identical(self):
+        """A cache hit produces exactly the same reading as a cold call."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        cold = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        warm = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        self.assertEqual(cold, warm)
+
+    def test_mutating_result_does_not_poison_cache(self):
+        """Readings receive copies of the cached dicts."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        first = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        first["fc60_stamp"]["fc60"] = "tampered"
+        first["moon"]["phase_name"] = "tampered"
+        first["ganzhi"]["day"]["animal_name"] = "tampered"
+        second = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        self.assertNotEqual(second["fc60_stamp"]["fc60"], "tampered")
+        self.assertNotEqual(second["moon"]["phase_name"], "tampered")
+        self.assertNotEqual(second["ganzhi"]["day"]["animal_name"], "tampered")
+
+    def test_cache_is_bounded(self):
+        """LRU never grows beyond MOMENT_CACHE_SIZE."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        limit = MasterOrchestrator.MOMENT_CACHE_SIZE
+        for minute in range(limit + 10):
+            MasterOrchestrator.moment_context(2026, 2, 9, minute // 60, minute % 60)
+        self.assertEqual(MasterOrchestrator.moment_cache_stats()["size"], limit)
+
+    def test_invalid_moment_not_cached(self):
+        """Invalid moments still raise ValueError and leave no entry."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        with self.assertRaises(ValueError):
+            MasterOrchestrator.moment_context(2025, 2, 29)
+        self.assertEqual(MasterOrchestrator.moment_cache_stats()["size"], 0)
+
+
+class TestFieldSelection(unittest.TestCase):
+    """generate_reading(fields=...) runs only the needed pipeline steps."""
+
+    KWARGS = dict(
+        full_name="Alice Johnson",
+        birth_day=15,
+        birth_month=7,
+        birth_year=1990,
+        current_date=datetime(2026, 2, 9),
+        mother_name="Barbara Johnson",
+        latitude=40.7,
+        longitude=-74.0,
+        actual_bpm=68,
+        current_hour=14,
+        current_minute=30,
+        current_second=0,
+        tz_hours=-5,
+    )
+
+    def test_subsets_match_full_reading(self):
+        """Every selection returns exactly the full reading's values."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        full = MasterOrchestrator.generate_reading(**self.KWARGS)
+        self.assertEqual(list(full), list(MasterOrchestrator.READING_FIELDS))
+        for fields in (
+            {"numerology"},
+            {"fc60_stamp", "moon"},
+            {"numerology", "moon", "confidence"},
+            {"person", "birth", "current", "patterns"},
+            {"synthesis"},
+            set(MasterOrchestrator.READING_FIELDS),
+        ):
+            partial = MasterOrchestrator.generate_reading(fields=fields, **self.KWARGS)
+            self.assertEqual(set(partial), fields)
+            for key in fields:
+                self.assertEqual(partial[key], full[key], key)
+
+    def test_skips_unneeded_steps(self):
+        """Numerology-only never touches the reading or translation engines."""
+        from unittest import mock
+        from synthesis.master_orchestrator import MasterOrchestrator
+        from synthesis.reading_engine import ReadingEngine
+        from synthesis.universe_translator import UniverseTranslator
+
+        with mock.patch.object(
+            ReadingEngine, "generate_reading", side_effect=AssertionError
+        ), mock.patch.object(UniverseTranslator, "translate", side_effect=AssertionError):
+            result = MasterOrchestrator.generate_reading(
+                fields={"numerology", "fc60_stamp", "moon"}, **self.KWARGS
+            )
+        self.assertIn("life_path", result["numerology"])
+
+    def test_pipeline_steps(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        self.assertEqual(MasterOrchestrator.pipeline_steps({"numerology"}), {"numerology"})
+        self.assertEqual(
+            MasterOrchestrator.pipeline_steps({"heartbeat"}), {"heartbeat", "age", "moment", "birth"}
+        )
+        self.assertNotIn("translation", MasterOrchestrator.pipeline_steps({"confidence"}))
+
+    def test_unknown_field_rejected(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        with self.assertRaises(ValueError):
+            MasterOrchestrator.generate_reading(fields={"numerology", "horoscope"}, **self.KWARGS)
+
+
+class TestBatchReadings(unittest.TestCase):
+    """generate_readings() equals per-person generate_reading() calls."""
+
+    MOMENT = dict(
+        current_date=datetime(2026, 2, 9),
+        current_hour=12,
+        current_minute=0,
+        current_second=0,
+    )
+
+    PEOPLE = [
+        dict(
+            full_name="Alice Johnson",
+            birth_day=15,
+            birth_month=7,
+            birth_year=1990,
+            mother_name="Barbara Johnson",
+            gender="female",
+            actual_bpm=68,
+        ),
+        dict(
+            full_name="Bob Smith",
+            birth_day=1,
+            birth_month=1,
+            birth_year=1985,
+            latitude=35.7,
+            longitude=51.4,
+            tz_hours=3,
+            tz_minutes=30,
+        ),
+        dict(
+            full_name="Cara Diaz",
+            birth_day=29,
+            birth_month=2,
+            birth_year=2000,
+            numerology_system="chaldean",
+        ),
+    ]
+
+    def _expected(self, **extra):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        return [
+            MasterOrchestrator.generate_reading(**{**self.MOMENT, **extra, **person})
+            for person in self.PEOPLE
+        ]
+
+    def test_matches_single_readings(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        batch = MasterOrchestrator.generate_readings(self.PEOPLE, **self.MOMENT)
+        self.assertEqual(batch, self._expected())
+
+    def test_fields_forwarded(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        batch = MasterOrchestrator.generate_readings(
+            self.PEOPLE, fields={"numerology", "moon"}, **self.MOMENT
+        )
+        self.assertEqual(batch, self._expected(fields={"numerology", "moon"}))
+
+    def test_process_pool_matches(self):
+        from unittest import mock
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        people = self.PEOPLE * 4
+        with mock.patch.object(MasterOrchestrator, "POOL_MIN_BATCH", 1):
+            pooled = MasterOrchestrator.generate_readings(people, processes=2, **self.MOMENT)
+        self.assertEqual(pooled, MasterOrchestrator.generate_readings(people, **self.MOMENT))
+
+    def test_person_cannot_set_moment(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        person = dict(self.PEOPLE[0], current_hour=3)
+        with self.assertRaises(ValueError):
+            MasterOrchestrator.generate_readings([person], **self.MOMENT)
+
+
+class TestCompactReadings(unittest.TestCase):
+    """Slotted result records convert back to the exact dict output."""
+
+    KWARGS = dict(
+        current_date=datetime(2026, 2, 9),
+        current_hour=14,
+        current_minute=30,
+        mother_name="Barbara Johnson",
+    )
+
+    def test_to_dict_matches_dict_output(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        full = MasterOrchestrator.generate_reading("Alice Johnson", 15, 7, 1990, **self.KWARGS)
+        compact = MasterOrchestrator.generate_reading(
+            "Alice Johnson", 15, 7, 1990, compact=True, **self.KWARGS
+        )
+        self.assertEqual(compact.to_dict(), full)
+        self.assertEqual(compact["numerology"]["life_path"]["number"], 5)
+        self.assertIsNone(compact["ganzhi"].get("missing"))
+
+    def test_fields_without_moment(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        full = MasterOrchestrator.generate_reading(
+            "Alice Johnson", 15, 7, 1990, fields={"numerology"}, **self.KWARGS
+        )
+        compact = MasterOrchestrator.generate_reading(
+            "Alice Johnson", 15, 7, 1990, fields={"numerology"}, compact=True, **self.KWARGS
+        )
+        self.assertEqual(compact.to_dict(), full)
+        self.assertNotIn("moon", compact)
+
+    def test_moment_records_shared_and_immutable(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        people = [
+            dict(full_name="Alice Johnson", birth_day=15, birth_month=7, birth_year=1990),
+            dict(full_name="Bob Smith", birth_day=1, birth_month=1, birth_year=1985),
+        ]
+        a, b = MasterOrchestrator.generate_readings(
+            people, compact=True, current_date=datetime(2026, 2, 9), current_hour=14
+        )
+        self.assertIs(a.fc60_stamp, b.fc60_stamp)
+        self.assertIs(a.moon, b.moon)
+        with self.assertRaises(AttributeError):
+            a.moon.phase_name = "tampered"
+        # to_dict() hands out fresh dicts
+        a.to_dict()["moon"]["phase_name"] = "tampered"
+        self.assertNotEqual(b.to_dict()["moon"]["phase_name"], "tampered")
+
+    def test_missing_fields_omitted(self):
+        from synthesis.result_types import GanzhiInfo
+
+        ganzhi = {"year": {"year": 2026}, "day": {"jdn": 1}}
+        record = GanzhiInfo.from_dict(ganzhi)
+        self.assertEqual(record.to_dict(), ganzhi)
+        self.assertNotIn("hour", record)
+        with self.assertRaises(TypeError):
+            GanzhiInfo.from_dict({"minute": {}})
+
+    def test_pickle_round_trip(self):
+        import pickle
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        compact = MasterOrchestrator.generate_reading(
+            "Alice Johnson", 15, 7, 1990, compact=True, **self.KWARGS
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+
+
+class TestRetimeReading(unittest.TestCase):
+    """retime_reading() equals a full recomputation at the new time."""
+
+    PERSON = dict(
+        full_name="Alice Johnson",
+        birth_day=15,
+        birth_month=7,
+        birth_year=1990,
+        current_date=datetime(2026, 2, 9),
+        mother_name="Barbara Johnson",
+        latitude=40.7,
+        longitude=-74.0,
+        actual_bpm=68,
+    )
+
+    def test_matches_full_recomputation(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        for tz_hours, tz_minutes in ((0, 0), (3, 30), (-5, 0)):
+            previous = MasterOrchestrator.generate_reading(
+                current_hour=14,
+                current_minute=30,
+                tz_hours=tz_hours,
+                tz_minutes=tz_minutes,
+                **self.PERSON,
+            )
+            for hour in range(24):
+                for minute, second in ((0, 0), (hour, 17), (59, 59)):
+                    expected = MasterOrchestrator.generate_reading(
+                        current_hour=hour,
+                        current_minute=minute,
+                        current_second=second,
+                        tz_hours=tz_hours,
+                        tz_minutes=tz_minutes,
+                        **self.PERSON,
+                    )
+                    retimed = MasterOrchestrator.retime_reading(
+                        previous, hour, minute, second, tz_hours, tz_minutes
+                    )
+                    self.assertEqual(retimed, expected, (hour, minute, second))
+                    self.assertEqual(list(retimed), list(expected))
+
+    def test_previous_without_time(self):
+        """A date-only reading (no hour pillar or hour signal) can be retimed."""
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        previous = MasterOrchestrator.generate_reading(
+            "Bob Smith", 1, 1, 1985, current_date=datetime(2026, 2, 9)
+        )
+        self.assertNotIn("hour", previous["ganzhi"])
+        expected = MasterOrchestrator.generate_reading(
+            "Bob Smith", 1, 1, 1985, current_date=datetime(2026, 2, 9), current_hour=3
+        )
+        self.assertEqual(MasterOrchestrator.retime_reading(previous, 3, 0), expected)
+
+    def test_skips_date_only_steps(self):
+        from unittest import mock
+        from personal.numerology_engine import NumerologyEngine
+        from synthesis.master_orchestrator import MasterOrchestrator
+        from universal.almanac import CalendarAlmanac
+
+        previous = MasterOrchestrator.generate_reading(current_hour=9, **self.PERSON)
+        with mock.patch.object(
+            NumerologyEngine, "complete_profile", side_effect=AssertionError
+        ), mock.patch.object(CalendarAlmanac, "full_moon_info", side_effect=AssertionError):
+            retimed = MasterOrchestrator.retime_reading(previous, 15, 0)
+        self.assertIs(retimed["numerology"], previous["numerology"])
+        self.assertEqual(retimed["ganzhi"]["hour"]["branch_token"], "MO")
+
+    def test_rejects_partial_or_invalid(self):
+        from synthesis.master_orchestrator import MasterOrchestrator
+
+        partial = MasterOrchestrator.generate_reading(
+            fields={"numerology", "fc60_stamp"}, current_hour=9, **self.PERSON
+        )
+        with self.assertRaises(ValueError):
+            MasterOrchestrator.retime_reading(partial, 10, 0)
+        full = MasterOrchestrator.generate_reading(current_hour=9, **self.PERSON)
+        with self.assertRaises(ValueError):
+            MasterOrchestrator.retime_reading(full, 24, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the best-moments search.
+
+The search never builds readings per candidate; these tests score every
+candidate with a full MasterOrchestrator.generate_reading() instead and
+check that the rankings agree.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthesis.master_orchestrator import MasterOrchestrator
+from synthesis.moment_search import MomentSearch
+from synthesis.signal_combiner import SignalCombiner
+
+PERSON = dict(
+    full_name="Alice Johnson",
+    birth_day=15,
+    birth_month=7,
+    birth_year=1990,
+    mother_name="Barbara Johnson",
+    latitude=40.7,
+    longitude=-74.0,
+    actual_bpm=68,
+)
+
+
+def _brute_force(start, days, step_minutes, k, tz_hours=0, **person):
+    """Rank every candidate by its full reading."""
+    ranked = []
+    for i in range(0, days * 1440, step_minutes):
+        when = start + timedelta(minutes=i)
+        reading = MasterOrchestrator.generate_reading(
+            current_date=when,
+            current_hour=when.hour,
+            current_minute=when.minute,
+            current_second=0,
+            tz_hours=tz_hours,
+            **person,
+        )
+        strength = sum(
+            SignalCombiner.PRIORITY_RANK[s["priority"]] for s in reading["reading"]["signals"]
+        )
+        ranked.append((-reading["confidence"]["score"], -strength, when.isoformat()))
+    ranked.sort()
+    return [(-c, -s, t) for c, s, t in ranked[:k]]
+
+
+def _summary(moments):
+    return [(m["confidence"], m["signal_strength"], m["local_time"]) for m in moments]
+
+
+class TestBestMoments(unittest.TestCase):
+    def test_matches_full_readings(self):
+        start = datetime(2026, 2, 9, 10, 7)
+        expected = _brute_force(start, 1, 7, 15, tz_hours=3, **PERSON)
+        found = MomentSearch.best_moments(
+            start=start, days=1, k=15, step_minutes=7, tz_hours=3, **PERSON
+        )
+        self.assertEqual(_summary(found), expected)
+
+    def test_matches_without_optional_data(self):
+        person = dict(full_name="Bob Smith", birth_day=1, birth_month=1, birth_year=2000)
+        start = datetime(2026, 3, 1)
+        expected = _brute_force(start, 2, 30, 8, **person)
+        found = MomentSearch.best_moments(start=start, days=2, k=8, step_minutes=30, **person)
+        self.assertEqual(_summary(found), expected)
+
+    def test_stream_contains_final_ranking(self):
+        start = datetime(2026, 2, 9)
+        streamed = list(MomentSearch.iter_best_moments(start=start, days=7, k=5, **PERSON))
+        best = MomentSearch.best_moments(start=start, days=7, k=5, **PERSON)
+        self.assertEqual(len(best), 5)
+        for moment in best:
+            self.assertIn(moment, streamed)
+        # Streamed in time order, as found
+        times = [m["local_time"] for m in streamed]
+        self.assertEqual(times, sorted(times))
+
+    def test_window_bounds(self):
+        start = datetime(2026, 2, 9, 23, 58, 30)
+        found = MomentSearch.best_moments(start=start, days=1, k=2000, **PERSON)
+        self.assertEqual(len(found), 1440)
+        times = sorted(m["local_time"] for m in found)
+        self.assertEqual(times[0], "2026-02-09T23:58:00")
+        self.assertEqual(times[-1], "2026-02-10T23:57:00")
+
+    def test_invalid_arguments(self):
+        start = datetime(2026, 2, 9)
+        for bad in (dict(days=0), dict(days=32), dict(k=0), dict(step_minutes=0)):
+            with self.assertRaises(ValueError):
+                MomentSearch.best_moments(start=start, **bad, **PERSON)
+        # Checked on the call, not on first iteration
+        with self.assertRaises(ValueError):
+            MomentSearch.iter_best_moments(start=start, k=0, **PERSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
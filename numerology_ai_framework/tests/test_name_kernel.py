@@ -0,0 +1,141 @@
+"""Tests for the single-pass name analysis kernel.
+
+The reference functions below are the original per-system implementations
+of expression / soul urge / personality. The kernel must agree with them
+on a fuzzed corpus of Latin, Persian and mixed names, including characters
+whose uppercase form expands (ß, ligatures) or carries combining marks.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from personal.abjad_table import get_abjad_value
+from personal.numerology_engine import NumerologyEngine
+
+NE = NumerologyEngine
+
+
+def _ref_expression(full_name, system):
+    if system == "abjad":
+        value = sum(get_abjad_value(c) for c in full_name)
+        return NE.digital_root(value) if value > 0 else 0
+    table = NE.PYTHAGOREAN if system == "pythagorean" else NE.CHALDEAN
+    return NE.digital_root(sum(table.get(c, 0) for c in full_name.upper() if c.isalpha()))
+
+
+def _ref_soul_urge(full_name, system):
+    if system == "abjad":
+        value = sum(get_abjad_value(c) for c in full_name if c in NE.ABJAD_VOWEL_LETTERS)
+        return NE.digital_root(value) if value > 0 else 0
+    table = NE.PYTHAGOREAN if system == "pythagorean" else NE.CHALDEAN
+    return NE.digital_root(sum(table.get(c, 0) for c in full_name.upper() if c in NE.VOWELS))
+
+
+def _ref_personality(full_name, system):
+    if system == "abjad":
+        value = sum(
+            get_abjad_value(c)
+            for c in full_name
+            if c not in NE.ABJAD_VOWEL_LETTERS and get_abjad_value(c) > 0
+        )
+        return NE.digital_root(value) if value > 0 else 0
+    table = NE.PYTHAGOREAN if system == "pythagorean" else NE.CHALDEAN
+    return NE.digital_root(
+        sum(
+            table.get(c, 0)
+            for c in full_name.upper()
+            if c.isalpha() and c not in NE.VOWELS
+        )
+    )
+
+
+_LATIN = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_LATIN_EXTRA = "éèüöñçåøßıſǰŉﬁﬂﬃÆæŒœ"
+_PERSIAN = (
+    "ابپتثجچحخدذر"
+    "زژسشصضطظعغفق"
+    "کگلمنوهیيك"
+    "آأإٱ"
+)
+_MARKS = "َُِّْـ‌‍"
+_OTHER = " -'.0123456789\t"
+
+
+def _fuzz_corpus(n=2000, seed=60):
+    rng = random.Random(seed)
+    pools = [
+        _LATIN + " -'",
+        _LATIN + _LATIN_EXTRA + _OTHER,
+        _PERSIAN + _MARKS + " ",
+        _LATIN + _PERSIAN + _MARKS + _LATIN_EXTRA + _OTHER,
+    ]
+    corpus = ["", " ", "Alice Johnson", "علی رضایی"]
+    for _ in range(n):
+        pool = rng.choice(pools)
+        corpus.append("".join(rng.choice(pool) for _ in range(rng.randint(1, 40))))
+    return corpus
+
+
+class TestNameKernel(unittest.TestCase):
+    """Kernel results equal the original per-system functions."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = _fuzz_corpus()
+
+    def test_matches_reference_all_systems(self):
+        for name in self.corpus:
+            for system in ("pythagorean", "chaldean", "abjad", "unknown"):
+                self.assertEqual(
+                    NE.expression_number(name, system), _ref_expression(name, system), name
+                )
+                self.assertEqual(NE.soul_urge(name, system), _ref_soul_urge(name, system), name)
+                self.assertEqual(
+                    NE.personality_number(name, system), _ref_personality(name, system), name
+                )
+
+    def test_name_numbers_single_pass(self):
+        for name in self.corpus[:300]:
+            for system in ("pythagorean", "chaldean", "abjad"):
+                self.assertEqual(
+                    NE.name_numbers(name, system),
+                    {
+                        "expression": _ref_expression(name, system),
+                        "soul_urge": _ref_soul_urge(name, system),
+                        "personality": _ref_personality(name, system),
+                    },
+                )
+
+    def test_raw_sums(self):
+        sums = NE.name_sums("Ab")
+        self.assertEqual(sums["pythagorean"], {"expression": 3, "soul_urge": 1, "personality": 2})
+        self.assertEqual(sums["chaldean"], {"expression": 3, "soul_urge": 1, "personality": 2})
+        self.assertEqual(sums["abjad"], {"expression": 0, "soul_urge": 0, "personality": 0})
+        # ghain = 1000, alef = 1 (a long-vowel letter)
+        abjad = NE.name_sums("غا")["abjad"]
+        self.assertEqual(abjad, {"expression": 1001, "soul_urge": 1, "personality": 1000})
+
+    def test_expanding_uppercase(self):
+        """"ß".upper() is "SS", so it counts as two S's."""
+        self.assertEqual(NE.name_sums("ß")["pythagorean"]["expression"], 2)
+        self.assertEqual(NE.name_sums("ﬃ")["chaldean"]["personality"], 8 + 8 + 0)
+
+    def test_bulk_matches_single(self):
+        names = self.corpus[:200]
+        self.assertEqual(NE.name_sums_bulk(names), [NE.name_sums(n) for n in names])
+
+    def test_long_input_does_not_overflow(self):
+        """Fields never carry into each other, even past one packing chunk."""
+        name = "غ" * ((1 << 20) + 5)
+        sums = NE.name_sums(name)["abjad"]
+        self.assertEqual(sums["expression"], 1000 * len(name))
+        self.assertEqual(sums["soul_urge"], 0)
+        self.assertEqual(NE.name_sums(name)["pythagorean"]["expression"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 
-from synthesis.signal_combiner import SignalCombiner
+from synthesis.signal_combiner import Signal, SignalCombiner
 from synthesis.reading_engine import ReadingEngine
 
 PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
@@ -156,6 +156,31 @@ class TestSignalCombiner(unittest.TestCase):
     # Animal harmony: symmetry
     # ------------------------------------------------------------------
 
+    def test_dense_tables_match_lookups(self):
+        """Dense tables reproduce the dict lookups for every cell."""
+        self.assertEqual(SignalCombiner.verify_tables(), [])
+        self.assertEqual(len(SignalCombiner.PLANET_MOON_TABLE), 7)
+        self.assertEqual({len(row) for row in SignalCombiner.PLANET_MOON_TABLE}, {8})
+        self.assertEqual(len(SignalCombiner.LP_PY_TABLE), 34)
+        self.assertEqual(len(SignalCombiner.ANIMAL_HARMONY_CODES), 12)
+
+    def test_table_results_are_copies(self):
+        r = SignalCombiner.lifepath_meets_year(11, 5)
+        r["message"] = "changed"
+        self.assertNotEqual(SignalCombiner.lifepath_meets_year(11, 5)["message"], "changed")
+
+    def test_lookups_outside_tables(self):
+        """Inputs the tables do not cover use the dict lookups."""
+        r = SignalCombiner.lifepath_meets_year(44, 5)
+        self.assertEqual(r["theme"], "Unique Intersection")
+        self.assertIn("Life Path 44", r["message"])
+        self.assertEqual(
+            SignalCombiner.lifepath_meets_year(True, 1), SignalCombiner.LP_PY_COMBOS[(1, 1)]
+        )
+        self.assertEqual(SignalCombiner.planet_meets_moon("Pluto", "Full Moon")["theme"],
+                         "Uncharted Alignment")
+        self.assertEqual(SignalCombiner.animal_harmony("RA", "XX")["type"], "neutral")
+
     def test_animal_harmony_symmetry_harmony_pair(self):
         """animal_harmony(RA, OX) == animal_harmony(OX, RA)."""
         r1 = SignalCombiner.animal_harmony("RA", "OX")
@@ -405,6 +430,97 @@ class TestSignalCombiner(unittest.TestCase):
         self.assertEqual(len(combined["recommended_actions"]), 3)
 
 
+class TestSignal(unittest.TestCase):
+    """Tests for the integer-coded Signal records."""
+
+    TEMPLATE = "Signal {0} of {1} — Fire meets Water."
+
+    def _signals(self):
+        return [
+            Signal("hour_animal", "Low-Medium", "Horse energy"),
+            Signal("day_planet", "Medium", "Mercury day"),
+            Signal("moon_phase", "Medium", "Full moon"),
+            Signal("dom_animal_element", "Medium", "Ox Wood"),
+            Signal("animal_repetition", "Very High", "Triple Dragon"),
+            Signal("day_planet", "Medium", "Second Mercury"),
+        ]
+
+    def test_codes(self):
+        s = Signal("moon_phase", "High", "x")
+        self.assertEqual(SignalCombiner.SIGNAL_TYPES[s.code], "moon_phase")
+        self.assertEqual(s.rank, SignalCombiner.PRIORITY_RANK["High"])
+        unknown = Signal("other", "Unheard-of", "x")
+        self.assertEqual((unknown.code, unknown.rank), (-1, 0))
+
+    def test_records_match_dicts(self):
+        """combine_signals gives the same result for records and dicts."""
+        ganzhi = {
+            "year": {"branch_token": "RA"},
+            "day": {"branch_token": "HO"},
+            "hour": {"branch_token": "OX"},
+        }
+        moon = {"best_for": "release"}
+        records = self._signals()
+        dicts = [s.to_dict() for s in records]
+        self.assertEqual(
+            SignalCombiner.combine_signals(records, {}, moon, ganzhi),
+            SignalCombiner.combine_signals(dicts, {}, moon, ganzhi),
+        )
+
+    def test_top_signals_ties_keep_input_order(self):
+        signals = self._signals()
+        for k in (1, 2, 4):
+            top = SignalCombiner.top_signals(signals, k)
+            expected = sorted(signals, key=lambda s: -s.rank)[:k]
+            self.assertEqual(top, expected)
+        long = signals * 5
+        self.assertEqual(
+            SignalCombiner.top_signals(long, 4),
+            sorted(long, key=lambda s: -s.rank)[:4],
+        )
+
+    def test_only_shown_messages_rendered(self):
+        """Signals past the top TOP_SIGNALS are never formatted."""
+        signals = [
+            Signal.from_template("hour_animal", "Low-Medium", self.TEMPLATE, "low", i)
+            for i in range(3)
+        ] + [
+            Signal.from_template("day_planet", "High", self.TEMPLATE, "high", i)
+            for i in range(3)
+        ]
+        for s in signals:
+            s._message = None
+        combined = SignalCombiner.combine_signals(signals, {}, {}, {})
+        self.assertEqual(combined["primary_message"], self.TEMPLATE.format("high", 0))
+        rendered = [s._message is not None for s in signals]
+        self.assertEqual(rendered, [True, False, False, True, True, True])
+        self.assertIn(SignalCombiner.ELEMENT_CLASHES[frozenset({"Fire", "Water"})],
+                      combined["tensions"])
+
+    def test_elements_without_rendering(self):
+        fire = SignalCombiner.ELEMENT_WORDS.index("fire")
+        wood = SignalCombiner.ELEMENT_WORDS.index("wood")
+        s = Signal.from_template("day_planet", "Medium", "A {0} day of {1}.", "Wood", 3)
+        s._message = s._elements = None
+        self.assertEqual(s.elements, 1 << wood)
+        self.assertIsNone(s._message)
+        # A placeholder glued to letters is scanned after rendering
+        glued = Signal.from_template("day_planet", "Medium", "Wild{0}re.", "fi")
+        self.assertEqual(glued.elements, 1 << fire)
+
+    def test_template_signals_shared(self):
+        a = Signal.from_template("day_planet", "Medium", self.TEMPLATE, "a", 1)
+        self.assertIs(a, Signal.from_template("day_planet", "Medium", self.TEMPLATE, "a", 1))
+        self.assertIsNot(a, Signal.from_template("day_planet", "High", self.TEMPLATE, "a", 1))
+
+    def test_mapping_access(self):
+        s = Signal.from_template("day_planet", "Medium", self.TEMPLATE, "m", 2)
+        self.assertEqual(s["message"], self.TEMPLATE.format("m", 2))
+        self.assertEqual(s.get("priority"), "Medium")
+        self.assertIsNone(s.get("rank"))
+        self.assertEqual(list(s.to_dict()), ["type", "priority", "message"])
+
+
 class TestAnimalElementDescriptions(unittest.TestCase):
     """Tests for ReadingEngine.ANIMAL_ELEMENT_DESCRIPTIONS and _describe_animal_element."""
 
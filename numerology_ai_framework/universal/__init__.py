@@ -1,7 +1,33 @@
 """Universal tier modules for FC60 Numerology AI Framework."""
 
-from .moon_engine import MoonEngine
-from .ganzhi_engine import GanzhiEngine
-from .location_engine import LocationEngine
+import sys
+from importlib import import_module
 
-__all__ = ["MoonEngine", "GanzhiEngine", "LocationEngine"]
+# Exported name -> defining module. Submodules load on first attribute
+# access (PEP 562), so importing one engine does not import the others.
+_EXPORTS = {
+    "MoonEngine": ".moon_engine",
+    "GanzhiEngine": ".ganzhi_engine",
+    "LocationEngine": ".location_engine",
+    "CalendarAlmanac": ".almanac",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__: import eagerly
+    for _name in _EXPORTS:
+        __getattr__(_name)
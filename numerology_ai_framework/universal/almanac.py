@@ -0,0 +1,317 @@
+"""
+Calendar Almanac - Universal Tier Module 4
+==========================================
+Purpose: Precomputed per-day calendar facts in a compact binary table
+         (JDN, weekday, moon age/phase/illumination, day + year Gānzhī)
+
+The table is written once by a build step and read through a read-only
+mmap, so every worker process (gunicorn, gRPC, bot) shares a single
+page-cached copy and a date lookup is one struct.unpack_from() at a fixed
+offset. Dates outside the table — or a missing file — fall back to the
+engine function for the requested field only, and both paths return
+identical values.
+
+Weekday and day Gānzhī are single modulo operations, cheaper than a record
+unpack, so MasterOrchestrator reads only moon data through the almanac.
+
+The oracle-service image builds the table. Loading and unloading are
+thread-safe.
+
+Build:
+    python3 -m universal.almanac build                # 1900-2200, default path
+    python3 -m universal.almanac build --start 1950 --end 2100 --out /tmp/a.bin
+
+File location: $FC60_ALMANAC_PATH, else universal/data/almanac.bin
+
+Dependencies: JulianDateEngine, WeekdayCalculator, MoonEngine, GanzhiEngine
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from typing import Dict, Optional, Tuple
+
+try:
+    from ..core.julian_date_engine import JulianDateEngine
+    from ..core.weekday_calculator import WeekdayCalculator
+    from .moon_engine import MoonEngine
+    from .ganzhi_engine import GanzhiEngine
+except ImportError:
+    from core.julian_date_engine import JulianDateEngine
+    from core.weekday_calculator import WeekdayCalculator
+    from universal.moon_engine import MoonEngine
+    from universal.ganzhi_engine import GanzhiEngine
+
+
+# File header: magic, format version, first JDN, record count
+_HEADER = struct.Struct("<8sHii")
+_MAGIC = b"FC60ALMA"
+_VERSION = 1
+
+# Record: jdn, weekday, phase, day stem, day branch, year stem, year branch,
+#         moon age (days), illumination (%) — both stored unrounded
+_RECORD = struct.Struct("<iBBBBBBdd")
+
+DEFAULT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "almanac.bin"
+)
+
+# Loaded table state (module-level so the mapping is shared by all callers).
+# "table" is (mm, file, start_jdn, count) or None, swapped as one object so
+# lookups read it without the lock; _lock serializes load/unload.
+_state = {
+    "attempted": False,
+    "table": None,
+}
+_lock = threading.Lock()
+
+
+class CalendarAlmanac:
+    """Memory-mapped per-day calendar table with arithmetic fallback."""
+
+    DEFAULT_START_YEAR = 1900
+    DEFAULT_END_YEAR = 2200
+
+    @staticmethod
+    def compute_record(jdn: int) -> Tuple:
+        """Compute one record arithmetically (used by build and fallback)."""
+        year = JulianDateEngine.jdn_to_gregorian(jdn)[0]
+        age = MoonEngine.moon_age(jdn)
+        day_stem, day_branch = GanzhiEngine.day_ganzhi(jdn)
+        year_stem, year_branch = GanzhiEngine.year_ganzhi(year)
+        return (
+            jdn,
+            WeekdayCalculator.weekday_from_jdn(jdn),
+            MoonEngine.phase_index(age),
+            day_stem,
+            day_branch,
+            year_stem,
+            year_branch,
+            age,
+            MoonEngine.moon_illumination(age),
+        )
+
+    @staticmethod
+    def build(
+        path: Optional[str] = None,
+        start_year: int = DEFAULT_START_YEAR,
+        end_year: int = DEFAULT_END_YEAR,
+    ) -> str:
+        """
+        Write the almanac for Jan 1 start_year .. Dec 31 end_year.
+
+        The file is written to a temp name and renamed into place, so
+        processes that already mapped the old table keep a valid view.
+
+        Returns:
+            Path of the written file
+        """
+        path = path or os.environ.get("FC60_ALMANAC_PATH") or DEFAULT_PATH
+        start_jdn = JulianDateEngine.gregorian_to_jdn(start_year, 1, 1)
+        end_jdn = JulianDateEngine.gregorian_to_jdn(end_year, 12, 31)
+        count = end_jdn - start_jdn + 1
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, start_jdn, count))
+            buf = bytearray(_RECORD.size * count)
+            for i in range(count):
+                _RECORD.pack_into(
+                    buf, i * _RECORD.size, *CalendarAlmanac.compute_record(start_jdn + i)
+                )
+            f.write(buf)
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def load(path: Optional[str] = None) -> bool:
+        """
+        Map the almanac file (replacing any previously loaded table).
+
+        Returns:
+            True if a valid table is now loaded, False otherwise
+        """
+        with _lock:
+            return CalendarAlmanac._load_locked(path)
+
+    @staticmethod
+    def _load_locked(path: Optional[str]) -> bool:
+        CalendarAlmanac._unload_locked()
+        _state["attempted"] = True
+        path = path or os.environ.get("FC60_ALMANAC_PATH") or DEFAULT_PATH
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return False
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            f.close()
+            return False
+
+        if len(mm) < _HEADER.size:
+            mm.close()
+            f.close()
+            return False
+        magic, version, start_jdn, count = _HEADER.unpack_from(mm, 0)
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or len(mm) != _HEADER.size + count * _RECORD.size
+        ):
+            mm.close()
+            f.close()
+            return False
+
+        _state["table"] = (mm, f, start_jdn, count)
+        return True
+
+    @staticmethod
+    def unload() -> None:
+        """Release the mapping; the next lookup will try to load again."""
+        with _lock:
+            CalendarAlmanac._unload_locked()
+
+    @staticmethod
+    def _unload_locked() -> None:
+        table = _state["table"]
+        _state.update(attempted=False, table=None)
+        if table is not None:
+            table[0].close()
+            table[1].close()
+
+    @staticmethod
+    def _table() -> Optional[Tuple]:
+        """The loaded table, mapping it on first use."""
+        if not _state["attempted"]:
+            with _lock:
+                if not _state["attempted"]:
+                    CalendarAlmanac._load_locked(None)
+        return _state["table"]
+
+    @staticmethod
+    def is_loaded() -> bool:
+        """True if lookups are currently served from the mapped table."""
+        return CalendarAlmanac._table() is not None
+
+    @staticmethod
+    def coverage() -> Optional[Tuple[int, int]]:
+        """(first_jdn, last_jdn) of the loaded table, or None."""
+        table = CalendarAlmanac._table()
+        if table is None:
+            return None
+        return table[2], table[2] + table[3] - 1
+
+    @staticmethod
+    def table_record(jdn: int) -> Optional[Tuple]:
+        """The stored record for a JDN, or None if the table does not cover it."""
+        table = CalendarAlmanac._table()
+        if table is not None:
+            mm, _, start_jdn, count = table
+            i = jdn - start_jdn
+            if 0 <= i < count:
+                try:
+                    return _RECORD.unpack_from(mm, _HEADER.size + i * _RECORD.size)
+                except ValueError:
+                    pass  # unmapped by a concurrent unload()
+        return None
+
+    @staticmethod
+    def day_record(jdn: int) -> Tuple:
+        """
+        Get the raw record for a JDN.
+
+        Returns:
+            (jdn, weekday_idx, phase_idx, day_stem, day_branch,
+             year_stem, year_branch, moon_age, illumination)
+        """
+        return CalendarAlmanac.table_record(jdn) or CalendarAlmanac.compute_record(jdn)
+
+    @staticmethod
+    def full_moon_info(jdn: int) -> Dict:
+        """Same result as MoonEngine.full_moon_info(jdn)."""
+        record = CalendarAlmanac.table_record(jdn)
+        if record is None:
+            return MoonEngine.full_moon_info(jdn)
+        return MoonEngine.info_from_phase(record[2], record[7], record[8])
+
+    @staticmethod
+    def full_day_info(jdn: int) -> Dict:
+        """Same result as GanzhiEngine.full_day_info(jdn)."""
+        record = CalendarAlmanac.table_record(jdn)
+        if record is None:
+            return GanzhiEngine.full_day_info(jdn)
+        return GanzhiEngine.day_info_from_indices(jdn, record[3], record[4])
+
+    @staticmethod
+    def weekday_info(jdn: int) -> Dict:
+        """Same result as WeekdayCalculator.full_info(jdn)."""
+        record = CalendarAlmanac.table_record(jdn)
+        if record is None:
+            return WeekdayCalculator.full_info(jdn)
+        idx = record[1]
+        return {
+            "index": idx,
+            "token": WeekdayCalculator.WEEKDAY_TOKENS[idx],
+            "name": WeekdayCalculator.WEEKDAY_NAMES[idx],
+            "planet": WeekdayCalculator.PLANETS[idx],
+            "domain": WeekdayCalculator.DOMAINS[idx],
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="FC60 calendar almanac")
+    sub = parser.add_subparsers(dest="command")
+    build_cmd = sub.add_parser("build", help="Write the binary almanac")
+    build_cmd.add_argument("--start", type=int, default=CalendarAlmanac.DEFAULT_START_YEAR)
+    build_cmd.add_argument("--end", type=int, default=CalendarAlmanac.DEFAULT_END_YEAR)
+    build_cmd.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        out = CalendarAlmanac.build(args.out, args.start, args.end)
+        print(f"Wrote {out} ({os.path.getsize(out):,} bytes)")
+        sys.exit(0)
+
+    print("=" * 60)
+    print("CALENDAR ALMANAC - SELF TEST")
+    print("=" * 60)
+
+    import tempfile
+
+    passed = 0
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = CalendarAlmanac.build(os.path.join(tmp, "almanac.bin"), 2025, 2027)
+        if CalendarAlmanac.load(path):
+            print(f"✓ Loaded table covering JDN {CalendarAlmanac.coverage()}")
+            passed += 1
+        else:
+            print("✗ Could not load freshly built table")
+            failed += 1
+
+        first, last = CalendarAlmanac.coverage() or (0, -1)
+        mismatches = 0
+        for jdn in range(first - 5, last + 6):
+            if (
+                CalendarAlmanac.full_moon_info(jdn) != MoonEngine.full_moon_info(jdn)
+                or CalendarAlmanac.full_day_info(jdn) != GanzhiEngine.full_day_info(jdn)
+                or CalendarAlmanac.weekday_info(jdn) != WeekdayCalculator.full_info(jdn)
+            ):
+                mismatches += 1
+        if mismatches == 0:
+            print("✓ Table and fallback match the arithmetic engines")
+            passed += 1
+        else:
+            print(f"✗ {mismatches} day(s) differ from the arithmetic engines")
+            failed += 1
+        CalendarAlmanac.unload()
+
+    print(f"\n{passed} passed, {failed} failed")
+    exit(0 if failed == 0 else 1)
@@ -8,11 +8,6 @@ Purpose: Calculate the Chinese Sexagenary Cycle (干支 Gānzhī)
 Dependencies: Base60Codec (for ANIMALS list)
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from typing import Dict, Tuple
 
 try:
@@ -155,6 +150,11 @@ class GanzhiEngine:
     def full_day_info(jdn: int) -> Dict:
         """Get complete day Gānzhī information."""
         stem_idx, branch_idx = GanzhiEngine.day_ganzhi(jdn)
+        return GanzhiEngine.day_info_from_indices(jdn, stem_idx, branch_idx)
+
+    @staticmethod
+    def day_info_from_indices(jdn: int, stem_idx: int, branch_idx: int) -> Dict:
+        """Build the full_day_info() dict from precomputed stem/branch indices."""
         return {
             "jdn": jdn,
             "stem_index": stem_idx,
@@ -71,6 +71,14 @@ class MoonEngine:
         """Calculate moon age in days since last new moon."""
         return (jdn - MoonEngine.REFERENCE_JDN) % MoonEngine.SYNODIC_MONTH
 
+    @staticmethod
+    def phase_index(age: float) -> int:
+        """Map moon age (days) to an index into PHASE_NAMES (0-7)."""
+        for i, boundary in enumerate(MoonEngine.PHASE_BOUNDARIES):
+            if age < boundary:
+                return i
+        return 7
+
     @staticmethod
     def moon_phase(jdn: int) -> Tuple[str, str, float]:
         """
@@ -80,12 +88,8 @@ class MoonEngine:
             Tuple of (phase_name, emoji, age_in_days)
         """
         age = MoonEngine.moon_age(jdn)
-
-        for i, boundary in enumerate(MoonEngine.PHASE_BOUNDARIES):
-            if age < boundary:
-                return MoonEngine.PHASE_NAMES[i], MoonEngine.PHASE_EMOJIS[i], age
-
-        return MoonEngine.PHASE_NAMES[7], MoonEngine.PHASE_EMOJIS[7], age
+        i = MoonEngine.phase_index(age)
+        return MoonEngine.PHASE_NAMES[i], MoonEngine.PHASE_EMOJIS[i], age
 
     @staticmethod
     def moon_illumination(age: float) -> float:
@@ -104,12 +108,19 @@ class MoonEngine:
     @staticmethod
     def full_moon_info(jdn: int) -> Dict:
         """Get complete moon information for a given JDN."""
-        phase_name, emoji, age = MoonEngine.moon_phase(jdn)
-        illumination = MoonEngine.moon_illumination(age)
+        age = MoonEngine.moon_age(jdn)
+        return MoonEngine.info_from_phase(
+            MoonEngine.phase_index(age), age, MoonEngine.moon_illumination(age)
+        )
+
+    @staticmethod
+    def info_from_phase(phase_idx: int, age: float, illumination: float) -> Dict:
+        """Build the full_moon_info() dict from precomputed phase values."""
+        phase_name = MoonEngine.PHASE_NAMES[phase_idx]
 
         return {
             "phase_name": phase_name,
-            "emoji": emoji,
+            "emoji": MoonEngine.PHASE_EMOJIS[phase_idx],
             "age": round(age, 2),
             "illumination": round(illumination, 1),
             "energy": MoonEngine.moon_energy(phase_name),
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Backfill the reading pattern index (oracle_reading_patterns).
+
+Indexes the patterns of every stored oracle reading, in id order, one
+committed batch at a time. Safe to re-run; use --after-id to resume from
+the last id printed. Run after applying database migration 024.
+
+Usage:
+    python3 scripts/backfill_reading_patterns.py
+    python3 scripts/backfill_reading_patterns.py --batch-size 1000 --after-id 52000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "api"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill oracle_reading_patterns")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--after-id", type=int, default=0, help="Resume after this reading id")
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from app.database import SessionLocal
+    from app.services.reading_patterns import ReadingPatternService
+
+    db = SessionLocal()
+    try:
+        result = ReadingPatternService(db).backfill(
+            batch_size=args.batch_size,
+            after_id=args.after_id,
+            max_batches=args.max_batches,
+        )
+    finally:
+        db.close()
+
+    print(
+        f"Indexed {result['readings']} readings, {result['patterns']} patterns "
+        f"in {result['batches']} batches (last id {result['last_id']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
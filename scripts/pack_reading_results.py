@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Convert stored oracle reading results between JSON and the packed codec.
+
+Moves reading_result (JSON) into reading_result_packed in id-ordered,
+committed batches, or back again with --unpack (required before rolling
+back migration 025). Safe to re-run; use --after-id to resume from the
+last id printed.
+
+Usage:
+    python3 scripts/pack_reading_results.py
+    python3 scripts/pack_reading_results.py --unpack
+    python3 scripts/pack_reading_results.py --batch-size 1000 --after-id 52000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "api"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pack or unpack stored reading results")
+    parser.add_argument("--unpack", action="store_true", help="Convert back to JSON")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--after-id", type=int, default=0, help="Resume after this reading id")
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from app.database import SessionLocal
+    from app.services.oracle_reading import OracleReadingService
+
+    db = SessionLocal()
+    try:
+        result = OracleReadingService(db).convert_stored_results(
+            to_format="json" if args.unpack else "packed",
+            batch_size=args.batch_size,
+            after_id=args.after_id,
+            max_batches=args.max_batches,
+        )
+    finally:
+        db.close()
+
+    ratio = result["bytes_after"] / result["bytes_before"] if result["bytes_before"] else 0.0
+    print(
+        f"Converted {result['converted']} readings in {result['batches']} batches "
+        f"(last id {result['last_id']}, {result['skipped']} unreadable skipped); "
+        f"{result['bytes_before']} -> {result['bytes_after']} bytes ({ratio:.0%})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ that the AI can parse and interpret.
 Public API:
   - build_reading_prompt(reading, reading_type, question, locale) -> str
   - build_multi_user_prompt(readings, names, locale) -> str
+  - reading_features(reading, reading_type, question_number, locale, question) -> tuple
+  - build_body_prompt(reading, reading_type, question_number, locale, question) -> str
 """
 
 from __future__ import annotations
@@ -330,3 +332,204 @@ def build_multi_user_prompt(
     )
 
     return "\n".join(parts)
+
+
+# ════════════════════════════════════════════════════════════
+# Person-independent body prompt (cacheable by features)
+# ════════════════════════════════════════════════════════════
+
+# Section headings the body prompt asks for, per locale (see the
+# ai_interpreter section markers)
+_BODY_SECTIONS = {
+    "en": [
+        "CORE IDENTITY",
+        "RIGHT NOW",
+        "PATTERNS DETECTED",
+        "THE MESSAGE",
+        "TODAY'S ADVICE",
+        "CAUTION",
+    ],
+    "fa": ["هویت اصلی", "اکنون", "الگوها", "پیام", "توصیه", "هشدار"],
+}
+
+# Name-derived numbers that shape a name reading's body
+_NAME_NUMBERS = ("expression", "soul_urge", "personality")
+
+_STRENGTH_ORDER = {"very_high": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def _pattern_set(patterns: dict | None) -> tuple:
+    """Detected patterns as a sorted tuple of their scalar fields (no message)."""
+    detected = (patterns or {}).get("detected", [])
+    items = [
+        tuple(
+            sorted(
+                (k, v)
+                for k, v in p.items()
+                if k != "message" and isinstance(v, (str, int, float, bool))
+            )
+        )
+        for p in detected
+        if isinstance(p, dict)
+    ]
+    return tuple(sorted(items, key=repr))
+
+
+def reading_features(
+    reading: dict,
+    reading_type: str = "daily",
+    question_number: int | None = None,
+    locale: str = "en",
+    question: str = "",
+) -> tuple:
+    """Canonical feature tuple of a reading — everything build_body_prompt() uses.
+
+    Readings for different people, dates or ages that share these features
+    get the same body prompt, so the tuple is a cache key for the AI body.
+    Name readings add the name numbers (expression, soul urge, personality)
+    and question readings add the question text.
+
+    Parameters
+    ----------
+    reading : dict
+        Output of MasterOrchestrator.generate_reading().
+    reading_type : str
+        One of: "daily", "time", "name", "question", "multi".
+    question_number : int or None
+        Numerological question number (question readings).
+    locale : str
+        "en" or "fa".
+    question : str
+        The user's question (only for reading_type="question").
+
+    Returns
+    -------
+    tuple
+        Hashable ``(name, value)`` pairs.
+    """
+    numerology = reading.get("numerology") or {}
+    life_path = numerology.get("life_path")
+    if isinstance(life_path, dict):
+        life_path = life_path.get("number")
+    ganzhi = reading.get("ganzhi") or {}
+    year = ganzhi.get("year") or {}
+    day = ganzhi.get("day") or {}
+    hour = ganzhi.get("hour") or {}
+    features = (
+        ("reading_type", reading_type),
+        ("locale", locale),
+        ("life_path", life_path),
+        ("personal_year", numerology.get("personal_year")),
+        ("personal_month", numerology.get("personal_month")),
+        ("personal_day", numerology.get("personal_day")),
+        ("moon_phase", (reading.get("moon") or {}).get("phase_name")),
+        (
+            "ganzhi",
+            (
+                year.get("gz_token") or year.get("traditional_name"),
+                day.get("gz_token"),
+                hour.get("animal_name"),
+            ),
+        ),
+        ("patterns", _pattern_set(reading.get("patterns"))),
+        ("planet", (reading.get("current") or {}).get("planet")),
+        ("question_number", question_number),
+    )
+    if reading_type == "name":
+        features += tuple((key, numerology.get(key)) for key in _NAME_NUMBERS)
+    elif reading_type == "question":
+        features += (("question", question),)
+    return features
+
+
+def build_body_prompt(
+    reading: dict,
+    reading_type: str = "daily",
+    question_number: int | None = None,
+    locale: str = "en",
+    question: str = "",
+) -> str:
+    """Build the user prompt for the person-independent body of a reading.
+
+    Only fields determined by reading_features() are included (no name,
+    dates, ages, FC60 stamp or confidence), and the AI is asked for the
+    core identity through caution sections only. ai_interpreter fills in
+    the header, universal address and footer per person.
+
+    Parameters are the same as reading_features().
+
+    Returns
+    -------
+    str
+        Formatted user prompt ready to send to the AI.
+    """
+    numerology = reading.get("numerology") or {}
+    moon = reading.get("moon") or {}
+    current = reading.get("current") or {}
+    ganzhi = reading.get("ganzhi") or {}
+
+    parts = [f"READING TYPE: {reading_type}"]
+    if reading_type == "question" and question:
+        parts.append(f"QUESTION: {question}")
+    if question_number is not None:
+        parts.append(f"QUESTION NUMBER: {question_number}")
+    parts.append(f"LOCALE: {locale}")
+    parts.append("")
+
+    parts.append("--- NUMEROLOGY ---")
+    lp = numerology.get("life_path", {})
+    if isinstance(lp, dict):
+        parts.append(f"Life Path: {lp.get('number', 'not provided')} ({lp.get('title', '')})")
+        if lp.get("message"):
+            parts.append(f"  Message: {lp['message']}")
+    else:
+        parts.append(f"Life Path: {lp if lp is not None else 'not provided'}")
+    if reading_type == "name":
+        parts.append(f"Expression: {numerology.get('expression', 'not provided')}")
+        parts.append(f"Soul Urge: {numerology.get('soul_urge', 'not provided')}")
+        parts.append(f"Personality: {numerology.get('personality', 'not provided')}")
+    parts.append(f"Personal Year: {numerology.get('personal_year', 'not provided')}")
+    parts.append(f"Personal Month: {numerology.get('personal_month', 'not provided')}")
+    parts.append(f"Personal Day: {numerology.get('personal_day', 'not provided')}")
+    parts.append("")
+
+    parts.append("--- CURRENT DAY ---")
+    parts.append(f"Planet: {current.get('planet', 'not provided')}")
+    parts.append(f"Domain: {current.get('domain', 'not provided')}")
+    parts.append("")
+
+    parts.append("--- MOON ---")
+    parts.append(f"Phase: {moon.get('phase_name', 'not provided')}")
+    parts.append(f"Energy: {moon.get('energy', 'not provided')}")
+    parts.append(f"Best For: {moon.get('best_for', 'not provided')}")
+    parts.append(f"Avoid: {moon.get('avoid', 'not provided')}")
+    parts.append("")
+
+    parts.append(_format_ganzhi(ganzhi))
+    parts.append("")
+
+    detected = (reading.get("patterns") or {}).get("detected", [])
+    parts.append("--- PATTERNS ---")
+    parts.append(f"Count: {len(detected)}")
+    for p in sorted(
+        detected,
+        key=lambda p: (_STRENGTH_ORDER.get(p.get("strength", "low"), 4), repr(sorted(p.items()))),
+    ):
+        parts.append(
+            f"  Type: {p.get('type', 'unknown')}, Strength: {p.get('strength', 'unknown')}, "
+            f"Message: {p.get('message', '')}"
+        )
+    parts.append("")
+
+    sections = _BODY_SECTIONS.get(locale, _BODY_SECTIONS["en"])
+    parts.append("--- INSTRUCTIONS ---")
+    parts.append(
+        "Write only these sections, each under its own heading: " + ", ".join(sections) + "."
+    )
+    parts.append(
+        "Do not write the header, universal address, confidence, data sources or "
+        "disclaimer, and do not mention the person's name, dates or age — those "
+        "parts are added separately."
+    )
+
+    return "\n".join(parts)
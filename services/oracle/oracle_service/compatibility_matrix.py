@@ -0,0 +1,269 @@
+"""Compatibility Matrix — every pairwise compatibility score of a large group.
+
+MultiUserAnalyzer.analyze_group() calls calculate_pairwise() once per pair,
+which is fine for a handful of users and far too slow for a group of 2,000
+(~2M pairs). CompatibilityMatrix produces the same numbers in bulk:
+
+- each user is reduced to CompatibilityFeatures, and identical feature
+  tuples ("profiles") are scored once;
+- every dimension is a lookup table over the distinct values seen, filled
+  by the scalar MultiUserAnalyzer.score_* methods, so table entries are the
+  scalar scores bit for bit;
+- pattern overlap is a shared-key count from a profile x pattern-key
+  indicator matrix product;
+- the weighted overall score is summed in calculate_pairwise()'s order and
+  rounded exactly like ``round(overall, 4)``.
+
+NumPy does the table gathers and the matrix product when it is installed;
+otherwise the same steps run in pure Python (correct, but seconds rather
+than milliseconds for thousands of users).
+
+Usage:
+    matrix = CompatibilityMatrix.from_readings(readings)
+    matrix.scores[i][j]        # == calculate_pairwise(r_i, r_j).overall_score
+    matrix.harmony()           # == analyze_group(readings).group_harmony_score
+    matrix.top_pairs(10)       # best pairs as CompatibilityResult
+"""
+
+import heapq
+import logging
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+from oracle_service.models.reading_types import (
+    CompatibilityFeatures,
+    CompatibilityResult,
+    ReadingResult,
+)
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Scaled values this close to x.5 are re-rounded with round() (see _round4)
+_TIE_MARGIN = 1e-6
+
+
+def _intern(values: Sequence[Hashable]) -> Tuple[List[int], List[Hashable]]:
+    """Integer code per value plus the distinct values in first-seen order."""
+    index: Dict[Hashable, int] = {}
+    codes = [index.setdefault(v, len(index)) for v in values]
+    return codes, list(index)
+
+
+def _round4(values: "np.ndarray") -> "np.ndarray":
+    """Elementwise ``round(v, 4)`` with Python's exact semantics.
+
+    rint(v * 1e4) / 1e4 is the correctly rounded result unless v * 1e4 sits
+    within float error of a .5 tie; those few values go through round().
+    """
+    scaled = values * 1e4
+    rounded = np.rint(scaled) / 1e4
+    near_tie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_MARGIN)
+    if near_tie.size:
+        rounded.flat[near_tie] = [round(v, 4) for v in values.flat[near_tie].tolist()]
+    return rounded
+
+
+class CompatibilityMatrix:
+    """Overall compatibility score of every pair in a group.
+
+    ``scores`` is an n x n matrix (NumPy array, or list of lists without
+    NumPy) of rounded overall scores in input order. It is symmetric; the
+    diagonal holds each user's score against an identical profile.
+    """
+
+    def __init__(self, features: Sequence[CompatibilityFeatures]):
+        self.features = list(features)
+        self.size = len(self.features)
+        self.user_ids = [f.user_id for f in self.features]
+        self.vectorized = np is not None
+
+        self._profile_of, profiles = _intern(
+            [(f.life_path, f.element, f.animal, f.moon_phase, f.patterns) for f in self.features]
+        )
+        lp_codes, lp_values = _intern([p[0] for p in profiles])
+        elem_codes, elem_values = _intern([p[1] for p in profiles])
+        animal_codes, animal_values = _intern([p[2] for p in profiles])
+        moon_codes, moon_values = _intern([p[3] for p in profiles])
+        self._codes = list(zip(lp_codes, elem_codes, animal_codes, moon_codes))
+
+        analyzer = MultiUserAnalyzer
+        self._tables = [
+            [[analyzer.score_life_path_compatibility(a, b) for b in lp_values] for a in lp_values],
+            [
+                [analyzer.score_element_compatibility(a, b) for b in elem_values]
+                for a in elem_values
+            ],
+            [
+                [analyzer.score_animal_compatibility(a, b) for b in animal_values]
+                for a in animal_values
+            ],
+            [
+                [
+                    analyzer.score_moon_alignment({"phase_name": a}, {"phase_name": b})
+                    for b in moon_values
+                ]
+                for a in moon_values
+            ],
+        ]
+
+        key_index: Dict[Any, int] = {}
+        for p in profiles:
+            for key in p[4]:
+                key_index.setdefault(key, len(key_index))
+        self._pattern_masks = [sum(1 << key_index[key] for key in p[4]) for p in profiles]
+
+        if self.vectorized:
+            self.scores = self._build_numpy(profiles, key_index)
+        else:
+            self.scores = self._build_python(profiles)
+
+    @classmethod
+    def from_readings(cls, readings: Sequence[ReadingResult]) -> "CompatibilityMatrix":
+        """Matrix over the comparison data of framework readings."""
+        return cls([MultiUserAnalyzer.extract_features(r) for r in readings])
+
+    # ── Construction ──
+
+    def _dimension_weights(self) -> List[float]:
+        a = MultiUserAnalyzer
+        return [a.WEIGHT_LIFE_PATH, a.WEIGHT_ELEMENT, a.WEIGHT_ANIMAL, a.WEIGHT_MOON]
+
+    @staticmethod
+    def _pattern_score(mask_a: int, mask_b: int) -> float:
+        # Mirrors MultiUserAnalyzer.score_pattern_overlap() on key sets
+        if not mask_a or not mask_b:
+            return 0.5
+        shared = (mask_a & mask_b).bit_count()
+        if shared >= 2:
+            return 0.9
+        if shared == 1:
+            return 0.7
+        return 0.4
+
+    def _build_numpy(self, profiles: List[tuple], key_index: Dict[Any, int]) -> "np.ndarray":
+        if not profiles:
+            return np.zeros((0, 0))
+        codes = np.array(self._codes, dtype=np.intp).reshape(len(profiles), 4)
+        overall = None
+        for dim, weight in enumerate(self._dimension_weights()):
+            table = np.array(self._tables[dim], dtype=np.float64)
+            c = codes[:, dim]
+            term = table.take(c, axis=0).take(c, axis=1) * weight
+            overall = term if overall is None else np.add(overall, term, out=overall)
+
+        indicator = np.zeros((len(profiles), len(key_index)), dtype=np.float32)
+        for row, p in enumerate(profiles):
+            indicator[row, [key_index[key] for key in p[4]]] = 1.0
+        shared = indicator @ indicator.T
+        has = indicator.any(axis=1)
+        pattern = np.select([shared >= 2, shared == 1], [0.9, 0.7], 0.4)
+        pattern[~(has[:, None] & has[None, :])] = 0.5
+        overall += pattern * MultiUserAnalyzer.WEIGHT_PATTERN
+
+        profile_scores = _round4(overall)
+        profile_of = np.array(self._profile_of, dtype=np.intp)
+        return profile_scores.take(profile_of, axis=0).take(profile_of, axis=1)
+
+    def _build_python(self, profiles: List[tuple]) -> List[List[float]]:
+        weights = self._dimension_weights()
+        pattern_weight = MultiUserAnalyzer.WEIGHT_PATTERN
+        profile_scores = []
+        for codes_a, mask_a in zip(self._codes, self._pattern_masks):
+            rows = [self._tables[dim][codes_a[dim]] for dim in range(4)]
+            profile_scores.append(
+                [
+                    round(
+                        rows[0][codes_b[0]] * weights[0]
+                        + rows[1][codes_b[1]] * weights[1]
+                        + rows[2][codes_b[2]] * weights[2]
+                        + rows[3][codes_b[3]] * weights[3]
+                        + self._pattern_score(mask_a, mask_b) * pattern_weight,
+                        4,
+                    )
+                    for codes_b, mask_b in zip(self._codes, self._pattern_masks)
+                ]
+            )
+        profile_of = self._profile_of
+        scores = []
+        for p in profile_of:
+            row = profile_scores[p]
+            scores.append([row[q] for q in profile_of])
+        return scores
+
+    # ── Queries ──
+
+    def _pair_values(self) -> List[float]:
+        """Score of every pair i < j, in combinations() order."""
+        if self.vectorized:
+            return self._upper_triangle().tolist()
+        return [v for i, row in enumerate(self.scores) for v in row[i + 1 :]]
+
+    def _upper_triangle(self) -> "np.ndarray":
+        """Scores of pairs i < j, row by row (combinations() order)."""
+        if self.size < 2:
+            return np.zeros(0)
+        return np.concatenate([self.scores[i, i + 1 :] for i in range(self.size - 1)])
+
+    def mean_overall(self) -> float:
+        """Unrounded mean overall score over all pairs (0.0 below two users)."""
+        values = self._pair_values()
+        if not values:
+            return 0.0
+        # sum() over the same sequence as analyze_group() -> identical float
+        return sum(values) / len(values)
+
+    def harmony(self) -> float:
+        """Group harmony, equal to analyze_group()'s group_harmony_score."""
+        return round(self.mean_overall(), 4)
+
+    def top_pairs(self, k: int = 10) -> List[CompatibilityResult]:
+        """The ``k`` highest-scoring pairs, ties in combinations() order."""
+        if k <= 0 or self.size < 2:
+            return []
+        if self.vectorized:
+            values = self._upper_triangle()
+            if k < values.size:
+                threshold = np.partition(values, values.size - k)[values.size - k]
+                candidates = np.flatnonzero(values >= threshold)
+            else:
+                candidates = np.arange(values.size)
+            order = candidates[np.argsort(-values[candidates], kind="stable")][:k]
+            # Flat index -> (i, j): row i starts at sum(n - 1 - r for r < i)
+            lengths = np.arange(self.size - 1, 0, -1)
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            rows = np.searchsorted(starts, order, side="right") - 1
+            cols = rows + 1 + (order - starts[rows])
+            pairs = zip(rows.tolist(), cols.tolist())
+        else:
+            best = heapq.nsmallest(
+                k,
+                (
+                    (-v, i, j)
+                    for i, row in enumerate(self.scores)
+                    for j, v in enumerate(row[i + 1 :], start=i + 1)
+                ),
+            )
+            pairs = [(i, j) for _, i, j in best]
+        return [self.pair(i, j) for i, j in pairs]
+
+    def pair(self, i: int, j: int) -> CompatibilityResult:
+        """Full result for users ``i`` and ``j``, as calculate_pairwise() builds it."""
+        pi, pj = self._profile_of[i], self._profile_of[j]
+        codes_a, codes_b = self._codes[pi], self._codes[pj]
+        lp, elem, animal, moon = (self._tables[dim][codes_a[dim]][codes_b[dim]] for dim in range(4))
+        pattern = self._pattern_score(self._pattern_masks[pi], self._pattern_masks[pj])
+        return MultiUserAnalyzer._build_result(
+            self.user_ids[i], self.user_ids[j], lp, elem, animal, moon, pattern
+        )
+
+    def element_balance(self) -> Dict[str, int]:
+        """User count per element, in first-seen order."""
+        balance: Dict[str, int] = {}
+        for f in self.features:
+            balance[f.element] = balance.get(f.element, 0) + 1
+        return balance
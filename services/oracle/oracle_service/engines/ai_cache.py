@@ -0,0 +1,384 @@
+"""
+AI Cache — Two-Tier Response Cache
+====================================
+Cache for AI responses, keyed by ai_client._cache_key():
+
+  1. Local tier: in-process LRU (OrderedDict) with per-entry TTL, capped
+     by entry count and total bytes. Lookups, writes and evictions are O(1).
+  2. Shared tier: Redis when configured, otherwise a SQLite file. Shared by
+     every process on the host (SQLite) or deployment (Redis), so responses
+     survive restarts and are reused across the API workers, the gRPC
+     server and the bot.
+
+The shared tier is best-effort: any backend error is logged, counted and
+treated as a miss. Shared-tier calls block on I/O, so ai_client makes them
+from a worker thread.
+
+Configuration (env vars):
+  NPS_AI_CACHE_BACKEND           auto | redis | sqlite | memory (default auto:
+                                 Redis if REDIS_URL / REDIS_HOST is set and
+                                 reachable, otherwise SQLite)
+  NPS_AI_CACHE_PATH              SQLite file (default oracle_service/data/ai_cache.sqlite3)
+  NPS_AI_CACHE_MAX_ENTRIES       local tier entry limit (default 200)
+  NPS_AI_CACHE_MAX_BYTES         local tier size limit (default 8 MB)
+  NPS_AI_CACHE_SHARED_MAX_BYTES  SQLite size limit (default 64 MB; Redis
+                                 relies on its own maxmemory policy)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_SQLITE_PATH = DATA_DIR / "ai_cache.sqlite3"
+
+_DEFAULT_MAX_ENTRIES = 200
+_DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+_DEFAULT_SHARED_MAX_BYTES = 64 * 1024 * 1024
+
+_REDIS_PREFIX = "nps:ai:"
+_SQLITE_PRUNE_EVERY = 64  # writes between SQLite expiry/size sweeps
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (ValueError, TypeError):
+        return default
+
+
+# ════════════════════════════════════════════════════════════
+# Local tier
+# ════════════════════════════════════════════════════════════
+
+
+class LRUCache:
+    """Thread-safe in-process LRU with per-entry expiry.
+
+    Holds at most ``max_entries`` values totalling at most ``max_bytes``
+    (UTF-8 size of the values). A hit moves the entry to the most recently
+    used end; eviction pops from the least recently used end.
+    """
+
+    def __init__(
+        self, max_entries: int = _DEFAULT_MAX_ENTRIES, max_bytes: int = _DEFAULT_MAX_BYTES
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """(value, expires_at) for a live entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], entry[1]
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Drop ``key``. Must hold _lock."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+# ════════════════════════════════════════════════════════════
+# Shared tier backends
+# ════════════════════════════════════════════════════════════
+
+
+class RedisTier:
+    """Shared tier on Redis; entries expire via Redis TTLs."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis
+
+        self._redis = redis.Redis.from_url(url, decode_responses=True, socket_timeout=1)
+        self._redis.ping()
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        pipe = self._redis.pipeline()
+        pipe.get(_REDIS_PREFIX + key)
+        pipe.pttl(_REDIS_PREFIX + key)
+        value, ttl_ms = pipe.execute()
+        if value is None or ttl_ms is None or ttl_ms <= 0:
+            return None
+        return value, time.time() + ttl_ms / 1000
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms > 0:
+            self._redis.set(_REDIS_PREFIX + key, value, px=ttl_ms)
+
+    def clear(self) -> None:
+        keys = list(self._redis.scan_iter(match=_REDIS_PREFIX + "*", count=500))
+        for start in range(0, len(keys), 500):
+            self._redis.delete(*keys[start : start + 500])
+
+    def close(self) -> None:
+        self._redis.close()
+
+
+class SQLiteTier:
+    """Shared tier in a local SQLite file (WAL mode, safe across processes).
+
+    Expired entries are dropped on read and in periodic sweeps, which also
+    evict the oldest entries once the file holds more than ``max_bytes``
+    of values.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path | str, max_bytes: int = _DEFAULT_SHARED_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ai_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ai_cache_stored_at ON ai_cache (stored_at)"
+            )
+        self.prune()
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                with self._db:
+                    self._db.execute("DELETE FROM ai_cache WHERE key = ?", (key,))
+                return None
+            return row[0], row[1]
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, value, size, stored_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, time.time(), expires_at),
+            )
+            self._writes += 1
+        if self._writes % _SQLITE_PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """Drop expired entries, then the oldest ones beyond ``max_bytes``."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM ai_cache WHERE expires_at <= ?", (time.time(),))
+            self._db.execute(
+                "DELETE FROM ai_cache WHERE key IN ("
+                " SELECT key FROM ("
+                "  SELECT key, SUM(size) OVER (ORDER BY stored_at DESC, key) AS running"
+                "  FROM ai_cache)"
+                " WHERE running > ?)",
+                (self.max_bytes,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM ai_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# ════════════════════════════════════════════════════════════
+# Two-tier cache
+# ════════════════════════════════════════════════════════════
+
+
+class ResponseCache:
+    """Local LRU in front of an optional shared tier, with hit statistics.
+
+    get_local() never blocks on I/O; get_shared() and set_shared() do, so
+    async callers should run them in a thread.
+    """
+
+    def __init__(self, local: LRUCache, shared=None):
+        self.local = local
+        self.shared = shared
+        self._stats_lock = threading.Lock()
+        self._counts = {"local_hits": 0, "shared_hits": 0, "misses": 0, "shared_errors": 0}
+
+    def get_local(self, key: str) -> str | None:
+        """Local-tier value; counts a hit only (a miss continues to get_shared())."""
+        entry = self.local.get(key)
+        if entry is None:
+            return None
+        self._count("local_hits")
+        return entry[0]
+
+    def get_shared(self, key: str) -> str | None:
+        """Shared-tier value, copied into the local tier; counts a hit or a miss."""
+        entry = None
+        if self.shared is not None:
+            try:
+                entry = self.shared.get(key)
+            except Exception as exc:
+                self._shared_error("read", exc)
+        if entry is None:
+            self._count("misses")
+            return None
+        self.local.set(key, *entry)
+        self._count("shared_hits")
+        return entry[0]
+
+    def set_local(self, key: str, value: str, ttl: float) -> float:
+        """Store in the local tier; returns the expiry time for set_shared()."""
+        expires_at = time.time() + ttl
+        self.local.set(key, value, expires_at)
+        return expires_at
+
+    def set_shared(self, key: str, value: str, expires_at: float) -> None:
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(key, value, expires_at)
+        except Exception as exc:
+            self._shared_error("write", exc)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            try:
+                self.shared.clear()
+            except Exception as exc:
+                self._shared_error("clear", exc)
+
+    def close(self) -> None:
+        if self.shared is not None:
+            try:
+                self.shared.close()
+            except Exception as exc:
+                self._shared_error("close", exc)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            counts = dict(self._counts)
+        hits = counts["local_hits"] + counts["shared_hits"]
+        lookups = hits + counts["misses"]
+        return {
+            "backend": self.shared.name if self.shared is not None else "memory",
+            **counts,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self.local),
+            "bytes": self.local.size_bytes,
+            "max_entries": self.local.max_entries,
+            "max_bytes": self.local.max_bytes,
+            "evictions": self.local.evictions,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._counts[name] += 1
+
+    def _shared_error(self, action: str, exc: Exception) -> None:
+        self._count("shared_errors")
+        logger.warning("AI cache: shared %s failed (%s): %s", action, self.shared.name, exc)
+
+
+def _redis_url() -> str | None:
+    url = os.environ.get("REDIS_URL")
+    if url:
+        return url
+    host = os.environ.get("REDIS_HOST")
+    if host:
+        return f"redis://{host}:{os.environ.get('REDIS_PORT', '6379')}"
+    return None
+
+
+def _shared_tier_from_env():
+    backend = os.environ.get("NPS_AI_CACHE_BACKEND", "auto").lower()
+    if backend == "memory":
+        return None
+
+    if backend in ("auto", "redis"):
+        url = _redis_url()
+        if url:
+            try:
+                return RedisTier(url)
+            except Exception as exc:
+                logger.warning("AI cache: Redis unavailable (%s), using SQLite", exc)
+        elif backend == "redis":
+            logger.warning("AI cache: NPS_AI_CACHE_BACKEND=redis but no REDIS_URL/REDIS_HOST")
+
+    path = os.environ.get("NPS_AI_CACHE_PATH") or DEFAULT_SQLITE_PATH
+    try:
+        return SQLiteTier(
+            path, _env_int("NPS_AI_CACHE_SHARED_MAX_BYTES", _DEFAULT_SHARED_MAX_BYTES)
+        )
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("AI cache: SQLite cache at %s unavailable (%s), local only", path, exc)
+        return None
+
+
+def cache_from_env() -> ResponseCache:
+    """ResponseCache configured from the NPS_AI_CACHE_* env vars."""
+    local = LRUCache(
+        max_entries=max(1, _env_int("NPS_AI_CACHE_MAX_ENTRIES", _DEFAULT_MAX_ENTRIES)),
+        max_bytes=max(1, _env_int("NPS_AI_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES)),
+    )
+    cache = ResponseCache(local, _shared_tier_from_env())
+    logger.info("AI cache: local LRU + %s shared tier", cache.stats()["backend"])
+    return cache
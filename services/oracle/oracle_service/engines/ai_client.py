@@ -3,17 +3,31 @@ AI Client — Anthropic SDK Wrapper
 ===================================
 Low-level wrapper for the Anthropic Python SDK. Provides:
   - Availability checking (API key + SDK import)
-  - In-memory dict cache with TTL and max size
-  - Thread-safe rate limiting
+  - Two-tier response cache (in-process LRU + Redis/SQLite, see ai_cache)
+    with TTLs per reading type
+  - Single-flight coalescing of identical in-flight requests
+  - Token-bucket rate limiting (requests/sec + max in-flight requests)
   - Retry logic (1 retry for rate-limit/server/connection errors)
+  - Streaming responses (astream) as text deltas
   - Graceful degradation when SDK/key unavailable
+
+All API calls run on one background event loop ("AI loop") that owns a
+single pooled AsyncAnthropic client and the rate limiter. agenerate()
+awaits it from any event loop; generate() is the blocking wrapper for
+sync callers; astream() yields the text as it arrives. All of them share
+the same connections, cache and limits.
 """
 
+import asyncio
 import hashlib
 import logging
 import os
 import threading
 import time
+from concurrent.futures import Future
+from typing import AsyncIterator, Callable
+
+from engines.ai_cache import cache_from_env
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +41,20 @@ _DEFAULT_MAX_TOKENS_SINGLE = 2000
 _DEFAULT_MAX_TOKENS_MULTI = 3000
 _DEFAULT_TIMEOUT = 30
 
-# Cache config
+# Cache TTLs (seconds) by reading type; _CACHE_TTL for anything else
 _CACHE_TTL = 3600  # 1 hour
-_CACHE_MAX = 200
-
-# Rate limiting
-_MIN_INTERVAL = 1.0  # seconds between API calls
+_CACHE_TTLS = {
+    "daily": 86400,  # prompt carries the date
+    "name": 7 * 86400,  # prompt depends on the name only
+    "time": 3600,
+    "question": 3600,
+    "multi": 3600,
+}
+
+# Rate limiting (token bucket)
+_DEFAULT_RATE_LIMIT = 1.0  # sustained requests per second
+_DEFAULT_BURST = 5  # requests allowed back to back before the rate applies
+_DEFAULT_MAX_CONCURRENCY = 8  # requests in flight at once
 
 # Retry config
 _RETRY_WAIT = 2.0  # seconds between retries
@@ -42,16 +64,22 @@ _MAX_RETRIES = 1
 # Internal state
 # ════════════════════════════════════════════════════════════
 
-_rate_lock = threading.Lock()
-_last_call_time = 0.0
-
 _cache_lock = threading.Lock()
-_cache: dict = {}  # key -> {"response": str, "timestamp": float}
+_response_cache = None  # ai_cache.ResponseCache, created on first use
+
+# Single flight: cache key -> Future of the upstream call in progress
+_inflight_lock = threading.Lock()
+_inflight: dict = {}
+_flight_stats = {"upstream": 0, "coalesced": 0}
 
-_client = None
+_client = None  # AsyncAnthropic, created and used on the AI loop only
+_limiter = None  # TokenBucket, AI loop only
 _client_lock = threading.Lock()
 _available = None
 
+_loop = None
+_loop_lock = threading.Lock()
+
 # Try importing the SDK at module level — but don't fail
 _sdk_available = False
 _RateLimitError = None
@@ -85,6 +113,78 @@ def _is_retryable(exc: Exception) -> bool:
     return isinstance(exc, (_RateLimitError, _InternalServerError, _APIConnectionError))
 
 
+# ════════════════════════════════════════════════════════════
+# Rate limiter
+# ════════════════════════════════════════════════════════════
+
+
+class TokenBucket:
+    """Token-bucket limiter for API requests.
+
+    Allows ``rate`` requests per second on average, bursts of up to
+    ``burst`` back-to-back requests, and at most ``max_concurrency``
+    requests in flight. Uses asyncio primitives, so one instance must only
+    be used from one event loop (the AI loop).
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        if rate <= 0 or burst < 1 or max_concurrency < 1:
+            raise ValueError("rate must be > 0, burst and max_concurrency >= 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._stats = {"acquired": 0, "throttled": 0, "waited_s": 0.0, "peak_in_flight": 0}
+
+    def _reserve(self) -> float:
+        """Take a token (possibly borrowed from the future); seconds to wait for it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for an in-flight slot, then for a token."""
+        await self._slots.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["waited_s"] += wait
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._tokens += 1  # cancelled while waiting: give the token back
+            self._slots.release()
+            raise
+        self._in_flight += 1
+        self._stats["acquired"] += 1
+        self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._slots.release()
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            **self._stats,
+        }
+
+
 # ════════════════════════════════════════════════════════════
 # Public API
 # ════════════════════════════════════════════════════════════
@@ -119,14 +219,162 @@ def is_available() -> bool:
     return True
 
 
+def _unavailable_result() -> dict:
+    return {
+        "success": False,
+        "response": "",
+        "error": "AI not available (no SDK or API key)",
+        "elapsed": 0.0,
+        "cached": False,
+        "retried": False,
+    }
+
+
+def _cached_result(response: str) -> dict:
+    return {
+        "success": True,
+        "response": response,
+        "error": None,
+        "elapsed": 0.0,
+        "cached": True,
+        "retried": False,
+    }
+
+
+async def agenerate(
+    prompt: str,
+    system_prompt: str = "",
+    max_tokens: int | None = None,
+    temperature: float = 0.7,
+    use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
+) -> dict:
+    """Generate a response from the Anthropic API without blocking the event loop.
+
+    The request runs on the AI loop through the shared client and rate
+    limiter, so it can be awaited from any event loop. Cancelling the
+    awaiting task cancels an uncached request; a cached one may be shared
+    with other callers, so it keeps running and still fills the cache.
+
+    Parameters and return value are the same as generate().
+    """
+    if not is_available():
+        return _unavailable_result()
+
+    future = _request(
+        prompt, system_prompt, max_tokens, temperature, use_cache, reading_type, cache_key
+    )
+    waiter = asyncio.wrap_future(future)
+    if use_cache:
+        waiter = asyncio.shield(waiter)
+    return dict(await waiter)
+
+
+class AIStream:
+    """Async iterator over the text of one response, as returned by astream().
+
+    Iterate it for the text deltas; afterwards ``result`` holds the same
+    dict agenerate() would have returned. A cached response, or one joined
+    from a request already in flight, arrives as a single delta.
+    """
+
+    def __init__(self, prompt: str, system_prompt: str, options: dict):
+        self.prompt = prompt
+        self.system_prompt = system_prompt
+        self.options = options
+        self.result: dict | None = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[str]:
+        if not is_available():
+            self.result = _unavailable_result()
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def on_delta(delta: str) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, delta)
+
+        opts = self.options
+        future = _request(
+            self.prompt,
+            self.system_prompt,
+            opts["max_tokens"],
+            opts["temperature"],
+            opts["use_cache"],
+            opts["reading_type"],
+            opts["cache_key"],
+            on_delta,
+        )
+        # Same thread as on_delta when the call is ours, so it queues last
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(queue.put_nowait, done))
+        streamed = False
+        try:
+            while (delta := await queue.get()) is not done:
+                streamed = True
+                yield delta
+        finally:
+            # An uncached stream is ours alone; a cached one may be shared
+            if not future.done() and not opts["use_cache"]:
+                future.cancel()
+
+        self.result = dict(future.result())
+        if not streamed and self.result["success"] and self.result["response"]:
+            yield self.result["response"]
+
+
+def astream(
+    prompt: str,
+    system_prompt: str = "",
+    max_tokens: int | None = None,
+    temperature: float = 0.7,
+    use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
+) -> AIStream:
+    """Stream a response from the Anthropic API as text deltas.
+
+    Same request path as agenerate() (AI loop, rate limiter, single flight,
+    cache); the assembled text is cached as usual. Use as::
+
+        stream = astream(prompt)
+        async for delta in stream:
+            ...
+        stream.result  # agenerate()-style result dict
+
+    Parameters are the same as generate().
+    """
+    return AIStream(
+        prompt,
+        system_prompt,
+        {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "use_cache": use_cache,
+            "reading_type": reading_type,
+            "cache_key": cache_key,
+        },
+    )
+
+
 def generate(
     prompt: str,
     system_prompt: str = "",
     max_tokens: int | None = None,
     temperature: float = 0.7,
     use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
 ) -> dict:
-    """Generate a response from the Anthropic API.
+    """Generate a response from the Anthropic API (blocking).
+
+    Sync counterpart of agenerate() for legacy callers: the request still
+    runs on the AI loop and shares its client, cache and rate limits.
 
     Parameters
     ----------
@@ -139,7 +387,13 @@ def generate(
     temperature : float
         Sampling temperature (0.0-1.0).
     use_cache : bool
-        Whether to use the in-memory cache.
+        Whether to use the response cache.
+    reading_type : str or None
+        "daily", "time", "name", ... — selects the cache TTL.
+    cache_key : str or None
+        Cache / single-flight key. Defaults to a hash of the prompts; callers
+        whose prompt is a pure function of fewer inputs can pass a key
+        derived from those inputs instead.
 
     Returns
     -------
@@ -148,31 +402,96 @@ def generate(
          "elapsed": float, "cached": bool, "retried": bool}
     """
     if not is_available():
-        return {
-            "success": False,
-            "response": "",
-            "error": "AI not available (no SDK or API key)",
-            "elapsed": 0.0,
-            "cached": False,
-            "retried": False,
-        }
+        return _unavailable_result()
 
-    # Cache lookup
-    key = _cache_key(prompt, system_prompt)
-    if use_cache:
-        cached = _read_cache(key)
+    future = _request(
+        prompt, system_prompt, max_tokens, temperature, use_cache, reading_type, cache_key
+    )
+    return dict(future.result())
+
+
+def _request(
+    prompt: str,
+    system_prompt: str,
+    max_tokens: int | None,
+    temperature: float,
+    use_cache: bool,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
+) -> Future:
+    """Future for a generate() result: cached, joined in flight, or new.
+
+    With ``use_cache``, callers whose cache key matches a request already
+    in flight share its Future instead of calling the API again (single
+    flight). The local cache tier is checked under the same lock, and
+    _call_api() writes it before the Future completes, so a response is
+    never fetched twice. The shared tier is checked inside the flight.
+    The result dict is shared: callers must copy it.
+
+    ``on_delta`` streams the response text (AI loop thread) when this
+    call starts a new upstream request; it is not called for cached or
+    joined results.
+    """
+    key = cache_key or _cache_key(prompt, system_prompt)
+    if not use_cache:
+        return _submit(
+            _call_api(key, prompt, system_prompt, max_tokens, temperature, None, on_delta)
+        )
+
+    ttl = _CACHE_TTLS.get(reading_type, _CACHE_TTL)
+    cache = _get_cache()
+    with _inflight_lock:
+        cached = cache.get_local(key)
         if cached is not None:
-            return {
-                "success": True,
-                "response": cached,
-                "error": None,
-                "elapsed": 0.0,
-                "cached": True,
-                "retried": False,
-            }
+            future: Future = Future()
+            future.set_result(_cached_result(cached))
+            return future
+
+        future = _inflight.get(key)
+        if future is not None:
+            _flight_stats["coalesced"] += 1
+            logger.debug("AI client: joined in-flight request %s", key[:12])
+            return future
 
-    # Rate limiting
-    _enforce_rate_limit()
+        future = _submit(
+            _call_api(key, prompt, system_prompt, max_tokens, temperature, ttl, on_delta)
+        )
+        _inflight[key] = future
+        _flight_stats["upstream"] += 1
+
+    future.add_done_callback(lambda done: _end_flight(key, done))
+    return future
+
+
+def _end_flight(key: str, future: Future) -> None:
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+async def _call_api(
+    key: str,
+    prompt: str,
+    system_prompt: str,
+    max_tokens: int | None,
+    temperature: float,
+    cache_ttl: float | None,
+    on_delta: Callable[[str], None] | None = None,
+) -> dict:
+    """Make the API call with retry logic. Runs on the AI loop.
+
+    With a ``cache_ttl`` the shared cache tier is tried first, and a
+    successful response is cached in both tiers. With ``on_delta`` the
+    response is streamed and each text delta passed to it; the assembled
+    text is what gets cached. A stream that fails after sending text is
+    not retried.
+    """
+    cache = _get_cache() if cache_ttl is not None else None
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get_shared, key)
+        if cached is not None:
+            return _cached_result(cached)
 
     # Resolve config
     if max_tokens is None:
@@ -188,13 +507,13 @@ def generate(
 
     model = os.environ.get("NPS_AI_MODEL", _DEFAULT_MODEL)
 
-    # Make the API call with retry logic
     start = time.time()
     retried = False
+    streamed: list[str] = []
 
     for attempt in range(_MAX_RETRIES + 1):
         try:
-            client = _get_client()
+            client = _get_async_client()
             kwargs: dict = {
                 "model": model,
                 "max_tokens": max_tokens,
@@ -206,17 +525,18 @@ def generate(
             if timeout:
                 kwargs["timeout"] = float(timeout)
 
-            response = client.messages.create(**kwargs)
+            async with _get_limiter():
+                if on_delta is None:
+                    response = await client.messages.create(**kwargs)
+                    text = response.content[0].text if response.content else ""
+                else:
+                    text = await _stream_text(client, kwargs, on_delta, streamed)
             elapsed = time.time() - start
 
-            # Extract text from response
-            text = ""
-            if response.content:
-                text = response.content[0].text
-
-            # Cache the result
-            if use_cache and text:
-                _write_cache(key, text)
+            # Cache the result (local tier before the Future completes)
+            if cache is not None and text:
+                expires_at = cache.set_local(key, text, cache_ttl)
+                await asyncio.to_thread(cache.set_shared, key, text, expires_at)
 
             return {
                 "success": True,
@@ -229,7 +549,7 @@ def generate(
 
         except Exception as e:
             # Check if retryable and haven't exhausted retries
-            if _is_retryable(e) and attempt < _MAX_RETRIES:
+            if _is_retryable(e) and attempt < _MAX_RETRIES and not streamed:
                 retried = True
                 logger.warning(
                     "AI client retryable error (attempt %d): %s — retrying in %.1fs",
@@ -237,7 +557,7 @@ def generate(
                     type(e).__name__,
                     _RETRY_WAIT,
                 )
-                time.sleep(_RETRY_WAIT)
+                await asyncio.sleep(_RETRY_WAIT)
                 continue
 
             # Non-retryable or retries exhausted
@@ -274,12 +594,28 @@ def generate(
     }
 
 
+async def _stream_text(
+    client, kwargs: dict, on_delta: Callable[[str], None], streamed: list[str]
+) -> str:
+    """Stream a Messages response, passing each text delta to ``on_delta``.
+
+    Deltas are also appended to ``streamed``; returns the full text.
+    """
+    async with client.messages.stream(**kwargs) as stream:
+        async for delta in stream.text_stream:
+            streamed.append(delta)
+            on_delta(delta)
+    return "".join(streamed)
+
+
 def generate_reading(
     user_prompt: str,
     system_prompt: str,
     locale: str = "en",
     max_tokens: int = _DEFAULT_MAX_TOKENS_SINGLE,
     use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
 ) -> dict:
     """Convenience wrapper for reading generation.
 
@@ -295,6 +631,10 @@ def generate_reading(
         Max tokens for the response.
     use_cache : bool
         Whether to use caching.
+    reading_type : str or None
+        Reading type, for the cache TTL.
+    cache_key : str or None
+        Cache key override (see generate()).
 
     Returns
     -------
@@ -306,22 +646,97 @@ def generate_reading(
         system_prompt=system_prompt,
         max_tokens=max_tokens,
         use_cache=use_cache,
+        reading_type=reading_type,
+        cache_key=cache_key,
+    )
+
+
+async def agenerate_reading(
+    user_prompt: str,
+    system_prompt: str,
+    locale: str = "en",
+    max_tokens: int = _DEFAULT_MAX_TOKENS_SINGLE,
+    use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
+) -> dict:
+    """Async counterpart of generate_reading()."""
+    return await agenerate(
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        use_cache=use_cache,
+        reading_type=reading_type,
+        cache_key=cache_key,
+    )
+
+
+def astream_reading(
+    user_prompt: str,
+    system_prompt: str,
+    locale: str = "en",
+    max_tokens: int = _DEFAULT_MAX_TOKENS_SINGLE,
+    use_cache: bool = True,
+    reading_type: str | None = None,
+    cache_key: str | None = None,
+) -> AIStream:
+    """Streaming counterpart of generate_reading() (see astream())."""
+    return astream(
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        use_cache=use_cache,
+        reading_type=reading_type,
+        cache_key=cache_key,
     )
 
 
 def clear_cache() -> None:
-    """Remove all cached responses."""
-    with _cache_lock:
-        _cache.clear()
+    """Remove all cached responses (both tiers, once the cache is in use)."""
+    cache = _response_cache
+    if cache is not None:
+        cache.clear()
     logger.info("AI client cache cleared")
 
 
+def cache_stats() -> dict:
+    """Response cache backend, hit counts, hit ratio and size (empty before first use)."""
+    cache = _response_cache
+    return cache.stats() if cache is not None else {}
+
+
+def rate_limit_stats() -> dict:
+    """Token-bucket settings and counters (empty before the first API call)."""
+    limiter = _limiter
+    return limiter.stats() if limiter is not None else {}
+
+
+def single_flight_stats() -> dict:
+    """Upstream requests started vs callers that joined one already in flight."""
+    with _inflight_lock:
+        return {"in_flight": len(_inflight), **_flight_stats}
+
+
 def reset_availability() -> None:
-    """Reset the cached availability check. Useful for testing."""
-    global _available, _client
+    """Reset the cached availability check, client, limiter, response
+    cache and request counters. Useful for testing.
+
+    The next API call picks up the current environment (key, base URL,
+    rate limit and cache settings).
+    """
+    global _available, _client, _limiter, _response_cache
     _available = None
     with _client_lock:
-        _client = None
+        client, _client = _client, None
+        _limiter = None
+    with _inflight_lock:
+        _flight_stats.update(upstream=0, coalesced=0)
+    with _cache_lock:
+        cache, _response_cache = _response_cache, None
+    if cache is not None:
+        cache.close()
+    if client is not None and _loop is not None:
+        asyncio.run_coroutine_threadsafe(client.close(), _loop)
 
 
 # ════════════════════════════════════════════════════════════
@@ -335,55 +750,70 @@ def _cache_key(prompt: str, system_prompt: str = "") -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
-def _read_cache(key: str) -> str | None:
-    """Read cached response if it exists and hasn't expired.
+def _env_number(name: str, default, cast=float):
+    """Numeric env var, falling back to ``default`` when unset or invalid."""
+    try:
+        return cast(os.environ.get(name, default))
+    except (ValueError, TypeError):
+        return default
 
-    Returns the response string or None.
-    """
-    with _cache_lock:
-        entry = _cache.get(key)
-        if entry is None:
-            return None
-        if time.time() - entry["timestamp"] > _CACHE_TTL:
-            del _cache[key]
-            return None
-        return entry["response"]
+
+def _ai_loop() -> asyncio.AbstractEventLoop:
+    """The background event loop all API calls run on (started on first use)."""
+    global _loop
+    if _loop is not None:
+        return _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="nps-ai-client", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
 
 
-def _write_cache(key: str, response: str) -> None:
-    """Write response to in-memory cache, evicting oldest if over limit."""
+def _submit(coro) -> Future:
+    """Schedule ``coro`` on the AI loop; returns a concurrent Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _ai_loop())
+
+
+def _get_cache():
+    """Lazy two-tier response cache from the NPS_AI_CACHE_* env vars."""
+    global _response_cache
+    if _response_cache is not None:
+        return _response_cache
     with _cache_lock:
-        _cache[key] = {"response": response, "timestamp": time.time()}
-        _evict_cache()
+        if _response_cache is None:
+            _response_cache = cache_from_env()
+        return _response_cache
 
 
-def _evict_cache() -> None:
-    """Remove oldest entries if cache exceeds max size. Must hold _cache_lock."""
-    if len(_cache) <= _CACHE_MAX:
-        return
-    sorted_keys = sorted(_cache.keys(), key=lambda k: _cache[k]["timestamp"])
-    while len(_cache) > _CACHE_MAX:
-        del _cache[sorted_keys.pop(0)]
+def _get_limiter() -> TokenBucket:
+    """Lazy limiter from NPS_AI_RATE_LIMIT / NPS_AI_BURST / NPS_AI_MAX_CONCURRENCY.
 
+    AI loop only.
+    """
+    global _limiter
+    if _limiter is None:
+        _limiter = TokenBucket(
+            rate=_env_number("NPS_AI_RATE_LIMIT", _DEFAULT_RATE_LIMIT),
+            burst=_env_number("NPS_AI_BURST", _DEFAULT_BURST, int),
+            max_concurrency=_env_number("NPS_AI_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY, int),
+        )
+    return _limiter
 
-def _enforce_rate_limit() -> None:
-    """Block until minimum interval has passed since last API call."""
-    global _last_call_time
-    with _rate_lock:
-        now = time.time()
-        wait = _MIN_INTERVAL - (now - _last_call_time)
-        if wait > 0:
-            time.sleep(wait)
-        _last_call_time = time.time()
 
+def _get_async_client():
+    """Lazy singleton AsyncAnthropic client (one connection pool). AI loop only.
 
-def _get_client():
-    """Lazy singleton client initialization."""
+    SDK-level retries are off so every attempt passes the rate limiter;
+    _call_api() does the retrying.
+    """
     global _client
     if _client is not None:
         return _client
     with _client_lock:
         if _client is None:
             api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-            _client = _anthropic_module.Anthropic(api_key=api_key)
+            _client = _anthropic_module.AsyncAnthropic(api_key=api_key, max_retries=0)
         return _client
@@ -4,12 +4,20 @@ AI Interpreter — Human-Friendly Reading Interpretations
 Consumes output from MasterOrchestrator.generate_reading() (framework format)
 and produces 9-section AI-generated interpretations with bilingual support.
 
+Single readings are cached by content: the AI writes only the
+person-independent body (core identity through caution) from a prompt
+built from reading_features(), and the cache key is a hash of those
+features. The header, universal address and footer are filled in from
+locale templates for each reading.
+
 Result classes:
   - ReadingInterpretation (single reading, 9 sections)
   - MultiUserInterpretation (group reading)
+  - SectionStream (incremental section parser for streamed responses)
 
 Public API:
   - interpret_reading(reading, reading_type, question, locale, use_cache)
+  - ainterpret_reading(...) / astream_interpretation(..., on_section)
   - interpret_multi_user(readings, names, locale)
 """
 
@@ -19,16 +27,27 @@ import hashlib
 import logging
 import time
 from dataclasses import dataclass, field
-
-from engines.ai_client import generate_reading, is_available
-from engines.prompt_templates import get_system_prompt
+from typing import Awaitable, Callable
+
+from engines.ai_client import agenerate_reading, astream_reading, generate_reading, is_available
+from engines.prompt_templates import (
+    DISCLAIMER_EN,
+    DISCLAIMER_FA,
+    get_reading_frame,
+    get_system_prompt,
+)
 from oracle_service.ai_prompt_builder import (
-    build_reading_prompt,
+    build_body_prompt,
     build_multi_user_prompt,
+    reading_features,
 )
+from oracle_service.question_analyzer import question_number
 
 logger = logging.getLogger(__name__)
 
+# Bump when build_body_prompt() changes, so stale cached bodies are not reused
+_BODY_KEY_VERSION = "body-v2"
+
 # ════════════════════════════════════════════════════════════
 # Section markers for parsing AI responses
 # ════════════════════════════════════════════════════════════
@@ -174,33 +193,145 @@ def interpret_reading(
     -------
     ReadingInterpretation
     """
-    confidence_score = _extract_confidence(reading)
     start = time.time()
-
     if not is_available():
-        logger.info("AI unavailable, using framework fallback for reading")
-        result = _build_fallback(reading, locale)
-        result.elapsed_ms = (time.time() - start) * 1000
-        result.confidence_score = confidence_score
-        return result
+        return _unavailable_interpretation(reading, locale, start)
 
-    # Build prompts
-    user_prompt = build_reading_prompt(
-        reading, reading_type=reading_type, question=question, locale=locale
+    user_prompt, system_prompt, cache_key = _reading_prompts(
+        reading, reading_type, question, locale
     )
-    system_prompt = get_system_prompt(locale)
-
-    # Call AI
     ai_result = generate_reading(
         user_prompt=user_prompt,
         system_prompt=system_prompt,
         locale=locale,
         use_cache=use_cache,
+        reading_type=reading_type,
+        cache_key=cache_key,
+    )
+    return _reading_interpretation(ai_result, reading, locale, start)
+
+
+async def ainterpret_reading(
+    reading: dict,
+    reading_type: str = "daily",
+    question: str = "",
+    locale: str = "en",
+    use_cache: bool = True,
+) -> ReadingInterpretation:
+    """Async counterpart of interpret_reading() (awaits the shared AI client)."""
+    start = time.time()
+    if not is_available():
+        return _unavailable_interpretation(reading, locale, start)
+
+    user_prompt, system_prompt, cache_key = _reading_prompts(
+        reading, reading_type, question, locale
+    )
+    ai_result = await agenerate_reading(
+        user_prompt=user_prompt,
+        system_prompt=system_prompt,
+        locale=locale,
+        use_cache=use_cache,
+        reading_type=reading_type,
+        cache_key=cache_key,
+    )
+    return _reading_interpretation(ai_result, reading, locale, start)
+
+
+async def astream_interpretation(
+    reading: dict,
+    reading_type: str = "daily",
+    question: str = "",
+    locale: str = "en",
+    use_cache: bool = True,
+    on_section: Callable[[str, str], Awaitable[None]] | None = None,
+) -> ReadingInterpretation:
+    """ainterpret_reading() that reports each section as soon as it is known.
+
+    The AI response is streamed, and ``on_section(key, text)`` is awaited
+    for every section as it completes: the locally built header and
+    universal address first, then each AI section once the next heading
+    arrives. When the interpretation is done, any section that was not
+    reported, or whose final text differs (footer, last section, fallback),
+    is reported again, so the last text per key matches the result.
+    """
+    start = time.time()
+    sent: dict[str, str] = {}
+
+    async def report(key: str, text: str) -> None:
+        if on_section is not None and text and sent.get(key) != text:
+            sent[key] = text
+            await on_section(key, text)
+
+    if not is_available():
+        result = _unavailable_interpretation(reading, locale, start)
+    else:
+        user_prompt, system_prompt, cache_key = _reading_prompts(
+            reading, reading_type, question, locale
+        )
+        sections = SectionStream(locale)
+        head, _ = _frame_parts(reading, locale)
+        for key, text in sections.feed(head + "\n\n"):
+            await report(key, text)
+
+        stream = astream_reading(
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            locale=locale,
+            use_cache=use_cache,
+            reading_type=reading_type,
+            cache_key=cache_key,
+        )
+        async for delta in stream:
+            for key, text in sections.feed(delta):
+                await report(key, text)
+        result = _reading_interpretation(stream.result, reading, locale, start)
+
+    for key in _SECTION_KEYS:
+        await report(key, getattr(result, key))
+    return result
+
+
+def _unavailable_interpretation(reading: dict, locale: str, start: float) -> ReadingInterpretation:
+    logger.info("AI unavailable, using framework fallback for reading")
+    result = _build_fallback(reading, locale)
+    result.elapsed_ms = (time.time() - start) * 1000
+    result.confidence_score = _extract_confidence(reading)
+    return result
+
+
+def _reading_prompts(
+    reading: dict, reading_type: str, question: str, locale: str
+) -> tuple[str, str, str]:
+    """(user prompt, system prompt, cache key) for a reading's AI body."""
+    qn = _question_number(reading, reading_type, question)
+    user_prompt = build_body_prompt(
+        reading, reading_type=reading_type, question_number=qn, locale=locale, question=question
     )
+    system_prompt = get_system_prompt(locale)
+    features = reading_features(reading, reading_type, qn, locale, question)
+    return user_prompt, system_prompt, _make_body_cache_key(features, system_prompt)
+
+
+def _question_number(reading: dict, reading_type: str, question: str) -> int | None:
+    """Question number of a question reading (framework output, else from text)."""
+    vibration = reading.get("question_vibration")
+    if vibration is not None:
+        return vibration
+    if reading_type == "question" and question:
+        return question_number(question)["question_number"]
+    return None
+
+
+def _reading_interpretation(
+    ai_result: dict, reading: dict, locale: str, start: float
+) -> ReadingInterpretation:
+    """Turn an ai_client result into an interpretation (fallback on failure)."""
+    confidence_score = _extract_confidence(reading)
     elapsed_ms = (time.time() - start) * 1000
 
     if ai_result["success"]:
-        sections = _parse_sections(ai_result["response"], locale)
+        full_text = _frame_body(ai_result["response"], reading, locale)
+        sections = _parse_sections(full_text, locale)
         return ReadingInterpretation(
             header=sections.get("header", ""),
             universal_address=sections.get("universal_address", ""),
@@ -211,7 +342,7 @@ def interpret_reading(
             advice=sections.get("advice", ""),
             caution=sections.get("caution", ""),
             footer=sections.get("footer", ""),
-            full_text=ai_result["response"],
+            full_text=full_text,
             ai_generated=True,
             locale=locale,
             elapsed_ms=elapsed_ms,
@@ -273,6 +404,7 @@ def interpret_multi_user(
             locale=locale,
             max_tokens=_DEFAULT_MAX_TOKENS_MULTI,
             use_cache=True,
+            reading_type="multi",
         )
 
         if ai_result["success"]:
@@ -303,6 +435,38 @@ def interpret_multi_user(
 # ════════════════════════════════════════════════════════════
 
 
+def _frame_body(body: str, reading: dict, locale: str = "en") -> str:
+    """Wrap a cached AI body in this reading's header, address and footer."""
+    head, foot = _frame_parts(reading, locale)
+    return "\n\n".join([head, body.strip(), foot])
+
+
+def _frame_parts(reading: dict, locale: str = "en") -> tuple[str, str]:
+    """(header + universal address, footer) text for a reading."""
+    frame = get_reading_frame(locale)
+    person = reading.get("person") or {}
+    stamp = reading.get("fc60_stamp") or {}
+    confidence = reading.get("confidence") or {}
+    factors = confidence.get("factors", "")
+    if isinstance(factors, (list, tuple)):
+        factors = ", ".join(str(f) for f in factors)
+    fields = {
+        "name": person.get("name") or "",
+        "date": (reading.get("current") or {}).get("date", ""),
+        "fc60": stamp.get("fc60", ""),
+        "j60": stamp.get("j60", ""),
+        "y60": stamp.get("y60", ""),
+        "score": confidence.get("score", 0),
+        "level": confidence.get("level", ""),
+        "factors": factors,
+        "disclaimer": DISCLAIMER_FA if locale == "fa" else DISCLAIMER_EN,
+    }
+    head = frame["header"].format(**fields)
+    if stamp:
+        head += "\n\n" + frame["universal_address"].format(**fields)
+    return head, frame["footer"].format(**fields)
+
+
 def _parse_sections(text: str, locale: str = "en") -> dict[str, str]:
     """Parse AI response text into 9 named sections.
 
@@ -319,53 +483,81 @@ def _parse_sections(text: str, locale: str = "en") -> dict[str, str]:
     markers = _SECTION_MARKERS_FA if locale == "fa" else _SECTION_MARKERS_EN
     result: dict[str, str] = {key: "" for key in _SECTION_KEYS}
 
-    # Find positions of each section
-    found: list[tuple[int, str]] = []  # (position, section_key)
-    for section_key, marker_list in markers.items():
-        for marker in marker_list:
-            pos = text.find(marker)
-            if pos != -1:
-                found.append((pos, section_key))
-                break  # Use first match for each section
-
+    found = _find_sections(text, markers)
     if not found:
         # No sections found — put everything in message
         result["message"] = text.strip()
         return result
 
-    # Sort by position
-    found.sort(key=lambda x: x[0])
-
     # Extract text between markers
     for i, (pos, section_key) in enumerate(found):
-        if i + 1 < len(found):
-            next_pos = found[i + 1][0]
-            section_text = text[pos:next_pos]
-        else:
-            section_text = text[pos:]
-
-        # Strip the marker line itself
-        lines = section_text.split("\n")
-        # Remove first line (the marker) and divider lines
-        content_lines = []
-        for j, line in enumerate(lines):
-            if j == 0:
-                # Keep the first line if it contains more than just the marker
-                stripped = line.strip()
-                for marker in markers.get(section_key, []):
-                    stripped = stripped.replace(marker, "").strip()
-                if stripped and stripped != "---":
-                    content_lines.append(stripped)
-                continue
-            if line.strip() == "---":
-                continue
-            content_lines.append(line)
-
-        result[section_key] = "\n".join(content_lines).strip()
+        end = found[i + 1][0] if i + 1 < len(found) else len(text)
+        result[section_key] = _section_content(text[pos:end], markers[section_key])
 
     return result
 
 
+def _find_sections(text: str, markers: dict[str, list[str]]) -> list[tuple[int, str]]:
+    """(position, section_key) of every section header in ``text``, in order."""
+    found: list[tuple[int, str]] = []
+    for section_key, marker_list in markers.items():
+        for marker in marker_list:
+            pos = text.find(marker)
+            if pos != -1:
+                found.append((pos, section_key))
+                break  # Use first match for each section
+    found.sort(key=lambda x: x[0])
+    return found
+
+
+def _section_content(section_text: str, marker_list: list[str]) -> str:
+    """A section's text without its marker line and divider lines."""
+    lines = section_text.split("\n")
+    content_lines = []
+    for j, line in enumerate(lines):
+        if j == 0:
+            # Keep the first line if it contains more than just the marker
+            stripped = line.strip()
+            for marker in marker_list:
+                stripped = stripped.replace(marker, "").strip()
+            if stripped and stripped != "---":
+                content_lines.append(stripped)
+            continue
+        if line.strip() == "---":
+            continue
+        content_lines.append(line)
+    return "\n".join(content_lines).strip()
+
+
+class SectionStream:
+    """Incremental _parse_sections() for a response that arrives in pieces.
+
+    feed() returns the sections completed by each new piece of text: a
+    section is complete once the next section's heading has arrived, and
+    its text then equals what _parse_sections() gives for the full text.
+    The last section is only known when the text ends, so callers take it
+    (and anything else not yet seen) from the final parse.
+    """
+
+    def __init__(self, locale: str = "en"):
+        self.markers = _SECTION_MARKERS_FA if locale == "fa" else _SECTION_MARKERS_EN
+        self.text = ""
+        self._done: set[str] = set()
+
+    def feed(self, delta: str) -> list[tuple[str, str]]:
+        """Append ``delta``; returns newly completed (section_key, content) pairs."""
+        self.text += delta
+        found = _find_sections(self.text, self.markers)
+        completed = []
+        for (pos, section_key), (next_pos, _) in zip(found, found[1:]):
+            if section_key in self._done:
+                continue
+            self._done.add(section_key)
+            content = _section_content(self.text[pos:next_pos], self.markers[section_key])
+            completed.append((section_key, content))
+        return completed
+
+
 # ════════════════════════════════════════════════════════════
 # Fallback
 # ════════════════════════════════════════════════════════════
@@ -435,6 +627,12 @@ def _extract_compatibility(text: str) -> str:
     return ""
 
 
+def _make_body_cache_key(features: tuple, system_prompt: str) -> str:
+    """AI cache key for a reading body: SHA-256 of its canonical features."""
+    content = f"{_BODY_KEY_VERSION}|||{system_prompt}|||{features!r}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def _make_daily_cache_key(user_id: str, date: str, locale: str) -> str:
     """Generate a deterministic cache key for daily reading DB cache.
 
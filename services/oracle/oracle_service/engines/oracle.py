@@ -49,9 +49,7 @@ try:
         numerology_reduce,
         digit_sum,
         is_master_number,
-        name_to_number,
-        name_soul_urge,
-        name_personality,
+        name_sums,
         life_path,
         LIFE_PATH_MEANINGS,
     )
@@ -1049,11 +1047,15 @@ def read_name(name, birthday=None, mother_name=None):
     }
 
     # --- Pythagorean numerology via NameSolver's engine ---
+    # One pass over the name yields every system's sums (Chaldean reused below)
+    sums = None
     if _numerology_available:
         try:
-            result["expression"] = name_to_number(name)
-            result["soul_urge"] = name_soul_urge(name)
-            result["personality"] = name_personality(name)
+            sums = name_sums(name)
+            pythagorean = sums["pythagorean"]
+            result["expression"] = numerology_reduce(pythagorean["expression"])
+            result["soul_urge"] = numerology_reduce(pythagorean["soul_urge"])
+            result["personality"] = numerology_reduce(pythagorean["personality"])
 
             # Life path meanings
             expr_info = LIFE_PATH_MEANINGS.get(result["expression"])
@@ -1084,7 +1086,12 @@ def read_name(name, birthday=None, mother_name=None):
 
     # --- Chaldean numerology ---
     try:
-        chaldean_val = _chaldean_reduce(name)
+        if sums is not None:
+            chaldean_raw = sums["chaldean"]["expression"]
+            chaldean_val = numerology_reduce(chaldean_raw)
+        else:
+            chaldean_raw = sum(CHALDEAN_VALUES.get(ch, 0) for ch in name.upper())
+            chaldean_val = _chaldean_reduce(name)
         result["chaldean"] = chaldean_val
         result["chaldean_meaning"] = _pythagorean_meaning(chaldean_val)
 
@@ -1094,19 +1101,26 @@ def read_name(name, birthday=None, mother_name=None):
             if ch in CHALDEAN_VALUES:
                 breakdown.append(f"{ch}={CHALDEAN_VALUES[ch]}")
         result["chaldean_breakdown"] = " + ".join(breakdown)
-        result["chaldean_raw_sum"] = sum(CHALDEAN_VALUES.get(ch, 0) for ch in name.upper())
+        result["chaldean_raw_sum"] = chaldean_raw
     except Exception as exc:
         logger.debug("Chaldean name analysis failed: %s", exc)
 
     # --- Mother's name influence ---
     if mother_name:
         try:
+            mother_sums = name_sums(mother_name) if _numerology_available else None
             mother_result = {
                 "name": mother_name,
-                "chaldean": _chaldean_reduce(mother_name),
+                "chaldean": (
+                    numerology_reduce(mother_sums["chaldean"]["expression"])
+                    if mother_sums
+                    else _chaldean_reduce(mother_name)
+                ),
             }
-            if _numerology_available:
-                mother_result["expression"] = name_to_number(mother_name)
+            if mother_sums:
+                mother_result["expression"] = numerology_reduce(
+                    mother_sums["pythagorean"]["expression"]
+                )
                 m_info = LIFE_PATH_MEANINGS.get(mother_result["expression"])
                 mother_result["expression_meaning"] = f"{m_info[0]}: {m_info[1]}" if m_info else ""
             result["mother_influence"] = mother_result
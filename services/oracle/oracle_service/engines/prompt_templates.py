@@ -7,10 +7,28 @@ User prompt construction delegated to ai_prompt_builder.py.
 Exports:
   - WISDOM_SYSTEM_PROMPT_EN / WISDOM_SYSTEM_PROMPT_FA
   - get_system_prompt(locale)
+  - DISCLAIMER_EN / DISCLAIMER_FA
+  - get_reading_frame(locale)
   - FC60_PRESERVED_TERMS
   - build_prompt(template, context)
 """
 
+# ════════════════════════════════════════════════════════════
+# Disclaimer (closes every reading)
+# ════════════════════════════════════════════════════════════
+
+DISCLAIMER_EN = """\
+This reading identifies patterns in numerical and temporal data. It suggests \
+themes for reflection, not predictions of future events. Use it as one input \
+among many for self-awareness and decision-making.\
+"""
+
+DISCLAIMER_FA = """\
+این خوانش الگوها را در داده‌های عددی و زمانی شناسایی می‌کند. موضوعاتی برای \
+تأمل پیشنهاد می‌دهد، نه پیش‌بینی رویدادهای آینده. از آن به عنوان یکی از \
+ورودی‌ها برای خودآگاهی و تصمیم‌گیری استفاده کنید.\
+"""
+
 # ════════════════════════════════════════════════════════════
 # System prompt — English
 # ════════════════════════════════════════════════════════════
@@ -88,10 +106,8 @@ LENGTH GUIDELINES
 - Full data (all 6 dimensions): 800-1200 words
 
 DISCLAIMER (always include at the end)
-This reading identifies patterns in numerical and temporal data. It suggests \
-themes for reflection, not predictions of future events. Use it as one input \
-among many for self-awareness and decision-making.\
 """
+WISDOM_SYSTEM_PROMPT_EN += DISCLAIMER_EN
 
 # ════════════════════════════════════════════════════════════
 # System prompt — Persian (Farsi)
@@ -154,10 +170,8 @@ RA, OX, TI, RU, DR, SN, HO, GO, MO, RO, DO, PI, WU, FI, ER, MT, WA
 اعداد را به صورت اعداد عربی (0-9) بنویس، نه ارقام فارسی.
 
 سلب‌مسئولیت (همیشه در پایان)
-این خوانش الگوها را در داده‌های عددی و زمانی شناسایی می‌کند. موضوعاتی برای \
-تأمل پیشنهاد می‌دهد، نه پیش‌بینی رویدادهای آینده. از آن به عنوان یکی از \
-ورودی‌ها برای خودآگاهی و تصمیم‌گیری استفاده کنید.\
 """
+WISDOM_SYSTEM_PROMPT_FA += DISCLAIMER_FA
 
 # ════════════════════════════════════════════════════════════
 # System prompt accessor
@@ -181,6 +195,46 @@ def get_system_prompt(locale: str = "en") -> str:
     return WISDOM_SYSTEM_PROMPT_EN
 
 
+# ════════════════════════════════════════════════════════════
+# Reading frame — person-specific sections filled in locally
+# ════════════════════════════════════════════════════════════
+
+# Header, universal address and footer wrapped around the cached AI body
+# (see ai_interpreter). Fields: name, date, fc60, j60, y60, score, level,
+# factors, disclaimer.
+READING_FRAME_EN = {
+    "header": "READING FOR {name}\nDate: {date}",
+    "universal_address": "YOUR UNIVERSAL ADDRESS\nFC60: {fc60}\nJ60: {j60}\nY60: {y60}",
+    "footer": (
+        "Confidence: {score}% ({level})\nData sources: {factors}\n\nDisclaimer: {disclaimer}"
+    ),
+}
+
+READING_FRAME_FA = {
+    "header": "خوانش برای {name}\nتاریخ: {date}",
+    "universal_address": "آدرس جهانی شما\nFC60: {fc60}\nJ60: {j60}\nY60: {y60}",
+    "footer": "اطمینان: {score}% ({level})\nمنابع داده: {factors}\n\nسلب‌مسئولیت: {disclaimer}",
+}
+
+
+def get_reading_frame(locale: str = "en") -> dict:
+    """Return the header / universal address / footer templates for a locale.
+
+    Parameters
+    ----------
+    locale : str
+        "en" for English, "fa" for Persian. Unknown locales default to English.
+
+    Returns
+    -------
+    dict
+        Keys "header", "universal_address" and "footer"; str.format templates.
+    """
+    if locale == "fa":
+        return READING_FRAME_FA
+    return READING_FRAME_EN
+
+
 # ════════════════════════════════════════════════════════════
 # Preserved terms — never translate these
 # ════════════════════════════════════════════════════════════
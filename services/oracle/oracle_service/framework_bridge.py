@@ -12,16 +12,17 @@ and the numerology_ai_framework package. It provides:
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
 
 from oracle_service.models.reading_types import (
+    CompatibilityFeatures,
     MultiUserResult,
     ReadingResult,
     ReadingType,
     UserProfile,
 )
 from oracle_service.multi_user_analyzer import MultiUserAnalyzer
-from oracle_service.pattern_formatter import ConfidenceMapper, PatternFormatter
+from oracle_service.pattern_formatter import PATTERN_VIEWS, FormattedPatterns
 from oracle_service.utils.script_detector import auto_select_system
 
 from numerology_ai_framework.core.base60_codec import Base60Codec
@@ -30,6 +31,7 @@ from numerology_ai_framework.core.julian_date_engine import JulianDateEngine
 from numerology_ai_framework.core.weekday_calculator import WeekdayCalculator
 from numerology_ai_framework.personal.numerology_engine import NumerologyEngine
 from numerology_ai_framework.synthesis.master_orchestrator import MasterOrchestrator
+from numerology_ai_framework.synthesis.moment_search import MomentSearch
 from numerology_ai_framework.universal.ganzhi_engine import GanzhiEngine
 from numerology_ai_framework.universal.moon_engine import MoonEngine
 
@@ -50,29 +52,30 @@ class FrameworkBridgeError(Exception):
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _enrich_with_patterns(framework_output: Dict[str, Any]) -> Dict[str, Any]:
+def _enrich_with_patterns(
+    framework_output: Dict[str, Any],
+    views: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
     """Add formatted pattern data and confidence UI mapping to framework output.
 
+    All views come from one FormattedPatterns pass; views not requested are
+    never built.
+
     Args:
         framework_output: Raw dict from MasterOrchestrator.generate_reading().
+        views: Keys to produce, from PATTERN_VIEWS (default: all of them).
 
     Returns:
-        Dict with keys: 'patterns_ai', 'patterns_frontend', 'patterns_db',
-        'confidence_ui'.
+        Dict with the requested keys: 'patterns_ai', 'patterns_frontend',
+        'patterns_db', 'confidence_ui'.
     """
     patterns = framework_output.get("patterns", {"detected": [], "count": 0})
     signals = framework_output.get("reading", {}).get("signals", [])
     combined = framework_output.get("reading", {}).get("combined_signals")
     confidence = framework_output.get("confidence", {"score": 50, "level": "low"})
 
-    return {
-        "patterns_ai": PatternFormatter.format_for_ai(patterns, signals, combined),
-        "patterns_frontend": PatternFormatter.format_for_frontend_full(
-            patterns, signals, confidence, combined
-        ),
-        "patterns_db": PatternFormatter.format_for_database(patterns, confidence),
-        "confidence_ui": ConfidenceMapper.map_to_ui(confidence),
-    }
+    formatted = FormattedPatterns(patterns, signals, confidence, combined)
+    return formatted.views(PATTERN_VIEWS if views is None else views)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -80,6 +83,18 @@ def _enrich_with_patterns(framework_output: Dict[str, Any]) -> Dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _validate_person(full_name: str, birth_day: int, birth_month: int, birth_year: int) -> None:
+    """Reject obviously invalid person input before calling the framework."""
+    if not full_name or not full_name.strip():
+        raise FrameworkBridgeError("Full name is required")
+    if not (1 <= birth_month <= 12):
+        raise FrameworkBridgeError(f"Invalid birth month: {birth_month}")
+    if not (1 <= birth_day <= 31):
+        raise FrameworkBridgeError(f"Invalid birth day: {birth_day}")
+    if birth_year < 1:
+        raise FrameworkBridgeError(f"Invalid birth year: {birth_year}")
+
+
 def generate_single_reading(
     full_name: str,
     birth_day: int,
@@ -98,11 +113,19 @@ def generate_single_reading(
     tz_minutes: int = 0,
     numerology_system: str = "pythagorean",
     mode: str = "full",
+    numerology_static: Optional[Dict[str, Any]] = None,
+    fields: Optional[Set[str]] = None,
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
     """Generate a complete numerological reading for one person.
 
     Wraps MasterOrchestrator.generate_reading() with timing, error handling,
-    and input validation.
+    and input validation. ``numerology_static`` is an optional precomputed
+    NumerologyEngine.static_profile() (see build_static_profiles()).
+    ``fields`` limits the output to those framework keys and runs only the
+    pipeline steps they need; the pattern/confidence UI enrichment is added
+    only to full readings. ``pattern_views`` limits that enrichment to the
+    listed PATTERN_VIEWS keys (default: all).
 
     Returns:
         Full framework output dict (person, numerology, fc60_stamp, moon,
@@ -111,14 +134,7 @@ def generate_single_reading(
     Raises:
         FrameworkBridgeError: If reading generation fails.
     """
-    if not full_name or not full_name.strip():
-        raise FrameworkBridgeError("Full name is required")
-    if not (1 <= birth_month <= 12):
-        raise FrameworkBridgeError(f"Invalid birth month: {birth_month}")
-    if not (1 <= birth_day <= 31):
-        raise FrameworkBridgeError(f"Invalid birth day: {birth_day}")
-    if birth_year < 1:
-        raise FrameworkBridgeError(f"Invalid birth year: {birth_year}")
+    _validate_person(full_name, birth_day, birth_month, birth_year)
 
     t0 = time.perf_counter()
     try:
@@ -140,9 +156,12 @@ def generate_single_reading(
             tz_minutes=tz_minutes,
             numerology_system=numerology_system,
             mode=mode,
+            numerology_static=numerology_static,
+            fields=fields,
         )
         # Enrich with formatted patterns + confidence UI (Session 9)
-        result.update(_enrich_with_patterns(result))
+        if fields is None:
+            result.update(_enrich_with_patterns(result, pattern_views))
         duration_ms = (time.perf_counter() - t0) * 1000
         logger.info("Framework reading generated in %.1fms", duration_ms)
         return result
@@ -159,6 +178,9 @@ def generate_multi_reading(
     current_minute: Optional[int] = None,
     current_second: Optional[int] = None,
     numerology_system: str = "pythagorean",
+    fields: Optional[Set[str]] = None,
+    processes: int = 0,
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Generate readings for multiple users.
 
@@ -166,34 +188,75 @@ def generate_multi_reading(
     Optional: mother_name, gender, latitude, longitude, heart_rate_bpm,
     tz_hours, tz_minutes.
 
+    All users are read at the same moment via
+    MasterOrchestrator.generate_readings(): ``current_date`` is resolved
+    once and the FC60 stamp, moon and ganzhi data are computed once per
+    timezone. ``processes`` > 1 shards large batches across a process pool.
+    Readings are built as CompactReading records (the per-moment data is
+    shared, not copied per user) and converted to dicts once on return.
+    ``pattern_views`` is passed to the pattern enrichment as in
+    generate_single_reading().
+
     Returns:
         List of framework output dicts, one per user.
 
     Raises:
         FrameworkBridgeError: If any reading fails.
     """
-    results = []
+    people = []
     for user in users:
-        result = generate_single_reading(
-            full_name=user["full_name"],
-            birth_day=user["birth_day"],
-            birth_month=user["birth_month"],
-            birth_year=user["birth_year"],
+        _validate_person(
+            user["full_name"], user["birth_day"], user["birth_month"], user["birth_year"]
+        )
+        people.append(
+            {
+                "full_name": user["full_name"],
+                "birth_day": user["birth_day"],
+                "birth_month": user["birth_month"],
+                "birth_year": user["birth_year"],
+                "mother_name": user.get("mother_name"),
+                "gender": user.get("gender"),
+                "latitude": user.get("latitude"),
+                "longitude": user.get("longitude"),
+                "actual_bpm": user.get("heart_rate_bpm"),
+                "tz_hours": user.get("tz_hours", 0),
+                "tz_minutes": user.get("tz_minutes", 0),
+            }
+        )
+
+    t0 = time.perf_counter()
+    try:
+        results = MasterOrchestrator.generate_readings(
+            people,
             current_date=current_date,
-            mother_name=user.get("mother_name"),
-            gender=user.get("gender"),
-            latitude=user.get("latitude"),
-            longitude=user.get("longitude"),
-            heart_rate_bpm=user.get("heart_rate_bpm"),
             current_hour=current_hour,
             current_minute=current_minute,
             current_second=current_second,
-            tz_hours=user.get("tz_hours", 0),
-            tz_minutes=user.get("tz_minutes", 0),
             numerology_system=numerology_system,
+            fields=fields,
+            processes=processes,
+            compact=True,
         )
-        results.append(result)
-    return results
+    except (ValueError, TypeError) as e:
+        duration_ms = (time.perf_counter() - t0) * 1000
+        logger.error("Framework multi reading failed after %.1fms: %s", duration_ms, e)
+        raise FrameworkBridgeError(f"Reading generation failed: {e}") from e
+
+    outputs = []
+    for result in results:
+        output = result.to_dict()
+        if fields is None:
+            output.update(_enrich_with_patterns(result, pattern_views))
+        outputs.append(output)
+    stats = MasterOrchestrator.moment_cache_stats()
+    logger.debug(
+        "Multi reading for %d users in %.1fms (moment cache: %d hits, %d misses)",
+        len(users),
+        (time.perf_counter() - t0) * 1000,
+        stats["hits"],
+        stats["misses"],
+    )
+    return outputs
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -266,6 +329,93 @@ def map_oracle_user_to_framework_kwargs(oracle_user: Any) -> Dict[str, Any]:
     return kwargs
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Persisted Static Numerology (oracle_users.numerology_static)
+# ═══════════════════════════════════════════════════════════════════════════
+
+STATIC_PROFILE_SYSTEMS = ("pythagorean", "chaldean", "abjad")
+
+
+def build_static_profiles(
+    full_name: str,
+    birth_day: int,
+    birth_month: int,
+    birth_year: int,
+    mother_name: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Precompute the static numerology profile for every system.
+
+    The result is stored on the oracle_users row. Each entry carries a
+    fingerprint of its inputs, so a stale copy (name, mother name or
+    birthday edited) is detected and ignored at read time.
+
+    Returns:
+        {system: {"fingerprint": str, "profile": dict}}
+    """
+    return {
+        system: {
+            "fingerprint": NumerologyEngine.static_profile_fingerprint(
+                full_name, birth_day, birth_month, birth_year, mother_name, system
+            ),
+            "profile": NumerologyEngine.static_profile(
+                full_name, birth_day, birth_month, birth_year, mother_name, system
+            ),
+        }
+        for system in STATIC_PROFILE_SYSTEMS
+    }
+
+
+def _persisted_static_profile(
+    user: UserProfile, kwargs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Return the user's persisted static profile if it matches these kwargs."""
+    if not user.numerology_static:
+        return None
+    entry = user.numerology_static.get(kwargs["numerology_system"])
+    if not isinstance(entry, dict):
+        return None
+    fingerprint = NumerologyEngine.static_profile_fingerprint(
+        kwargs["full_name"],
+        kwargs["birth_day"],
+        kwargs["birth_month"],
+        kwargs["birth_year"],
+        kwargs.get("mother_name"),
+        kwargs["numerology_system"],
+    )
+    if entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("profile")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Birth Compatibility Features (oracle_users.compat_* columns)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def birth_compatibility_features(
+    user_id: int, birth_day: int, birth_month: int, birth_year: int
+) -> CompatibilityFeatures:
+    """Compatibility features fixed at birth, for profile-to-profile search.
+
+    Life path, the birth year's element and animal, and the moon phase on
+    the birth date. Unlike MultiUserAnalyzer.extract_features() (which reads
+    a reading taken at the current moment) nothing here changes over time,
+    so the API stores the result on the user row. Patterns are left empty:
+    they belong to a moment, not a person.
+    """
+    stem_idx, branch_idx = GanzhiEngine.year_ganzhi(birth_year)
+    phase_name, _emoji, _age = MoonEngine.moon_phase(
+        JulianDateEngine.gregorian_to_jdn(birth_year, birth_month, birth_day)
+    )
+    return CompatibilityFeatures(
+        user_id=user_id,
+        life_path=NumerologyEngine.life_path(birth_day, birth_month, birth_year),
+        element=GanzhiEngine.STEM_ELEMENTS[stem_idx],
+        animal=GanzhiEngine.ANIMAL_NAMES[branch_idx],
+        moon_phase=phase_name,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Constants — backward-compatible re-exports from old engines.fc60
 # ═══════════════════════════════════════════════════════════════════════════
@@ -517,6 +667,16 @@ def name_personality(name: str, system: str = "pythagorean") -> int:
     return NumerologyEngine.personality_number(name, system=system)
 
 
+def name_sums(name: str) -> Dict[str, Dict[str, int]]:
+    """Raw expression/soul_urge/personality sums for every system, one pass."""
+    return NumerologyEngine.name_sums(name)
+
+
+def name_sums_bulk(names: List[str]) -> List[Dict[str, Dict[str, int]]]:
+    """name_sums() for a list of names."""
+    return NumerologyEngine.name_sums_bulk(names)
+
+
 def personal_year(birth_month: int, birth_day: int, current_year: int) -> int:
     """Backward-compatible wrapper for NumerologyEngine.personal_year."""
     return NumerologyEngine.personal_year(birth_month, birth_day, current_year)
@@ -688,6 +848,16 @@ def _build_daily_insights(user: UserProfile, output: Dict[str, Any]) -> Dict[str
     }
 
 
+def _validate_time(hour: int, minute: int, second: int) -> None:
+    """Raise ValueError for an out-of-range time of day."""
+    if not (0 <= hour <= 23):
+        raise ValueError(f"Invalid hour: {hour}")
+    if not (0 <= minute <= 59):
+        raise ValueError(f"Invalid minute: {minute}")
+    if not (0 <= second <= 59):
+        raise ValueError(f"Invalid second: {second}")
+
+
 def generate_time_reading(
     user: UserProfile,
     hour: int,
@@ -695,31 +865,31 @@ def generate_time_reading(
     second: int,
     target_date: Optional[datetime] = None,
     locale: str = "en",
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> ReadingResult:
     """Generate a reading where the "sign" is a specific time (HH:MM:SS).
 
-    The time overrides any time in target_date.
+    The time overrides any time in target_date. ``pattern_views`` limits the
+    pattern enrichment, as for generate_single_reading(); the other reading
+    functions take it too.
 
     Raises:
         ValueError: If hour/minute/second are out of range.
         FrameworkBridgeError: If framework reading generation fails.
     """
-    if not (0 <= hour <= 23):
-        raise ValueError(f"Invalid hour: {hour}")
-    if not (0 <= minute <= 59):
-        raise ValueError(f"Invalid minute: {minute}")
-    if not (0 <= second <= 59):
-        raise ValueError(f"Invalid second: {second}")
+    _validate_time(hour, minute, second)
 
     resolved_system = resolve_numerology_system(user, locale)
     t0 = time.perf_counter()
     kwargs = user.to_framework_kwargs()
     kwargs["numerology_system"] = resolved_system
+    kwargs["numerology_static"] = _persisted_static_profile(user, kwargs)
     kwargs["current_hour"] = hour
     kwargs["current_minute"] = minute
     kwargs["current_second"] = second
     if target_date is not None:
         kwargs["current_date"] = target_date
+    kwargs["pattern_views"] = pattern_views
 
     output = generate_single_reading(**kwargs)
     duration_ms = (time.perf_counter() - t0) * 1000
@@ -734,11 +904,62 @@ def generate_time_reading(
     )
 
 
+def regenerate_time_reading(
+    user: UserProfile,
+    previous: ReadingResult,
+    hour: int,
+    minute: int,
+    second: int,
+    pattern_views: Optional[Sequence[str]] = None,
+) -> ReadingResult:
+    """Time reading for a new HH:MM:SS, reusing a previous reading of the same day.
+
+    ``previous`` must be a full reading for the same user and date (e.g. an
+    earlier generate_time_reading() result). Only the time-dependent parts
+    (stamp, hour pillar, hour/minute animal signals, patterns, translation)
+    are recomputed via MasterOrchestrator.retime_reading(); the result equals
+    generate_time_reading() for the new time.
+
+    Raises:
+        ValueError: If the time is out of range or ``previous`` belongs to
+            another user.
+        FrameworkBridgeError: If ``previous`` is not a full reading.
+    """
+    _validate_time(hour, minute, second)
+    if previous.user_id != user.user_id:
+        raise ValueError(f"Previous reading belongs to user {previous.user_id}, not {user.user_id}")
+
+    t0 = time.perf_counter()
+    try:
+        output = MasterOrchestrator.retime_reading(
+            previous.framework_output,
+            hour,
+            minute,
+            second,
+            tz_hours=user.timezone_hours,
+            tz_minutes=user.timezone_minutes,
+        )
+    except ValueError as e:
+        raise FrameworkBridgeError(f"Reading regeneration failed: {e}") from e
+    output.update(_enrich_with_patterns(output, pattern_views))
+    duration_ms = (time.perf_counter() - t0) * 1000
+    logger.info("Time reading regenerated in %.1fms", duration_ms)
+
+    return ReadingResult(
+        reading_type=ReadingType.TIME,
+        user_id=user.user_id,
+        framework_output=output,
+        sign_value=f"{hour:02d}:{minute:02d}:{second:02d}",
+        confidence_score=float(output.get("confidence", {}).get("score", 0)),
+    )
+
+
 def generate_name_reading(
     user: UserProfile,
     name_to_analyze: str,
     target_date: Optional[datetime] = None,
     locale: str = "en",
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> ReadingResult:
     """Generate a reading where the "sign" is a name string.
 
@@ -763,8 +984,10 @@ def generate_name_reading(
     kwargs = user.to_framework_kwargs()
     kwargs["full_name"] = name_to_analyze
     kwargs["numerology_system"] = resolved_system
+    kwargs["numerology_static"] = _persisted_static_profile(user, kwargs)
     if target_date is not None:
         kwargs["current_date"] = target_date
+    kwargs["pattern_views"] = pattern_views
 
     output = generate_single_reading(**kwargs)
     duration_ms = (time.perf_counter() - t0) * 1000
@@ -784,6 +1007,7 @@ def generate_question_reading(
     question_text: str,
     target_date: Optional[datetime] = None,
     locale: str = "en",
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> ReadingResult:
     """Generate a reading where the "sign" is a question typed by the user.
 
@@ -805,8 +1029,10 @@ def generate_question_reading(
 
     kwargs = user.to_framework_kwargs()
     kwargs["numerology_system"] = resolved_system
+    kwargs["numerology_static"] = _persisted_static_profile(user, kwargs)
     if target_date is not None:
         kwargs["current_date"] = target_date
+    kwargs["pattern_views"] = pattern_views
 
     output = generate_single_reading(**kwargs)
     output["question_vibration"] = vibration
@@ -827,6 +1053,7 @@ def generate_daily_reading(
     user: UserProfile,
     target_date: Optional[datetime] = None,
     locale: str = "en",
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> ReadingResult:
     """Generate a daily reading — no manual sign input.
 
@@ -842,11 +1069,13 @@ def generate_daily_reading(
 
     kwargs = user.to_framework_kwargs()
     kwargs["numerology_system"] = resolved_system
+    kwargs["numerology_static"] = _persisted_static_profile(user, kwargs)
     kwargs["current_hour"] = 12
     kwargs["current_minute"] = 0
     kwargs["current_second"] = 0
     if target_date is not None:
         kwargs["current_date"] = target_date
+    kwargs["pattern_views"] = pattern_views
 
     output = generate_single_reading(**kwargs)
     daily_insights = _build_daily_insights(user, output)
@@ -872,6 +1101,7 @@ def generate_multi_user_reading(
     sign_value: Optional[str] = None,
     target_date: Optional[datetime] = None,
     locale: str = "en",
+    pattern_views: Optional[Sequence[str]] = None,
 ) -> MultiUserResult:
     """Generate readings for 2-5 users with pairwise compatibility analysis.
 
@@ -900,17 +1130,23 @@ def generate_multi_user_reading(
             else:
                 now = target_date or datetime.now()
                 h, m, s = now.hour, now.minute, now.second
-            reading = generate_time_reading(user, h, m, s, target_date, locale)
+            reading = generate_time_reading(user, h, m, s, target_date, locale, pattern_views)
         elif reading_type == ReadingType.NAME:
-            reading = generate_name_reading(user, sign_value or user.full_name, target_date, locale)
+            reading = generate_name_reading(
+                user, sign_value or user.full_name, target_date, locale, pattern_views
+            )
         elif reading_type == ReadingType.QUESTION:
             reading = generate_question_reading(
-                user, sign_value or "What is our shared destiny?", target_date, locale
+                user,
+                sign_value or "What is our shared destiny?",
+                target_date,
+                locale,
+                pattern_views,
             )
         elif reading_type == ReadingType.DAILY:
-            reading = generate_daily_reading(user, target_date, locale)
+            reading = generate_daily_reading(user, target_date, locale, pattern_views)
         else:
-            reading = generate_time_reading(user, 12, 0, 0, target_date, locale)
+            reading = generate_time_reading(user, 12, 0, 0, target_date, locale, pattern_views)
         individual.append(reading)
 
     result = MultiUserAnalyzer.analyze_group(individual)
@@ -921,6 +1157,69 @@ def generate_multi_user_reading(
     return result
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Best Moments Search
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def iter_best_moments(
+    user: UserProfile,
+    start: Optional[datetime] = None,
+    days: int = 7,
+    k: int = 10,
+    step_minutes: int = 1,
+    locale: str = "en",
+) -> Iterator[Dict[str, Any]]:
+    """Stream a user's strongest moments in a window, as they are found.
+
+    Wraps MomentSearch.iter_best_moments(): candidates are the user's local
+    times from ``start`` (default now) every ``step_minutes`` for ``days``
+    days, ranked by reading confidence then signal strength, without
+    building a reading per candidate. Each yielded moment was in the top-k
+    when found; see best_moments() for the final ranking.
+
+    Raises:
+        FrameworkBridgeError: If the window, k or step is out of range
+            (raised by the call, before anything is yielded).
+    """
+    kwargs = user.to_framework_kwargs()
+    kwargs["actual_bpm"] = kwargs.pop("heart_rate_bpm")
+    kwargs["numerology_system"] = resolve_numerology_system(user, locale)
+    kwargs["numerology_static"] = _persisted_static_profile(user, kwargs)
+    try:
+        return MomentSearch.iter_best_moments(
+            start=start or datetime.now(),
+            days=days,
+            k=k,
+            step_minutes=step_minutes,
+            **kwargs,
+        )
+    except ValueError as e:
+        raise FrameworkBridgeError(f"Best moments search failed: {e}") from e
+
+
+def best_moments(
+    user: UserProfile,
+    start: Optional[datetime] = None,
+    days: int = 7,
+    k: int = 10,
+    step_minutes: int = 1,
+    locale: str = "en",
+) -> List[Dict[str, Any]]:
+    """Top-k moments for a user in the window, best first.
+
+    Raises:
+        FrameworkBridgeError: If the window, k or step is out of range.
+    """
+    t0 = time.perf_counter()
+    found = MomentSearch.rank(
+        list(iter_best_moments(user, start, days, k, step_minutes, locale)), k
+    )
+    duration_ms = (time.perf_counter() - t0) * 1000
+    logger.info("Best moments (%d days) found in %.1fms", days, duration_ms)
+    return found
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # FC60 Stamp Validation & Display (Session 10)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -10,7 +10,7 @@ Pydantic models belong in the API layer (Session 13+).
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 
 class ReadingType(str, Enum):
@@ -44,6 +44,8 @@ class UserProfile:
     timezone_hours: int = 0
     timezone_minutes: int = 0
     numerology_system: str = "pythagorean"
+    # Persisted {system: {"fingerprint", "profile"}} from build_static_profiles()
+    numerology_static: Optional[Dict[str, Any]] = None
 
     def to_framework_kwargs(self) -> Dict[str, Any]:
         """Convert to MasterOrchestrator.generate_reading() keyword args."""
@@ -104,6 +106,21 @@ class CompatibilityResult:
     challenges: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class CompatibilityFeatures:
+    """Per-user inputs to pairwise compatibility scoring.
+
+    ``patterns`` holds (type, number-or-animal) keys of detected patterns.
+    """
+
+    user_id: int
+    life_path: int
+    element: str
+    animal: str
+    moon_phase: str
+    patterns: FrozenSet[Tuple[Any, Any]] = frozenset()
+
+
 @dataclass
 class MultiUserResult:
     """Result from multi-user group analysis."""
@@ -115,3 +132,6 @@ class MultiUserResult:
     group_element_balance: Dict[str, int] = field(default_factory=dict)
     group_summary: str = ""
     generated_at: datetime = field(default_factory=datetime.now)
+    # Set by MultiUserAnalyzer.analyze_large_group() (then pairwise_compatibility
+    # holds only the top pairs)
+    compatibility_matrix: Optional[Any] = None
@@ -12,9 +12,11 @@ import logging
 from typing import Dict, List
 
 from oracle_service.models.reading_types import (
+    CompatibilityFeatures,
     CompatibilityResult,
     MultiUserResult,
     ReadingResult,
+    ReadingType,
 )
 
 logger = logging.getLogger(__name__)
@@ -241,6 +243,28 @@ class MultiUserAnalyzer:
         moon_score = cls.score_moon_alignment(data_a["moon"], data_b["moon"])
         pattern_score = cls.score_pattern_overlap(data_a["patterns"], data_b["patterns"])
 
+        return cls._build_result(
+            reading_a.user_id,
+            reading_b.user_id,
+            lp_score,
+            elem_score,
+            animal_score,
+            moon_score,
+            pattern_score,
+        )
+
+    @classmethod
+    def _build_result(
+        cls,
+        user_a_id: int,
+        user_b_id: int,
+        lp_score: float,
+        elem_score: float,
+        animal_score: float,
+        moon_score: float,
+        pattern_score: float,
+    ) -> CompatibilityResult:
+        """Weight the five dimension scores into a CompatibilityResult."""
         overall = (
             lp_score * cls.WEIGHT_LIFE_PATH
             + elem_score * cls.WEIGHT_ELEMENT
@@ -269,8 +293,8 @@ class MultiUserAnalyzer:
             desc = "Challenging compatibility — growth through friction"
 
         return CompatibilityResult(
-            user_a_id=reading_a.user_id,
-            user_b_id=reading_b.user_id,
+            user_a_id=user_a_id,
+            user_b_id=user_b_id,
             overall_score=round(overall, 4),
             life_path_score=lp_score,
             element_score=elem_score,
@@ -303,6 +327,78 @@ class MultiUserAnalyzer:
             elem = data["element"]
             element_balance[elem] = element_balance.get(elem, 0) + 1
 
+        return MultiUserResult(
+            individual_readings=readings,
+            pairwise_compatibility=pairwise,
+            group_harmony_score=round(harmony, 4),
+            group_element_balance=element_balance,
+            group_summary=cls._group_summary(harmony, element_balance),
+        )
+
+    @classmethod
+    def analyze_large_group(cls, readings: List[ReadingResult], top_k: int = 10) -> MultiUserResult:
+        """analyze_group() for groups of hundreds to thousands of users.
+
+        Scores every pair at once with a CompatibilityMatrix instead of one
+        calculate_pairwise() call per pair. Harmony, element balance and
+        summary equal analyze_group()'s; pairwise_compatibility holds only
+        the ``top_k`` best pairs and the full matrix is attached as
+        ``compatibility_matrix``.
+        """
+        from oracle_service.compatibility_matrix import CompatibilityMatrix
+
+        matrix = CompatibilityMatrix.from_readings(readings)
+        element_balance = matrix.element_balance()
+        return MultiUserResult(
+            individual_readings=readings,
+            pairwise_compatibility=matrix.top_pairs(top_k),
+            group_harmony_score=matrix.harmony(),
+            group_element_balance=element_balance,
+            group_summary=cls._group_summary(matrix.mean_overall(), element_balance),
+            compatibility_matrix=matrix,
+        )
+
+    @classmethod
+    def extract_features(cls, reading: ReadingResult) -> CompatibilityFeatures:
+        """The comparison fields of a reading as hashable CompatibilityFeatures."""
+        data = cls._extract_comparison_data(reading)
+        return CompatibilityFeatures(
+            user_id=reading.user_id,
+            life_path=data["life_path"],
+            element=data["element"],
+            animal=data["animal"],
+            moon_phase=data["moon"].get("phase_name", ""),
+            patterns=frozenset(
+                (p.get("type"), p.get("number", p.get("animal"))) for p in data["patterns"]
+            ),
+        )
+
+    @classmethod
+    def features_reading(cls, features: CompatibilityFeatures) -> ReadingResult:
+        """Minimal ReadingResult carrying ``features`` (inverse of extract_features()).
+
+        Lets stored features be scored with calculate_pairwise() without
+        generating a full framework reading.
+        """
+        return ReadingResult(
+            reading_type=ReadingType.MULTI_USER,
+            user_id=features.user_id,
+            framework_output={
+                "numerology": {"life_path": {"number": features.life_path}},
+                "ganzhi": {"year": {"element": features.element, "animal_name": features.animal}},
+                "moon": {"phase_name": features.moon_phase},
+                "patterns": {
+                    "detected": [
+                        {"type": pattern_type, "number": value}
+                        for pattern_type, value in sorted(features.patterns, key=repr)
+                    ]
+                },
+            },
+        )
+
+    @staticmethod
+    def _group_summary(harmony: float, element_balance: Dict[str, int]) -> str:
+        """Summary text for a group's (unrounded) harmony and element balance."""
         if harmony >= 0.8:
             summary = "Exceptional group harmony — strong collective energy"
         elif harmony >= 0.6:
@@ -318,11 +414,4 @@ class MultiUserAnalyzer:
         elif unique_elements == 1:
             elem_name = list(element_balance.keys())[0]
             summary += f". Uniform {elem_name} energy — focused but narrow."
-
-        return MultiUserResult(
-            individual_readings=readings,
-            pairwise_compatibility=pairwise,
-            group_harmony_score=round(harmony, 4),
-            group_element_balance=element_balance,
-            group_summary=summary,
-        )
+        return summary
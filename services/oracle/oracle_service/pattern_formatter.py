@@ -5,10 +5,13 @@ Extracts patterns from framework output and formats them for:
 - Frontend display (badges, colors, indicators)
 - Database storage (compact JSONB summary)
 
+FormattedPatterns builds all of these from one pass over the patterns and
+only materializes the views a caller reads.
+
 Also provides ConfidenceMapper for mapping confidence scores to UI indicators.
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 
 class PatternFormatter:
@@ -145,27 +148,143 @@ class PatternFormatter:
         Returns:
             Multi-line text block for AI context.
         """
-        detected = patterns.get("detected", [])
+        return FormattedPatterns(patterns, signals, {}, combined_signals).ai
+
+    @staticmethod
+    def format_for_frontend(
+        patterns: Dict,
+        signals: List[Dict],
+        confidence: Dict,
+    ) -> Dict:
+        """Format patterns for React component consumption.
+
+        Args:
+            patterns: Dict with 'detected' list and 'count'.
+            signals: List of signal dicts from ReadingEngine.
+            confidence: Dict with 'score', 'level', 'factors'.
+
+        Returns:
+            Dict with patterns list, counts, tensions, actions, primary_signal.
+        """
+        return FormattedPatterns(patterns, signals, confidence).frontend
+
+    @staticmethod
+    def format_for_frontend_full(
+        patterns: Dict,
+        signals: List[Dict],
+        confidence: Dict,
+        combined_signals: Optional[Dict] = None,
+    ) -> Dict:
+        """Format patterns for frontend with combined signal data.
+
+        Extended version that accepts combined_signals for tension/action data.
+        """
+        return FormattedPatterns(patterns, signals, confidence, combined_signals).frontend
+
+    @staticmethod
+    def format_for_database(
+        patterns: Dict,
+        confidence: Dict,
+    ) -> Dict:
+        """Format patterns as compact JSONB-ready dict for database storage.
+
+        Args:
+            patterns: Dict with 'detected' list and 'count'.
+            confidence: Dict with 'score', 'level', 'factors'.
+
+        Returns:
+            Dict with 'patterns_summary', 'confidence_score', 'confidence_level'.
+        """
+        return FormattedPatterns(patterns, [], confidence).database
+
+
+# Views _enrich_with_patterns() can add to a reading, keyed as in framework output
+DISPLAY_VIEWS: Tuple[str, ...] = ("patterns_frontend", "patterns_db", "confidence_ui")
+PATTERN_VIEWS: Tuple[str, ...] = ("patterns_ai",) + DISPLAY_VIEWS
+
+
+class FormattedPatterns:
+    """Every formatted view of one reading's patterns, built on demand.
+
+    The detected patterns are walked once (type, strength, priority label
+    and badge text per pattern) and every view reuses that pass. Each view
+    is built the first time it is read; views never read cost nothing.
+
+    Usage:
+        formatted = FormattedPatterns(patterns, signals, confidence, combined)
+        formatted.frontend                   # == format_for_frontend_full(...)
+        formatted.views(DISPLAY_VIEWS)       # {"patterns_frontend": ..., ...}
+    """
+
+    def __init__(
+        self,
+        patterns: Dict,
+        signals: List[Dict],
+        confidence: Dict,
+        combined_signals: Optional[Dict] = None,
+    ):
+        self.detected: List[Dict] = patterns.get("detected", [])
+        self.signals = signals
+        self.confidence = confidence
+        self.combined_signals = combined_signals
+        self._built: Dict[str, Any] = {}
+        self._items_cache: Optional[List[Tuple[Dict, str, str, str, str]]] = None
+
+    # ── Shared pass ──
+
+    @property
+    def _items(self) -> List[Tuple[Dict, str, str, str, str]]:
+        """(pattern, type, strength, priority label, badge text) per pattern."""
+        if self._items_cache is not None:
+            return self._items_cache
+        items = []
+        for p in self.detected:
+            strength = p.get("strength", "medium")
+            items.append(
+                (
+                    p,
+                    p.get("type", ""),
+                    strength,
+                    PatternFormatter.STRENGTH_TO_PRIORITY.get(strength, "Medium"),
+                    PatternFormatter._badge_text(p),
+                )
+            )
+        self._items_cache = items
+        return items
+
+    def _primary_signal(self) -> str:
+        """Message of the highest-priority signal (first one on ties)."""
+        if not self.signals:
+            return ""
+        # max() keeps the first of equal ranks, like sort_by_priority()[0]
+        top = max(
+            self.signals,
+            key=lambda s: PatternFormatter.PRIORITY_RANK.get(s.get("priority", ""), 0),
+        )
+        return top.get("message", "")
+
+    # ── View builders ──
+
+    def _build_ai(self) -> str:
+        """Priority-ordered text block for the AI prompt (format_for_ai)."""
         lines: List[str] = ["=== PATTERN ANALYSIS ===", ""]
 
-        if not detected:
+        if not self.detected:
             lines.append(
                 "No specific patterns detected \u2014 all numbers and "
                 "animals are unique in this reading."
             )
         else:
-            lines.append(f"DETECTED PATTERNS ({len(detected)}):")
-            for p in detected:
-                strength = p.get("strength", "medium")
-                priority_label = PatternFormatter.STRENGTH_TO_PRIORITY.get(strength, "Medium")
-                message = p.get("message", "")
-                lines.append(f"[{priority_label}] {message}")
-
-        if combined_signals is not None:
-            primary = combined_signals.get("primary_message", "")
-            supporting = combined_signals.get("supporting_messages", [])
-            tensions = combined_signals.get("tensions", [])
-            actions = combined_signals.get("recommended_actions", [])
+            lines.append(f"DETECTED PATTERNS ({len(self.detected)}):")
+            for p, _ptype, _strength, priority_label, _badge in self._items:
+                lines.append(f"[{priority_label}] {p.get('message', '')}")
+
+        combined = self.combined_signals
+        if combined is not None:
+            primary = combined.get("primary_message", "")
+            supporting = combined.get("supporting_messages", [])
+            tensions = combined.get("tensions", [])
+            actions = combined.get("recommended_actions", [])
 
             lines.append("")
             lines.append("SIGNAL SUMMARY:")
@@ -189,126 +308,114 @@ class PatternFormatter:
 
         return "\n".join(lines)
 
-    @staticmethod
-    def format_for_frontend(
-        patterns: Dict,
-        signals: List[Dict],
-        confidence: Dict,
-    ) -> Dict:
-        """Format patterns for React component consumption.
-
-        Args:
-            patterns: Dict with 'detected' list and 'count'.
-            signals: List of signal dicts from ReadingEngine.
-            confidence: Dict with 'score', 'level', 'factors'.
-
-        Returns:
-            Dict with patterns list, counts, tensions, actions, primary_signal.
-        """
-        detected = patterns.get("detected", [])
-        sorted_signals = PatternFormatter.sort_by_priority(signals)
-
+    def _build_frontend(self) -> Dict:
+        """Badge data for React components (format_for_frontend_full)."""
         pattern_items: List[Dict] = []
-        for p in detected:
-            strength = p.get("strength", "medium")
-            priority_label = PatternFormatter.STRENGTH_TO_PRIORITY.get(strength, "Medium")
+        for p, ptype, _strength, priority_label, badge in self._items:
             pattern_items.append(
                 {
-                    "type": p.get("type", ""),
-                    "badge_text": PatternFormatter._badge_text(p),
+                    "type": ptype,
+                    "badge_text": badge,
                     "badge_color": PatternFormatter.PRIORITY_COLORS.get(priority_label, "#6B7280"),
                     "priority": priority_label,
                     "priority_rank": PatternFormatter.PRIORITY_RANK.get(priority_label, 0),
                     "description": p.get("message", ""),
                     "tooltip": PatternFormatter._tooltip(p),
-                    "icon": PatternFormatter.ICON_MAP.get(p.get("type", ""), "info"),
+                    "icon": PatternFormatter.ICON_MAP.get(ptype, "info"),
                 }
             )
 
-        # Use sorted signals to derive primary_signal.
-        primary_signal = sorted_signals[0].get("message", "") if sorted_signals else ""
-        has_tensions = False
         tensions: List[str] = []
         actions: List[str] = []
+        if self.combined_signals is not None:
+            tensions = self.combined_signals.get("tensions", [])
+            actions = self.combined_signals.get("recommended_actions", [])
 
         return {
             "patterns": pattern_items,
-            "signal_count": len(signals),
-            "pattern_count": len(detected),
-            "has_tensions": has_tensions,
+            "signal_count": len(self.signals),
+            "pattern_count": len(self.detected),
+            "has_tensions": len(tensions) > 0,
             "tensions": tensions,
             "recommended_actions": actions,
-            "primary_signal": primary_signal,
+            "primary_signal": self._primary_signal(),
         }
 
-    @staticmethod
-    def format_for_frontend_full(
-        patterns: Dict,
-        signals: List[Dict],
-        confidence: Dict,
-        combined_signals: Optional[Dict] = None,
-    ) -> Dict:
-        """Format patterns for frontend with combined signal data.
-
-        Extended version that accepts combined_signals for tension/action data.
-        """
-        result = PatternFormatter.format_for_frontend(patterns, signals, confidence)
-
-        if combined_signals is not None:
-            tensions = combined_signals.get("tensions", [])
-            actions = combined_signals.get("recommended_actions", [])
-            result["has_tensions"] = len(tensions) > 0
-            result["tensions"] = tensions
-            result["recommended_actions"] = actions
-
-        return result
-
-    @staticmethod
-    def format_for_database(
-        patterns: Dict,
-        confidence: Dict,
-    ) -> Dict:
-        """Format patterns as compact JSONB-ready dict for database storage.
-
-        Args:
-            patterns: Dict with 'detected' list and 'count'.
-            confidence: Dict with 'score', 'level', 'factors'.
-
-        Returns:
-            Dict with 'patterns_summary', 'confidence_score', 'confidence_level'.
-        """
-        detected = patterns.get("detected", [])
-        score = confidence.get("score", 50)
-        level = confidence.get("level", "low")
-
+    def _build_database(self) -> Dict:
+        """Compact JSONB-ready summary (format_for_database)."""
         all_items: List[Dict] = []
         types_seen: List[str] = []
 
-        for p in detected:
-            ptype = p.get("type", "")
+        for _p, ptype, strength, _priority, badge in self._items:
             if ptype not in types_seen:
                 types_seen.append(ptype)
-            all_items.append(
-                {
-                    "type": ptype,
-                    "detail": PatternFormatter._detail_text(p),
-                    "strength": p.get("strength", "medium"),
-                }
-            )
-
-        strongest = all_items[0] if all_items else None
+            # Detail text is the badge text (see PatternFormatter._detail_text)
+            all_items.append({"type": ptype, "detail": badge, "strength": strength})
 
         return {
             "patterns_summary": {
-                "count": len(detected),
+                "count": len(self.detected),
                 "types": types_seen,
-                "strongest": strongest,
+                "strongest": all_items[0] if all_items else None,
                 "all": all_items,
             },
-            "confidence_score": score,
-            "confidence_level": level,
+            "confidence_score": self.confidence.get("score", 50),
+            "confidence_level": self.confidence.get("level", "low"),
         }
 
+    def _build_confidence_ui(self) -> Dict:
+        """Confidence indicator data (ConfidenceMapper.map_to_ui)."""
+        return ConfidenceMapper.map_to_ui(self.confidence)
+
+    # View name -> builder
+    _BUILDERS: Dict[str, Callable[["FormattedPatterns"], Any]] = {
+        "patterns_ai": _build_ai,
+        "patterns_frontend": _build_frontend,
+        "patterns_db": _build_database,
+        "confidence_ui": _build_confidence_ui,
+    }
+
+    # ── Access ──
+
+    def _view(self, name: str) -> Any:
+        built = self._built.get(name)
+        if built is None:
+            built = self._built[name] = self._BUILDERS[name](self)
+        return built
+
+    @property
+    def ai(self) -> str:
+        """Text for the AI prompt."""
+        return self._view("patterns_ai")
+
+    @property
+    def frontend(self) -> Dict:
+        """Badge data for the frontend."""
+        return self._view("patterns_frontend")
+
+    @property
+    def database(self) -> Dict:
+        """Summary for database storage."""
+        return self._view("patterns_db")
+
+    @property
+    def confidence_ui(self) -> Dict:
+        """Confidence indicator data."""
+        return self._view("confidence_ui")
+
+    def views(self, names: Sequence[str] = PATTERN_VIEWS) -> Dict:
+        """Requested views keyed by their framework output name (PATTERN_VIEWS).
+
+        Raises:
+            ValueError: If a name is not in PATTERN_VIEWS.
+        """
+        result = {}
+        for name in names:
+            if name not in self._BUILDERS:
+                raise ValueError(f"Unknown pattern view: {name}")
+            result[name] = self._view(name)
+        return result
+
 
 class ConfidenceMapper:
     """Map framework confidence scores to UI-ready indicator data."""
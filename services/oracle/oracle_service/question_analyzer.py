@@ -5,6 +5,7 @@ Persian/Arabic (Abjad), sums letter values, reduces to single
 digit or master number.
 """
 
+from numerology_ai_framework.personal.numerology_engine import NumerologyEngine
 from oracle_service.utils.script_detector import contains_persian, detect_script
 
 # ─── Letter Value Tables ─────────────────────────────────────────────────────
@@ -159,12 +160,9 @@ def sum_letter_values(text: str, system: str = "auto") -> int:
         else:
             system = "pythagorean"
 
-    table = _SYSTEM_TABLES.get(system, PYTHAGOREAN_VALUES)
-
-    if system == "abjad":
-        return sum(table.get(c, 0) for c in text)
-    else:
-        return sum(table.get(c, 0) for c in text.upper() if c.isalpha())
+    if system not in _SYSTEM_TABLES:
+        system = "pythagorean"
+    return NumerologyEngine.name_sums(text)[system]["expression"]
 
 
 # ─── Question Number ─────────────────────────────────────────────────────────
@@ -8,9 +8,11 @@ Session 14 implements time reading; Sessions 15-18 add others.
 import logging
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from oracle_service.models.reading_types import ReadingResult, UserProfile
+from oracle_service.pattern_formatter import DISPLAY_VIEWS, PATTERN_VIEWS
+from oracle_service.worker_pool import call_framework, run_framework
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +25,21 @@ class ReadingOrchestrator:
     - AI interpretation via Session 13 engine
     - Response formatting to API model structure
     - Progress callback for WebSocket updates
+    - Section callback: with one registered, time and daily readings stream
+      the AI response and report each interpretation section as it
+      completes, instead of only after the whole response
+
+    Framework calls go through the shared FrameworkWorkerPool when one is
+    installed (see worker_pool.py), so they never block the event loop.
     """
 
     def __init__(
         self,
         progress_callback: Optional[Callable] = None,
+        section_callback: Optional[Callable] = None,
     ):
         self.progress_callback = progress_callback
+        self.section_callback = section_callback
 
     async def _send_progress(
         self, step: int, total: int, message: str, reading_type: str = "time"
@@ -38,6 +48,16 @@ class ReadingOrchestrator:
         if self.progress_callback:
             await self.progress_callback(step, total, message, reading_type)
 
+    @staticmethod
+    def _pattern_views() -> Tuple[str, ...]:
+        """Pattern views to build for responses that carry framework_result.
+
+        The AI prompt view is only worth formatting when AI is available.
+        """
+        from engines.ai_client import is_available
+
+        return PATTERN_VIEWS if is_available() else DISPLAY_VIEWS
+
     async def generate_time_reading(
         self,
         user_profile: UserProfile,
@@ -56,13 +76,13 @@ class ReadingOrchestrator:
 
         # Step 1: Generate framework reading
         await self._send_progress(1, total_steps, "Generating reading...")
-        reading_result = self._call_framework_time(
+        reading_result = await self._call_framework_time(
             user_profile, hour, minute, second, target_date, locale
         )
 
         # Step 2: AI interpretation
         await self._send_progress(2, total_steps, "Interpreting patterns...")
-        ai_sections = self._call_ai_interpreter(reading_result.framework_output, locale)
+        ai_sections = await self._call_ai_interpreter(reading_result.framework_output, locale)
 
         # Step 3: Format response
         await self._send_progress(3, total_steps, "Formatting response...")
@@ -75,7 +95,7 @@ class ReadingOrchestrator:
 
         return response
 
-    def _call_framework_time(
+    async def _call_framework_time(
         self,
         user: UserProfile,
         hour: int,
@@ -87,56 +107,111 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_time_reading()."""
         from oracle_service.framework_bridge import generate_time_reading
 
-        return generate_time_reading(user, hour, minute, second, target_date, locale)
+        return await run_framework(
+            generate_time_reading,
+            user,
+            hour,
+            minute,
+            second,
+            target_date,
+            locale,
+            self._pattern_views(),
+        )
 
-    def _call_ai_interpreter(self, framework_output: Dict[str, Any], locale: str) -> Dict[str, Any]:
-        """Invoke AI interpreter from Session 13."""
+    async def _call_ai_interpreter(
+        self, framework_output: Dict[str, Any], locale: str, reading_type: str = "time"
+    ) -> Dict[str, Any]:
+        """Invoke AI interpreter from Session 13 (awaits the shared async AI client).
+
+        With a section callback the response is streamed and each section
+        is passed on as ``section_callback(section, text, reading_type)``.
+        """
+        try:
+            from oracle_service.engines.ai_interpreter import (
+                ainterpret_reading,
+                astream_interpretation,
+            )
+
+            if self.section_callback:
+
+                async def on_section(section: str, text: str) -> None:
+                    await self.section_callback(section, text, reading_type)
+
+                result = await astream_interpretation(
+                    framework_output,
+                    reading_type=reading_type,
+                    locale=locale,
+                    on_section=on_section,
+                )
+            else:
+                result = await ainterpret_reading(
+                    framework_output, reading_type=reading_type, locale=locale
+                )
+            return result.to_dict() if hasattr(result, "to_dict") else result
+        except Exception:
+            logger.warning("AI interpretation unavailable", exc_info=True)
+            return self._fallback_sections(framework_output, locale)
+
+    def _call_ai_interpreter_sync(
+        self,
+        framework_output: Dict[str, Any],
+        locale: str,
+        reading_type: str,
+        question: str = "",
+    ) -> Dict[str, Any]:
+        """Blocking _call_ai_interpreter() for the sync name/question pipelines."""
         try:
             from oracle_service.engines.ai_interpreter import interpret_reading
 
-            result = interpret_reading(framework_output, reading_type="time", locale=locale)
+            result = interpret_reading(
+                framework_output, reading_type=reading_type, question=question, locale=locale
+            )
             return result.to_dict() if hasattr(result, "to_dict") else result
         except Exception:
             logger.warning("AI interpretation unavailable", exc_info=True)
-            # Fallback: use framework synthesis
-            synthesis = framework_output.get("synthesis", "")
-            translation = framework_output.get("translation", {})
-            if translation and isinstance(translation, dict):
-                return {
-                    "header": translation.get("header", ""),
-                    "universal_address": translation.get("universal_address", ""),
-                    "core_identity": translation.get("core_identity", ""),
-                    "right_now": translation.get("right_now", ""),
-                    "patterns": translation.get("patterns", ""),
-                    "message": translation.get("message", ""),
-                    "advice": translation.get("advice", ""),
-                    "caution": translation.get("caution", ""),
-                    "footer": translation.get("footer", ""),
-                    "full_text": translation.get("full_text", synthesis),
-                    "ai_generated": False,
-                    "locale": locale,
-                    "elapsed_ms": 0.0,
-                    "cached": False,
-                    "confidence_score": 0,
-                }
+            return self._fallback_sections(framework_output, locale)
+
+    @staticmethod
+    def _fallback_sections(framework_output: Dict[str, Any], locale: str) -> Dict[str, Any]:
+        """AI-shaped sections from the framework's own synthesis/translation."""
+        # Fallback: use framework synthesis
+        synthesis = framework_output.get("synthesis", "")
+        translation = framework_output.get("translation", {})
+        if translation and isinstance(translation, dict):
             return {
-                "header": "",
-                "universal_address": "",
-                "core_identity": "",
-                "right_now": "",
-                "patterns": "",
-                "message": synthesis or "Reading data available but AI interpretation unavailable.",
-                "advice": "",
-                "caution": "",
-                "footer": "",
-                "full_text": synthesis
-                or "Reading data available but AI interpretation unavailable.",
+                "header": translation.get("header", ""),
+                "universal_address": translation.get("universal_address", ""),
+                "core_identity": translation.get("core_identity", ""),
+                "right_now": translation.get("right_now", ""),
+                "patterns": translation.get("patterns", ""),
+                "message": translation.get("message", ""),
+                "advice": translation.get("advice", ""),
+                "caution": translation.get("caution", ""),
+                "footer": translation.get("footer", ""),
+                "full_text": translation.get("full_text", synthesis),
                 "ai_generated": False,
                 "locale": locale,
                 "elapsed_ms": 0.0,
                 "cached": False,
                 "confidence_score": 0,
             }
+        return {
+            "header": "",
+            "universal_address": "",
+            "core_identity": "",
+            "right_now": "",
+            "patterns": "",
+            "message": synthesis or "Reading data available but AI interpretation unavailable.",
+            "advice": "",
+            "caution": "",
+            "footer": "",
+            "full_text": synthesis or "Reading data available but AI interpretation unavailable.",
+            "ai_generated": False,
+            "locale": locale,
+            "elapsed_ms": 0.0,
+            "cached": False,
+            "confidence_score": 0,
+        }
 
     def generate_name_reading(
         self,
@@ -168,15 +243,15 @@ class ReadingOrchestrator:
             numerology_system=numerology_system,
         )
 
-        # Build framework reading
-        reading_result = fw_name(user, name, locale=locale)
+        # Build framework reading (the response carries no formatted pattern views)
+        reading_result = call_framework(fw_name, user, name, locale=locale, pattern_views=())
 
         fw = reading_result.framework_output
 
         # AI interpretation
         ai_text = None
         if include_ai:
-            ai_sections = self._call_ai_interpreter(fw, locale)
+            ai_sections = self._call_ai_interpreter_sync(fw, locale, "name")
             ai_text = ai_sections.get("full_text", "")
 
         # Extract numerology from framework output
@@ -283,15 +358,17 @@ class ReadingOrchestrator:
             numerology_system=q_analysis["system_used"],
         )
 
-        # Generate framework reading
-        reading_result = fw_question(user, question, locale=locale)
+        # Generate framework reading (the response carries no formatted pattern views)
+        reading_result = call_framework(
+            fw_question, user, question, locale=locale, pattern_views=()
+        )
 
         fw = reading_result.framework_output
 
         # AI interpretation with question context
         ai_text = None
         if include_ai:
-            ai_sections = self._call_ai_interpreter(fw, locale)
+            ai_sections = self._call_ai_interpreter_sync(fw, locale, "question", question)
             ai_text = ai_sections.get("full_text", "")
 
         # Extract confidence
@@ -378,11 +455,13 @@ class ReadingOrchestrator:
 
         # Step 1: Generate framework reading via bridge
         await self._send_progress(1, total_steps, "Generating daily reading...", "daily")
-        reading_result = self._call_framework_daily(user_profile, target_date)
+        reading_result = await self._call_framework_daily(user_profile, target_date)
 
         # Step 2: AI interpretation
         await self._send_progress(2, total_steps, "Interpreting today's energy...", "daily")
-        ai_sections = self._call_ai_interpreter(reading_result.framework_output, locale)
+        ai_sections = await self._call_ai_interpreter(
+            reading_result.framework_output, locale, "daily"
+        )
 
         # Step 3: Format response
         await self._send_progress(3, total_steps, "Formatting response...", "daily")
@@ -395,7 +474,7 @@ class ReadingOrchestrator:
 
         return response
 
-    def _call_framework_daily(
+    async def _call_framework_daily(
         self,
         user: UserProfile,
         target_date: Optional[datetime],
@@ -403,7 +482,9 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_daily_reading()."""
         from oracle_service.framework_bridge import generate_daily_reading
 
-        return generate_daily_reading(user, target_date)
+        return await run_framework(
+            generate_daily_reading, user, target_date, pattern_views=self._pattern_views()
+        )
 
     def _build_daily_response(
         self,
@@ -445,7 +526,7 @@ class ReadingOrchestrator:
         await self._send_progress(
             1, total_steps, f"Generating readings for {n_users} users...", "multi"
         )
-        individual_results = self._call_framework_multi(user_profiles, target_date)
+        individual_results = await self._call_framework_multi(user_profiles, target_date)
 
         # Step 2: Run compatibility analysis
         await self._send_progress(2, total_steps, "Analyzing compatibility...", "multi")
@@ -483,7 +564,7 @@ class ReadingOrchestrator:
         response["computation_ms"] = elapsed
         return response
 
-    def _call_framework_multi(
+    async def _call_framework_multi(
         self,
         users: list[UserProfile],
         target_date: Optional[datetime],
@@ -491,7 +572,12 @@ class ReadingOrchestrator:
         """Invoke framework_bridge.generate_multi_user_reading()."""
         from oracle_service.framework_bridge import generate_multi_user_reading
 
-        return generate_multi_user_reading(users, target_date=target_date)
+        return await run_framework(
+            generate_multi_user_reading,
+            users,
+            target_date=target_date,
+            pattern_views=self._pattern_views(),
+        )
 
     def _call_multi_analyzer(self, individual_results: list[ReadingResult]):
         """Invoke MultiUserAnalyzer.analyze_group() for compatibility scoring."""
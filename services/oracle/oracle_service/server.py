@@ -44,6 +44,13 @@ from engines.oracle import (
     _get_zodiac,
 )
 from engines.timing_advisor import get_current_quality, get_optimal_hours_today
+from oracle_service.worker_pool import (
+    FrameworkWorkerPool,
+    WorkerPoolBusy,
+    WorkerPoolTimeout,
+    get_worker_pool,
+    set_worker_pool,
+)
 
 # Structured logging (graceful fallback if devops package not available)
 try:
@@ -105,6 +112,25 @@ def _parse_datetime(dt_str):
         return datetime.now(timezone.utc)
 
 
+def _offload(context, fn, *args, **kwargs):
+    """Run an engine call on the framework worker pool (inline without one).
+
+    The task deadline is the RPC deadline when that is sooner than the
+    pool's own; a full queue aborts with RESOURCE_EXHAUSTED.
+    """
+    pool = get_worker_pool()
+    if pool is None:
+        return fn(*args, **kwargs)
+    remaining = context.time_remaining()
+    timeout = remaining if remaining is not None and remaining < pool.task_timeout else None
+    try:
+        return pool.call(fn, *args, timeout=timeout, **kwargs)
+    except WorkerPoolBusy as exc:
+        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+    except WorkerPoolTimeout as exc:
+        context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(exc))
+
+
 class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
     """Implements oracle.proto OracleService — 8 RPCs wrapping legacy engines."""
 
@@ -138,6 +164,13 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
             except Exception as e:
                 checks["timing"] = f"error: {e}"
 
+            pool = get_worker_pool()
+            if pool is not None:
+                stats = pool.stats()
+                checks["workers"] = (
+                    f"{stats['workers']} workers, {stats['pending']}/{stats['queue_size']} queued"
+                )
+
             all_ok = all("error" not in v for v in checks.values())
 
             return oracle_pb2.HealthResponse(
@@ -219,7 +252,7 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
             # Summary via oracle.read_sign
             date_str = f"{y:04d}-{m:02d}-{d:02d}"
             time_str = f"{h:02d}:{mi:02d}"
-            sign_result = read_sign(time_str, date=date_str, time_str=time_str)
+            sign_result = _offload(context, read_sign, time_str, date=date_str, time_str=time_str)
             summary = sign_result.get("interpretation", "")
 
             return oracle_pb2.ReadingResponse(
@@ -240,7 +273,7 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
                 return oracle_pb2.NameResponse()
 
             name = request.name
-            result = read_name(name)
+            result = _offload(context, read_name, name)
 
             # Letter analysis
             letters = []
@@ -274,7 +307,7 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
                 context.set_details("question is required")
                 return oracle_pb2.QuestionResponse()
 
-            result = question_sign(request.question)
+            result = _offload(context, question_sign, request.question)
 
             # Determine answer from numerology
             reduced_numbers = result.get("numerology", {}).get("reduced", [])
@@ -314,7 +347,7 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
             logger.info("GetDailyInsight called: date=%s", request.date)
             dt = _parse_datetime(request.date) if request.date else datetime.now(timezone.utc)
 
-            result = daily_insight(dt)
+            result = _offload(context, daily_insight, dt)
 
             # Build FC60 reading for the day
             y, m, d = dt.year, dt.month, dt.day
@@ -359,7 +392,7 @@ class OracleServiceImpl(oracle_pb2_grpc.OracleServiceServicer):
         with _track_rpc("GetTimingAlignment"):
             logger.info("GetTimingAlignment called")
             quality_result = get_current_quality()
-            hours_result = get_optimal_hours_today()
+            hours_result = _offload(context, get_optimal_hours_today)
 
             # Build optimal hours (top 5)
             optimal_hours = []
@@ -491,6 +524,11 @@ def serve(port=None):
     if port is None:
         port = int(os.environ.get("ORACLE_PORT", "50052"))
 
+    # Engine computations run in worker processes, not on the RPC threads
+    pool = FrameworkWorkerPool.from_env()
+    if pool is not None:
+        set_worker_pool(pool.start())
+
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
     # Register Oracle service
@@ -562,6 +600,9 @@ def serve(port=None):
             health_pb2.HealthCheckResponse.NOT_SERVING,
         )
         server.stop(grace=5)
+        if pool is not None:
+            set_worker_pool(None)
+            pool.shutdown(wait=False)
 
     signal.signal(signal.SIGTERM, _shutdown)
     signal.signal(signal.SIGINT, _shutdown)
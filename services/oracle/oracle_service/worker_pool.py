@@ -0,0 +1,319 @@
+"""Framework Worker Pool — runs framework readings in pre-warmed processes.
+
+Framework readings are pure CPU work. Run inline they hold the GIL, so one
+slow multi-user reading stalls the API event loop or every gRPC thread.
+FrameworkWorkerPool moves them into worker processes:
+
+- workers are started and warmed (framework imported, lazy tables built)
+  before the first request;
+- at most ``queue_size`` tasks are queued or running; beyond that submit()
+  fails fast with WorkerPoolBusy (back-pressure) instead of piling up;
+- each task carries a deadline. A task still queued at its deadline is
+  skipped by the worker; a caller still waiting at the deadline gets
+  WorkerPoolTimeout.
+
+Tasks are module-level functions (framework_bridge.generate_time_reading,
+generate_single_reading, ...) with picklable arguments.
+
+One shared pool per process is installed with set_worker_pool(); callers
+use get_worker_pool() and run inline when none is installed (tests, CLI).
+
+Configuration via environment variables (FrameworkWorkerPool.from_env):
+    NPS_FRAMEWORK_WORKERS=4 (0 disables the pool; default: CPUs, max 4)
+    NPS_FRAMEWORK_QUEUE_SIZE=32 (default: 8 per worker)
+    NPS_FRAMEWORK_TASK_TIMEOUT=30 (seconds)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from oracle_service.framework_bridge import (
+    FrameworkBridgeError,
+    generate_multi_reading,
+    generate_single_reading,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_TIMEOUT = 30.0
+QUEUE_SLOTS_PER_WORKER = 8
+
+
+class WorkerPoolError(FrameworkBridgeError):
+    """Raised when the worker pool cannot run a framework task."""
+
+
+class WorkerPoolBusy(WorkerPoolError):
+    """Raised when the pool's queue is full (back-pressure)."""
+
+
+class WorkerPoolTimeout(WorkerPoolError):
+    """Raised when a task misses its deadline."""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Worker side
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class _Expired(Exception):
+    """A task reached its worker after its deadline."""
+
+
+def _warm_worker() -> None:
+    """Process initializer: import the framework and build its lazy tables."""
+    generate_single_reading("Warm Up", 1, 1, 2000, current_hour=12, current_minute=0)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _run_task(deadline: float, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Run ``fn`` unless its deadline (wall clock) passed while it was queued."""
+    if time.time() > deadline:
+        raise _Expired()
+    return fn(*args, **kwargs)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pool
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class FrameworkWorkerPool:
+    """Bounded process pool for framework readings.
+
+    Usage:
+        pool = FrameworkWorkerPool(workers=4).start()
+        output = pool.generate_single_reading(full_name="...", ...)
+        result = await pool.run(generate_time_reading, user, 14, 30, 0)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: Optional[int] = None,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        warm: bool = True,
+        start_method: str = "spawn",
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.queue_size = queue_size or workers * QUEUE_SLOTS_PER_WORKER
+        if self.queue_size < workers:
+            raise ValueError("queue_size must be at least workers")
+        self.task_timeout = task_timeout
+        self._warm = warm
+        self._start_method = start_method
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "timed_out": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["FrameworkWorkerPool"]:
+        """Pool configured from NPS_FRAMEWORK_* variables, or None if disabled."""
+        workers = int(os.environ.get("NPS_FRAMEWORK_WORKERS", min(4, os.cpu_count() or 1)))
+        if workers <= 0:
+            return None
+        queue_size = int(os.environ.get("NPS_FRAMEWORK_QUEUE_SIZE", "0")) or None
+        timeout = float(os.environ.get("NPS_FRAMEWORK_TASK_TIMEOUT", DEFAULT_TASK_TIMEOUT))
+        return cls(workers=workers, queue_size=queue_size, task_timeout=timeout)
+
+    # ── Lifecycle ──
+
+    def start(self) -> "FrameworkWorkerPool":
+        """Start every worker process and wait until all are warm."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            executor = self._executor
+        t0 = time.perf_counter()
+        # One probe per worker: each submit spawns a process while none is idle
+        pids = {f.result() for f in [executor.submit(_ready) for _ in range(self.workers)]}
+        logger.info(
+            "Framework worker pool ready: %d workers (%d started) in %.0fms, queue %d",
+            self.workers,
+            len(pids),
+            (time.perf_counter() - t0) * 1000,
+            self.queue_size,
+        )
+        return self
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; queued tasks are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        import multiprocessing
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self._start_method),
+            initializer=_warm_worker if self._warm else None,
+        )
+
+    # ── Submission ──
+
+    def submit(
+        self, fn: Callable, *args: Any, timeout: Optional[float] = None, **kwargs: Any
+    ) -> Future:
+        """Queue ``fn(*args, **kwargs)`` on a worker.
+
+        Args:
+            timeout: Seconds until the task's deadline (default: task_timeout).
+
+        Returns:
+            A Future; the deadline is ``future.deadline`` (time.time() based).
+
+        Raises:
+            WorkerPoolBusy: ``queue_size`` tasks are already queued or running.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise WorkerPoolBusy(f"Framework worker pool is busy ({self.queue_size} tasks queued)")
+        deadline = time.time() + (self.task_timeout if timeout is None else timeout)
+        try:
+            future = self._submit(deadline, fn, args, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending += 1
+            self._stats["submitted"] += 1
+        future.deadline = deadline
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _submit(self, deadline: float, fn: Callable, args: tuple, kwargs: Dict) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            executor = self._executor
+        try:
+            return executor.submit(_run_task, deadline, fn, args, kwargs)
+        except BrokenProcessPool:
+            # A worker died (OOM, crash): replace the pool once and retry
+            logger.warning("Framework worker pool broken, restarting workers")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+                replacement = self._executor
+            executor.shutdown(wait=False)
+            return replacement.submit(_run_task, deadline, fn, args, kwargs)
+
+    def _task_done(self, future: Future) -> None:
+        self._slots.release()
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                self._stats["timed_out"] += 1
+            elif future.exception() is not None:
+                key = "timed_out" if isinstance(future.exception(), _Expired) else "failed"
+                self._stats[key] += 1
+            else:
+                self._stats["completed"] += 1
+
+    # ── Results ──
+
+    def call(self, fn: Callable, *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run ``fn`` on a worker and wait for its result (blocking)."""
+        future = self.submit(fn, *args, timeout=timeout, **kwargs)
+        try:
+            return future.result(timeout=max(0.0, future.deadline - time.time()))
+        except (FutureTimeoutError, CancelledError, _Expired):
+            future.cancel()
+            raise WorkerPoolTimeout(self._timeout_message(fn)) from None
+        except BrokenProcessPool as exc:
+            raise WorkerPoolError(f"Framework worker died: {exc}") from exc
+
+    async def run(
+        self, fn: Callable, *args: Any, timeout: Optional[float] = None, **kwargs: Any
+    ) -> Any:
+        """Run ``fn`` on a worker without blocking the event loop."""
+        future = self.submit(fn, *args, timeout=timeout, **kwargs)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), max(0.0, future.deadline - time.time())
+            )
+        except (asyncio.TimeoutError, _Expired):
+            future.cancel()
+            raise WorkerPoolTimeout(self._timeout_message(fn)) from None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BrokenProcessPool as exc:
+            raise WorkerPoolError(f"Framework worker died: {exc}") from exc
+
+    @staticmethod
+    def _timeout_message(fn: Callable) -> str:
+        return f"Framework task {getattr(fn, '__name__', fn)} missed its deadline"
+
+    def generate_single_reading(self, timeout: Optional[float] = None, **kwargs: Any) -> Dict:
+        """framework_bridge.generate_single_reading() on a worker."""
+        return self.call(generate_single_reading, timeout=timeout, **kwargs)
+
+    def generate_multi_reading(
+        self, users: List[Dict[str, Any]], timeout: Optional[float] = None, **kwargs: Any
+    ) -> List[Dict]:
+        """framework_bridge.generate_multi_reading() on a worker."""
+        return self.call(generate_multi_reading, users, timeout=timeout, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Worker count, queue depth and task counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "pending": self._pending,
+                "running": self._executor is not None,
+                **self._stats,
+            }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Shared pool
+# ═══════════════════════════════════════════════════════════════════════════
+
+_pool: Optional[FrameworkWorkerPool] = None
+
+
+def set_worker_pool(pool: Optional[FrameworkWorkerPool]) -> None:
+    """Install (or with None, remove) the process-wide worker pool."""
+    global _pool
+    _pool = pool
+
+
+def get_worker_pool() -> Optional[FrameworkWorkerPool]:
+    """The process-wide worker pool, or None to run framework calls inline."""
+    return _pool
+
+
+async def run_framework(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Await ``fn(*args, **kwargs)`` on the shared pool, or inline without one."""
+    pool = _pool
+    if pool is None:
+        return fn(*args, **kwargs)
+    return await pool.run(fn, *args, **kwargs)
+
+
+def call_framework(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Blocking counterpart of run_framework() for sync callers."""
+    pool = _pool
+    if pool is None:
+        return fn(*args, **kwargs)
+    return pool.call(fn, *args, **kwargs)
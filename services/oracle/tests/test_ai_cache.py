@@ -0,0 +1,168 @@
+"""Tests for the two-tier AI response cache (engines/ai_cache.py)."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from engines import ai_cache
+from engines.ai_cache import LRUCache, ResponseCache, SQLiteTier
+
+
+def _later(seconds: float = 60) -> float:
+    return time.time() + seconds
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_least_recently_used_evicted(self):
+        cache = LRUCache(max_entries=3)
+        for key in "abc":
+            cache.set(key, key.upper(), _later())
+        cache.get("a")  # refresh a
+        cache.set("d", "D", _later())
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual([cache.get(k)[0] for k in "acd"], ["A", "C", "D"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_byte_limit(self):
+        cache = LRUCache(max_entries=100, max_bytes=10)
+        cache.set("a", "xxxx", _later())
+        cache.set("b", "yyyy", _later())
+        cache.set("c", "zzzz", _later())
+        self.assertEqual((len(cache), cache.size_bytes), (2, 8))
+        self.assertIsNone(cache.get("a"))
+        cache.set("huge", "x" * 11, _later())  # larger than the whole cache
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(len(cache), 2)
+
+    def test_size_counts_utf8_bytes(self):
+        cache = LRUCache()
+        cache.set("fa", "خرد", _later())
+        self.assertEqual(cache.size_bytes, 6)
+
+    def test_expired_entries_dropped(self):
+        cache = LRUCache()
+        cache.set("old", "value", time.time() - 1)
+        cache.set("replaced", "first", _later())
+        cache.set("replaced", "second", _later())
+        self.assertIsNone(cache.get("old"))
+        self.assertEqual(cache.get("replaced")[0], "second")
+        self.assertEqual((len(cache), cache.size_bytes), (1, 6))
+
+    def test_rejects_bad_limits(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
+
+
+class TestSQLiteTier(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "cache", "ai.sqlite3")
+
+    def _tier(self, **kwargs) -> SQLiteTier:
+        tier = SQLiteTier(self.path, **kwargs)
+        self.addCleanup(tier.close)
+        return tier
+
+    def test_shared_between_connections(self):
+        writer, reader = self._tier(), self._tier()
+        expires_at = _later()
+        writer.set("k", "v", expires_at)
+        self.assertEqual(reader.get("k"), ("v", expires_at))
+        reader.clear()
+        self.assertIsNone(writer.get("k"))
+
+    def test_expired_entry_is_a_miss(self):
+        tier = self._tier()
+        tier.set("k", "v", time.time() - 1)
+        self.assertIsNone(tier.get("k"))
+
+    def test_prune_keeps_newest_within_budget(self):
+        tier = self._tier(max_bytes=10)
+        expires_at = _later()
+        for i, key in enumerate("abcd"):
+            with mock.patch.object(ai_cache.time, "time", return_value=1000.0 + i):
+                tier.set(key, "xxxx", expires_at)
+        tier.prune()
+        self.assertEqual([k for k in "abcd" if tier.get(k)], ["c", "d"])
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_hit_ratio_and_promotion(self):
+        shared = mock.Mock(name="shared")
+        shared.name = "sqlite"
+        shared.get.return_value = ("from shared", _later())
+        cache = ResponseCache(LRUCache(), shared)
+
+        self.assertIsNone(cache.get_local("k"))
+        self.assertEqual(cache.get_shared("k"), "from shared")
+        self.assertEqual(cache.get_local("k"), "from shared")
+        shared.get.return_value = None
+        self.assertIsNone(cache.get_shared("other"))
+
+        stats = cache.stats()
+        self.assertEqual(stats["backend"], "sqlite")
+        self.assertEqual((stats["local_hits"], stats["shared_hits"], stats["misses"]), (1, 1, 1))
+        self.assertEqual(stats["hit_ratio"], round(2 / 3, 4))
+        self.assertEqual(stats["entries"], 1)
+
+    def test_shared_errors_are_misses(self):
+        shared = mock.Mock(name="shared")
+        shared.name = "redis"
+        shared.get.side_effect = ConnectionError("down")
+        shared.set.side_effect = ConnectionError("down")
+        cache = ResponseCache(LRUCache(), shared)
+
+        self.assertIsNone(cache.get_shared("k"))
+        cache.set_shared("k", "v", cache.set_local("k", "v", 60))
+        self.assertEqual(cache.get_local("k"), "v")
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["shared_errors"]), (1, 2))
+
+    def test_memory_backend(self):
+        cache = ResponseCache(LRUCache())
+        self.assertIsNone(cache.get_shared("k"))
+        self.assertEqual(cache.stats()["backend"], "memory")
+
+
+class TestCacheFromEnv(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "ai.sqlite3")
+
+    def _cache(self, **env) -> ResponseCache:
+        env = {"NPS_AI_CACHE_PATH": self.path, **env}
+        with mock.patch.dict(os.environ, env, clear=True):
+            cache = ai_cache.cache_from_env()
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_defaults_to_sqlite_without_redis(self):
+        cache = self._cache()
+        self.assertEqual(cache.stats()["backend"], "sqlite")
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_unreachable_redis_falls_back_to_sqlite(self):
+        cache = self._cache(REDIS_HOST="127.0.0.1", REDIS_PORT="1")
+        self.assertEqual(cache.stats()["backend"], "sqlite")
+
+    def test_memory_backend_and_limits(self):
+        cache = self._cache(
+            NPS_AI_CACHE_BACKEND="memory",
+            NPS_AI_CACHE_MAX_ENTRIES="5",
+            NPS_AI_CACHE_MAX_BYTES="1000",
+        )
+        stats = cache.stats()
+        self.assertEqual(
+            (stats["backend"], stats["max_entries"], stats["max_bytes"]), ("memory", 5, 1000)
+        )
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,449 @@
+"""Tests for ai_client against a local fake Anthropic Messages endpoint.
+
+The real SDK talks HTTP to a ThreadingHTTPServer on 127.0.0.1 that answers
+POST /v1/messages, so client pooling, the token bucket and the sync/async
+entry points are exercised end to end without network access.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+import engines.ai_client as ai_client
+
+
+def _run(coro):
+    """Run ``coro`` on a private loop (asyncio.run() would unset the main
+    thread's loop, which other test modules rely on)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _FakeMessages(BaseHTTPRequestHandler):
+    """Answers every POST /v1/messages with an echo of the prompt.
+
+    Streaming requests get the echo as server-sent events, one word per
+    text delta, ``server.chunk_delay`` seconds apart.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802 — http.server API
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((time.monotonic(), self.path, body))
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+
+        status = server.status
+        if body.get("stream") and status == 200:
+            self._stream(server, body)
+            return
+        payload = {
+            "id": "msg_test",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": f"echo: {body['messages'][0]['content']}"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 3, "output_tokens": 3},
+        }
+        if status != 200:
+            payload = {"type": "error", "error": {"type": "api_error", "message": "boom"}}
+        raw = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _stream(self, server, body):
+        text = f"echo: {body['messages'][0]['content']}"
+        message = {
+            "id": "msg_test",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": 3, "output_tokens": 1},
+        }
+        words = text.split(" ")
+        events = [
+            ("message_start", {"message": message}),
+            ("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}}),
+            *(
+                (
+                    "content_block_delta",
+                    {"index": 0, "delta": {"type": "text_delta", "text": word}},
+                )
+                for word in [words[0]] + [" " + w for w in words[1:]]
+            ),
+            ("content_block_stop", {"index": 0}),
+            (
+                "message_delta",
+                {"delta": {"stop_reason": "end_turn", "stop_sequence": None}, "usage": {}},
+            ),
+            ("message_stop", {}),
+        ]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for event, data in events:
+            if event == "content_block_delta":
+                time.sleep(server.chunk_delay)
+            payload = json.dumps({"type": event, **data})
+            self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode())
+            self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeEndpointTest(unittest.TestCase):
+    """Starts the fake endpoint and points the client at it."""
+
+    env = {}
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from anthropic.resources.messages import AsyncMessages
+        except ImportError:
+            raise unittest.SkipTest("anthropic not installed")
+        if "temperature" not in inspect.signature(AsyncMessages.create).parameters:
+            raise unittest.SkipTest("installed anthropic SDK has no sampling parameters")
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeMessages)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        server = self.server
+        server.lock = threading.Lock()
+        server.requests = []
+        server.in_flight = server.peak = 0
+        server.delay = 0.0
+        server.chunk_delay = 0.0
+        server.status = 200
+
+        env = {
+            "ANTHROPIC_API_KEY": "test-key",
+            "ANTHROPIC_BASE_URL": f"http://127.0.0.1:{server.server_address[1]}",
+            "NPS_AI_RATE_LIMIT": "1000",
+            "NPS_AI_BURST": "1000",
+            "NPS_AI_MAX_CONCURRENCY": "8",
+            "NPS_AI_CACHE_BACKEND": "memory",
+            **self.env,
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ai_client.reset_availability()
+        ai_client.clear_cache()
+        self.addCleanup(ai_client.clear_cache)
+        self.addCleanup(ai_client.reset_availability)
+
+    def gather(self, prompts):
+        async def run():
+            return await asyncio.gather(
+                *(ai_client.agenerate(p, system_prompt="sys", use_cache=False) for p in prompts)
+            )
+
+        return _run(run())
+
+
+class TestAgenerate(_FakeEndpointTest):
+    def test_round_trip(self):
+        result = _run(ai_client.agenerate("hello", system_prompt="be brief"))
+        self.assertTrue(result["success"])
+        self.assertEqual(result["response"], "echo: hello")
+        self.assertFalse(result["cached"])
+
+        _, path, body = self.server.requests[0]
+        self.assertEqual(path, "/v1/messages")
+        self.assertEqual(body["system"], "be brief")
+        self.assertEqual(body["messages"], [{"role": "user", "content": "hello"}])
+
+    def test_cache_hit_skips_endpoint(self):
+        _run(ai_client.agenerate("same"))
+        result = _run(ai_client.agenerate("same"))
+        self.assertTrue(result["cached"])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_sync_wrapper_shares_client(self):
+        self.assertEqual(ai_client.generate("sync")["response"], "echo: sync")
+        _run(ai_client.agenerate("async"))
+        self.assertEqual(ai_client.rate_limit_stats()["acquired"], 2)
+
+    def test_concurrent_requests_overlap(self):
+        self.server.delay = 0.2
+        start = time.perf_counter()
+        results = self.gather([f"p{i}" for i in range(6)])
+        elapsed = time.perf_counter() - start
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertLess(elapsed, 0.8)  # serial would be >= 1.2s
+        self.assertGreater(self.server.peak, 1)
+
+    def test_server_error(self):
+        self.server.status = 500
+        with mock.patch.object(ai_client, "_RETRY_WAIT", 0.01):
+            result = _run(ai_client.agenerate("fail", use_cache=False))
+        self.assertFalse(result["success"])
+        self.assertTrue(result["retried"])
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class TestConcurrencyLimit(_FakeEndpointTest):
+    env = {"NPS_AI_MAX_CONCURRENCY": "2"}
+
+    def test_in_flight_capped(self):
+        self.server.delay = 0.1
+        results = self.gather([f"p{i}" for i in range(6)])
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(self.server.peak, 2)
+        self.assertEqual(ai_client.rate_limit_stats()["peak_in_flight"], 2)
+
+    def test_limit_spans_sync_and_async_callers(self):
+        self.server.delay = 0.1
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(ai_client.generate, f"t{i}", use_cache=False) for i in range(4)]
+            self.gather([f"a{i}" for i in range(4)])
+            self.assertTrue(all(f.result()["success"] for f in futures))
+        self.assertEqual(self.server.peak, 2)
+
+
+class TestRateLimit(_FakeEndpointTest):
+    env = {"NPS_AI_RATE_LIMIT": "10", "NPS_AI_BURST": "2"}
+
+    def test_burst_then_rate(self):
+        self.gather([f"p{i}" for i in range(6)])
+        times = sorted(t for t, _, _ in self.server.requests)
+        # 2 burst tokens, then 4 more at 10/s -> ~0.4s
+        self.assertGreaterEqual(times[-1] - times[0], 0.35)
+        self.assertLess(times[1] - times[0], 0.05)
+        stats = ai_client.rate_limit_stats()
+        self.assertEqual((stats["acquired"], stats["throttled"]), (6, 4))
+
+
+class TestSingleFlight(_FakeEndpointTest):
+    def setUp(self):
+        super().setUp()
+        self.server.delay = 0.2
+
+    def test_identical_prompts_share_one_request(self):
+        async def run():
+            return await asyncio.gather(*(ai_client.agenerate("daily") for _ in range(5)))
+
+        results = _run(run())
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual({r["response"] for r in results}, {"echo: daily"})
+        self.assertIsNot(results[0], results[1])
+        stats = ai_client.single_flight_stats()
+        self.assertEqual(stats, {"in_flight": 0, "upstream": 1, "coalesced": 4})
+
+    def test_threads_and_tasks_share_one_request(self):
+        async def run():
+            return await asyncio.gather(*(ai_client.agenerate("daily") for _ in range(3)))
+
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(ai_client.generate, "daily") for _ in range(3)]
+            results = _run(run()) + [f.result() for f in futures]
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertTrue(all(r["response"] == "echo: daily" for r in results))
+        self.assertEqual(ai_client.single_flight_stats()["coalesced"], 5)
+
+    def test_later_callers_hit_cache(self):
+        ai_client.generate("daily")
+        self.assertTrue(ai_client.generate("daily")["cached"])
+        self.assertEqual(ai_client.single_flight_stats()["upstream"], 1)
+
+    def test_explicit_cache_key(self):
+        first = ai_client.generate("daily for Alice", cache_key="body")
+        second = ai_client.generate("daily for Bob", cache_key="body")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["response"], first["response"])
+
+    def test_uncached_requests_not_coalesced(self):
+        self.gather(["daily"] * 3)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(ai_client.single_flight_stats()["coalesced"], 0)
+
+    def test_cancelled_caller_leaves_request_running(self):
+        async def run():
+            first = asyncio.create_task(ai_client.agenerate("daily"))
+            second = asyncio.create_task(ai_client.agenerate("daily"))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            return await second
+
+        self.assertEqual(_run(run())["response"], "echo: daily")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_failures_are_not_cached(self):
+        self.server.status = 500
+        with mock.patch.object(ai_client, "_RETRY_WAIT", 0.01):
+            self.assertFalse(ai_client.generate("daily")["success"])
+            self.server.status = 200
+            self.assertTrue(ai_client.generate("daily")["success"])
+        self.assertEqual(ai_client.single_flight_stats()["upstream"], 2)
+
+
+class TestStream(_FakeEndpointTest):
+    @staticmethod
+    async def consume(stream):
+        deltas = []
+        async for delta in stream:
+            deltas.append((time.perf_counter(), delta))
+        return deltas
+
+    def test_deltas_then_result(self):
+        stream = ai_client.astream("one two three", system_prompt="sys")
+        deltas = [d for _, d in _run(self.consume(stream))]
+        self.assertEqual(deltas, ["echo:", " one", " two", " three"])
+        self.assertEqual(stream.result["response"], "echo: one two three")
+        self.assertTrue(stream.result["success"])
+        self.assertTrue(self.server.requests[0][2]["stream"])
+
+    def test_first_delta_before_full_response(self):
+        self.server.chunk_delay = 0.1
+        start = time.perf_counter()
+        deltas = _run(self.consume(ai_client.astream("a b c d")))
+        self.assertLess(deltas[0][0] - start, 0.35)
+        self.assertGreater(deltas[-1][0] - start, 0.45)
+
+    def test_assembled_text_is_cached(self):
+        _run(self.consume(ai_client.astream("cache me", reading_type="time")))
+        stream = ai_client.astream("cache me", reading_type="time")
+        deltas = [d for _, d in _run(self.consume(stream))]
+        self.assertEqual(deltas, ["echo: cache me"])
+        self.assertTrue(stream.result["cached"])
+        self.assertTrue(ai_client.generate("cache me")["cached"])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_generate_joins_stream_in_flight(self):
+        self.server.chunk_delay = 0.05
+
+        async def run():
+            stream = ai_client.astream("shared words here")
+            streaming = asyncio.create_task(self.consume(stream))
+            await asyncio.sleep(0.02)
+            joined = await ai_client.agenerate("shared words here")
+            return await streaming, joined
+
+        deltas, joined = _run(run())
+        self.assertEqual(len(deltas), 4)
+        self.assertEqual(joined["response"], "echo: shared words here")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(ai_client.single_flight_stats()["coalesced"], 1)
+
+    def test_server_error(self):
+        self.server.status = 500
+        stream = ai_client.astream("hello")
+        with mock.patch.object(ai_client, "_RETRY_WAIT", 0.01):
+            self.assertEqual(_run(self.consume(stream)), [])
+        self.assertFalse(stream.result["success"])
+
+    def test_unavailable(self):
+        with mock.patch.dict(os.environ, {"ANTHROPIC_API_KEY": ""}):
+            ai_client.reset_availability()
+            stream = ai_client.astream("hello")
+            self.assertEqual(_run(self.consume(stream)), [])
+        self.assertFalse(stream.result["success"])
+
+
+class TestSharedCache(_FakeEndpointTest):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.env = {
+            "NPS_AI_CACHE_BACKEND": "sqlite",
+            "NPS_AI_CACHE_PATH": os.path.join(self.tmp.name, "ai_cache.sqlite3"),
+        }
+        super().setUp()
+
+    def test_response_survives_restart(self):
+        self.assertFalse(ai_client.generate("daily", reading_type="daily")["cached"])
+        ai_client.reset_availability()  # new process: empty local tier
+
+        result = _run(ai_client.agenerate("daily", reading_type="daily"))
+        self.assertTrue(result["cached"])
+        self.assertEqual(result["response"], "echo: daily")
+        self.assertEqual(len(self.server.requests), 1)
+        stats = ai_client.cache_stats()
+        self.assertEqual((stats["backend"], stats["shared_hits"]), ("sqlite", 1))
+
+        # Promoted to the local tier
+        ai_client.generate("daily", reading_type="daily")
+        self.assertEqual(ai_client.cache_stats()["local_hits"], 1)
+
+    def test_ttl_by_reading_type(self):
+        ai_client.generate("reading", reading_type="name")
+        ai_client.generate("other")
+        entries = ai_client._get_cache().local._entries
+        name_ttl = entries[ai_client._cache_key("reading")][1] - time.time()
+        default_ttl = entries[ai_client._cache_key("other")][1] - time.time()
+        self.assertAlmostEqual(name_ttl, ai_client._CACHE_TTLS["name"], delta=5)
+        self.assertAlmostEqual(default_ttl, ai_client._CACHE_TTL, delta=5)
+
+    def test_clear_cache_clears_shared_tier(self):
+        ai_client.generate("daily")
+        ai_client.clear_cache()
+        ai_client.reset_availability()
+        self.assertFalse(ai_client.generate("daily")["cached"])
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rejects_bad_settings(self):
+        with self.assertRaises(ValueError):
+            ai_client.TokenBucket(rate=0, burst=1, max_concurrency=1)
+        with self.assertRaises(ValueError):
+            ai_client.TokenBucket(rate=1, burst=1, max_concurrency=0)
+
+    def test_cancelled_waiter_returns_token(self):
+        async def run():
+            bucket = ai_client.TokenBucket(rate=1, burst=1, max_concurrency=4)
+            async with bucket:
+                pass
+            waiter = asyncio.create_task(bucket.acquire())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            return bucket
+
+        bucket = _run(run())
+        self.assertEqual(bucket.stats()["in_flight"], 0)
+        # Refunded: the next request waits one interval, not two
+        self.assertAlmostEqual(bucket._reserve(), 1.0, delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,18 +9,24 @@ Tests for AI Integration (Session 13)
   - Interpreter (AI success, fallback, FA, multi-user, to_dict)
   - Fallback (translation sections, synthesis, minimal)
   - Cache key (deterministic, locale differentiation)
+  - Body cache key (canonical features, person-specific frame)
+  - Streaming (incremental section parsing, section callbacks)
 
 All AI calls mocked -- zero real API calls.
 """
 
+import asyncio
+import copy
 import json
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 
 from oracle_service.ai_prompt_builder import (
+    build_body_prompt,
     build_reading_prompt,
     build_multi_user_prompt,
+    reading_features,
     _safe_get,
 )
 from engines.ai_client import (
@@ -30,10 +36,14 @@ from engines.ai_client import (
     reset_availability,
 )
 from engines.ai_interpreter import (
+    astream_interpretation,
     interpret_reading,
     interpret_multi_user,
     ReadingInterpretation,
     MultiUserInterpretation,
+    SectionStream,
+    _SECTION_MARKERS_EN,
+    _find_sections,
     _parse_sections,
     _build_fallback,
     _make_daily_cache_key,
@@ -472,13 +482,13 @@ class TestAIClientRetry(unittest.TestCase):
         clear_cache()
 
     @patch("engines.ai_client.is_available", return_value=True)
-    @patch("engines.ai_client._enforce_rate_limit")
-    @patch("engines.ai_client._get_client")
-    def test_retry_on_rate_limit(self, mock_client_fn, mock_rate, mock_avail):
+    @patch("engines.ai_client._get_async_client")
+    def test_retry_on_rate_limit(self, mock_client_fn, mock_avail):
         """Retries once on rate limit error, then succeeds."""
         import engines.ai_client as client_mod
 
         mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock()
         # First call raises a retryable error, second succeeds
         rate_limit_exc = Exception("rate limit exceeded")
         # Make it retryable by patching _is_retryable
@@ -496,11 +506,11 @@ class TestAIClientRetry(unittest.TestCase):
         self.assertTrue(result["retried"])
 
     @patch("engines.ai_client.is_available", return_value=True)
-    @patch("engines.ai_client._enforce_rate_limit")
-    @patch("engines.ai_client._get_client")
-    def test_no_retry_on_auth_error(self, mock_client_fn, mock_rate, mock_avail):
+    @patch("engines.ai_client._get_async_client")
+    def test_no_retry_on_auth_error(self, mock_client_fn, mock_avail):
         """Does NOT retry on authentication error."""
         mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock()
         auth_exc = Exception("authentication failed")
         mock_client.messages.create.side_effect = auth_exc
         mock_client_fn.return_value = mock_client
@@ -513,13 +523,13 @@ class TestAIClientRetry(unittest.TestCase):
         self.assertEqual(mock_client.messages.create.call_count, 1)
 
     @patch("engines.ai_client.is_available", return_value=True)
-    @patch("engines.ai_client._enforce_rate_limit")
-    @patch("engines.ai_client._get_client")
-    def test_retry_exhausted(self, mock_client_fn, mock_rate, mock_avail):
+    @patch("engines.ai_client._get_async_client")
+    def test_retry_exhausted(self, mock_client_fn, mock_avail):
         """Returns error after retry is exhausted."""
         import engines.ai_client as client_mod
 
         mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock()
         rate_exc = Exception("rate limit")
         mock_client.messages.create.side_effect = rate_exc
         mock_client_fn.return_value = mock_client
@@ -534,13 +544,13 @@ class TestAIClientRetry(unittest.TestCase):
         self.assertEqual(mock_client.messages.create.call_count, 2)
 
     @patch("engines.ai_client.is_available", return_value=True)
-    @patch("engines.ai_client._enforce_rate_limit")
-    @patch("engines.ai_client._get_client")
-    def test_retried_field_in_result(self, mock_client_fn, mock_rate, mock_avail):
+    @patch("engines.ai_client._get_async_client")
+    def test_retried_field_in_result(self, mock_client_fn, mock_avail):
         """Result includes 'retried' field set to False on first success."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Immediate success")]
         mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock()
         mock_client.messages.create.return_value = mock_response
         mock_client_fn.return_value = mock_client
 
@@ -775,6 +785,214 @@ class TestCacheKey(unittest.TestCase):
         self.assertNotEqual(key_en, key_fa)
 
 
+def _same_features_other_person():
+    """SAMPLE_FRAMEWORK_READING for another person, date and moment."""
+    reading = copy.deepcopy(SAMPLE_FRAMEWORK_READING)
+    reading["person"] = {"name": "Carol Diaz", "birthdate": "1972-11-02", "age_years": 53}
+    reading["current"]["date"] = "2026-05-18"
+    reading["fc60_stamp"]["fc60"] = "SO-RA-TIFI"
+    reading["moon"]["age"] = 11.1
+    reading["moon"]["illumination"] = 79
+    reading["numerology"]["expression"] = 2
+    reading["confidence"]["score"] = 70
+    return reading
+
+
+class TestBodyCacheKey(unittest.TestCase):
+    """Readings are cached on canonical features, not on the full prompt."""
+
+    AI_BODY = {
+        "success": True,
+        "response": "CORE IDENTITY\nExplorer.\n\nTHE MESSAGE\nMove.\n\nCAUTION\nRest.",
+        "cached": False,
+    }
+
+    def test_features_ignore_person_and_date(self):
+        other = _same_features_other_person()
+        self.assertEqual(reading_features(SAMPLE_FRAMEWORK_READING), reading_features(other))
+        self.assertEqual(build_body_prompt(SAMPLE_FRAMEWORK_READING), build_body_prompt(other))
+
+    def test_features_differ_on_content(self):
+        base = reading_features(SAMPLE_FRAMEWORK_READING)
+        other = copy.deepcopy(SAMPLE_FRAMEWORK_READING)
+        other["numerology"]["personal_day"] = 8
+        self.assertNotEqual(base, reading_features(other))
+        other = copy.deepcopy(SAMPLE_FRAMEWORK_READING)
+        other["patterns"]["detected"].pop()
+        self.assertNotEqual(base, reading_features(other))
+        self.assertNotEqual(base, reading_features(SAMPLE_FRAMEWORK_READING, locale="fa"))
+        self.assertNotEqual(base, reading_features(SAMPLE_FRAMEWORK_READING, question_number=7))
+
+    def test_body_prompt_has_no_person_data(self):
+        prompt = build_body_prompt(SAMPLE_FRAMEWORK_READING, "question", question_number=7)
+        self.assertIn("Life Path: 5", prompt)
+        self.assertIn("QUESTION NUMBER: 7", prompt)
+        for personal in ("Alice", "2026-02-09", "LU-OX-OXWA", "12.3", "95"):
+            self.assertNotIn(personal, prompt)
+
+    @patch("engines.ai_interpreter.generate_reading")
+    @patch("engines.ai_interpreter.is_available", return_value=True)
+    def test_same_key_for_equivalent_readings(self, mock_avail, mock_gen):
+        mock_gen.return_value = self.AI_BODY
+        alice = interpret_reading(SAMPLE_FRAMEWORK_READING)
+        carol = interpret_reading(_same_features_other_person())
+        keys = [c.kwargs["cache_key"] for c in mock_gen.call_args_list]
+        self.assertEqual(len(keys[0]), 64)
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(alice.message, carol.message)
+        self.assertIn("Alice Johnson", alice.header)
+        self.assertIn("Carol Diaz", carol.header)
+        self.assertIn("2026-05-18", carol.header)
+
+        interpret_reading(SAMPLE_FRAMEWORK_READING, reading_type="question", question="Why?")
+        self.assertNotEqual(mock_gen.call_args.kwargs["cache_key"], keys[0])
+
+    @patch("engines.ai_interpreter.generate_reading")
+    @patch("engines.ai_interpreter.is_available", return_value=True)
+    def test_name_key_depends_on_name_numbers(self, mock_avail, mock_gen):
+        mock_gen.return_value = self.AI_BODY
+        other = copy.deepcopy(SAMPLE_FRAMEWORK_READING)
+        other["numerology"]["expression"] = 2
+        interpret_reading(SAMPLE_FRAMEWORK_READING, reading_type="name")
+        interpret_reading(other, reading_type="name")
+        first, second = mock_gen.call_args_list
+        self.assertNotEqual(first.kwargs["cache_key"], second.kwargs["cache_key"])
+        self.assertIn("Expression: 2", second.kwargs["user_prompt"])
+        self.assertIn("Soul Urge:", second.kwargs["user_prompt"])
+        # Other reading types do not depend on the name
+        self.assertEqual(reading_features(SAMPLE_FRAMEWORK_READING), reading_features(other))
+
+    def test_question_in_body_prompt(self):
+        kwargs = dict(reading_type="question", question_number=7)
+        prompt = build_body_prompt(SAMPLE_FRAMEWORK_READING, question="Will I move?", **kwargs)
+        self.assertIn("QUESTION: Will I move?", prompt)
+        self.assertNotEqual(
+            reading_features(SAMPLE_FRAMEWORK_READING, question="Will I move?", **kwargs),
+            reading_features(SAMPLE_FRAMEWORK_READING, question="Will I stay?", **kwargs),
+        )
+
+    @patch("engines.ai_interpreter.generate_reading")
+    @patch("engines.ai_interpreter.is_available", return_value=True)
+    def test_frame_filled_from_reading(self, mock_avail, mock_gen):
+        mock_gen.return_value = self.AI_BODY
+        result = interpret_reading(SAMPLE_FRAMEWORK_READING)
+        self.assertTrue(result.full_text.startswith("READING FOR Alice Johnson"))
+        self.assertIn("LU-OX-OXWA", result.universal_address)
+        self.assertIn("95% (very_high)", result.footer)
+        self.assertIn("name, DOB", result.footer)
+        self.assertIn("not predictions of future events", result.footer)
+        self.assertEqual(result.core_identity, "Explorer.")
+        self.assertEqual(result.caution, "Rest.")
+
+        result = interpret_reading(SAMPLE_FRAMEWORK_READING, locale="fa")
+        self.assertTrue(result.full_text.startswith("خوانش برای Alice Johnson"))
+        self.assertIn("95%", result.footer)
+
+
+class _FakeStream:
+    """Stands in for ai_client.astream_reading(): yields fixed deltas."""
+
+    def __init__(self, deltas, success=True):
+        self.deltas = deltas
+        self.sent = 0
+        self.result = {
+            "success": success,
+            "response": "".join(deltas) if success else "",
+            "error": None if success else "boom",
+            "cached": False,
+        }
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            self.sent += 1
+            yield delta
+
+
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestStreaming(unittest.TestCase):
+    """Sections are reported as soon as they are complete."""
+
+    def test_section_stream_matches_batch_parse(self):
+        stream = SectionStream("en")
+        completed = []
+        for chunk in _chunks(SAMPLE_AI_RESPONSE_EN):
+            completed.extend(stream.feed(chunk))
+        parsed = _parse_sections(SAMPLE_AI_RESPONSE_EN)
+        found = _find_sections(SAMPLE_AI_RESPONSE_EN, _SECTION_MARKERS_EN)
+        self.assertEqual([key for key, _ in completed], [key for _, key in found][:-1])
+        for key, text in completed:
+            self.assertEqual(text, parsed[key])
+
+    def test_section_waits_for_next_heading(self):
+        stream = SectionStream("en")
+        self.assertEqual(stream.feed("CORE IDENTITY\nExplorer"), [])
+        self.assertEqual(stream.feed(" at heart.\n\nRIGHT"), [])
+        self.assertEqual(stream.feed(" NOW\nToday"), [("core_identity", "Explorer at heart.")])
+        self.assertEqual(stream.feed("\n\nCAUTION\n"), [("right_now", "Today")])
+
+    def _stream(self, deltas, success=True):
+        """Run astream_interpretation() over a fake stream.
+
+        Returns the result and (key, text, deltas received so far) events.
+        """
+        fake = _FakeStream(deltas, success)
+        events = []
+
+        async def on_section(key, text):
+            events.append((key, text, fake.sent))
+
+        loop = asyncio.new_event_loop()
+        try:
+            with (
+                patch("engines.ai_interpreter.astream_reading", return_value=fake),
+                patch("engines.ai_interpreter.is_available", return_value=True),
+            ):
+                result = loop.run_until_complete(
+                    astream_interpretation(SAMPLE_FRAMEWORK_READING, on_section=on_section)
+                )
+        finally:
+            loop.close()
+        return result, events
+
+    def test_sections_reported_as_they_complete(self):
+        body = (
+            "CORE IDENTITY\nExplorer.\n\nRIGHT NOW\nMoon day.\n\n"
+            "THE MESSAGE\nMove.\n\nTODAY'S ADVICE\nWalk.\n\nCAUTION\nRest."
+        )
+        deltas = _chunks(body, 5)
+        result, events = self._stream(deltas)
+        keys = [key for key, _, _ in events]
+        self.assertEqual(
+            keys,
+            [
+                "header",
+                "universal_address",
+                "core_identity",
+                "right_now",
+                "message",
+                "advice",
+                "caution",
+                "footer",
+            ],
+        )
+        # Header before any AI text; sections long before the stream ends
+        self.assertEqual(events[0][2], 0)
+        self.assertLess(events[2][2], len(deltas) // 2)
+        for key, text, _ in events:
+            self.assertEqual(text, getattr(result, key))
+        self.assertTrue(result.ai_generated)
+
+    def test_failed_stream_reports_fallback(self):
+        result, events = self._stream(["CORE IDENTITY\nExpl"], success=False)
+        self.assertFalse(result.ai_generated)
+        final = {key: text for key, text, _ in events}
+        self.assertEqual(final["core_identity"], result.core_identity)
+        self.assertIn("Explorer", final["core_identity"])
+
+
 class TestIntegrationPipeline(unittest.TestCase):
     """Integration tests verifying full pipelines end-to-end."""
 
@@ -0,0 +1,152 @@
+"""Tests for CompatibilityMatrix — bulk pairwise compatibility scoring.
+
+Every result is compared against the scalar MultiUserAnalyzer path, with
+and without NumPy.
+"""
+
+import itertools
+import random
+import time
+import unittest
+from unittest import mock
+
+import oracle_service  # noqa: F401 — triggers sys.path shim
+
+from oracle_service import compatibility_matrix
+from oracle_service.compatibility_matrix import CompatibilityMatrix, _round4
+from oracle_service.models.reading_types import ReadingResult, ReadingType
+from oracle_service.multi_user_analyzer import MultiUserAnalyzer
+
+ELEMENTS = ["Wood", "Fire", "Earth", "Metal", "Water"]
+ANIMALS = [
+    "Rat",
+    "Ox",
+    "Tiger",
+    "Rabbit",
+    "Dragon",
+    "Snake",
+    "Horse",
+    "Goat",
+    "Monkey",
+    "Rooster",
+    "Dog",
+    "Pig",
+]
+PHASES = MultiUserAnalyzer.PHASE_ORDER + ["Unknown Phase"]
+LIFE_PATHS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33]
+
+
+def _random_reading(rng: random.Random, user_id: int) -> ReadingResult:
+    patterns = [
+        rng.choice(
+            [
+                {"type": "repeated_number", "number": rng.randint(1, 9)},
+                {"type": "master_number", "number": rng.choice([11, 22, 33])},
+                {"type": "animal_repetition", "animal": rng.choice(ANIMALS)},
+            ]
+        )
+        for _ in range(rng.randint(0, 3))
+    ]
+    framework_output = {
+        "numerology": {"life_path": {"number": rng.choice(LIFE_PATHS)}},
+        "ganzhi": {"year": {"element": rng.choice(ELEMENTS), "animal_name": rng.choice(ANIMALS)}},
+        "moon": {"phase_name": rng.choice(PHASES)},
+        "patterns": {"detected": patterns},
+    }
+    if rng.random() < 0.05:
+        framework_output = {}  # exercises the extraction defaults
+    return ReadingResult(
+        reading_type=ReadingType.TIME, user_id=user_id, framework_output=framework_output
+    )
+
+
+def _readings(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [_random_reading(rng, user_id) for user_id in range(1, count + 1)]
+
+
+class _MatrixParity:
+    """Shared checks, run once with NumPy and once with the pure-Python path."""
+
+    numpy_enabled = True
+
+    def setUp(self):
+        if not self.numpy_enabled:
+            patcher = mock.patch.object(compatibility_matrix, "np", None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        elif compatibility_matrix.np is None:
+            self.skipTest("numpy not installed")
+
+    def test_every_pair_matches_calculate_pairwise(self):
+        readings = _readings(60)
+        matrix = CompatibilityMatrix.from_readings(readings)
+        self.assertEqual(matrix.vectorized, self.numpy_enabled)
+        for i, j in itertools.combinations(range(len(readings)), 2):
+            expected = MultiUserAnalyzer.calculate_pairwise(readings[i], readings[j])
+            self.assertEqual(matrix.scores[i][j], expected.overall_score)
+            self.assertEqual(matrix.scores[j][i], expected.overall_score)
+            self.assertEqual(matrix.pair(i, j), expected)
+
+    def test_group_matches_analyze_group(self):
+        for seed in range(5):
+            readings = _readings(80, seed)
+            scalar = MultiUserAnalyzer.analyze_group(readings)
+            large = MultiUserAnalyzer.analyze_large_group(readings, top_k=5)
+            self.assertEqual(large.group_harmony_score, scalar.group_harmony_score)
+            self.assertEqual(large.group_element_balance, scalar.group_element_balance)
+            self.assertEqual(large.group_summary, scalar.group_summary)
+            self.assertIsInstance(large.compatibility_matrix, CompatibilityMatrix)
+
+    def test_top_pairs(self):
+        readings = _readings(50)
+        expected = sorted(
+            MultiUserAnalyzer.analyze_group(readings).pairwise_compatibility,
+            key=lambda p: -p.overall_score,
+        )
+        matrix = CompatibilityMatrix.from_readings(readings)
+        self.assertEqual(matrix.top_pairs(12), expected[:12])
+        self.assertEqual(len(matrix.top_pairs(5000)), len(expected))
+        self.assertEqual(matrix.top_pairs(0), [])
+
+    def test_ties_keep_pair_order(self):
+        readings = [_random_reading(random.Random(1), user_id) for user_id in range(6)]
+        matrix = CompatibilityMatrix.from_readings(readings)
+        top = matrix.top_pairs(3)
+        self.assertEqual([(p.user_a_id, p.user_b_id) for p in top], [(0, 1), (0, 2), (0, 3)])
+
+    def test_small_groups(self):
+        self.assertEqual(CompatibilityMatrix([]).harmony(), 0.0)
+        single = CompatibilityMatrix.from_readings(_readings(1))
+        self.assertEqual(single.harmony(), 0.0)
+        self.assertEqual(single.top_pairs(3), [])
+
+
+class TestMatrixNumpy(_MatrixParity, unittest.TestCase):
+    numpy_enabled = True
+
+    def test_two_thousand_users_under_a_second(self):
+        readings = _readings(2000)
+        start = time.perf_counter()
+        matrix = CompatibilityMatrix.from_readings(readings)
+        matrix.harmony()
+        matrix.top_pairs(10)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(matrix.scores), 2000)
+
+    def test_round4_matches_round(self):
+        np = compatibility_matrix.np
+        rng = random.Random(3)
+        values = [rng.random() for _ in range(20000)]
+        # Exact binary neighbours of decimal ties (x.xxxx5)
+        values += [(k + 0.5) / 1e4 for k in range(0, 10000, 7)]
+        rounded = _round4(np.array(values)).tolist()
+        self.assertEqual(rounded, [round(v, 4) for v in values])
+
+
+class TestMatrixPurePython(_MatrixParity, unittest.TestCase):
+    numpy_enabled = False
+
+
+if __name__ == "__main__":
+    unittest.main()
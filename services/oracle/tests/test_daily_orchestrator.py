@@ -1,9 +1,10 @@
 """Tests for daily and multi-user reading orchestration (Session 16)."""
 
 import asyncio
+import time
 from datetime import date
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from oracle_service.models.reading_types import ReadingResult, ReadingType, UserProfile
 from oracle_service.reading_orchestrator import ReadingOrchestrator
@@ -254,6 +255,70 @@ class TestDailyProgressCallbackCalled:
             assert call[3] == "daily"
 
 
+_AI_SECTIONS = {"full_text": "Daily text", "ai_generated": True, "locale": "en"}
+
+
+class TestDailyReadingType:
+    """The daily pipeline asks the AI interpreter for a "daily" reading."""
+
+    @patch("oracle_service.engines.ai_interpreter.ainterpret_reading", new_callable=AsyncMock)
+    @patch.object(ReadingOrchestrator, "_call_framework_daily")
+    def test_interpreted_as_daily(self, mock_fw, mock_interpret):
+        mock_fw.return_value = _make_reading_result()
+        mock_interpret.return_value = _AI_SECTIONS
+
+        orch = ReadingOrchestrator()
+        asyncio.get_event_loop().run_until_complete(
+            orch.generate_daily_reading(_make_user_profile())
+        )
+
+        assert mock_interpret.call_args.kwargs["reading_type"] == "daily"
+
+    @patch("oracle_service.engines.ai_interpreter.astream_interpretation", new_callable=AsyncMock)
+    @patch.object(ReadingOrchestrator, "_call_framework_daily")
+    def test_streamed_as_daily(self, mock_fw, mock_stream):
+        mock_fw.return_value = _make_reading_result()
+        mock_stream.return_value = _AI_SECTIONS
+
+        async def on_section(section, text, reading_type):
+            pass
+
+        orch = ReadingOrchestrator(section_callback=on_section)
+        asyncio.get_event_loop().run_until_complete(
+            orch.generate_daily_reading(_make_user_profile())
+        )
+
+        assert mock_stream.call_args.kwargs["reading_type"] == "daily"
+
+    @patch.dict("os.environ", {"NPS_AI_CACHE_BACKEND": "memory"})
+    @patch("oracle_service.engines.ai_interpreter.is_available", return_value=True)
+    @patch("engines.ai_client.is_available", return_value=True)
+    @patch("engines.ai_client._get_async_client")
+    @patch.object(ReadingOrchestrator, "_call_framework_daily")
+    def test_cached_with_daily_ttl(self, mock_fw, mock_client_fn, *_available):
+        from engines import ai_client
+
+        ai_client.reset_availability()
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(
+            return_value=MagicMock(content=[MagicMock(text="Core identity text")])
+        )
+        mock_client_fn.return_value = mock_client
+        mock_fw.return_value = _make_reading_result()
+
+        orch = ReadingOrchestrator()
+        try:
+            asyncio.get_event_loop().run_until_complete(
+                orch.generate_daily_reading(_make_user_profile())
+            )
+            (entry,) = ai_client._get_cache().local._entries.values()
+        finally:
+            ai_client.reset_availability()
+
+        ttl = entry[1] - time.time()
+        assert abs(ttl - ai_client._CACHE_TTLS["daily"]) < 5
+
+
 class TestMultiReadingTwoUsers:
     @patch.object(ReadingOrchestrator, "_call_ai_group_interpreter")
     @patch.object(ReadingOrchestrator, "_call_multi_analyzer")
@@ -163,6 +163,17 @@ class TestOracleEngine(unittest.TestCase):
         self.assertIn("personality", result)
         self.assertEqual(result["expression"], 5)
 
+    def test_read_name_chaldean_and_mother(self):
+        result = read_name("Alice Johnson", mother_name="Barbara")
+        # A1 L3 I1 C3 E5 + J1 O7 H5 N5 S3 O7 N5 = 46 -> 1
+        self.assertEqual(result["chaldean_raw_sum"], 46)
+        self.assertEqual(result["chaldean"], 1)
+        self.assertEqual(result["expression"], 8)
+        self.assertEqual(result["soul_urge"], 9)
+        self.assertEqual(result["personality"], 8)
+        self.assertEqual(result["mother_influence"]["expression"], 7)
+        self.assertEqual(result["mother_influence"]["chaldean"], 11)
+
     def test_read_name_empty(self):
         result = read_name("")
         self.assertIn("error", result)
@@ -14,11 +14,17 @@ from datetime import datetime
 
 import oracle_service  # noqa: F401 — triggers sys.path shim
 
+from numerology_ai_framework.personal.numerology_engine import NumerologyEngine
+from numerology_ai_framework.synthesis.master_orchestrator import MasterOrchestrator
 from oracle_service.framework_bridge import (
     # High-level
     generate_single_reading,
     generate_multi_reading,
+    generate_daily_reading,
     map_oracle_user_to_framework_kwargs,
+    build_static_profiles,
+    birth_compatibility_features,
+    STATIC_PROFILE_SYSTEMS,
     FrameworkBridgeError,
     # Constants
     ANIMALS,
@@ -63,6 +69,8 @@ from oracle_service.framework_bridge import (
     self_test,
     generate_symbolic_reading,
 )
+from oracle_service.models.reading_types import UserProfile
+from oracle_service.pattern_formatter import DISPLAY_VIEWS, PATTERN_VIEWS
 
 
 class TestConstants(unittest.TestCase):
@@ -357,6 +365,68 @@ class TestGenerateSingleReading(unittest.TestCase):
             )
 
 
+class TestFieldSelectiveReading(unittest.TestCase):
+    """fields= returns just the requested framework keys."""
+
+    def test_selected_fields_only(self):
+        result = generate_single_reading(
+            full_name="Alice Johnson",
+            birth_day=15,
+            birth_month=7,
+            birth_year=1990,
+            current_date=datetime(2026, 2, 11),
+            fields={"numerology", "moon"},
+        )
+        self.assertEqual(set(result), {"numerology", "moon"})
+
+    def test_unknown_field_raises(self):
+        with self.assertRaises(FrameworkBridgeError):
+            generate_single_reading(
+                full_name="Alice Johnson",
+                birth_day=15,
+                birth_month=7,
+                birth_year=1990,
+                fields={"horoscope"},
+            )
+
+
+class TestPatternViews(unittest.TestCase):
+    """pattern_views= limits the formatted pattern enrichment."""
+
+    KWARGS = {
+        "full_name": "Alice Johnson",
+        "birth_day": 15,
+        "birth_month": 7,
+        "birth_year": 1990,
+        "current_date": datetime(2026, 2, 11),
+        "current_hour": 14,
+        "current_minute": 30,
+    }
+
+    def test_all_views_by_default(self):
+        result = generate_single_reading(**self.KWARGS)
+        self.assertTrue(set(PATTERN_VIEWS) <= set(result))
+
+    def test_requested_views_only(self):
+        full = generate_single_reading(**self.KWARGS)
+        display = generate_single_reading(**self.KWARGS, pattern_views=DISPLAY_VIEWS)
+        self.assertNotIn("patterns_ai", display)
+        self.assertEqual(display, {k: v for k, v in full.items() if k != "patterns_ai"})
+
+        bare = generate_single_reading(**self.KWARGS, pattern_views=())
+        self.assertFalse(set(PATTERN_VIEWS) & set(bare))
+
+    def test_typed_readings_pass_views_through(self):
+        user = UserProfile(
+            user_id=1, full_name="Alice Johnson", birth_day=15, birth_month=7, birth_year=1990
+        )
+        reading = generate_daily_reading(
+            user, datetime(2026, 2, 11), pattern_views=("patterns_db",)
+        )
+        self.assertIn("patterns_db", reading.framework_output)
+        self.assertNotIn("patterns_frontend", reading.framework_output)
+
+
 class TestGenerateMultiReading(unittest.TestCase):
     """Multi-user reading generation."""
 
@@ -381,6 +451,41 @@ class TestGenerateMultiReading(unittest.TestCase):
             self.assertIsInstance(r, dict)
             self.assertIn("confidence", r)
 
+    def test_multi_reading_shares_moment(self):
+        """All users are read at one moment, computed once."""
+        MasterOrchestrator.clear_moment_cache()
+        users = [
+            {"full_name": name, "birth_day": 1 + i, "birth_month": 5, "birth_year": 1990}
+            for i, name in enumerate(["Alice Johnson", "Bob Smith", "Cara Diaz"])
+        ]
+        results = generate_multi_reading(users)
+        stats = MasterOrchestrator.moment_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(len({r["fc60_stamp"]["fc60"] for r in results}), 1)
+
+    def test_multi_reading_matches_single(self):
+        """Compact batch output converts to the same dicts as single readings."""
+        moment = dict(current_date=datetime(2026, 3, 1), current_hour=10, current_minute=5)
+        users = [
+            {"full_name": "Alice Johnson", "birth_day": 15, "birth_month": 7, "birth_year": 1990},
+            {"full_name": "Bob Smith", "birth_day": 3, "birth_month": 11, "birth_year": 1985},
+        ]
+        results = generate_multi_reading(users, current_second=0, **moment)
+        for user, result in zip(users, results):
+            self.assertIs(type(result), dict)
+            self.assertIs(type(result["moon"]), dict)
+            single = generate_single_reading(**user, current_second=0, **moment)
+            self.assertEqual(result, single)
+
+    def test_multi_reading_numerology_only(self):
+        users = [
+            {"full_name": "Alice Johnson", "birth_day": 15, "birth_month": 7, "birth_year": 1990},
+        ]
+        results = generate_multi_reading(users, fields={"numerology"})
+        self.assertEqual(set(results[0]), {"numerology"})
+        self.assertIs(type(results[0]["numerology"]), dict)
+
 
 class TestMapOracleUser(unittest.TestCase):
     """DB field mapping utility."""
@@ -415,5 +520,82 @@ class TestMapOracleUser(unittest.TestCase):
             map_oracle_user_to_framework_kwargs({"name": "Alice"})
 
 
+class TestPersistedStaticProfile(unittest.TestCase):
+    """oracle_users.numerology_static is used only when its fingerprint matches."""
+
+    def _user(self, **overrides):
+        fields = dict(
+            user_id=1,
+            full_name="Alice Johnson",
+            birth_day=15,
+            birth_month=7,
+            birth_year=1990,
+            mother_name="Barbara",
+        )
+        fields.update(overrides)
+        return UserProfile(**fields)
+
+    def test_build_covers_all_systems(self):
+        static = build_static_profiles("Alice Johnson", 15, 7, 1990, "Barbara")
+        self.assertEqual(set(static), set(STATIC_PROFILE_SYSTEMS))
+        for entry in static.values():
+            self.assertEqual(len(entry["fingerprint"]), 16)
+            self.assertIn("mother_influence", entry["profile"])
+
+    def test_persisted_profile_is_used(self):
+        static = build_static_profiles("Alice Johnson", 15, 7, 1990, "Barbara")
+        static["pythagorean"]["profile"]["life_path"]["title"] = "Persisted"
+        result = generate_daily_reading(
+            self._user(numerology_static=static), target_date=datetime(2026, 2, 9)
+        )
+        numerology = result.framework_output["numerology"]
+        self.assertEqual(numerology["life_path"]["title"], "Persisted")
+
+    def test_stale_fingerprint_ignored(self):
+        static = build_static_profiles("Alice Johnson", 15, 7, 1990, "Barbara")
+        static["pythagorean"]["profile"]["life_path"]["title"] = "Persisted"
+        # Birthday edited after the profile was stored
+        result = generate_daily_reading(
+            self._user(birth_day=16, numerology_static=static),
+            target_date=datetime(2026, 2, 9),
+        )
+        numerology = result.framework_output["numerology"]
+        self.assertNotEqual(numerology["life_path"]["title"], "Persisted")
+
+    def test_output_unchanged(self):
+        static = build_static_profiles("Alice Johnson", 15, 7, 1990, "Barbara")
+        NumerologyEngine.clear_static_cache()
+        without = generate_daily_reading(self._user(), target_date=datetime(2026, 2, 9))
+        with_static = generate_daily_reading(
+            self._user(numerology_static=static), target_date=datetime(2026, 2, 9)
+        )
+        self.assertEqual(
+            with_static.framework_output["numerology"],
+            without.framework_output["numerology"],
+        )
+
+
+class TestBirthCompatibilityFeatures(unittest.TestCase):
+    """Birth features agree with a reading generated at the birth moment."""
+
+    def test_matches_framework_at_birth(self):
+        features = birth_compatibility_features(7, 15, 7, 1990)
+        output = generate_single_reading(
+            full_name="Alice Johnson",
+            birth_day=15,
+            birth_month=7,
+            birth_year=1990,
+            current_date=datetime(1990, 7, 15),
+            current_hour=12,
+            current_minute=0,
+        )
+        self.assertEqual(features.user_id, 7)
+        self.assertEqual(features.life_path, output["numerology"]["life_path"]["number"])
+        self.assertEqual(features.element, output["ganzhi"]["year"]["element"])
+        self.assertEqual(features.animal, output["ganzhi"]["year"]["animal_name"])
+        self.assertEqual(features.moon_phase, output["moon"]["phase_name"])
+        self.assertEqual(features.patterns, frozenset())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -258,5 +258,30 @@ class TestGroupAnalysis(unittest.TestCase):
         self.assertAlmostEqual(total, 1.0, places=10)
 
 
+class TestFeatures(unittest.TestCase):
+    """CompatibilityFeatures round trip through a minimal reading."""
+
+    def test_features_reading_round_trip(self):
+        reading = _make_reading(
+            4,
+            11,
+            "Water",
+            "Dog",
+            "Full Moon",
+            [
+                {"type": "master_number", "number": 11},
+                {"type": "animal_repetition", "animal": "Ox"},
+            ],
+        )
+        features = MultiUserAnalyzer.extract_features(reading)
+        rebuilt = MultiUserAnalyzer.features_reading(features)
+        self.assertEqual(MultiUserAnalyzer.extract_features(rebuilt), features)
+        other = _make_reading(5, 2, "Metal", "Rabbit", "New Moon")
+        self.assertEqual(
+            MultiUserAnalyzer.calculate_pairwise(rebuilt, other),
+            MultiUserAnalyzer.calculate_pairwise(reading, other),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,13 @@
 
 import pytest
 
-from oracle_service.pattern_formatter import ConfidenceMapper, PatternFormatter
+from oracle_service.pattern_formatter import (
+    DISPLAY_VIEWS,
+    PATTERN_VIEWS,
+    ConfidenceMapper,
+    FormattedPatterns,
+    PatternFormatter,
+)
 
 # ─── Test Fixtures ──────────────────────────────────────────────────────
 
@@ -331,3 +337,49 @@ class TestConfidenceMapper:
         assert result["level"] == "low"
         assert result["color"] == "#DC2626"
         assert "limited data" in result["caveat_en"]
+
+
+# ─── FormattedPatterns ──────────────────────────────────────────────────
+
+
+class TestFormattedPatterns:
+    def test_views_match_formatters(
+        self, mixed_patterns, sample_signals, sample_confidence_high, sample_combined_signals
+    ):
+        """Every view equals the standalone formatter output."""
+        formatted = FormattedPatterns(
+            mixed_patterns, sample_signals, sample_confidence_high, sample_combined_signals
+        )
+        assert formatted.views() == {
+            "patterns_ai": PatternFormatter.format_for_ai(
+                mixed_patterns, sample_signals, sample_combined_signals
+            ),
+            "patterns_frontend": PatternFormatter.format_for_frontend_full(
+                mixed_patterns, sample_signals, sample_confidence_high, sample_combined_signals
+            ),
+            "patterns_db": PatternFormatter.format_for_database(
+                mixed_patterns, sample_confidence_high
+            ),
+            "confidence_ui": ConfidenceMapper.map_to_ui(sample_confidence_high),
+        }
+
+    def test_primary_signal_matches_sort(self, sample_signals):
+        """Primary signal is the first highest-priority signal."""
+        ties = sample_signals + [dict(sample_signals[1], message="Later tie")]
+        frontend = FormattedPatterns({"detected": []}, ties, {}).frontend
+        assert frontend["primary_signal"] == PatternFormatter.sort_by_priority(ties)[0]["message"]
+
+    def test_only_requested_views_built(
+        self, mixed_patterns, sample_signals, sample_confidence_low
+    ):
+        formatted = FormattedPatterns(mixed_patterns, sample_signals, sample_confidence_low)
+        views = formatted.views(DISPLAY_VIEWS)
+        assert list(views) == list(DISPLAY_VIEWS)
+        assert set(formatted._built) == set(DISPLAY_VIEWS)
+        assert formatted.frontend is views["patterns_frontend"]
+        assert formatted.views(()) == {}
+        assert set(PATTERN_VIEWS) - set(DISPLAY_VIEWS) == {"patterns_ai"}
+
+    def test_unknown_view_raises(self, empty_patterns):
+        with pytest.raises(ValueError):
+            FormattedPatterns(empty_patterns, [], {}).views(["patterns_xml"])
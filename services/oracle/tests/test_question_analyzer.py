@@ -1,7 +1,11 @@
 """Tests for question_analyzer — script detection, letter value tables, and question hashing."""
 
+import random
+
 from oracle_service.question_analyzer import (
     ABJAD_VALUES,
+    CHALDEAN_VALUES,
+    PYTHAGOREAN_VALUES,
     digital_root,
     question_number,
     sum_letter_values,
@@ -57,6 +61,22 @@ class TestLetterSumValues:
         result_dirty = sum_letter_values("Hello! World?", "pythagorean")
         assert result_clean == result_dirty
 
+    def test_matches_table_sums_on_fuzzed_text(self):
+        """Shared name kernel gives the same sums as the letter tables."""
+        rng = random.Random(7)
+        alphabet = "ABCXYZabcxyz éßﬁ-'1\u0627\u0628\u067e\u063a\u06cc\u0622\u064e\u200c"
+        tables = {
+            "pythagorean": PYTHAGOREAN_VALUES,
+            "chaldean": CHALDEAN_VALUES,
+            "unknown": PYTHAGOREAN_VALUES,
+        }
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            for system, table in tables.items():
+                expected = sum(table.get(c, 0) for c in text.upper() if c.isalpha())
+                assert sum_letter_values(text, system) == expected
+            assert sum_letter_values(text, "abjad") == sum(ABJAD_VALUES.get(c, 0) for c in text)
+
 
 class TestDigitalRoot:
     def test_basic_reduction(self):
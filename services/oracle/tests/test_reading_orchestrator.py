@@ -203,3 +203,61 @@ class TestProgressCallbackOptional:
         )
         assert result is not None
         assert result["reading_type"] == "time"
+
+
+class TestSectionCallback:
+    @patch("oracle_service.engines.ai_interpreter.is_available", return_value=False)
+    @patch.object(ReadingOrchestrator, "_call_framework_time")
+    def test_sections_forwarded(self, mock_fw, _mock_available):
+        reading = _make_reading_result()
+        reading.framework_output["translation"] = {
+            "header": "TEST USER",
+            "message": "Create.",
+            "full_text": "TEST USER\nCreate.",
+        }
+        mock_fw.return_value = reading
+        sections = []
+
+        async def on_section(section, text, reading_type="time"):
+            sections.append((section, text, reading_type))
+
+        orch = ReadingOrchestrator(section_callback=on_section)
+        result = asyncio.get_event_loop().run_until_complete(
+            orch.generate_time_reading(_make_user_profile(), 14, 30, 0)
+        )
+
+        assert sections == [("header", "TEST USER", "time"), ("message", "Create.", "time")]
+        assert result["ai_interpretation"]["message"] == "Create."
+
+
+class TestPatternViews:
+    def test_ai_view_only_with_ai(self):
+        with patch("engines.ai_client.is_available", return_value=False):
+            assert "patterns_ai" not in ReadingOrchestrator._pattern_views()
+        with patch("engines.ai_client.is_available", return_value=True):
+            assert "patterns_ai" in ReadingOrchestrator._pattern_views()
+
+    @patch("engines.ai_client.is_available", return_value=False)
+    def test_framework_result_skips_ai_view(self, _mock_available):
+        orch = ReadingOrchestrator()
+        result = asyncio.run(orch._call_framework_time(_make_user_profile(), 14, 30, 0, None, "en"))
+        fw = result.framework_output
+        assert "patterns_frontend" in fw and "confidence_ui" in fw
+        assert "patterns_ai" not in fw
+
+
+class TestSyncReadingTypes:
+    """Name and question pipelines ask the interpreter for their own type."""
+
+    @patch("oracle_service.engines.ai_interpreter.interpret_reading")
+    def test_name_reading(self, mock_interpret):
+        mock_interpret.return_value = {"full_text": "Name text"}
+        ReadingOrchestrator().generate_name_reading("Alice Johnson")
+        assert mock_interpret.call_args.kwargs["reading_type"] == "name"
+
+    @patch("oracle_service.engines.ai_interpreter.interpret_reading")
+    def test_question_reading(self, mock_interpret):
+        mock_interpret.return_value = {"full_text": "Question text"}
+        ReadingOrchestrator().generate_question_reading("Will I succeed?")
+        assert mock_interpret.call_args.kwargs["reading_type"] == "question"
+        assert mock_interpret.call_args.kwargs["question"] == "Will I succeed?"
@@ -15,7 +15,11 @@ from oracle_service.models.reading_types import (
     UserProfile,
 )
 from oracle_service.framework_bridge import (
+    FrameworkBridgeError,
+    best_moments,
+    iter_best_moments,
     generate_time_reading,
+    regenerate_time_reading,
     generate_name_reading,
     generate_question_reading,
     generate_daily_reading,
@@ -120,6 +124,55 @@ class TestTimeReading(unittest.TestCase):
             generate_time_reading(TEST_USER_BOB, 12, 60, 0)
 
 
+class TestRegenerateTimeReading(unittest.TestCase):
+    """Incremental time reading equals a fresh generate_time_reading()."""
+
+    def test_matches_full_time_reading(self):
+        previous = generate_time_reading(TEST_USER_ALICE, 14, 30, 0, FIXED_DATE)
+        for hour, minute, second in ((15, 0, 0), (0, 0, 0), (23, 59, 59), (14, 30, 0)):
+            expected = generate_time_reading(TEST_USER_ALICE, hour, minute, second, FIXED_DATE)
+            result = regenerate_time_reading(TEST_USER_ALICE, previous, hour, minute, second)
+            self.assertEqual(result.framework_output, expected.framework_output)
+            self.assertEqual(result.sign_value, expected.sign_value)
+            self.assertEqual(result.confidence_score, expected.confidence_score)
+
+    def test_chained_regeneration(self):
+        reading = generate_time_reading(TEST_USER_BOB, 9, 0, 0, FIXED_DATE)
+        for hour in (10, 11, 12):
+            reading = regenerate_time_reading(TEST_USER_BOB, reading, hour, 0, 0)
+        expected = generate_time_reading(TEST_USER_BOB, 12, 0, 0, FIXED_DATE)
+        self.assertEqual(reading.framework_output, expected.framework_output)
+
+    def test_rejects_other_user_and_invalid_time(self):
+        previous = generate_time_reading(TEST_USER_ALICE, 14, 30, 0, FIXED_DATE)
+        with self.assertRaises(ValueError):
+            regenerate_time_reading(TEST_USER_BOB, previous, 15, 0, 0)
+        with self.assertRaises(ValueError):
+            regenerate_time_reading(TEST_USER_ALICE, previous, 24, 0, 0)
+
+
+class TestBestMoments(unittest.TestCase):
+    """Best-moments search for a user profile."""
+
+    def test_best_moments_ranked(self):
+        found = best_moments(TEST_USER_ALICE, FIXED_DATE, days=2, k=5)
+        self.assertEqual(len(found), 5)
+        keys = [(-m["confidence"], -m["signal_strength"], m["local_time"]) for m in found]
+        self.assertEqual(keys, sorted(keys))
+        for moment in found:
+            self.assertGreaterEqual(moment["local_time"], "2026-02-11T14:30:00")
+            self.assertLess(moment["local_time"], "2026-02-13T14:30:00")
+
+    def test_stream_includes_final_ranking(self):
+        streamed = list(iter_best_moments(TEST_USER_BOB, FIXED_DATE, days=1, k=3))
+        for moment in best_moments(TEST_USER_BOB, FIXED_DATE, days=1, k=3):
+            self.assertIn(moment, streamed)
+
+    def test_invalid_window(self):
+        with self.assertRaises(FrameworkBridgeError):
+            iter_best_moments(TEST_USER_BOB, FIXED_DATE, days=0)
+
+
 class TestNameReading(unittest.TestCase):
     """Name reading: sign is a name string."""
 
@@ -0,0 +1,137 @@
+"""Tests for FrameworkWorkerPool — process-backed framework execution."""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from oracle_service.framework_bridge import (
+    FrameworkBridgeError,
+    generate_single_reading,
+    generate_time_reading,
+)
+from oracle_service.models.reading_types import UserProfile
+from oracle_service.reading_orchestrator import ReadingOrchestrator
+from oracle_service.worker_pool import (
+    FrameworkWorkerPool,
+    WorkerPoolBusy,
+    WorkerPoolTimeout,
+    call_framework,
+    get_worker_pool,
+    run_framework,
+    set_worker_pool,
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = FrameworkWorkerPool(workers=1, queue_size=2, warm=False).start()
+    yield pool
+    pool.shutdown()
+
+
+def _user() -> UserProfile:
+    return UserProfile(
+        user_id=1, full_name="Alice Johnson", birth_day=15, birth_month=7, birth_year=1990
+    )
+
+
+class TestWorkerPool:
+    def test_runs_in_worker_process(self, pool):
+        assert pool.call(os.getpid) != os.getpid()
+        assert pool.call(divmod, 17, 5) == (3, 2)
+
+    def test_generate_single_reading_matches_inline(self, pool):
+        kwargs = {
+            "full_name": "Alice Johnson",
+            "birth_day": 15,
+            "birth_month": 7,
+            "birth_year": 1990,
+            "current_date": datetime(2024, 6, 1),
+            "current_hour": 14,
+            "current_minute": 30,
+        }
+        assert pool.generate_single_reading(**kwargs) == generate_single_reading(**kwargs)
+
+    def test_bridge_errors_propagate(self, pool):
+        with pytest.raises(FrameworkBridgeError):
+            pool.generate_single_reading(full_name="", birth_day=1, birth_month=1, birth_year=2000)
+
+    def test_back_pressure(self, pool):
+        running = pool.submit(time.sleep, 0.3)
+        queued = pool.submit(time.sleep, 0)
+        with pytest.raises(WorkerPoolBusy):
+            pool.submit(os.getpid)
+        running.result()
+        queued.result()
+        assert pool.call(os.getpid)
+        assert pool.stats()["rejected"] >= 1
+
+    def test_deadline(self, pool):
+        blocker = pool.submit(time.sleep, 0.4)
+        with pytest.raises(WorkerPoolTimeout):
+            pool.call(os.getpid, timeout=0.05)
+        blocker.result()
+        # A task already handed to the worker can't be cancelled; it expires there
+        deadline = time.time() + 2
+        while pool.stats()["pending"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert pool.stats()["timed_out"] >= 1
+        assert pool.stats()["pending"] == 0
+
+    def test_async_run(self, pool):
+        async def both():
+            return await asyncio.gather(pool.run(divmod, 7, 2), pool.run(divmod, 9, 4))
+
+        assert asyncio.run(both()) == [(3, 1), (2, 1)]
+
+    def test_async_deadline(self, pool):
+        async def late():
+            return await pool.run(time.sleep, 0.3, timeout=0.05)
+
+        with pytest.raises(WorkerPoolTimeout):
+            asyncio.run(late())
+        time.sleep(0.3)
+
+
+class TestConfiguration:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("NPS_FRAMEWORK_WORKERS", "0")
+        assert FrameworkWorkerPool.from_env() is None
+
+        monkeypatch.setenv("NPS_FRAMEWORK_WORKERS", "3")
+        monkeypatch.setenv("NPS_FRAMEWORK_TASK_TIMEOUT", "5")
+        pool = FrameworkWorkerPool.from_env()
+        assert (pool.workers, pool.queue_size, pool.task_timeout) == (3, 24, 5.0)
+
+    def test_rejects_bad_sizes(self):
+        with pytest.raises(ValueError):
+            FrameworkWorkerPool(workers=0)
+        with pytest.raises(ValueError):
+            FrameworkWorkerPool(workers=4, queue_size=2)
+
+
+class TestSharedPool:
+    def test_inline_without_pool(self):
+        assert get_worker_pool() is None
+        assert call_framework(os.getpid) == os.getpid()
+        assert asyncio.run(run_framework(divmod, 7, 2)) == (3, 1)
+
+    def test_orchestrator_uses_shared_pool(self, pool):
+        set_worker_pool(pool)
+        try:
+            before = pool.stats()["completed"]
+            orch = ReadingOrchestrator()
+            result = asyncio.run(
+                orch._call_framework_time(_user(), 14, 30, 0, datetime(2024, 6, 1), "en")
+            )
+            assert pool.stats()["completed"] == before + 1
+        finally:
+            set_worker_pool(None)
+        inline = generate_time_reading(
+            _user(), 14, 30, 0, datetime(2024, 6, 1), "en", orch._pattern_views()
+        )
+        assert result.framework_output == inline.framework_output
+        assert result.sign_value == "14:30:00"